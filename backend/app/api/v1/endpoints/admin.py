@@ -6,10 +6,12 @@ PRD v1.2:
 - 수동 리셋 API
 - P2-2: Profile 재생성 API
 - v1.2: LLM Cache 상태 조회 API
+- 공유 검색 캐시 (INDUSTRY/ENVIRONMENT) 상태 조회/무효화 API
 """
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,8 +21,13 @@ from app.worker.llm.circuit_breaker import (
     CircuitState,
 )
 from app.worker.llm.cache import get_llm_cache, CacheOperation
+from app.worker.llm.search_cache import get_search_cache, SearchScope
 from app.worker.llm.fact_checker import get_fact_checker, FactCheckResult
 from app.worker.llm.usage_tracker import get_usage_tracker, reset_usage_tracker
+from app.services.dart_client import get_dart_client
+from app.services.dashboard_summary import get_dashboard_summary_service
+from app.services.query_fanout import get_query_fanout
+from app.services.report_snapshot import get_report_snapshot_service
 from app.core.database import get_db
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -604,6 +611,69 @@ def _format_ttl(seconds: int) -> str:
         return f"{seconds}s"
 
 
+# ============================================================================
+# Shared Search Result Cache API (INDUSTRY / ENVIRONMENT)
+# ============================================================================
+
+
+class SearchCacheInvalidateRequest(BaseModel):
+    """검색 캐시 무효화 요청"""
+    scope: Optional[str] = None  # industry | environment, None이면 전체
+    industry_code: Optional[str] = None  # None이면 전체 업종
+
+
+@router.get(
+    "/search-cache/status",
+    summary="공유 검색 캐시 상태 조회",
+    description="기업 간 공유되는 INDUSTRY/ENVIRONMENT 검색 결과 캐시 상태를 조회합니다.",
+)
+async def get_search_cache_status():
+    """
+    공유 검색 캐시 상태 조회
+
+    Returns:
+        dict: 캐시 통계 (프로세스 카운터, Redis 키 수, TTL)
+    """
+    cache = get_search_cache()
+    return await run_in_threadpool(cache.get_stats)
+
+
+@router.post(
+    "/search-cache/invalidate",
+    response_model=CacheInvalidateResponse,
+    summary="공유 검색 캐시 무효화",
+    description="업종/범위 단위로 공유 검색 결과를 무효화합니다. 다음 검색부터 새로 조회합니다 (워커 프로세스의 메모리 캐시는 최대 5분 후 반영).",
+)
+async def invalidate_search_cache(request: SearchCacheInvalidateRequest):
+    """
+    공유 검색 캐시 무효화
+
+    Args:
+        request: 무효화 요청 (scope, industry_code)
+
+    Returns:
+        CacheInvalidateResponse: 무효화 결과
+    """
+    scope = None
+    if request.scope:
+        try:
+            scope = SearchScope(request.scope)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid scope: {request.scope}. Valid values: {[s.value for s in SearchScope]}"
+            )
+
+    cache = get_search_cache()
+    count = await run_in_threadpool(cache.invalidate, scope, request.industry_code)
+
+    return CacheInvalidateResponse(
+        success=True,
+        message=f"Invalidated {count} search cache entries",
+        invalidated_count=count,
+    )
+
+
 # ============================================================================
 # Multi-Search Provider Status API (Perplexity 의존도 완화)
 # ============================================================================
@@ -1434,6 +1504,164 @@ async def disable_fact_checker():
     return {"success": True, "message": "Fact checker disabled"}
 
 
+@router.get(
+    "/fact-checker/cache",
+    summary="팩트체크 캐시 상태 조회",
+)
+async def get_fact_check_cache_status():
+    """팩트체크 결과 캐시 통계 (판정별 TTL 포함)"""
+    cache = get_fact_checker().cache
+    stats = cache.get_stats()
+    stats["ttl"] = {
+        "decisive": cache.config.TTL_DECISIVE,
+        "partial": cache.config.TTL_PARTIAL,
+        "unverified": cache.config.TTL_UNVERIFIED,
+    }
+    return stats
+
+
+@router.post(
+    "/fact-checker/cache/clear",
+    response_model=CacheInvalidateResponse,
+    summary="팩트체크 캐시 초기화",
+)
+async def clear_fact_check_cache():
+    """팩트체크 결과 캐시 전체 삭제 (판정 기준 변경 시)"""
+    count = await run_in_threadpool(get_fact_checker().cache.clear)
+    return CacheInvalidateResponse(
+        success=True,
+        message=f"Cleared {count} fact-check cache entries",
+        invalidated_count=count,
+    )
+
+
+@router.get(
+    "/dart/cache",
+    summary="DART 응답 캐시 / 쿼터 상태 조회",
+)
+async def get_dart_client_status():
+    """DART 공유 클라이언트 통계 (캐시 적중, 요청 병합, 일일 쿼터, endpoint별 TTL)"""
+    client = get_dart_client()
+    stats = client.get_stats()
+    stats["ttl"] = {
+        **client.config.ENDPOINT_TTL,
+        "past_year": client.config.PAST_YEAR_TTL,
+        "no_data": client.config.NO_DATA_TTL,
+    }
+    return stats
+
+
+@router.post(
+    "/dart/cache/clear",
+    response_model=CacheInvalidateResponse,
+    summary="DART 응답 캐시 초기화",
+)
+async def clear_dart_client_cache():
+    """DART 응답 캐시 전체 삭제 (정정공시 반영 등, 워커 memory 복사본은 최대 5분 후 반영)"""
+    count = await run_in_threadpool(get_dart_client().clear)
+    return CacheInvalidateResponse(
+        success=True,
+        message=f"Cleared {count} DART response cache entries",
+        invalidated_count=count,
+    )
+
+
+@router.get(
+    "/dashboard/summary-cache",
+    summary="Dashboard 요약 캐시 상태 조회",
+)
+async def get_dashboard_summary_cache_status():
+    """Dashboard 요약 캐시 통계 (적중, 전체 집계 fallback, 카운터 사용 가능 여부)"""
+    return get_dashboard_summary_service().get_stats()
+
+
+@router.post(
+    "/dashboard/counter/rebuild",
+    summary="Dashboard 카운터 재계산",
+)
+async def rebuild_dashboard_counter(db: AsyncSession = Depends(get_db)):
+    """rkyc_dashboard_counter 전체 재계산 (수동 데이터 보정 후 불일치 복구)"""
+    try:
+        total = await db.scalar(text("SELECT rkyc_dashboard_counter_rebuild()"))
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Counter rebuild failed: {str(e)[:200]}")
+    get_dashboard_summary_service().invalidate()
+    return {"success": True, "total_signals": int(total or 0)}
+
+
+@router.get(
+    "/reports/snapshot-stats",
+    summary="기업 보고서 스냅샷 상태 조회",
+)
+async def get_report_snapshot_status():
+    """보고서 스냅샷 통계 (적중, 조립, 저장 건너뜀, 스냅샷 테이블 사용 가능 여부)"""
+    return get_report_snapshot_service().get_stats()
+
+
+@router.get(
+    "/query-fanout/stats",
+    summary="상세 조회 하위 조회 동시 실행 통계",
+)
+async def get_query_fanout_status():
+    """Query fan-out 통계 (동시/순차 실행 수, 하위 조회 timeout/실패 수)"""
+    return get_query_fanout().get_stats()
+
+
+@router.get(
+    "/portfolio-rules/evaluate",
+    summary="포트폴리오 규칙 일괄 평가",
+)
+async def evaluate_portfolio_rules_now(
+    corp_id: Optional[list[str]] = Query(None, description="대상 기업 (미지정 시 전체)"),
+    limit: int = Query(100, ge=1, le=1000, description="반환할 기업 결과 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Banking Insights + Rule-based 시그널 규칙 전체 평가 (LLM 호출 없음)
+
+    Returns:
+        summary: 평가 기업 수, 규칙별 인사이트/시그널 후보 수, 단계별 소요 시간
+        results: 인사이트 또는 시그널 후보가 있는 기업 (최대 limit)
+    """
+    from app.services.portfolio_rules import evaluate_portfolio
+
+    evaluation = await evaluate_portfolio(db, corp_id)
+    return {"summary": evaluation.summary(), "results": evaluation.results[:limit]}
+
+
+@router.post(
+    "/portfolio-rules/run",
+    summary="포트폴리오 규칙 평가 태스크 실행",
+)
+async def run_portfolio_rules_task(
+    corp_id: Optional[list[str]] = Query(None, description="대상 기업 (미지정 시 전체)"),
+):
+    """evaluate_portfolio_rules 태스크 큐 등록 (신규 시그널 후보가 있는 기업은 분석 Job 생성)"""
+    try:
+        from app.worker.tasks.portfolio_rules import evaluate_portfolio_rules
+        task = evaluate_portfolio_rules.delay(corp_id)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Task dispatch failed: {str(e)[:200]}")
+    return {"success": True, "task_id": task.id}
+
+
+@router.post(
+    "/reports/snapshots/invalidate",
+    summary="기업 보고서 스냅샷 전체 무효화",
+)
+async def invalidate_report_snapshots(db: AsyncSession = Depends(get_db)):
+    """모든 보고서 스냅샷 무효화 (조립 로직 변경 배포 후) - 다음 열람 시 다시 조립"""
+    try:
+        count = await db.scalar(text("SELECT rkyc_report_snapshot_invalidate_all()"))
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Snapshot invalidation failed: {str(e)[:200]}")
+    return {"success": True, "invalidated_count": int(count or 0)}
+
+
 # ============================================================================
 # LLM Usage Tracking API (Sprint 1 Task 3)
 # ============================================================================
@@ -1826,7 +2054,8 @@ async def clear_industry_hints_cache_endpoint(industry_code: Optional[str] = Que
     """
     from app.worker.pipelines.corp_profiling import clear_industry_hints_cache
 
-    count = clear_industry_hints_cache(industry_code)
+    # Redis/DB 동기 I/O
+    count = await run_in_threadpool(clear_industry_hints_cache, industry_code)
     return {
         "success": True,
         "cleared_count": count,
@@ -1845,16 +2074,16 @@ async def get_industry_hints_cache_status():
     업종 힌트 캐시 상태 조회
 
     Returns:
-        캐시된 업종 코드 목록 및 캐시 크기
+        이 프로세스 memory tier의 업종 코드 목록, 캐시 크기, 저장소 통계
     """
-    from app.worker.pipelines.corp_profiling import _industry_hints_cache, _industry_hints_lock
+    from app.worker.llm.industry_knowledge import get_industry_knowledge_store
 
-    with _industry_hints_lock:
-        cached_codes = list(_industry_hints_cache.keys())
-        cache_size = len(cached_codes)
+    stats = get_industry_knowledge_store().get_stats()
+    cached_codes = stats.pop("memory_codes")
 
     return {
         "cached_industry_codes": cached_codes,
-        "cache_size": cache_size,
+        "cache_size": len(cached_codes),
+        "store": stats,
         "hint": "Use POST /admin/industry-hints/clear to reset cache after prompt changes",
     }
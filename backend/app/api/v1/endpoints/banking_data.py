@@ -15,7 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, func
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.banking_data import BankingData
 from app.models.corporation import Corporation
 from app.schemas.banking_data import (
@@ -27,7 +27,11 @@ from app.schemas.banking_data import (
     BankingDataCreate,
     BankingDataUpdate,
 )
-from app.services.dart_api import get_financial_statements_by_name, get_corp_code
+from app.services.dart_api import (
+    get_corp_code,
+    get_financial_statements as get_dart_financial_statements,
+    get_financial_statements_by_name,
+)
 
 router = APIRouter()
 
@@ -36,7 +40,7 @@ router = APIRouter()
 async def get_banking_data(
     corp_id: str,
     data_date: Optional[date] = Query(None, description="기준일 (미지정 시 최신)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     기업의 Banking Data 조회
@@ -73,7 +77,7 @@ async def get_banking_data(
 async def get_banking_data_history(
     corp_id: str,
     limit: int = Query(12, ge=1, le=60, description="조회 개수"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     기업의 Banking Data 이력 조회
@@ -112,7 +116,7 @@ async def get_banking_data_history(
 @router.get("/{corp_id}/risk-alerts", response_model=RiskAlertListResponse)
 async def get_risk_alerts(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     기업의 리스크 알림 조회
@@ -155,7 +159,7 @@ async def get_risk_alerts(
 @router.get("/{corp_id}/opportunities", response_model=OpportunityListResponse)
 async def get_opportunities(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     기업의 영업 기회 조회
@@ -190,7 +194,7 @@ async def get_opportunities(
 @router.get("/{corp_id}/loan-exposure")
 async def get_loan_exposure(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     여신 현황 조회
@@ -214,7 +218,7 @@ async def get_loan_exposure(
 @router.get("/{corp_id}/deposit-trend")
 async def get_deposit_trend(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     수신 추이 조회
@@ -238,7 +242,7 @@ async def get_deposit_trend(
 @router.get("/{corp_id}/card-usage")
 async def get_card_usage(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     법인카드 이용 현황 조회
@@ -262,7 +266,7 @@ async def get_card_usage(
 @router.get("/{corp_id}/collateral")
 async def get_collateral_detail(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     담보물 현황 조회
@@ -286,7 +290,7 @@ async def get_collateral_detail(
 @router.get("/{corp_id}/trade-finance")
 async def get_trade_finance(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     무역금융 현황 조회
@@ -310,7 +314,7 @@ async def get_trade_finance(
 @router.get("/{corp_id}/financial-statements")
 async def get_financial_statements(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     재무제표 조회 (DB 저장 데이터)
@@ -334,12 +338,13 @@ async def get_financial_statements(
 @router.get("/{corp_id}/financial-statements/dart")
 async def get_financial_statements_from_dart(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    DART 실시간 재무제표 조회 (100% Fact)
+    DART 재무제표 조회 (100% Fact)
 
-    DART 전자공시에서 최근 3년 재무제표를 실시간으로 조회합니다.
+    DART 전자공시 최근 3년 재무제표를 조회합니다.
+    dart_corp_code가 있고 sync_dart_filings로 동기화된 기업은 로컬 사본을 읽습니다.
     - 매출액, 영업이익, 당기순이익
     - 총자산, 총부채, 총자본
     - 부채비율 자동 계산
@@ -352,8 +357,11 @@ async def get_financial_statements_from_dart(
     if not corporation:
         raise HTTPException(status_code=404, detail=f"Corporation not found: {corp_id}")
 
-    # Fetch from DART API
-    statements = await get_financial_statements_by_name(corporation.corp_name)
+    # 고유번호가 있으면 기업명 검색 없이 조회 (동기화된 기업은 로컬)
+    if corporation.dart_corp_code:
+        statements = await get_dart_financial_statements(corporation.dart_corp_code)
+    else:
+        statements = await get_financial_statements_by_name(corporation.corp_name)
 
     if not statements:
         raise HTTPException(
@@ -468,7 +476,7 @@ async def update_banking_data(
 
 @router.get("/summary/all", response_model=List[BankingDataSummary])
 async def get_all_banking_data_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     전체 기업의 Banking Data 요약 조회
@@ -506,7 +514,7 @@ async def get_all_banking_data_summary(
 @router.get("/{corp_id}/insights")
 async def get_banking_insights(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Banking Data + Signal 교차 분석 인사이트 조회
@@ -13,8 +13,15 @@ Endpoints:
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from app.core.database import get_db
+from sqlalchemy import select
+from app.core.database import get_db, get_read_db
+from app.services.pagination import (
+    CountMode,
+    InvalidCursor,
+    apply_keyset,
+    count_rows,
+    split_page,
+)
 
 
 from app.models.corporation import Corporation
@@ -41,9 +48,11 @@ async def list_corporations(
     search: Optional[str] = Query(None, description="기업명 검색"),
     limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    count: CountMode = Query(CountMode.EXACT, description="total 계산 방식 (exact | estimate)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """기업 목록 조회 (페이지네이션 및 필터 지원)"""
+    """기업 목록 조회 (페이지네이션 및 필터 지원, (created_at, corp_id) keyset cursor)"""
 
     # Build query
     query = select(Corporation)
@@ -56,22 +65,31 @@ async def list_corporations(
         query = query.where(Corporation.corp_name.ilike(f"%{escaped_search}%", escape="\\"))
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    filtered = bool(industry_code or search)
+    total, total_is_estimate = await count_rows(db, query, count, table="corp", filtered=filtered)
 
     # Get items with pagination
-    query = query.limit(limit).offset(offset).order_by(Corporation.created_at.desc())
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    return CorporationListResponse(total=total, items=items)
+    try:
+        query = apply_keyset(query, Corporation.created_at, Corporation.corp_id, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cursor:
+        query = query.offset(offset)
+    result = await db.execute(query.limit(limit + 1))
+    items, next_cursor = split_page(result.scalars().all(), limit, lambda c: (c.created_at, c.corp_id))
+
+    return CorporationListResponse(
+        total=total,
+        items=items,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
 
 
 @router.get("/{corp_id}", response_model=CorporationResponse)
 async def get_corporation(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """기업 상세 조회"""
 
@@ -88,7 +106,7 @@ async def get_corporation(
 @router.get("/{corp_id}/snapshot", response_model=SnapshotResponse)
 async def get_corporation_snapshot(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """기업 최신 Snapshot 조회 (PRD 14.2)"""
 
@@ -4,19 +4,24 @@ DART API Endpoints
 주주 정보 검증 및 DART 공시 조회 API
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.services.dart_api import (
     get_corp_code,
+    get_corp_codes_batch,
+    get_corp_name_index,
+    search_corp_codes,
     get_major_shareholders,
     verify_shareholders,
     get_verified_shareholders,
     load_corp_codes,
-    _corp_code_loaded,
+    get_corp_code_count,
+    get_corp_code_store,
     # P0: Fact-Based APIs
     get_company_info,
     get_company_info_by_name,
@@ -52,11 +57,34 @@ router = APIRouter()
 # Request/Response Models
 # ============================================================================
 
+class CorpCodeCandidate(BaseModel):
+    """기업 고유번호 후보 (기업명 인덱스 검색 결과)"""
+    corp_code: str
+    corp_name: str
+    score: float
+    match_type: str  # EXACT, PREFIX, CONTAINS, NGRAM
+
+
 class CorpCodeResponse(BaseModel):
     """기업 고유번호 응답"""
     corp_name: str
     corp_code: Optional[str]
     found: bool
+    candidates: list[CorpCodeCandidate] = []
+
+
+class CorpCodeBatchRequest(BaseModel):
+    """기업 고유번호 일괄 조회 요청"""
+    corp_names: list[str] = Field(..., min_length=1, max_length=1000)
+    include_candidates: bool = False
+    limit: int = Field(3, ge=1, le=20)
+
+
+class CorpCodeBatchResponse(BaseModel):
+    """기업 고유번호 일괄 조회 응답"""
+    results: list[CorpCodeResponse]
+    found_count: int
+    total: int
 
 
 class ShareholderResponse(BaseModel):
@@ -176,31 +204,35 @@ async def get_dart_status():
     Returns:
         DartStatusResponse: DART API 상태 정보
     """
-    from app.services.dart_api import _corp_code_cache, _corp_code_loaded
+    store = get_corp_code_store()
 
     return DartStatusResponse(
-        corp_codes_loaded=_corp_code_loaded,
-        corp_code_count=len(_corp_code_cache),
+        corp_codes_loaded=store.is_available(),
+        corp_code_count=store.count(),
         api_available=True,  # TODO: 실제 API 헬스체크
     )
 
 
 @router.post("/initialize")
-async def initialize_dart():
+async def initialize_dart(
+    force: bool = Query(False, description="TTL과 무관하게 고유번호 목록 재다운로드"),
+):
     """
     DART API 초기화 (기업 고유번호 목록 로드)
 
+    Args:
+        force: 저장소 강제 갱신
+
     Returns:
         dict: 초기화 결과
     """
     try:
-        success = await load_corp_codes()
+        success = await load_corp_codes(force=force)
         if success:
-            from app.services.dart_api import _corp_code_cache
             return {
                 "success": True,
                 "message": "DART corp codes loaded successfully",
-                "count": len(_corp_code_cache),
+                "count": get_corp_code_count(),
             }
         else:
             return {
@@ -216,6 +248,7 @@ async def initialize_dart():
 async def lookup_corp_code(
     corp_name: str = Query(..., description="기업명 (예: 삼성전자)"),
     stock_code: Optional[str] = Query(None, description="주식 종목코드 (예: 005930)"),
+    limit: int = Query(5, ge=1, le=20, description="최대 후보 수"),
 ):
     """
     DART 기업 고유번호 조회
@@ -223,16 +256,59 @@ async def lookup_corp_code(
     Args:
         corp_name: 기업명
         stock_code: 주식 종목코드 (선택)
+        limit: 최대 후보 수
 
     Returns:
-        CorpCodeResponse: 기업 고유번호 정보
+        CorpCodeResponse: 기업 고유번호 정보 + 점수순 후보 목록
     """
     corp_code = await get_corp_code(corp_name=corp_name, stock_code=stock_code)
+    candidates = await search_corp_codes(corp_name, limit=limit)
 
     return CorpCodeResponse(
         corp_name=corp_name,
         corp_code=corp_code,
         found=corp_code is not None,
+        candidates=[CorpCodeCandidate(**c.to_dict()) for c in candidates],
+    )
+
+
+@router.post("/corp-code/batch", response_model=CorpCodeBatchResponse)
+async def lookup_corp_codes_batch(request: CorpCodeBatchRequest):
+    """
+    DART 기업 고유번호 일괄 조회 (온보딩 대량 매핑용)
+
+    Args:
+        request: 기업명 목록 (최대 1000건), 후보 포함 여부
+
+    Returns:
+        CorpCodeBatchResponse: 기업명별 고유번호 (입력 순서 유지)
+    """
+    codes = await get_corp_codes_batch(request.corp_names)
+
+    candidates_by_name = {}
+    if request.include_candidates:
+        index = await get_corp_name_index()
+        candidates_by_name = await asyncio.to_thread(
+            index.search_batch, request.corp_names, request.limit
+        )
+
+    results = []
+    for corp_name in request.corp_names:
+        corp_code = codes.get(corp_name)
+        results.append(CorpCodeResponse(
+            corp_name=corp_name,
+            corp_code=corp_code,
+            found=corp_code is not None,
+            candidates=[
+                CorpCodeCandidate(**c.to_dict())
+                for c in candidates_by_name.get(corp_name, [])
+            ],
+        ))
+
+    return CorpCodeBatchResponse(
+        results=results,
+        found_count=sum(1 for r in results if r.found),
+        total=len(results),
     )
 
 
@@ -3,8 +3,8 @@ Documents API Endpoints
 PRD 16.3 기준 - 문서 관리 및 추출된 Facts 조회
 """
 
-import base64
 import hashlib
+import logging
 import os
 import time
 from datetime import datetime, UTC
@@ -12,7 +12,8 @@ from pathlib import Path
 from uuid import UUID, uuid4
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -36,6 +37,10 @@ from app.schemas.document import (
 DOCUMENT_STORAGE_PATH = Path(os.getenv("DOCUMENT_STORAGE_PATH", "./data/documents"))
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".pdf", ".tiff", ".tif"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_STREAMING_FILE_SIZE = 200 * 1024 * 1024  # 200MB (large scanned filings)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -104,12 +109,19 @@ async def get_document_status(
     )
     facts_count = facts_result.scalar() or 0
 
+    # Count extracted pages (streaming ingest records one row per page)
+    pages_result = await db.execute(
+        select(func.count()).select_from(DocumentPage).where(DocumentPage.doc_id == doc_id)
+    )
+    pages_processed = pages_result.scalar() or 0
+
     return DocumentStatusResponse(
         doc_id=document.doc_id,
         corp_id=document.corp_id,
         doc_type=document.doc_type,
         ingest_status=document.ingest_status,
         page_count=document.page_count,
+        pages_processed=pages_processed,
         facts_count=facts_count,
         last_ingested_at=document.last_ingested_at,
     )
@@ -262,9 +274,41 @@ def _ensure_storage_directory(corp_id: str) -> Path:
     return corp_dir
 
 
-def _compute_file_hash(content: bytes) -> str:
-    """Compute SHA256 hash of file content"""
-    return hashlib.sha256(content).hexdigest()
+async def _stream_upload_to_disk(
+    file: UploadFile,
+    file_path: Path,
+    max_size: int = MAX_FILE_SIZE,
+) -> tuple[str, int]:
+    """
+    Write upload chunks to disk while computing SHA256 incrementally.
+
+    The upload is never held in memory as a whole. Data is written to a
+    ".part" file and atomically renamed once complete.
+
+    Returns:
+        tuple: (file_hash, file_size)
+    """
+    sha256_hash = hashlib.sha256()
+    file_size = 0
+    part_path = file_path.with_name(file_path.name + ".part")
+
+    try:
+        with open(part_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"File too large. Maximum size: {max_size / 1024 / 1024}MB",
+                    )
+                sha256_hash.update(chunk)
+                await run_in_threadpool(f.write, chunk)
+        os.replace(part_path, file_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    return sha256_hash.hexdigest(), file_size
 
 
 def _validate_file(file: UploadFile) -> None:
@@ -305,18 +349,17 @@ async def upload_document(
     # Validate file
     _validate_file(file)
 
-    # Read file content
-    content = await file.read()
+    # Ensure storage directory
+    corp_dir = _ensure_storage_directory(corp_id)
 
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB",
-        )
+    # Generate filename
+    ext = Path(file.filename).suffix.lower() if file.filename else ".jpg"
+    doc_id = uuid4()
+    filename = f"{doc_type.value}_{doc_id.hex[:8]}{ext}"
+    file_path = corp_dir / filename
 
-    # Compute file hash
-    file_hash = _compute_file_hash(content)
+    # Stream file to disk (size check + hash computed incrementally)
+    file_hash, file_size = await _stream_upload_to_disk(file, file_path)
 
     # Check for duplicate (same corp_id, doc_type, file_hash)
     existing = await db.execute(
@@ -327,24 +370,12 @@ async def upload_document(
         )
     )
     if existing.scalar_one_or_none():
+        file_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Document with same content already exists for this corporation",
         )
 
-    # Ensure storage directory
-    corp_dir = _ensure_storage_directory(corp_id)
-
-    # Generate filename
-    ext = Path(file.filename).suffix.lower() if file.filename else ".jpg"
-    doc_id = uuid4()
-    filename = f"{doc_type.value}_{doc_id.hex[:8]}{ext}"
-    file_path = corp_dir / filename
-
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(content)
-
     # Create document record
     document = Document(
         doc_id=doc_id,
@@ -367,7 +398,7 @@ async def upload_document(
         corp_id=document.corp_id,
         doc_type=document.doc_type,
         file_name=filename,
-        file_size=len(content),
+        file_size=file_size,
         storage_path=str(file_path),
         ingest_status=document.ingest_status,
         message=f"Document uploaded successfully. Run analysis job to extract facts.",
@@ -399,19 +430,6 @@ async def upload_and_process_document(
     # Validate file
     _validate_file(file)
 
-    # Read file content
-    content = await file.read()
-
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB",
-        )
-
-    # Compute file hash
-    file_hash = _compute_file_hash(content)
-
     # Ensure storage directory
     corp_dir = _ensure_storage_directory(corp_id)
 
@@ -421,9 +439,8 @@ async def upload_and_process_document(
     filename = f"{doc_type.value}_{doc_id.hex[:8]}{ext}"
     file_path = corp_dir / filename
 
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(content)
+    # Stream file to disk (size check + hash computed incrementally)
+    file_hash, file_size = await _stream_upload_to_disk(file, file_path)
 
     # Create document record
     document = Document(
@@ -452,14 +469,11 @@ async def upload_and_process_document(
 
         pipeline = DocIngestPipeline()
 
-        # Convert to base64 for Vision LLM
-        image_base64 = base64.b64encode(content).decode("utf-8")
-
-        # Process single document
+        # Process single document from the stored file
         result = pipeline.process_single_document(
             corp_id=corp_id,
             doc_type=doc_type.value,
-            image_base64=image_base64,
+            pdf_path=str(file_path),
         )
 
         facts_extracted = len(result.get("facts", []))
@@ -569,6 +583,122 @@ async def upload_and_process_document(
         )
 
 
+def _dispatch_streaming_ingest(document: Document) -> Optional[str]:
+    """Celery로 페이지 단위 처리 요청 (Returns: 실패 시 오류 메시지)"""
+    try:
+        from app.worker.job_scheduler import INTERACTIVE_QUEUE
+        from app.worker.tasks.document_ingest import ingest_uploaded_document
+
+        task = ingest_uploaded_document.apply_async(
+            args=[str(document.doc_id), document.storage_path, document.file_hash],
+            queue=INTERACTIVE_QUEUE,
+        )
+        logger.info(f"Streaming ingest dispatched: task_id={task.id}, doc_id={document.doc_id}")
+        return None
+    except Exception as e:
+        logger.error(f"Streaming ingest dispatch failed for document {document.doc_id}: {e}")
+        return str(e)
+
+
+@router.post(
+    "/upload-stream",
+    response_model=DocumentUploadResponse,
+    summary="문서 스트리밍 업로드 및 백그라운드 처리",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def upload_and_process_document_streaming(
+    corp_id: str = Form(..., description="기업 ID"),
+    doc_type: DocType = Form(..., description="문서 타입"),
+    file: UploadFile = File(..., description="문서 파일 (pdf)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    대용량 PDF를 스트리밍 방식으로 업로드하고 워커(Celery)에서 페이지 단위로 처리합니다.
+
+    - **corp_id**: 기업 ID (필수)
+    - **doc_type**: 문서 타입 (BIZ_REG, REGISTRY, SHAREHOLDERS, AOI, FIN_STATEMENT)
+    - **file**: PDF 파일 (최대 200MB)
+
+    업로드는 청크 단위로 디스크에 기록되며 SHA256은 업로드 중에 계산됩니다.
+    응답은 업로드 완료 즉시 반환되고, 진행 상황은 GET /documents/{doc_id}/status 의
+    page_count / pages_processed / facts_count 로 확인합니다.
+    같은 기업/문서 타입에 동일한 파일(SHA256)이 이미 있으면 409를 반환합니다.
+    """
+    _validate_file(file)
+    if not file.filename or Path(file.filename).suffix.lower() != ".pdf":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Streaming upload supports PDF files only",
+        )
+
+    corp_dir = _ensure_storage_directory(corp_id)
+
+    doc_id = uuid4()
+    filename = f"{doc_type.value}_{doc_id.hex[:8]}.pdf"
+    file_path = corp_dir / filename
+
+    file_hash, file_size = await _stream_upload_to_disk(
+        file, file_path, max_size=MAX_STREAMING_FILE_SIZE
+    )
+
+    # Check for duplicate (same corp_id, doc_type, file_hash)
+    existing = await db.execute(
+        select(Document).where(
+            Document.corp_id == corp_id,
+            Document.doc_type == doc_type,
+            Document.file_hash == file_hash,
+        )
+    )
+    if existing.scalar_one_or_none():
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Document with same content already exists for this corporation",
+        )
+
+    document = Document(
+        doc_id=doc_id,
+        corp_id=corp_id,
+        doc_type=doc_type,
+        storage_provider="FILESYS",
+        storage_path=str(file_path),
+        file_hash=file_hash,
+        captured_at=datetime.now(UTC),
+        ingest_status=IngestStatus.PENDING,
+        created_at=datetime.now(UTC),
+    )
+    db.add(document)
+    await db.commit()
+    await db.refresh(document)
+
+    # 업로드 중 계산한 해시는 워커가 추출 엔진에 등록 (파일을 다시 해시하지 않음)
+    dispatch_error = _dispatch_streaming_ingest(document)
+    if dispatch_error:
+        document.ingest_status = IngestStatus.FAILED
+        await db.commit()
+        return DocumentUploadResponse(
+            doc_id=document.doc_id,
+            corp_id=document.corp_id,
+            doc_type=document.doc_type,
+            file_name=filename,
+            file_size=file_size,
+            storage_path=str(file_path),
+            ingest_status=document.ingest_status,
+            message=f"Document uploaded but processing could not be queued (worker unavailable): {dispatch_error[:200]}",
+        )
+
+    return DocumentUploadResponse(
+        doc_id=document.doc_id,
+        corp_id=document.corp_id,
+        doc_type=document.doc_type,
+        file_name=filename,
+        file_size=file_size,
+        storage_path=str(file_path),
+        ingest_status=document.ingest_status,
+        message=f"Document uploaded. Processing in background - poll /documents/{document.doc_id}/status for progress.",
+    )
+
+
 @router.delete(
     "/{doc_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -4,16 +4,36 @@ rKYC Jobs API Endpoints
 """
 
 import logging
+from datetime import datetime, UTC
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from typing import Optional
 
 from app.core.database import get_db
+from app.services.job_events import (
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    corp_channel,
+    event_from_job,
+    event_stream,
+    get_job_event_subscriber,
+    job_channel,
+    load_corp_job_states,
+    load_job_states,
+)
+from app.services.pagination import (
+    CountMode,
+    InvalidCursor,
+    apply_keyset,
+    count_rows,
+    split_page,
+)
 
 logger = logging.getLogger(__name__)
-from app.models.job import Job, JobType, JobStatus
+from app.models.job import Job, JobType, JobStatus, QueueReason
 from app.models.corporation import Corporation
 from app.schemas.job import (
     JobTriggerRequest,
@@ -44,6 +64,7 @@ def job_to_response(job: Job) -> JobStatusResponse:
         queued_at=job.queued_at,
         started_at=job.started_at,
         finished_at=job.finished_at,
+        queue_reason=job.queue_reason,
     )
 
 
@@ -77,6 +98,7 @@ async def trigger_analyze_job(
         job_type=JobType.ANALYZE,
         corp_id=request.corp_id,
         status=JobStatus.QUEUED,
+        queue_reason=QueueReason.MANUAL.value,
     )
 
     db.add(new_job)
@@ -87,8 +109,13 @@ async def trigger_analyze_job(
     celery_dispatch_failed = False
     celery_error_message = None
     try:
+        from app.worker.job_scheduler import INTERACTIVE_QUEUE
         from app.worker.tasks.analysis import run_analysis_pipeline
-        task = run_analysis_pipeline.delay(str(new_job.job_id), request.corp_id)
+        # 사용자 요청은 high 큐 → 정기 분석(low)보다 먼저 실행
+        task = run_analysis_pipeline.apply_async(
+            args=[str(new_job.job_id), request.corp_id],
+            queue=INTERACTIVE_QUEUE,
+        )
         # Task ID는 로깅용 (Celery 결과 추적에 사용)
         logger.info(f"Celery task dispatched: task_id={task.id}, job_id={new_job.job_id}")
     except Exception as e:
@@ -138,7 +165,57 @@ async def get_job_status(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return job_to_response(job)
+    # Worker는 진행률을 checkpoint 주기로만 DB에 기록 → Redis 마지막 이벤트로 보정
+    response = job_to_response(job)
+    event = await get_job_event_subscriber().overlay(event_from_job(job))
+    response.status = event["status"]
+    response.progress = JobProgress(step=event["step"], percent=event["percent"] or 0)
+    return response
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: UUID, request: Request):
+    """
+    작업 진행 SSE 스트림 (GET /jobs/{job_id} 폴링 대체)
+
+    event: progress, data: {job_id, corp_id, status, step, percent, error_code, error_message, ts}
+    접속 시 현재 상태 1회 → 변경마다 전송 → DONE/FAILED 후 종료
+    """
+    if not await load_job_states(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return StreamingResponse(
+        event_stream(
+            job_channel(job_id),
+            lambda: load_job_states(job_id),
+            request.is_disconnected,
+            get_job_event_subscriber(),
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/corp/{corp_id}/events")
+async def stream_corp_job_events(corp_id: str, request: Request):
+    """
+    기업별 작업 진행 SSE 스트림
+
+    접속 시 진행 중 작업들의 현재 상태 → 이후 해당 기업의 모든 작업 이벤트 (새 작업 포함)
+    작업이 끝나도 연결 유지 (최대 JOB_EVENTS_MAX_STREAM_SECONDS 후 클라이언트 재접속)
+    """
+    since = datetime.now(UTC)
+    return StreamingResponse(
+        event_stream(
+            corp_channel(corp_id),
+            lambda: load_corp_job_states(corp_id, since),
+            request.is_disconnected,
+            get_job_event_subscriber(),
+            stop_on_terminal=False,
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
 
 
 @router.get("", response_model=JobListResponse)
@@ -146,10 +223,12 @@ async def list_jobs(
     corp_id: Optional[str] = None,
     status: Optional[str] = None,
     skip: int = 0,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
+    count: CountMode = Query(CountMode.EXACT, description="total 계산 방식 (exact | estimate)"),
     db: AsyncSession = Depends(get_db),
 ):
-    """작업 목록 조회"""
+    """작업 목록 조회 ((queued_at, job_id) keyset cursor)"""
     query = select(Job)
 
     if corp_id:
@@ -162,17 +241,23 @@ async def list_jobs(
             pass  # 잘못된 status 값은 무시
 
     # Count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    total, total_is_estimate = await count_rows(db, query, count, table="rkyc_job", filtered=bool(corp_id or status))
 
     # Fetch
-    query = query.order_by(Job.queued_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+    try:
+        query = apply_keyset(query, Job.queued_at, Job.job_id, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cursor:
+        query = query.offset(skip)
+    result = await db.execute(query.limit(limit + 1))
+    jobs, next_cursor = split_page(result.scalars().all(), limit, lambda job: (job.queued_at, job.job_id))
 
     return JobListResponse(
         total=total,
         items=[job_to_response(job) for job in jobs],
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
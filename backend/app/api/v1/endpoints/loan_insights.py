@@ -14,7 +14,7 @@ from sqlalchemy import text
 from typing import Optional, Tuple
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.schemas.loan_insight import LoanInsightResponse, LoanInsightStanceSchema
 
 router = APIRouter()
@@ -53,7 +53,7 @@ async def check_loan_status(db: AsyncSession, corp_id: str) -> Tuple[bool, Optio
 @router.get("/{corp_id}")
 async def get_loan_insight(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get pre-generated Loan Insight for a corporation.
@@ -141,7 +141,7 @@ async def get_loan_insight(
 @router.get("/{corp_id}/exists")
 async def check_loan_insight_exists(
     corp_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Check if Loan Insight exists for a corporation.
@@ -176,7 +176,7 @@ async def check_loan_insight_exists(
 
 @router.get("/")
 async def get_all_loan_insight_summaries(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get all Loan Insight summaries for Signal Inbox display.
@@ -15,14 +15,24 @@ import uuid
 from datetime import datetime, UTC
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, Form, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from pydantic import BaseModel
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.models.job import Job, JobType, JobStatus
+from app.models.job import Job, JobType, JobStatus, QueueReason
+from app.services.job_events import (
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    event_stream,
+    get_job_event_subscriber,
+    job_channel,
+    load_job_states,
+    make_event,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -295,6 +305,7 @@ async def analyze_new_kyc(
         job_type=JobType.ANALYZE,
         corp_id=None,  # 신규 고객이므로 corp_id 없음
         status=JobStatus.QUEUED,
+        queue_reason=QueueReason.MANUAL.value,
     )
     db.add(new_job)
     await db.commit()
@@ -302,8 +313,9 @@ async def analyze_new_kyc(
 
     # Celery 태스크 실행
     try:
+        from app.worker.job_scheduler import INTERACTIVE_QUEUE
         from app.worker.tasks.new_kyc_analysis import run_new_kyc_pipeline
-        task = run_new_kyc_pipeline.delay(job_id, job_dir, corp_name)
+        task = run_new_kyc_pipeline.apply_async(args=[job_id, job_dir, corp_name], queue=INTERACTIVE_QUEUE)
         logger.info(f"New KYC analysis task dispatched: job_id={job_id}")
     except Exception as e:
         logger.error(f"Celery dispatch failed: {e}")
@@ -379,13 +391,18 @@ async def get_new_kyc_job_status(
             except (json.JSONDecodeError, IOError):
                 pass
 
+    # Worker는 진행률을 checkpoint 주기로만 DB에 기록 → Redis 마지막 이벤트로 보정
+    event = await get_job_event_subscriber().overlay(
+        make_event(job_uuid, row.status, step=row.progress_step, percent=row.progress_percent)
+    )
+
     return NewKycJobStatusResponse(
         job_id=job_id,
-        status=row.status,
+        status=event["status"],
         corp_name=corp_name,
         progress=NewKycJobProgress(
-            step=row.progress_step,
-            percent=row.progress_percent or 0,
+            step=event["step"],
+            percent=event["percent"] or 0,
         ),
         error=NewKycJobError(
             code=row.error_code,
@@ -394,6 +411,34 @@ async def get_new_kyc_job_status(
     )
 
 
+@router.get(
+    "/jobs/{job_id}/events",
+    summary="분석 작업 진행 스트림 (SSE)",
+)
+async def stream_new_kyc_job_events(job_id: str, request: Request):
+    """신규 KYC 분석 진행 SSE 스트림 (GET /jobs/{job_id} 폴링 대체, DONE/FAILED 후 종료)"""
+
+    # UUID 검증 (P0-2)
+    job_uuid = validate_uuid(job_id)
+
+    if not await load_job_states(job_uuid):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+
+    return StreamingResponse(
+        event_stream(
+            job_channel(job_uuid),
+            lambda: load_job_states(job_uuid),
+            request.is_disconnected,
+            get_job_event_subscriber(),
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get(
     "/report/{job_id}",
     response_model=NewKycReportResponse,
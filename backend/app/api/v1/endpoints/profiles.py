@@ -17,6 +17,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.services.query_fanout import SubQuery, get_query_fanout
 from app.schemas.profile import (
     CorpProfileResponse,
     CorpProfileDetailResponse,
@@ -519,7 +520,7 @@ async def refresh_corp_profile(
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger profile refresh by creating an analysis job."""
-    from app.models.job import Job, JobType, JobStatus
+    from app.models.job import Job, JobType, JobStatus, QueueReason
 
     # Verify corporation exists
     corp_query = text("SELECT corp_id FROM corp WHERE corp_id = :corp_id")
@@ -545,6 +546,7 @@ async def refresh_corp_profile(
         job_type=JobType.ANALYZE,
         corp_id=corp_id,
         status=JobStatus.QUEUED,
+        queue_reason=QueueReason.MANUAL.value,
     )
     db.add(new_job)
     await db.commit()
@@ -554,9 +556,14 @@ async def refresh_corp_profile(
     celery_dispatch_failed = False
     celery_error_message = None
     try:
+        from app.worker.job_scheduler import INTERACTIVE_QUEUE
         from app.worker.tasks.analysis import run_analysis_pipeline
         # force=True일 때 skip_cache=True로 전달하여 캐시 무시
-        task = run_analysis_pipeline.delay(str(new_job.job_id), corp_id, skip_cache=request.force)
+        task = run_analysis_pipeline.apply_async(
+            args=[str(new_job.job_id), corp_id],
+            kwargs={"skip_cache": request.force},
+            queue=INTERACTIVE_QUEUE,
+        )
         logger.info(f"Profile refresh: Celery task dispatched for job_id={new_job.job_id}, corp_id={corp_id}, skip_cache={request.force}")
     except Exception as e:
         celery_dispatch_failed = True
@@ -621,8 +628,23 @@ async def get_profile_query_selection(
         LIMIT 1
     """)
 
-    result = await db.execute(query, {"corp_id": corp_id})
-    row = result.fetchone()
+    # Get industry_code from corp table
+    corp_query = text("SELECT industry_code FROM corp WHERE corp_id = :corp_id")
+
+    async def fetch_profile(session):
+        return (await session.execute(query, {"corp_id": corp_id})).fetchone()
+
+    async def fetch_industry_code(session):
+        corp_row = (await session.execute(corp_query, {"corp_id": corp_id})).fetchone()
+        return corp_row.industry_code if corp_row else ""
+
+    # 프로필 / 업종코드 동시 조회
+    fanout = await get_query_fanout().run(db, [
+        SubQuery("profile", fetch_profile, required=True),
+        SubQuery("industry_code", fetch_industry_code, default=""),
+    ])
+    row = fanout["profile"]
+    industry_code = fanout["industry_code"]
 
     if not row:
         raise HTTPException(
@@ -630,12 +652,6 @@ async def get_profile_query_selection(
             detail=f"Profile not found for corp_id: {corp_id}",
         )
 
-    # Get industry_code from corp table
-    corp_query = text("SELECT industry_code FROM corp WHERE corp_id = :corp_id")
-    corp_result = await db.execute(corp_query, {"corp_id": corp_id})
-    corp_row = corp_result.fetchone()
-    industry_code = corp_row.industry_code if corp_row else ""
-
     # Build profile dict
     profile = {
         "export_ratio_pct": row.export_ratio_pct,
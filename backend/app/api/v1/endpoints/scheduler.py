@@ -3,11 +3,12 @@ Scheduler Control API Endpoints
 Real-time control of automated signal detection for demo purposes
 """
 
+import asyncio
 from enum import Enum
 from typing import Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from app.worker.tasks.dynamic_scheduler import get_scheduler, SchedulerStatus
@@ -58,6 +59,29 @@ class SchedulerActionResponse(BaseModel):
     corporations_count: Optional[int] = Field(None, description="Number of corporations")
 
 
+class PlanCandidate(BaseModel):
+    corp_id: str
+    score: float = Field(..., description="Risk score (HIGH/MED signals, overdue, internal grade, staleness)")
+    reason: str = Field(..., description="Queue reason (NO_PRIOR_RUN, INPUT_CHANGED, FRESHNESS_EXPIRED, ...)")
+    high_risk: bool = Field(..., description="Uses the high-risk freshness SLA")
+    selected: bool = Field(..., description="Within the current admission window")
+
+
+class SchedulerPlanResponse(BaseModel):
+    generated_at: str
+    worker_slots: int = Field(..., description="Worker pool slots (celery inspect, or configured fallback)")
+    running: int = Field(..., description="RUNNING jobs")
+    queue_depths: dict[str, int] = Field(..., description="Waiting messages per broker queue")
+    queue_depth_source: str = Field(..., description="broker (Redis LLEN) or database (QUEUED jobs)")
+    admission_window: int = Field(..., description="Background jobs the next tick may admit")
+    interactive_waiting: int = Field(..., description="User-triggered jobs waiting (blocks background admission)")
+    candidates: int = Field(..., description="Corporations due for analysis (inputs changed or SLA expired)")
+    deferred: int = Field(..., description="Candidates outside the window (picked up by later ticks)")
+    skipped_unchanged: int = Field(..., description="Corporations skipped by the input-change gate")
+    admitted: int = Field(0, description="Jobs created (always 0 for a preview)")
+    top_candidates: list[PlanCandidate]
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -191,3 +215,28 @@ async def trigger_immediate_scan():
     result = scheduler.trigger_now()
 
     return result
+
+
+@router.get(
+    "/plan",
+    response_model=SchedulerPlanResponse,
+    summary="Get analysis admission plan",
+    description="Preview which corporations the next scheduler tick would queue, and why"
+)
+async def get_scheduler_plan(limit: int = Query(20, ge=1, le=200, description="Number of top candidates")):
+    """
+    Dry-run of the background analysis scheduler (app.worker.job_scheduler).
+
+    - Candidates: corporations whose inputs changed or whose freshness SLA expired,
+      ranked by risk score
+    - Admission window: worker slots x (1 + backlog per slot) - running - queued background,
+      0 while user-triggered jobs are waiting
+    """
+    from app.worker.job_scheduler import get_job_scheduler
+
+    try:
+        plan = await asyncio.to_thread(get_job_scheduler().preview)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Scheduler plan unavailable: {e}")
+
+    return SchedulerPlanResponse(**plan.to_dict(limit))
@@ -20,9 +20,17 @@ from uuid import UUID
 from datetime import datetime, UTC
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import select, text
 from sqlalchemy.orm import selectinload
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.services.dashboard_summary import get_dashboard_summary_service
+from app.services.pagination import (
+    CountMode,
+    InvalidCursor,
+    apply_keyset,
+    count_rows,
+    split_page,
+)
 from app.models.signal import (
     SignalIndex,
     Signal,
@@ -57,7 +65,9 @@ async def list_signals(
     industry_code: Optional[str] = Query(None, description="업종코드 필터"),
     limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    count: CountMode = Query(CountMode.EXACT, description="total 계산 방식 (exact | estimate)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     시그널 목록 조회 (Dashboard용)
@@ -65,6 +75,8 @@ async def list_signals(
     Migration v11 변경:
     - 항상 Signal 테이블과 JOIN하여 상태 정보 조회
     - signal_index는 immutable, 상태는 signal에서만 관리
+
+    페이지네이션: (detected_at, signal_id) keyset cursor 권장 - offset은 하위 호환용
     """
 
     # 항상 JOIN으로 상태 정보 조회 (v11: signal_index에서 상태 필드 제거)
@@ -103,14 +115,18 @@ async def list_signals(
         query = query.where(Signal.signal_status == signal_status)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    filtered = any([signal_type, event_type, impact_direction, impact_strength, corp_id, industry_code, signal_status])
+    total, total_is_estimate = await count_rows(db, query, count, table="rkyc_signal_index", filtered=filtered)
 
-    # Get items with pagination (sorted by detected_at DESC)
-    query = query.limit(limit).offset(offset).order_by(SignalIndex.detected_at.desc())
-    result = await db.execute(query)
-    rows = result.all()
+    # Get items with pagination (sorted by detected_at DESC, signal_id DESC)
+    try:
+        query = apply_keyset(query, SignalIndex.detected_at, SignalIndex.signal_id, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cursor:
+        query = query.offset(offset)
+    result = await db.execute(query.limit(limit + 1))
+    rows, next_cursor = split_page(result.all(), limit, lambda row: (row[0].detected_at, row[0].signal_id))
 
     # 결과 변환: SignalIndex + Signal 상태 정보 병합
     items = []
@@ -139,13 +155,18 @@ async def list_signals(
             dismiss_reason=row[4],
         ))
 
-    return SignalListResponse(total=total, items=items)
+    return SignalListResponse(
+        total=total,
+        items=items,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
 
 
 @router.get("/{signal_id}", response_model=SignalIndexResponse)
 async def get_signal(
     signal_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     시그널 기본 조회
@@ -197,7 +218,7 @@ async def get_signal(
 @router.get("/{signal_id}/detail", response_model=SignalDetailResponse)
 async def get_signal_detail(
     signal_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     시그널 상세 조회 (Evidence 포함)
@@ -324,6 +345,11 @@ async def update_signal_status(
             detail=f"Failed to update signal status: {str(e)[:200]}"
         )
 
+    # 카운터/보고서 스냅샷 version은 트리거가 갱신 - 이 프로세스의 요약 캐시만 비움
+    get_dashboard_summary_service().invalidate()
+    from app.worker.tasks.report_snapshot import schedule_report_rebuild
+    schedule_report_rebuild(signal.corp_id)
+
     return {"message": "Status updated", "status": status_value}
 
 
@@ -375,4 +401,8 @@ async def dismiss_signal(
             detail=f"Failed to dismiss signal: {str(e)[:200]}"
         )
 
+    get_dashboard_summary_service().invalidate()
+    from app.worker.tasks.report_snapshot import schedule_report_rebuild
+    schedule_report_rebuild(signal.corp_id)
+
     return {"message": "Signal dismissed", "reason": dismiss_request.reason}
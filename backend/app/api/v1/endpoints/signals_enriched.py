@@ -19,7 +19,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, text, and_, or_
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.services.query_fanout import SubQuery, get_query_fanout
 from app.models.signal import (
     SignalIndex,
     Signal,
@@ -71,7 +72,7 @@ async def get_signal_enriched_detail(
     include_verifications: bool = Query(True, description="검증 결과 포함"),
     include_impact: bool = Query(True, description="영향도 분석 포함"),
     include_related: bool = Query(True, description="관련 시그널 포함"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     풍부한 시그널 상세 조회
@@ -92,68 +93,40 @@ async def get_signal_enriched_detail(
 
     signal_index, signal = row
 
-    # 2. Evidence 조회 (확장된 정보 포함)
-    evidence_query = select(Evidence).where(Evidence.signal_id == signal_id).order_by(Evidence.created_at.desc())
-    evidence_result = await db.execute(evidence_query)
-    evidences_raw = evidence_result.scalars().all()
-
-    # Evidence 변환 (소스 신뢰도 추가)
-    evidences = []
-    for e in evidences_raw:
-        # URL에서 도메인 추출
-        source_domain = None
-        if e.ref_type == "URL" and e.ref_value:
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(e.ref_value)
-                source_domain = parsed.netloc
-            except:
-                pass
-
-        # 소스 신뢰도 결정
-        credibility = _determine_source_credibility(e.ref_value, source_domain)
-
-        evidences.append(EnrichedEvidenceResponse(
-            evidence_id=e.evidence_id,
-            signal_id=e.signal_id,
-            evidence_type=e.evidence_type,
-            ref_type=e.ref_type,
-            ref_value=e.ref_value,
-            snippet=e.snippet,
-            meta=e.meta,
-            created_at=e.created_at,
-            source_credibility=credibility,
-            verification_status="VERIFIED" if credibility in [SourceCredibility.OFFICIAL, SourceCredibility.MAJOR_MEDIA] else "UNVERIFIED",
-            source_domain=source_domain,
-            is_primary_source=e.evidence_type == "INTERNAL_FIELD" or credibility == SourceCredibility.OFFICIAL,
+    # 2. 독립 하위 조회 동시 실행 (evidence, 기업 컨텍스트, 유사 케이스, 관련 시그널, 인사이트)
+    #    선택 항목은 실패/timeout 시 빈 값으로 응답 (부분 결과)
+    corp_id = signal_index.corp_id
+    subqueries = [
+        SubQuery("evidences", lambda s: _get_enriched_evidences(s, signal_id), required=True),
+        SubQuery("corp_context", lambda s: _get_corp_context(s, corp_id)),
+        SubQuery("insight_excerpt", lambda s: _get_insight_excerpt(s, corp_id, signal_index.event_type)),
+    ]
+    if include_similar_cases:
+        subqueries.append(SubQuery(
+            "similar_cases", lambda s: _get_similar_cases(s, signal_id, signal_index), default=list,
         ))
+    if include_related:
+        subqueries.append(SubQuery(
+            "related_signals", lambda s: _get_related_signals(s, signal_id, signal_index), default=list,
+        ))
+    fanout = await get_query_fanout().run(db, subqueries)
 
-    # 3. 기업 컨텍스트 조회 (Corp Profile)
-    corp_context = await _get_corp_context(db, signal_index.corp_id)
-
-    # 4. 유사 과거 케이스 조회
-    similar_cases = []
-    if include_similar_cases:
-        similar_cases = await _get_similar_cases(db, signal_id, signal_index)
+    evidences = fanout["evidences"]
+    corp_context = fanout["corp_context"]
+    similar_cases = fanout.values.get("similar_cases", [])
+    related_signals = fanout.values.get("related_signals", [])
+    insight_excerpt = fanout["insight_excerpt"]
 
-    # 5. 검증 결과 조회
+    # 3. 검증 결과 (Evidence 기반, DB 조회 없음)
     verifications = []
     if include_verifications:
         verifications = await _get_verifications(db, signal_id, evidences)
 
-    # 6. 영향도 분석 조회
+    # 4. 영향도 분석 (DB 조회 없음)
     impact_analysis = []
     if include_impact:
         impact_analysis = await _get_impact_analysis(db, signal_id, signal_index, corp_context)
 
-    # 7. 관련 시그널 조회
-    related_signals = []
-    if include_related:
-        related_signals = await _get_related_signals(db, signal_id, signal_index)
-
-    # 8. 인사이트 발췌 조회
-    insight_excerpt = await _get_insight_excerpt(db, signal_index.corp_id, signal_index.event_type)
-
     # 응답 구성
     return SignalEnrichedDetailResponse(
         signal_id=signal_index.signal_id,
@@ -191,7 +164,7 @@ async def get_signal_similar_cases(
     signal_id: UUID,
     limit: int = Query(5, ge=1, le=20),
     min_similarity: float = Query(0.6, ge=0, le=1),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """유사 과거 케이스 조회"""
     # 시그널 존재 확인
@@ -210,7 +183,7 @@ async def get_related_signals(
     signal_id: UUID,
     relation_types: Optional[List[str]] = Query(None, description="관계 유형 필터"),
     limit: int = Query(10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """관련 시그널 조회"""
     signal_query = select(SignalIndex).where(SignalIndex.signal_id == signal_id)
@@ -259,6 +232,46 @@ def _determine_source_credibility(ref_value: str, domain: str) -> SourceCredibil
     return SourceCredibility.UNKNOWN
 
 
+async def _get_enriched_evidences(db: AsyncSession, signal_id: UUID) -> List[EnrichedEvidenceResponse]:
+    """Evidence 조회 (소스 신뢰도/검증 상태 포함)"""
+    evidence_query = select(Evidence).where(Evidence.signal_id == signal_id).order_by(Evidence.created_at.desc())
+    evidence_result = await db.execute(evidence_query)
+    evidences_raw = evidence_result.scalars().all()
+
+    # Evidence 변환 (소스 신뢰도 추가)
+    evidences = []
+    for e in evidences_raw:
+        # URL에서 도메인 추출
+        source_domain = None
+        if e.ref_type == "URL" and e.ref_value:
+            try:
+                from urllib.parse import urlparse
+                parsed = urlparse(e.ref_value)
+                source_domain = parsed.netloc
+            except:
+                pass
+
+        # 소스 신뢰도 결정
+        credibility = _determine_source_credibility(e.ref_value, source_domain)
+
+        evidences.append(EnrichedEvidenceResponse(
+            evidence_id=e.evidence_id,
+            signal_id=e.signal_id,
+            evidence_type=e.evidence_type,
+            ref_type=e.ref_type,
+            ref_value=e.ref_value,
+            snippet=e.snippet,
+            meta=e.meta,
+            created_at=e.created_at,
+            source_credibility=credibility,
+            verification_status="VERIFIED" if credibility in [SourceCredibility.OFFICIAL, SourceCredibility.MAJOR_MEDIA] else "UNVERIFIED",
+            source_domain=source_domain,
+            is_primary_source=e.evidence_type == "INTERNAL_FIELD" or credibility == SourceCredibility.OFFICIAL,
+        ))
+
+    return evidences
+
+
 async def _get_corp_context(db: AsyncSession, corp_id: str) -> Optional[CorpContextResponse]:
     """기업 컨텍스트 조회"""
     # Corp 테이블 + Profile 테이블 조회
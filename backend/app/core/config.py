@@ -3,6 +3,8 @@ rKYC Application Configuration
 Pydantic Settings for environment variable management
 """
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -28,6 +30,13 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 5
     DB_ECHO: bool = False
+    # Read replica (선택) - 조회 API는 get_read_db로 replica 사용, 미설정/지연/장애 시 primary
+    DATABASE_READ_URL: Optional[str] = Field(default=None, description="Read replica connection string")
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 5
+    DB_READ_MAX_LAG_SECONDS: float = Field(default=5.0, description="허용 replica 지연 (초과 시 primary에서 조회)")
+    DB_READ_LAG_CHECK_SECONDS: float = Field(default=5.0, description="replica 지연 확인 주기 (초)")
+    DB_READ_YOUR_WRITES_SECONDS: int = Field(default=30, description="변경 요청 후 같은 클라이언트의 조회를 primary로 보내는 시간 (초)")
 
     # Supabase API
     SUPABASE_URL: str = Field(..., description="Supabase project URL")
@@ -120,6 +129,47 @@ class Settings(BaseSettings):
     # Document Storage
     DOCUMENT_STORAGE_PATH: str = Field(default="./data/documents", description="Path for document storage")
 
+    # Document Extraction Engine (PDF page extraction + page cache)
+    DOC_EXTRACTION_MAX_WORKERS: int = Field(default=0, description="Process pool size for PDF extraction (0 = min(4, cpu_count))")
+    DOC_EXTRACTION_PARALLEL_MIN_PAGES: int = Field(default=20, description="Minimum pages to use the process pool")
+    DOC_EXTRACTION_CACHE_MAX_PAGES: int = Field(default=2000, description="Max cached pages per worker process")
+
+    # Worker Async Runtime (per-process event loop + pooled httpx.AsyncClient)
+    ASYNC_HTTP_MAX_CONNECTIONS: int = Field(default=20, description="Max connections in shared AsyncClient pool")
+    ASYNC_HTTP_MAX_KEEPALIVE: int = Field(default=10, description="Max keep-alive connections in shared AsyncClient pool")
+
+    # External Search (Perplexity 3-Track)
+    EXTERNAL_SEARCH_ENV_MAX_CONCURRENCY: int = Field(default=3, description="Max concurrent ENVIRONMENT queries per job")
+    EXTERNAL_SEARCH_QUERY_TIMEOUT: float = Field(default=30.0, description="Per-query timeout seconds for ENVIRONMENT queries")
+    EXTERNAL_SEARCH_TOTAL_TIMEOUT: float = Field(default=60.0, description="Overall timeout seconds for 3-Track search")
+    # 기업 간 공유 검색 캐시 (INDUSTRY / ENVIRONMENT - 업종/주제 단위)
+    EXTERNAL_SEARCH_CACHE_ENABLED: bool = Field(default=True, description="Share INDUSTRY/ENVIRONMENT search results across corporations")
+    EXTERNAL_SEARCH_CACHE_TTL: int = Field(default=21600, description="Freshness window for shared search results (6 hours)")
+    EXTERNAL_SEARCH_CACHE_EMPTY_TTL: int = Field(default=600, description="TTL for empty search results (10 minutes)")
+    EXTERNAL_SEARCH_CACHE_LOCK_TTL: int = Field(default=90, description="Single-flight fill lock TTL seconds")
+
+    # Gemini Fact-Checker (결과 캐시 + 주장 배치)
+    FACT_CHECK_BATCH_SIZE: int = Field(default=5, description="Claims verified per grounded Gemini call (1 = single mode)")
+    FACT_CHECK_CACHE_ENABLED: bool = Field(default=True, description="Cache fact-check verdicts by normalized claim hash")
+    FACT_CHECK_CACHE_TTL_DECISIVE: int = Field(default=604800, description="TTL for VERIFIED/FALSE verdicts (7 days)")
+    FACT_CHECK_CACHE_TTL_PARTIAL: int = Field(default=86400, description="TTL for PARTIALLY_VERIFIED verdicts (1 day)")
+    FACT_CHECK_CACHE_TTL_UNVERIFIED: int = Field(default=3600, description="TTL for UNVERIFIED verdicts (1 hour)")
+
+    # Industry Knowledge Store (업종명/키워드/힌트: Memory → Redis → DB)
+    INDUSTRY_KNOWLEDGE_DB_ENABLED: bool = Field(default=True, description="Persist industry knowledge in rkyc_industry_knowledge")
+    INDUSTRY_KNOWLEDGE_MEMORY_TTL: int = Field(default=300, description="Per-process LRU TTL (bounds cross-process invalidation lag)")
+    INDUSTRY_KNOWLEDGE_REDIS_TTL: int = Field(default=86400, description="Redis tier TTL (1 day)")
+    INDUSTRY_KNOWLEDGE_REFRESH_AFTER: int = Field(default=2592000, description="Regenerate LLM hints older than this (30 days)")
+
+    # Corp Profile Phase Cache (단계별 산출물 재사용, 만료 단계만 재실행)
+    PROFILE_PHASE_CACHE_ENABLED: bool = Field(default=True, description="Reuse unexpired profiling phases on refresh")
+    PROFILE_PHASE_TTL_PHASE1: int = Field(default=604800, description="Basic info / financials search TTL (7 days)")
+    PROFILE_PHASE_TTL_PHASE2: int = Field(default=2592000, description="Overseas business search TTL (30 days)")
+    PROFILE_PHASE_TTL_PHASE3: int = Field(default=2592000, description="Supply chain / customers search TTL (30 days)")
+    PROFILE_PHASE_TTL_SUMMARY: int = Field(default=2592000, description="Phase summary TTL (keyed by search content hash)")
+    PROFILE_PHASE_TTL_GEMINI: int = Field(default=604800, description="Gemini grounding search TTL (7 days)")
+    PROFILE_PHASE_TTL_CONSENSUS: int = Field(default=2592000, description="Synthesis result TTL (keyed by synthesis prompt hash)")
+
     # LLM Providers (Legacy - used by both External/Internal in MVP)
     ANTHROPIC_API_KEY: str = Field(default="", description="Anthropic API key for Claude")
     OPENAI_API_KEY: str = Field(default="", description="OpenAI API key for GPT-4o fallback")
@@ -180,6 +230,162 @@ class Settings(BaseSettings):
         default=True,
         description="DART 2-Source Verification 활성화 여부"
     )
+    DART_CORP_CODE_STORE_PATH: str = Field(
+        default="",
+        description="DART 고유번호 SQLite 저장소 경로 (worker 간 공유, 미설정 시 임시 디렉토리)"
+    )
+    DART_CORP_CODE_TTL_HOURS: int = Field(
+        default=24,
+        description="DART 고유번호 목록 갱신 주기 (시간)"
+    )
+    DART_RATE_PER_SECOND: float = Field(
+        default=10.0,
+        description="DART API 초당 요청 수 (Redis로 전체 프로세스 공유, Redis 없으면 프로세스당 token bucket)"
+    )
+    DART_DAILY_QUOTA: int = Field(
+        default=20000,
+        description="OpenDART 인증키 일일 요청 한도 (Redis로 프로세스 간 공유)"
+    )
+    DART_MAX_CONNECTIONS: int = Field(
+        default=20,
+        description="DART 공유 AsyncClient 최대 커넥션 수"
+    )
+    DART_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="DART 응답 캐시 활성화 (endpoint별 TTL)"
+    )
+    DART_LOCAL_ENABLED: bool = Field(
+        default=True,
+        description="동기화된 기업의 DART 재무제표/공시를 로컬 테이블에서 조회"
+    )
+    DART_LOCAL_MAX_AGE_HOURS: int = Field(
+        default=48,
+        description="마지막 DART 동기화 후 로컬 조회를 허용하는 시간"
+    )
+    DART_SYNC_CONCURRENCY: int = Field(
+        default=4,
+        description="DART 일괄 동기화 시 동시에 처리하는 기업 수"
+    )
+    DART_SYNC_FINANCIALS_RECHECK_DAYS: int = Field(
+        default=7,
+        description="DART 미제출 사업연도 재무제표 재확인 주기 (일)"
+    )
+
+    # Dashboard summary (migration_v22 카운터 앞단 프로세스 캐시, 0이면 비활성화)
+    DASHBOARD_SUMMARY_CACHE_TTL_SECONDS: float = Field(
+        default=5.0,
+        description="Dashboard 요약 캐시 TTL (초)"
+    )
+
+    # Report snapshot (migration_v23, GET /reports/corporation/{corp_id})
+    REPORT_SNAPSHOT_ENABLED: bool = Field(
+        default=True,
+        description="기업 보고서 스냅샷 저장/제공 (False면 매 요청 조립)"
+    )
+    REPORT_SNAPSHOT_REBUILD_DELAY_SECONDS: int = Field(
+        default=5,
+        description="원천 변경 후 스냅샷 재생성 태스크 지연 (연속 변경을 한 번에 반영)"
+    )
+
+    # Query fan-out (상세 조회 API의 독립 하위 조회를 별도 풀 커넥션에서 동시 실행)
+    QUERY_FANOUT_ENABLED: bool = Field(
+        default=True,
+        description="상세 조회 API 하위 조회 동시 실행 (False면 요청 세션에서 순차 실행)"
+    )
+    QUERY_FANOUT_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="요청당 동시에 사용하는 DB 커넥션 수"
+    )
+    QUERY_FANOUT_MAX_SESSIONS: int = Field(
+        default=0,
+        description="프로세스 전체 하위 조회 동시 커넥션 수 (0이면 (DB_POOL_SIZE + DB_MAX_OVERFLOW) // 3)"
+    )
+    QUERY_FANOUT_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        description="하위 조회별 timeout (초) - 선택 조회는 초과 시 기본값으로 대체"
+    )
+
+    # Job progress events (Redis pub/sub + SSE, LLM_CACHE_REDIS_DB 사용)
+    JOB_EVENTS_ENABLED: bool = Field(
+        default=True,
+        description="작업 진행 이벤트 publish/SSE 구독 (False면 매 단계 DB 기록)"
+    )
+    JOB_PROGRESS_CHECKPOINT_SECONDS: float = Field(
+        default=15.0,
+        description="진행률만 바뀔 때 DB에 기록하는 최소 간격 (초) - 상태 변경/종료는 즉시 기록"
+    )
+    JOB_EVENTS_MAX_STREAM_SECONDS: float = Field(
+        default=1800.0,
+        description="SSE 연결 최대 유지 시간 (초) - 이후 클라이언트 재접속"
+    )
+
+    # Input fingerprint gate (migration_v24, 입력이 바뀐 기업만 정기 재분석)
+    INPUT_FINGERPRINT_ENABLED: bool = Field(
+        default=True,
+        description="정기 스캔 변경 감지 게이트 (False면 모든 기업 Job 생성)"
+    )
+    ANALYSIS_FRESHNESS_HOURS: int = Field(
+        default=72,
+        description="입력이 같아도 재분석하는 주기 (시간) - 전체 스캔/DynamicScheduler"
+    )
+    HIGH_RISK_ANALYSIS_FRESHNESS_HOURS: int = Field(
+        default=24,
+        description="고위험 기업 재분석 주기 (시간) - scan_high_risk_corporations"
+    )
+
+    # Job scheduler (정기 분석 admission window, app.worker.job_scheduler)
+    JOB_SCHEDULER_ENABLED: bool = Field(
+        default=True,
+        description="큐 깊이 기반 admission (False면 tick당 최대 건수까지 바로 생성)"
+    )
+    JOB_SCHEDULER_WORKER_SLOTS: int = Field(
+        default=2,
+        description="워커 슬롯 수 (celery inspect 실패 시 사용)"
+    )
+    JOB_SCHEDULER_BACKLOG_PER_SLOT: int = Field(
+        default=1,
+        description="슬롯당 미리 큐에 넣어두는 정기 분석 수 - 사용자 요청 앞에 놓일 수 있는 최대 건수"
+    )
+    JOB_SCHEDULER_MAX_ADMIT_PER_TICK: int = Field(
+        default=50,
+        description="tick당 최대 생성 Job 수"
+    )
+
+    # Worker database (app.worker.db)
+    WORKER_CONCURRENCY: int = Field(
+        default=2,
+        description="워커 프로세스 수 (celery worker_concurrency, DB 풀 크기 계산에 사용)"
+    )
+    WORKER_DB_MAX_CONNECTIONS: int = Field(
+        default=12,
+        description="워커 노드 전체 DB 커넥션 상한 - 프로세스별 몫 = 상한 / WORKER_CONCURRENCY (sync 풀 + async 풀)"
+    )
+    WORKER_DB_TRANSACTION_POOLER: Optional[bool] = Field(
+        default=None,
+        description="pgbouncer transaction mode 여부 (None이면 포트 6543 = Supabase Transaction Pooler로 판단)"
+    )
+    WORKER_DB_STATEMENT_TIMEOUT_MS: int = Field(
+        default=30000,
+        description="워커 쿼리 statement_timeout (ms)"
+    )
+
+    # Monthly partitions (app.worker.partition_maintenance, migration_v25)
+    PARTITION_MAINTENANCE_ENABLED: bool = Field(
+        default=True,
+        description="월 파티션 생성/보존 기간 적용 (rkyc_job, rkyc_signal_index)"
+    )
+    PARTITION_MONTHS_AHEAD: int = Field(
+        default=3,
+        description="미리 만들어 두는 미래 월 파티션 수"
+    )
+    SIGNAL_INDEX_RETENTION_MONTHS: int = Field(
+        default=0,
+        description="rkyc_signal_index 보존 개월 수 (0 = 무기한, 지난 월 파티션은 분리)"
+    )
+    PARTITION_RETENTION_MODE: str = Field(
+        default="detach",
+        description="보존 기간이 지난 파티션 처리: detach(분리 후 보관) | drop(삭제)"
+    )
 
     # CORS (comma-separated string, parsed in main.py)
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000,https://rkyc.vercel.app"
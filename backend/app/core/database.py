@@ -1,19 +1,39 @@
 """
 rKYC Database Connection
 SQLAlchemy async engine and session management for Supabase PostgreSQL
+
+Read/write 라우팅:
+    get_db       primary (변경 API, 직후 일관성이 필요한 조회)
+    get_read_db  DATABASE_READ_URL replica (대시보드/시그널/기업/여신 조회 등)
+                 아래 경우 primary로 조회:
+                 - replica 미설정, 지연 > DB_READ_MAX_LAG_SECONDS, 지연 확인 실패
+                 - read-your-writes: 변경 요청(POST/PUT/PATCH/DELETE) 성공 후
+                   DB_READ_YOUR_WRITES_SECONDS 동안 같은 클라이언트 (쿠키)
+                 - 요청 헤더 X-Read-Consistency: primary
+                 replica 조회 중 커넥션/복구 충돌 오류 → 세션을 primary로 전환해 같은 조회 재시도
 """
 
+import asyncio
+import logging
 import ssl
-from typing import AsyncGenerator
+import time
+from typing import AsyncGenerator, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
 from sqlalchemy.orm import declarative_base
+from starlette.requests import Request
+from starlette.responses import Response
+
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 def _prepare_database_url(url: str) -> tuple[str, dict]:
     """
@@ -81,6 +101,65 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# replica에서만 실패하고 primary에서는 성공할 수 있는 오류 (커넥션 끊김, 복구 충돌로 취소 등)
+REPLICA_RETRY_ERRORS = (OperationalError, InterfaceError, OSError)
+
+
+class ReplicaReadSession(AsyncSession):
+    """
+    replica 조회 세션 - replica 오류 시 primary로 전환 후 같은 조회 재시도
+
+    조회 전용이므로 재실행해도 안전. 전환 후 이 세션의 나머지 조회도 primary
+    (QueryFanout 하위 세션도 요청 세션의 bind를 따름)
+    """
+
+    async def _read(self, method: str, *args, **kwargs):
+        try:
+            return await getattr(super(), method)(*args, **kwargs)
+        except REPLICA_RETRY_ERRORS as e:
+            if read_engine is None or self.bind is not read_engine:
+                raise
+            get_replica_router().mark_unavailable(e)
+            await self.rollback()
+            self.bind = engine
+            self.sync_session.bind = engine.sync_engine
+            return await getattr(super(), method)(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._read("execute", *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await self._read("scalar", *args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await self._read("scalars", *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await self._read("get", *args, **kwargs)
+
+
+# Read replica engine (선택)
+read_engine = None
+ReadSessionLocal = None
+if settings.DATABASE_READ_URL:
+    _read_database_url, _read_connect_args = _prepare_database_url(settings.DATABASE_READ_URL)
+    read_engine = create_async_engine(
+        _read_database_url,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        echo=settings.DB_ECHO,
+        future=True,
+        connect_args=_read_connect_args,
+    )
+    ReadSessionLocal = async_sessionmaker(
+        read_engine,
+        class_=ReplicaReadSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
 # Declarative base for models
 Base = declarative_base()
 
@@ -101,6 +180,174 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+READ_CONSISTENCY_HEADER = "x-read-consistency"
+READ_PRIMARY_COOKIE = "rkyc_read_primary_until"
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# WAL을 모두 재생했으면 0 (primary가 한동안 쓰기가 없으면 replay timestamp가 오래돼 보이므로)
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END AS lag_seconds
+""")
+
+
+class ReplicaRouter:
+    """replica 지연 확인 (DB_READ_LAG_CHECK_SECONDS마다 1회) + 조회 세션 선택"""
+
+    PROBE_TIMEOUT_SECONDS = 2.0
+
+    def __init__(
+        self,
+        engine=None,
+        max_lag_seconds: Optional[float] = None,
+        check_interval_seconds: Optional[float] = None,
+    ):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds if max_lag_seconds is not None else settings.DB_READ_MAX_LAG_SECONDS
+        self.check_interval_seconds = (
+            check_interval_seconds if check_interval_seconds is not None else settings.DB_READ_LAG_CHECK_SECONDS
+        )
+        self.lag_seconds: Optional[float] = None
+        self._usable = False
+        self._checked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self._stats = {"replica_reads": 0, "primary_reads": 0, "lag_fallbacks": 0, "probe_errors": 0}
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def _probe(self) -> float:
+        async with self.engine.connect() as conn:
+            return float((await conn.execute(REPLICA_LAG_SQL)).scalar() or 0)
+
+    async def is_usable(self) -> bool:
+        """replica 지연이 허용 범위 안인지 (확인 실패 시 다음 주기까지 primary)"""
+        if self.engine is None:
+            return False
+        if time.monotonic() < self._checked_until:
+            return self._usable
+
+        async with self._get_lock():
+            if time.monotonic() < self._checked_until:
+                return self._usable
+            try:
+                self.lag_seconds = await asyncio.wait_for(self._probe(), self.PROBE_TIMEOUT_SECONDS)
+                self._usable = self.lag_seconds <= self.max_lag_seconds
+                if not self._usable:
+                    self._stats["lag_fallbacks"] += 1
+                    logger.warning(f"[ReadReplica] Lag {self.lag_seconds:.1f}s > {self.max_lag_seconds}s, reading from primary")
+            except Exception as e:
+                self._stats["probe_errors"] += 1
+                self.lag_seconds = None
+                self._usable = False
+                logger.warning(f"[ReadReplica] Lag check failed, reading from primary: {e}")
+            self._checked_until = time.monotonic() + self.check_interval_seconds
+            return self._usable
+
+    def mark_unavailable(self, e: Exception) -> None:
+        """조회 중 커넥션 오류 - 다음 확인 주기까지 primary 사용"""
+        logger.warning(f"[ReadReplica] Connection error, reading from primary: {e}")
+        self._usable = False
+        self._checked_until = time.monotonic() + self.check_interval_seconds
+
+    def count(self, replica: bool) -> None:
+        self._stats["replica_reads" if replica else "primary_reads"] += 1
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "configured": self.engine is not None,
+            "usable": self._usable,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+        }
+
+
+def wants_primary(request: Request, now: Optional[float] = None) -> bool:
+    """read-your-writes: 명시 헤더 또는 최근 변경 요청 쿠키"""
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+    until = request.cookies.get(READ_PRIMARY_COOKIE)
+    if until:
+        try:
+            return float(until) > (now if now is not None else time.time())
+        except ValueError:
+            return False
+    return False
+
+
+def mark_read_your_writes(request: Request, response: Response) -> None:
+    """변경 요청 성공 시 이후 조회를 잠시 primary로 (HTTP middleware에서 호출)"""
+    if read_engine is None or request.method not in MUTATING_METHODS or response.status_code >= 400:
+        return
+    ttl = settings.DB_READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        READ_PRIMARY_COOKIE,
+        f"{time.time() + ttl:.0f}",
+        max_age=ttl,
+        httponly=True,
+        secure=not settings.DEBUG,
+        samesite="lax" if settings.DEBUG else "none",
+    )
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only routes (replica 가능 시 replica 세션)
+
+    replica 조회 오류는 세션이 primary로 재시도 (ReplicaReadSession).
+    그 밖에 요청 처리 중 발생한 DB 오류는 replica를 다음 확인 주기까지 제외하고 전달
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    router = get_replica_router()
+    use_replica = (
+        ReadSessionLocal is not None
+        and not wants_primary(request)
+        and await router.is_usable()
+    )
+    router.count(use_replica)
+    session_factory = ReadSessionLocal if use_replica else AsyncSessionLocal
+    async with session_factory() as session:
+        try:
+            yield session
+        except (DBAPIError, OSError) as e:
+            if use_replica:
+                router.mark_unavailable(e)
+            raise
+        finally:
+            await session.close()
+
+
+# Singleton instance
+_replica_router: Optional[ReplicaRouter] = None
+
+
+def get_replica_router() -> ReplicaRouter:
+    """Get singleton ReplicaRouter instance"""
+    global _replica_router
+    if _replica_router is None:
+        _replica_router = ReplicaRouter(read_engine)
+    return _replica_router
+
+
+def reset_replica_router() -> None:
+    """Reset singleton (for testing)"""
+    global _replica_router
+    _replica_router = None
+
+
 async def init_db():
     """
     Initialize database.
@@ -117,3 +364,5 @@ async def init_db():
 async def close_db():
     """Close database connection pool"""
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
@@ -4,12 +4,13 @@ Main application setup with middleware and routers
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.database import init_db, close_db, mark_read_your_writes
 from app.api.v1.router import api_router
+from app.services.dart_client import get_dart_client
 
 
 @asynccontextmanager
@@ -17,8 +18,11 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     await init_db()
+    # 서버 루프는 프로세스 수명 동안 유지 - DART 클라이언트가 커넥션 풀을 재사용
+    get_dart_client().register_loop()
     yield
     # Shutdown
+    await get_dart_client().aclose()
     await close_db()
 
 
@@ -56,6 +60,15 @@ app.add_middleware(
 # GZip Middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+
+# Read-your-writes: 변경 요청 직후 같은 클라이언트의 조회는 primary (app.core.database.get_read_db)
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    mark_read_your_writes(request, response)
+    return response
+
+
 # Include API routers
 app.include_router(api_router, prefix="/api/v1")
 
@@ -5,9 +5,11 @@ from app.models.signal import Signal, Evidence, SignalIndex
 from app.models.job import Job
 from app.models.snapshot import InternalSnapshot, InternalSnapshotLatest
 from app.models.document import Document, DocumentPage, Fact
-from app.models.profile import CorpProfile
+from app.models.profile import CorpProfile, CorpProfilePhase
 from app.models.loan_insight import LoanInsight
 from app.models.banking_data import BankingData
+from app.models.industry_knowledge import IndustryKnowledge
+from app.models.dart_filing import DartFinancialStatement, DartMajorEvent, DartSyncState
 
 # Security Architecture - External Intel
 from app.models.external_intel import (
@@ -38,10 +40,17 @@ __all__ = [
     "Fact",
     # Corp Profile
     "CorpProfile",
+    "CorpProfilePhase",
     # Loan Insight
     "LoanInsight",
     # Banking Data
     "BankingData",
+    # Industry Knowledge
+    "IndustryKnowledge",
+    # DART Filings (local sync)
+    "DartFinancialStatement",
+    "DartMajorEvent",
+    "DartSyncState",
     # External Intel
     "ExternalNews",
     "ExternalAnalysis",
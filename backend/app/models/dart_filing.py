@@ -0,0 +1,74 @@
+"""
+DART Filing Models
+
+DART 공시 로컬 저장소 (sync_dart_filings 배치가 적재)
+- 재무제표 주요계정 / 주요사항보고서 / 기업별 동기화 high-water mark
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, String, Text, text
+
+from app.core.database import Base
+
+
+class DartFinancialStatement(Base):
+    """재무제표 주요계정 (rkyc_dart_financial)"""
+
+    __tablename__ = "rkyc_dart_financial"
+
+    corp_code = Column(String(8), primary_key=True)
+    bsns_year = Column(String(4), primary_key=True)
+    reprt_code = Column(String(5), primary_key=True)   # 11011=사업보고서
+    fs_div = Column(String(3), primary_key=True)       # OFS=개별, CFS=연결
+
+    revenue = Column(BigInteger)
+    operating_profit = Column(BigInteger)
+    net_income = Column(BigInteger)
+    total_assets = Column(BigInteger)
+    total_liabilities = Column(BigInteger)
+    total_equity = Column(BigInteger)
+    retained_earnings = Column(BigInteger)
+    debt_ratio = Column(Float)
+
+    synced_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
+
+    def __repr__(self):
+        return f"<DartFinancialStatement(corp_code={self.corp_code}, bsns_year={self.bsns_year})>"
+
+
+class DartMajorEvent(Base):
+    """주요사항보고서 (rkyc_dart_event)"""
+
+    __tablename__ = "rkyc_dart_event"
+
+    rcept_no = Column(String(14), primary_key=True)    # 접수번호 (YYYYMMDD + 일련번호)
+    corp_code = Column(String(8), nullable=False)
+    rcept_dt = Column(String(8), nullable=False)       # YYYYMMDD
+    report_nm = Column(Text, nullable=False)
+    event_type = Column(String(30), nullable=False)    # MajorEventType value
+    corp_name = Column(String(200))
+    flr_nm = Column(String(200))
+    rm = Column(String(50))
+
+    synced_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
+
+    def __repr__(self):
+        return f"<DartMajorEvent(rcept_no={self.rcept_no}, corp_code={self.corp_code})>"
+
+
+class DartSyncState(Base):
+    """기업별 DART 동기화 상태 (rkyc_dart_sync_state)"""
+
+    __tablename__ = "rkyc_dart_sync_state"
+
+    corp_code = Column(String(8), primary_key=True)
+
+    events_from = Column(String(8))                    # 로컬 공시가 보장하는 시작일 (YYYYMMDD)
+    events_last_rcept_no = Column(String(14))          # high-water mark
+    events_last_rcept_dt = Column(String(8))
+
+    financials_checked_at = Column(DateTime(timezone=True))
+    last_synced_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+    def __repr__(self):
+        return f"<DartSyncState(corp_code={self.corp_code}, last_rcept_no={self.events_last_rcept_no})>"
@@ -63,6 +63,8 @@ class Document(Base):
     )
     last_ingested_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    # DOC_INGEST digest: {"file_hash", "facts", "summary", "generated_at"} (v17)
+    fact_digest = Column(JSON)
 
     # Relationships
     pages = relationship("DocumentPage", back_populates="document", cascade="all, delete-orphan")
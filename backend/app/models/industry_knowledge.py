@@ -0,0 +1,33 @@
+"""
+Industry Knowledge Model
+
+업종 지식 저장소 (IndustryKnowledgeStore Tier 3)
+- 업종명 / 외부 검색 키워드 / LLM 업종 힌트
+"""
+
+from sqlalchemy import Column, String, Integer, DateTime, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.database import Base
+
+
+class IndustryKnowledge(Base):
+    """업종 지식 (rkyc_industry_knowledge)"""
+
+    __tablename__ = "rkyc_industry_knowledge"
+
+    industry_code = Column(String(10), primary_key=True)
+    industry_name = Column(String(100), nullable=False)
+
+    keywords = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))  # 외부 검색 키워드
+    hints = Column(JSONB)                                                         # LLM 업종 힌트 (NULL = 무효화)
+
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    source = Column(String(20), nullable=False, server_default=text("'seed'"))   # seed, llm, manual
+
+    refreshed_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
+    updated_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
+
+    def __repr__(self):
+        return f"<IndustryKnowledge(industry_code={self.industry_code}, version={self.version})>"
@@ -23,6 +23,17 @@ class JobStatus(str, enum.Enum):
     FAILED = "FAILED"
 
 
+class QueueReason(str, enum.Enum):
+    """Job 생성 사유 (app.services.input_fingerprint)"""
+
+    NO_PRIOR_RUN = "NO_PRIOR_RUN"
+    INPUT_CHANGED = "INPUT_CHANGED"
+    FRESHNESS_EXPIRED = "FRESHNESS_EXPIRED"
+    GATE_DISABLED = "GATE_DISABLED"
+    MANUAL = "MANUAL"
+    RULE_TRIGGERED = "RULE_TRIGGERED"
+
+
 class ProgressStep(str, enum.Enum):
     SNAPSHOT = "SNAPSHOT"
     DOC_INGEST = "DOC_INGEST"
@@ -59,6 +70,8 @@ class Job(Base):
     progress_percent = Column(Integer, default=0)
     error_code = Column(String(50), nullable=True)
     error_message = Column(Text, nullable=True)
-    queued_at = Column(DateTime(timezone=True), server_default=func.now())
+    queued_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())  # 파티션 키 (migration_v25)
     started_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
+    input_fingerprint = Column(String(64), nullable=True)  # 분석이 읽은 입력 해시 (migration_v24)
+    queue_reason = Column(String(30), nullable=True)  # QueueReason
@@ -260,3 +260,28 @@ class CorpProfile(Base):
             "is_fallback": self.is_fallback,
             "is_expired": self.is_expired,
         }
+
+
+class CorpProfilePhase(Base):
+    """
+    기업 프로파일링 phase별 산출물 캐시
+    rkyc_corp_profile_phase
+
+    Purpose:
+    - 프로필 갱신 시 만료된 phase만 재실행하고 나머지는 재사용
+    - input_hash가 다르면 (쿼리/본문/프롬프트 변경) TTL과 무관하게 재실행
+    """
+
+    __tablename__ = "rkyc_corp_profile_phase"
+
+    corp_id = Column(String(20), primary_key=True, comment="기업 ID")
+    phase = Column(String(30), primary_key=True, comment="phase1/2/3, phaseN_summary, gemini, consensus")
+
+    input_hash = Column(String(64), nullable=False, comment="phase 입력 sha256")
+    payload = Column(JSONB, nullable=False, comment="phase 산출물")
+
+    generated_at = Column(TIMESTAMP(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False, comment="phase별 TTL 만료 시각")
+
+    def __repr__(self):
+        return f"<CorpProfilePhase(corp_id={self.corp_id}, phase={self.phase})>"
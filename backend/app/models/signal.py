@@ -101,7 +101,7 @@ class SignalIndex(Base):
     evidence_count = Column(Integer, nullable=False)
 
     # Timestamps
-    detected_at = Column(TIMESTAMP(timezone=True), nullable=False, comment="정렬 기준")
+    detected_at = Column(TIMESTAMP(timezone=True), nullable=False, comment="정렬 기준, 파티션 키 (migration_v25)")
     last_updated_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
 
@@ -154,6 +154,7 @@ class DocumentStatusResponse(BaseModel):
     doc_type: DocType
     ingest_status: IngestStatus
     page_count: Optional[int] = None
+    pages_processed: int = 0
     facts_count: int = 0
     last_ingested_at: Optional[datetime] = None
     error_message: Optional[str] = None
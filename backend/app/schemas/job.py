@@ -53,6 +53,7 @@ class JobStatusResponse(BaseModel):
     queued_at: datetime
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
+    queue_reason: Optional[str] = Field(None, description="Job 생성 사유 (NO_PRIOR_RUN/INPUT_CHANGED/FRESHNESS_EXPIRED/MANUAL/RULE_TRIGGERED 등)")
 
     class Config:
         from_attributes = True
@@ -63,3 +64,5 @@ class JobListResponse(BaseModel):
 
     total: int
     items: list[JobStatusResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+    total_is_estimate: bool = Field(False, description="count=estimate로 추정한 total 여부")
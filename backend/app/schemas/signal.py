@@ -59,6 +59,8 @@ class SignalListResponse(BaseModel):
 
     total: int
     items: list[SignalIndexResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+    total_is_estimate: bool = Field(False, description="count=estimate로 추정한 total 여부")
 
 
 class SignalFilterParams(BaseModel):
@@ -3,6 +3,8 @@
 from app.services.dart_api import (
     # Core
     get_corp_code,
+    get_corp_codes_batch,
+    search_corp_codes,
     get_major_shareholders,
     verify_shareholders,
     get_verified_shareholders,
@@ -40,6 +42,8 @@ from app.services.dart_api import (
 __all__ = [
     # Core
     "get_corp_code",
+    "get_corp_codes_batch",
+    "search_corp_codes",
     "get_major_shareholders",
     "verify_shareholders",
     "get_verified_shareholders",
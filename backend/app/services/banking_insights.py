@@ -5,11 +5,31 @@ Rule-based 방식으로 Banking Data + Signal을 교차 분석하여 인사이
 Option A: 결정론적, Hallucination 없음
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# 규칙 이름 (실행 순서) - 메서드 _rule_{name}
+RULES = (
+    "deposit_loan_ratio",      # Rule 1: 수신/여신 비율
+    "fx_hedge_export",         # Rule 2: 환헤지 + 수출 시그널
+    "unsecured_loan_revenue",  # Rule 3: 신용대출 비중 + 매출 시그널
+    "ltv_industry",            # Rule 4: LTV + 업황 시그널
+    "grade_change",            # Rule 5: 내부등급 변동
+    "overdue",                 # Rule 6: 연체 플래그
+    "deposit_trend",           # Rule 7: 수신 추세 + 시그널
+    "financial_health",        # Rule 8: 재무건전성 + 시그널
+)
+
+# 시그널 키워드 그룹 (title + summary 부분 일치, 대소문자 무시)
+EXPORT_KEYWORDS = ["수출", "export", "해외", "달러", "환율"]
+REVENUE_DOWN_KEYWORDS = ["매출 감소", "매출 하락", "실적 악화", "영업이익 감소"]
+REVENUE_UP_KEYWORDS = ["매출 증가", "매출 성장", "실적 개선", "영업이익 증가"]
+INDUSTRY_UP_KEYWORDS = ["업황 회복", "업황 호조", "산업 성장", "수요 증가"]
+INDUSTRY_DOWN_KEYWORDS = ["업황 악화", "업황 부진", "산업 침체", "수요 감소"]
+
+
 class InsightType(str, Enum):
     RISK = "RISK"
     OPPORTUNITY = "OPPORTUNITY"
@@ -148,33 +168,20 @@ class BankingInsightsEngine:
             return f"${value / 1_000:.0f}K"
         return f"${value:,}"
 
-    def analyze(self) -> List[Dict[str, Any]]:
-        """전체 분석 실행"""
-        self.insights = []
-
-        # Rule 1: 수신/여신 비율 분석
-        self._rule_deposit_loan_ratio()
-
-        # Rule 2: 환헤지 + 수출 시그널
-        self._rule_fx_hedge_export()
+    def analyze(self, rules: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        전체 분석 실행
 
-        # Rule 3: 신용대출 비중 + 매출 시그널
-        self._rule_unsecured_loan_revenue()
-
-        # Rule 4: LTV + 업황 시그널
-        self._rule_ltv_industry()
-
-        # Rule 5: 내부등급 변동
-        self._rule_grade_change()
-
-        # Rule 6: 연체 플래그
-        self._rule_overdue()
-
-        # Rule 7: 수신 추세 + 시그널
-        self._rule_deposit_trend()
+        Args:
+            rules: 실행할 규칙 이름 (RULES 중, None이면 전체) - 포트폴리오 평가에서
+                   조건을 만족한 규칙만 실행할 때 사용 (app.services.portfolio_rules)
+        """
+        self.insights = []
 
-        # Rule 8: 재무건전성 + 시그널
-        self._rule_financial_health()
+        selected = set(RULES if rules is None else rules)
+        for name in RULES:
+            if name in selected:
+                getattr(self, f"_rule_{name}")()
 
         # 우선순위 정렬 (HIGH > MED > LOW)
         priority_order = {"HIGH": 0, "MED": 1, "LOW": 2}
@@ -216,7 +223,7 @@ class BankingInsightsEngine:
             return
 
         # 수출 관련 시그널 검색
-        export_signals = self._get_signals_by_keyword(["수출", "export", "해외", "달러", "환율"])
+        export_signals = self._get_signals_by_keyword(EXPORT_KEYWORDS)
 
         if self.hedge_ratio < 50:
             # 환헤지 부족 리스크
@@ -255,8 +262,8 @@ class BankingInsightsEngine:
             return
 
         # 매출 관련 시그널 검색
-        revenue_down_signals = self._get_signals_by_keyword(["매출 감소", "매출 하락", "실적 악화", "영업이익 감소"])
-        revenue_up_signals = self._get_signals_by_keyword(["매출 증가", "매출 성장", "실적 개선", "영업이익 증가"])
+        revenue_down_signals = self._get_signals_by_keyword(REVENUE_DOWN_KEYWORDS)
+        revenue_up_signals = self._get_signals_by_keyword(REVENUE_UP_KEYWORDS)
 
         unsecured_amount = self.total_loan * self.unsecured_ratio / 100
 
@@ -291,8 +298,8 @@ class BankingInsightsEngine:
             return
 
         # 업황 관련 시그널 검색
-        industry_up_signals = self._get_signals_by_keyword(["업황 회복", "업황 호조", "산업 성장", "수요 증가"])
-        industry_down_signals = self._get_signals_by_keyword(["업황 악화", "업황 부진", "산업 침체", "수요 감소"])
+        industry_up_signals = self._get_signals_by_keyword(INDUSTRY_UP_KEYWORDS)
+        industry_down_signals = self._get_signals_by_keyword(INDUSTRY_DOWN_KEYWORDS)
 
         if self.avg_ltv < 50 and industry_up_signals:
             collateral_headroom = self.total_collateral - (self.total_collateral * self.avg_ltv / 100)
@@ -0,0 +1,242 @@
+"""
+DART Corp Name Index
+
+DART 기업 고유번호 목록(~10만 건)에 대한 기업명 검색 인덱스.
+get_corp_code의 선형 부분문자열 스캔(조회당 O(N), 첫 매칭 임의 반환)을 대체한다.
+
+Index 구성:
+1. Exact map      정규화 이름 → id                  O(1)
+2. Prefix index   정규화 이름 정렬 배열 + bisect     O(log N + k)
+                  (노드 기반 trie와 같은 prefix 탐색을 10만 건 기준 훨씬 적은 메모리로 수행)
+3. N-gram index   문자 bigram → id 목록 (inverted index)
+                  부분 포함(양방향) / 오타·어순 차이 후보 탐색
+
+Scoring (0.0 ~ 1.0, 높을수록 우선):
+- EXACT     1.0
+- PREFIX    0.7 ~ 0.9   (검색어가 기업명의 앞부분, 길이 차이가 작을수록 높음)
+- CONTAINS  0.5 ~ 0.7   (한쪽이 다른 쪽을 포함)
+- NGRAM     0.0 ~ 0.5   (bigram Dice 계수)
+
+동점이면 짧은 이름 → 이름순. 인덱스는 빌드 후 읽기 전용이므로 스레드 간 공유 가능하며,
+재로딩 시 새 인덱스를 만들어 참조를 교체한다.
+
+저장소 hook(_exact_id / _prefix_candidates / _gram_candidates / _entries)만 바꾸면
+같은 점수 규칙으로 다른 저장소를 검색할 수 있다 (예: dart_corp_store의 SQLite 인덱스).
+
+Usage:
+    index = CorpNameIndex.build(entries, normalizer=_normalize_corp_name)
+    index.search("삼성전자", limit=5)        # [CorpNameMatch, ...]
+    index.best("삼성전자")                   # CorpNameMatch | None
+    index.search_batch(["삼성전자", "하림"])  # {name: [CorpNameMatch, ...]}
+"""
+
+import bisect
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Iterable, Optional
+
+NGRAM_SIZE = 2
+NGRAM_MIN_DICE = 0.3
+
+
+class MatchType(str, Enum):
+    """기업명 매칭 유형"""
+    EXACT = "EXACT"
+    PREFIX = "PREFIX"
+    CONTAINS = "CONTAINS"
+    NGRAM = "NGRAM"
+
+
+@dataclass(frozen=True)
+class CorpNameMatch:
+    """기업명 검색 후보"""
+    corp_code: str
+    corp_name: str
+    normalized_name: str
+    score: float
+    match_type: MatchType
+
+    def to_dict(self) -> dict:
+        return {
+            "corp_code": self.corp_code,
+            "corp_name": self.corp_name,
+            "score": self.score,
+            "match_type": self.match_type.value,
+        }
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> set[str]:
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class CorpNameIndex:
+    """Exact map + prefix index + n-gram inverted index (빌드 후 읽기 전용)"""
+
+    def __init__(self, normalizer: Optional[Callable[[str], str]] = None):
+        self._normalizer = normalizer or (lambda s: s.strip().lower())
+        self._names: list[str] = []        # id → 정규화 이름
+        self._codes: list[str] = []        # id → corp_code
+        self._display: list[str] = []      # id → 원본 기업명
+        self._exact: dict[str, int] = {}
+        self._sorted: list[str] = []       # prefix 탐색용 정렬 이름
+        self._sorted_ids: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        entries: Iterable[tuple[str, str, str]],
+        normalizer: Optional[Callable[[str], str]] = None,
+    ) -> "CorpNameIndex":
+        """
+        인덱스 빌드
+
+        Args:
+            entries: (정규화 이름, corp_code, 원본 기업명) - 정규화 이름이 같으면 마지막 값 사용
+            normalizer: 검색어 정규화 함수 (entries 정규화와 동일해야 함)
+        """
+        index = cls(normalizer)
+        for normalized, corp_code, corp_name in entries:
+            if not normalized or not corp_code:
+                continue
+            existing = index._exact.get(normalized)
+            if existing is not None:
+                index._codes[existing] = corp_code
+                index._display[existing] = corp_name or normalized
+                continue
+            index._exact[normalized] = len(index._names)
+            index._names.append(normalized)
+            index._codes.append(corp_code)
+            index._display.append(corp_name or normalized)
+
+        order = sorted(range(len(index._names)), key=index._names.__getitem__)
+        index._sorted = [index._names[i] for i in order]
+        index._sorted_ids = order
+
+        for i, name in enumerate(index._names):
+            for gram in ngrams(name):
+                index._postings.setdefault(gram, []).append(i)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ------------------------------------------------------------------
+    # Storage hooks
+    # ------------------------------------------------------------------
+
+    def _exact_id(self, query: str) -> Optional[int]:
+        return self._exact.get(query)
+
+    def _prefix_candidates(self, query: str, limit: int) -> list[tuple[int, str]]:
+        """query로 시작하는 이름 중 짧은 순 limit개 → [(id, 정규화 이름)]"""
+        lo = bisect.bisect_left(self._sorted, query)
+        hi = bisect.bisect_left(self._sorted, query + "\U0010ffff", lo)
+        ids = heapq.nsmallest(
+            limit, self._sorted_ids[lo:hi], key=lambda i: (len(self._names[i]), self._names[i])
+        )
+        return [(i, self._names[i]) for i in ids]
+
+    def _gram_candidates(self, grams: set[str]) -> list[tuple[int, str, int]]:
+        """grams 중 하나 이상을 가진 이름 → [(id, 정규화 이름, 공유 gram 수)]"""
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        return [(i, self._names[i], count) for i, count in shared.items()]
+
+    def _entries(self, ids: list[int]) -> dict[int, tuple[str, str]]:
+        """id → (corp_code, 원본 기업명)"""
+        return {i: (self._codes[i], self._display[i]) for i in ids}
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(self, name: str, limit: int = 5, min_score: float = 0.0) -> list[CorpNameMatch]:
+        """
+        기업명 후보 검색 (점수 내림차순)
+
+        Args:
+            name: 기업명 (정규화 전)
+            limit: 최대 후보 수
+            min_score: 최소 점수
+        """
+        query = self._normalizer(name or "")
+        if not query or not len(self) or limit <= 0:
+            return []
+
+        scored: dict[int, tuple[float, MatchType]] = {}
+        names: dict[int, str] = {}
+
+        def offer(i: int, score: float, match_type: MatchType) -> None:
+            if score >= min_score and score > scored.get(i, (-1.0, None))[0]:
+                scored[i] = (score, match_type)
+
+        exact = self._exact_id(query)
+        if exact is not None:
+            names[exact] = query
+            offer(exact, 1.0, MatchType.EXACT)
+
+        for i, candidate in self._prefix_candidates(query, limit + 1):
+            if i != exact:
+                names[i] = candidate
+                offer(i, 0.7 + 0.2 * len(query) / len(candidate), MatchType.PREFIX)
+
+        query_grams = ngrams(query)
+        for i, candidate, count in self._gram_candidates(query_grams):
+            if i in scored and scored[i][1] != MatchType.NGRAM:
+                continue
+            names[i] = candidate
+            if len(candidate) > 1 and (query in candidate or candidate in query):
+                ratio = min(len(query), len(candidate)) / max(len(query), len(candidate))
+                offer(i, 0.5 + 0.2 * ratio, MatchType.CONTAINS)
+                continue
+            dice = 2 * count / (len(query_grams) + len(ngrams(candidate)))
+            if dice >= NGRAM_MIN_DICE:
+                offer(i, 0.5 * dice, MatchType.NGRAM)
+
+        ranked = sorted(
+            scored.items(),
+            key=lambda item: (-item[1][0], len(names[item[0]]), names[item[0]]),
+        )[:limit]
+        entries = self._entries([i for i, _ in ranked])
+        return [
+            CorpNameMatch(
+                corp_code=entries[i][0],
+                corp_name=entries[i][1],
+                normalized_name=names[i],
+                score=round(score, 4),
+                match_type=match_type,
+            )
+            for i, (score, match_type) in ranked
+            if i in entries
+        ]
+
+    def best(self, name: str, fuzzy: bool = False) -> Optional[CorpNameMatch]:
+        """
+        최상위 후보 1건
+
+        Args:
+            fuzzy: False면 EXACT/PREFIX/CONTAINS(부분 포함)만 인정 - 기존 get_corp_code 의미 유지
+        """
+        for match in self.search(name, limit=1):
+            if fuzzy or match.match_type != MatchType.NGRAM:
+                return match
+        return None
+
+    def search_batch(
+        self,
+        names: Iterable[str],
+        limit: int = 5,
+        min_score: float = 0.0,
+    ) -> dict[str, list[CorpNameMatch]]:
+        """여러 기업명 일괄 검색 (중복 이름은 1회만 계산)"""
+        results: dict[str, list[CorpNameMatch]] = {}
+        for name in names:
+            if name not in results:
+                results[name] = self.search(name, limit=limit, min_score=min_score)
+        return results
@@ -26,9 +26,6 @@ References:
 import asyncio
 import logging
 import re
-import io
-import zipfile
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, UTC
 from enum import Enum
@@ -38,6 +35,8 @@ from functools import lru_cache
 import httpx
 
 from app.core.config import settings
+from app.services.dart_client import get_dart_client
+from app.services.dart_local import get_dart_local_store
 
 logger = logging.getLogger(__name__)
 
@@ -206,89 +205,82 @@ class VerificationResult:
 
 
 # ============================================================================
-# Corp Code Lookup (with File Cache for Worker Persistence)
+# Corp Code Lookup (shared on-disk store for Worker Persistence)
 # ============================================================================
 
-import json
-import os
-import tempfile
+import time
 
-# In-memory cache for corp codes (loaded from DART ZIP file)
-_corp_code_cache: dict[str, str] = {}
-_corp_code_by_name: dict[str, str] = {}
-_corp_code_loaded: bool = False
-
-# P0 Performance: File-based cache to avoid re-download across workers
-CORP_CODE_CACHE_FILE = os.path.join(tempfile.gettempdir(), "dart_corp_codes.json")
-CORP_CODE_CACHE_TTL_HOURS = 24  # 24시간마다 갱신
+from app.services.corp_name_index import CorpNameIndex, CorpNameMatch
+from app.services.dart_corp_store import DartCorpCodeStore
 
+# P0 Performance: 고유번호 목록은 SQLite 파일 하나를 모든 API/Celery worker가
+# 읽기 전용으로 공유 (프로세스별 dict 사본/JSON 파싱 없음, 갱신 시 원자적 교체)
+CORP_CODE_CACHE_TTL_HOURS = getattr(settings, 'DART_CORP_CODE_TTL_HOURS', 24)  # 24시간마다 갱신
+CORP_CODE_RETRY_SECONDS = 600  # 갱신 실패 시 기존 저장소로 버티는 시간
 
-def _is_cache_file_valid() -> bool:
-    """Check if cache file exists and is fresh (within TTL)."""
-    if not os.path.exists(CORP_CODE_CACHE_FILE):
-        return False
-    try:
-        mtime = os.path.getmtime(CORP_CODE_CACHE_FILE)
-        age_hours = (datetime.now().timestamp() - mtime) / 3600
-        return age_hours < CORP_CODE_CACHE_TTL_HOURS
-    except Exception:
-        return False
+_corp_code_store: Optional[DartCorpCodeStore] = None
+_corp_code_loaded: bool = False
+_corp_code_retry_at: float = 0.0
 
 
-def _load_from_cache_file() -> bool:
-    """Load corp codes from file cache."""
-    global _corp_code_cache, _corp_code_by_name, _corp_code_loaded
+def _normalize_corp_name(name: str) -> str:
+    """기업명 정규화 (검색용)"""
+    # 1. 법인 표기 제거 (순서 중요: 긴 패턴부터)
+    corp_suffixes = [
+        '주식회사', '(주)', '(株)', '㈜',
+        '유한회사', '(유)',
+        '유한책임회사',
+        '합자회사', '합명회사',
+        'inc', 'inc.', 'corp', 'corp.', 'ltd', 'ltd.', 'llc', 'co.', 'co'
+    ]
+    normalized = name.lower()
+    for suffix in corp_suffixes:
+        normalized = normalized.replace(suffix.lower(), '')
 
-    try:
-        with open(CORP_CODE_CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            _corp_code_cache = data.get("cache", {})
-            _corp_code_by_name = data.get("by_name", {})
-            _corp_code_loaded = True
-            logger.info(f"[DartAPI] Loaded {len(_corp_code_cache)} corp codes from file cache")
-            return True
-    except Exception as e:
-        logger.warning(f"[DartAPI] Failed to load from cache file: {e}")
-        return False
+    # 2. 공백 및 특수문자 제거
+    normalized = re.sub(r'[^\w가-힣]', '', normalized)
+    return normalized.strip()
 
 
-def _save_to_cache_file() -> None:
-    """Save corp codes to file cache."""
-    try:
-        with open(CORP_CODE_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({
-                "cache": _corp_code_cache,
-                "by_name": _corp_code_by_name,
-                "updated_at": datetime.now().isoformat(),
-            }, f)
-        logger.info(f"[DartAPI] Saved {len(_corp_code_cache)} corp codes to file cache")
-    except Exception as e:
-        logger.warning(f"[DartAPI] Failed to save cache file: {e}")
+def get_corp_code_store() -> DartCorpCodeStore:
+    """고유번호 저장소 (프로세스당 읽기 전용 연결 1개)"""
+    global _corp_code_store
+    if _corp_code_store is None:
+        _corp_code_store = DartCorpCodeStore(
+            normalizer=_normalize_corp_name,
+            ttl_hours=CORP_CODE_CACHE_TTL_HOURS,
+        )
+    return _corp_code_store
 
 
-async def load_corp_codes() -> bool:
+async def load_corp_codes(force: bool = False) -> bool:
     """
-    DART 기업 고유번호 목록 다운로드 및 캐시
+    DART 기업 고유번호 목록 다운로드 및 저장소 갱신
 
-    P0 Performance: File-based cache로 Worker간 공유 (10초 → 0.1초)
-    - 메모리 캐시 확인 → 파일 캐시 확인 → DART 다운로드
+    P0 Performance: 저장소 파일을 Worker간 공유 (cold start 시 파싱 없음)
+    - 저장소 신선도 확인 → DART 다운로드 → iterparse로 새 파일 빌드 → 원자적 교체
+    - 다운로드 실패 시 기존(만료된) 저장소가 있으면 계속 사용
+
+    Args:
+        force: TTL과 무관하게 다시 다운로드
 
     Returns:
         True if successful, False otherwise
     """
-    global _corp_code_cache, _corp_code_by_name, _corp_code_loaded
+    global _corp_code_loaded, _corp_code_retry_at
 
-    # 1. 메모리 캐시 확인
-    if _corp_code_loaded and _corp_code_cache:
-        logger.debug("[DartAPI] Corp codes already in memory")
+    store = get_corp_code_store()
+
+    # 1. 저장소 확인 (다른 Worker가 이미 갱신했을 수 있음)
+    if not force and store.is_fresh() and store.is_available():
+        _corp_code_loaded = True
         return True
 
-    # 2. 파일 캐시 확인 (Worker간 공유)
-    if _is_cache_file_valid():
-        if _load_from_cache_file():
-            return True
+    # 최근 갱신 실패 → 기존 저장소로 버팀
+    if not force and time.monotonic() < _corp_code_retry_at and store.is_available():
+        return True
 
-    # 3. DART에서 다운로드
+    # 2. DART에서 다운로드
     url = f"{DART_BASE_URL}/corpCode.xml?crtfc_key={DART_API_KEY}"
 
     try:
@@ -297,63 +289,40 @@ async def load_corp_codes() -> bool:
             response = await client.get(url)
             response.raise_for_status()
 
-            # Response is a ZIP file containing XML
-            zip_buffer = io.BytesIO(response.content)
-            with zipfile.ZipFile(zip_buffer, 'r') as zf:
-                # The ZIP contains a single XML file
-                xml_filename = zf.namelist()[0]
-                with zf.open(xml_filename) as xml_file:
-                    tree = ET.parse(xml_file)
-                    root = tree.getroot()
-
-                    for corp in root.findall('.//list'):
-                        corp_code = corp.findtext('corp_code', '')
-                        corp_name = corp.findtext('corp_name', '')
-                        stock_code = corp.findtext('stock_code', '')  # 상장사만 있음
-
-                        if corp_code and corp_name:
-                            _corp_code_cache[corp_code] = corp_name
-
-                            # 이름으로도 검색 가능하게 (정규화된 이름)
-                            normalized_name = _normalize_corp_name(corp_name)
-                            _corp_code_by_name[normalized_name] = corp_code
-
-                            # 주식코드도 매핑 (상장사)
-                            if stock_code and stock_code.strip():
-                                _corp_code_cache[f"stock:{stock_code.strip()}"] = corp_code
-
-            _corp_code_loaded = True
-            logger.info(f"[DartAPI] Loaded {len(_corp_code_cache)} corp codes")
-
-            # 파일 캐시에 저장 (다른 Worker가 재사용)
-            _save_to_cache_file()
-            return True
+        # Response is a ZIP file containing XML
+        count = await asyncio.to_thread(store.build_from_zip, response.content)
+        _corp_code_loaded = True
+        _corp_code_retry_at = 0.0
+        logger.info(f"[DartAPI] Loaded {count} corp codes")
+        return True
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] Failed to download corp codes: {e}")
-        return False
     except Exception as e:
         logger.error(f"[DartAPI] Failed to parse corp codes: {e}")
-        return False
 
+    _corp_code_retry_at = time.monotonic() + CORP_CODE_RETRY_SECONDS
+    if store.is_available():
+        logger.warning("[DartAPI] Using stale corp code store")
+        _corp_code_loaded = True
+        return True
+    return False
 
-def _normalize_corp_name(name: str) -> str:
-    """기업명 정규화 (검색용)"""
-    # 1. 법인 표기 제거 (순서 중요: 긴 패턴부터)
-    corp_suffixes = [
-        '주식회사', '(주)', '(株)', '㈜',
-        '유한회사', '(유)',
-        '유한책임회사',
-        '합자회사', '합명회사',
-        'inc', 'inc.', 'corp', 'corp.', 'ltd', 'ltd.', 'llc', 'co.', 'co'
-    ]
-    normalized = name.lower()
-    for suffix in corp_suffixes:
-        normalized = normalized.replace(suffix.lower(), '')
 
-    # 2. 공백 및 특수문자 제거
-    normalized = re.sub(r'[^\w가-힣]', '', normalized)
-    return normalized.strip()
+def get_corp_code_count() -> int:
+    """저장소의 기업 수 (미로드 시 0)"""
+    return get_corp_code_store().count()
+
+
+def list_corp_codes(listed_only: bool = False) -> list[str]:
+    """저장소의 전체 (또는 상장사) corp_code 목록"""
+    return list(get_corp_code_store().iter_corp_codes(listed_only=listed_only))
+
+
+async def get_corp_name_index() -> CorpNameIndex:
+    """기업명 인덱스 (저장소 위 exact + prefix + n-gram, 필요 시 저장소 갱신)"""
+    await load_corp_codes()
+    return get_corp_code_store().name_index()
 
 
 async def get_corp_code(
@@ -372,30 +341,62 @@ async def get_corp_code(
     Returns:
         8자리 DART 고유번호 또는 None
     """
-    # 캐시 로드 확인
-    if not _corp_code_loaded:
-        await load_corp_codes()
+    # 저장소 확인
+    index = await get_corp_name_index()
+
+    def lookup() -> Optional[str]:
+        # 주식코드로 검색
+        if stock_code:
+            corp_code = get_corp_code_store().get_by_stock(stock_code)
+            if corp_code:
+                return corp_code
+
+        # 기업명으로 검색 (정확 > 접두 > 부분 포함 순 최상위 후보)
+        if corp_name:
+            match = index.best(corp_name)
+            if match:
+                return match.corp_code
+        return None
 
-    # 주식코드로 검색
-    if stock_code:
-        stock_key = f"stock:{stock_code.strip()}"
-        if stock_key in _corp_code_cache:
-            return _corp_code_cache[stock_key]
+    return await asyncio.to_thread(lookup)
 
-    # 기업명으로 검색
-    if corp_name:
-        normalized = _normalize_corp_name(corp_name)
 
-        # 정확 매칭
-        if normalized in _corp_code_by_name:
-            return _corp_code_by_name[normalized]
+async def search_corp_codes(
+    corp_name: str,
+    limit: int = 5,
+    min_score: float = 0.0,
+) -> list[CorpNameMatch]:
+    """
+    기업명으로 DART 고유번호 후보 검색 (점수순)
 
-        # 부분 매칭 (첫 번째 매칭 반환)
-        for cached_name, code in _corp_code_by_name.items():
-            if normalized in cached_name or cached_name in normalized:
-                return code
+    Args:
+        corp_name: 기업명 (예: "삼성전자")
+        limit: 최대 후보 수
+        min_score: 최소 매칭 점수 (0.0 ~ 1.0)
 
-    return None
+    Returns:
+        CorpNameMatch 목록 (EXACT/PREFIX/CONTAINS/NGRAM)
+    """
+    index = await get_corp_name_index()
+    return await asyncio.to_thread(index.search, corp_name, limit, min_score)
+
+
+async def get_corp_codes_batch(corp_names: list[str]) -> dict[str, Optional[str]]:
+    """
+    여러 기업명의 고유번호 일괄 조회 (온보딩 대량 매핑용)
+
+    Returns:
+        {기업명: 8자리 DART 고유번호 또는 None}
+    """
+    index = await get_corp_name_index()
+
+    def resolve() -> dict[str, Optional[str]]:
+        return {
+            name: (match.corp_code if (match := index.best(name)) else None)
+            for name in dict.fromkeys(corp_names)
+        }
+
+    return await asyncio.to_thread(resolve)
 
 
 # ============================================================================
@@ -417,49 +418,45 @@ async def get_company_info(corp_code: str) -> Optional[CompanyInfo]:
     Returns:
         CompanyInfo 객체 또는 None
     """
-    url = f"{DART_BASE_URL}/company.json"
+    endpoint = "company.json"
     params = {
-        "crtfc_key": DART_API_KEY,
         "corp_code": corp_code,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = await get_dart_client().get_json(endpoint, params)
 
-            status = data.get("status", "")
-            message = data.get("message", "")
+        status = data.get("status", "")
+        message = data.get("message", "")
 
-            if status == DART_STATUS_NO_DATA:
-                logger.info(f"[DartAPI] No company info for corp_code={corp_code}")
-                return None
+        if status == DART_STATUS_NO_DATA:
+            logger.info(f"[DartAPI] No company info for corp_code={corp_code}")
+            return None
 
-            if status != DART_STATUS_SUCCESS:
-                raise DartError(status, message)
-
-            return CompanyInfo(
-                corp_code=data.get("corp_code", corp_code),
-                corp_name=data.get("corp_name", ""),
-                corp_name_eng=data.get("corp_name_eng"),
-                stock_name=data.get("stock_name"),
-                stock_code=data.get("stock_code"),
-                ceo_name=data.get("ceo_nm"),
-                corp_cls=data.get("corp_cls"),
-                jurir_no=data.get("jurir_no"),
-                bizr_no=data.get("bizr_no"),
-                adres=data.get("adres"),
-                hm_url=data.get("hm_url"),
-                ir_url=data.get("ir_url"),
-                phn_no=data.get("phn_no"),
-                fax_no=data.get("fax_no"),
-                induty_code=data.get("induty_code"),
-                est_dt=data.get("est_dt"),
-                acc_mt=data.get("acc_mt"),
-                source="DART",
-                confidence="HIGH",
-            )
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, message)
+
+        return CompanyInfo(
+            corp_code=data.get("corp_code", corp_code),
+            corp_name=data.get("corp_name", ""),
+            corp_name_eng=data.get("corp_name_eng"),
+            stock_name=data.get("stock_name"),
+            stock_code=data.get("stock_code"),
+            ceo_name=data.get("ceo_nm"),
+            corp_cls=data.get("corp_cls"),
+            jurir_no=data.get("jurir_no"),
+            bizr_no=data.get("bizr_no"),
+            adres=data.get("adres"),
+            hm_url=data.get("hm_url"),
+            ir_url=data.get("ir_url"),
+            phn_no=data.get("phn_no"),
+            fax_no=data.get("fax_no"),
+            induty_code=data.get("induty_code"),
+            est_dt=data.get("est_dt"),
+            acc_mt=data.get("acc_mt"),
+            source="DART",
+            confidence="HIGH",
+        )
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] HTTP error getting company info: {e}")
@@ -518,56 +515,52 @@ async def get_largest_shareholders(
     Returns:
         LargestShareholder 객체 리스트
     """
-    url = f"{DART_BASE_URL}/hyslrSttus.json"
+    endpoint = "hyslrSttus.json"
 
     # 사업연도 미지정 시 전년도 사용 (사업보고서는 전년도 기준)
     if not bsns_year:
         bsns_year = str(datetime.now().year - 1)
 
     params = {
-        "crtfc_key": DART_API_KEY,
         "corp_code": corp_code,
         "bsns_year": bsns_year,
         "reprt_code": reprt_code,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            status = data.get("status", "")
-            message = data.get("message", "")
+        data = await get_dart_client().get_json(endpoint, params)
+
+        status = data.get("status", "")
+        message = data.get("message", "")
+
+        if status == DART_STATUS_NO_DATA:
+            logger.info(f"[DartAPI] No largest shareholder data for corp_code={corp_code}, year={bsns_year}")
+            # 전년도 데이터가 없으면 2년 전 시도
+            if bsns_year == str(datetime.now().year - 1):
+                logger.info(f"[DartAPI] Trying previous year...")
+                return await get_largest_shareholders(
+                    corp_code,
+                    bsns_year=str(datetime.now().year - 2),
+                    reprt_code=reprt_code,
+                )
+            return []
 
-            if status == DART_STATUS_NO_DATA:
-                logger.info(f"[DartAPI] No largest shareholder data for corp_code={corp_code}, year={bsns_year}")
-                # 전년도 데이터가 없으면 2년 전 시도
-                if bsns_year == str(datetime.now().year - 1):
-                    logger.info(f"[DartAPI] Trying previous year...")
-                    return await get_largest_shareholders(
-                        corp_code,
-                        bsns_year=str(datetime.now().year - 2),
-                        reprt_code=reprt_code,
-                    )
-                return []
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, message)
 
-            if status != DART_STATUS_SUCCESS:
-                raise DartError(status, message)
-
-            shareholders = []
-            items = data.get("list", [])
+        shareholders = []
+        items = data.get("list", [])
 
-            for item in items:
-                shareholder = _parse_largest_shareholder_item(item, bsns_year)
-                if shareholder:
-                    shareholders.append(shareholder)
+        for item in items:
+            shareholder = _parse_largest_shareholder_item(item, bsns_year)
+            if shareholder:
+                shareholders.append(shareholder)
 
-            # 기말 지분율 기준 정렬
-            shareholders.sort(key=lambda s: s.trmend_posesn_stock_qota_rt, reverse=True)
+        # 기말 지분율 기준 정렬
+        shareholders.sort(key=lambda s: s.trmend_posesn_stock_qota_rt, reverse=True)
 
-            logger.info(f"[DartAPI] Found {len(shareholders)} largest shareholders for corp_code={corp_code}")
-            return shareholders
+        logger.info(f"[DartAPI] Found {len(shareholders)} largest shareholders for corp_code={corp_code}")
+        return shareholders
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] HTTP error getting largest shareholders: {e}")
@@ -793,11 +786,13 @@ async def get_financial_statements(
     bsns_year: Optional[str] = None,
     reprt_code: str = "11011",  # 11011: 사업보고서
     fs_div: str = "OFS",  # OFS: 개별재무제표, CFS: 연결재무제표
+    prefer_local: bool = True,
 ) -> list[FinancialStatement]:
     """
     P2: DART 재무제표 주요계정 조회 (100% Fact)
 
     단일회사 주요계정 API를 호출하여 매출액, 영업이익, 순이익 등을 조회합니다.
+    sync_dart_filings 배치로 최근 동기화된 기업은 로컬 사본(rkyc_dart_financial)에서 읽습니다.
 
     API: https://opendart.fss.or.kr/api/fnlttSinglAcnt.json
 
@@ -806,11 +801,12 @@ async def get_financial_statements(
         bsns_year: 사업연도 (미지정 시 최근 3년)
         reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         fs_div: 재무제표 구분 (OFS=개별, CFS=연결)
+        prefer_local: 로컬 사본 우선 조회 (False면 항상 DART 호출)
 
     Returns:
         FinancialStatement 객체 리스트
     """
-    url = f"{DART_BASE_URL}/fnlttSinglAcnt.json"
+    endpoint = "fnlttSinglAcnt.json"
 
     # 사업연도 미지정 시 최근 3년 조회
     years = []
@@ -820,11 +816,17 @@ async def get_financial_statements(
         current_year = datetime.now().year
         years = [str(current_year - i) for i in range(1, 4)]  # 전년도, 2년전, 3년전
 
-    all_statements = []
+    if prefer_local:
+        rows = await asyncio.to_thread(
+            get_dart_local_store().load_financials, corp_code, years, reprt_code, fs_div
+        )
+        # 특정 연도 요청인데 로컬에 없으면 (동기화 범위 밖) 실시간 조회
+        if rows is not None and (rows or not bsns_year):
+            logger.debug(f"[DartAPI] Local financial statements for corp_code={corp_code}: {len(rows)}")
+            return [_financial_from_row(row) for row in rows]
 
-    for year in years:
+    async def fetch_year(year: str) -> Optional[FinancialStatement]:
         params = {
-            "crtfc_key": DART_API_KEY,
             "corp_code": corp_code,
             "bsns_year": year,
             "reprt_code": reprt_code,
@@ -832,31 +834,30 @@ async def get_financial_statements(
         }
 
         try:
-            async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            data = await get_dart_client().get_json(endpoint, params)
 
-                status = data.get("status", "")
-                message = data.get("message", "")
+            status = data.get("status", "")
+            message = data.get("message", "")
 
-                if status == DART_STATUS_NO_DATA:
-                    logger.debug(f"[DartAPI] No financial data for corp_code={corp_code}, year={year}")
-                    continue
+            if status == DART_STATUS_NO_DATA:
+                logger.debug(f"[DartAPI] No financial data for corp_code={corp_code}, year={year}")
+                return None
 
-                if status != DART_STATUS_SUCCESS:
-                    logger.warning(f"[DartAPI] Financial API error: {message}")
-                    continue
+            if status != DART_STATUS_SUCCESS:
+                logger.warning(f"[DartAPI] Financial API error: {message}")
+                return None
 
-                # 재무 항목 파싱
-                items = data.get("list", [])
-                statement = _parse_financial_items(items, year, reprt_code)
-                if statement:
-                    all_statements.append(statement)
+            # 재무 항목 파싱
+            items = data.get("list", [])
+            return _parse_financial_items(items, year, reprt_code)
 
         except Exception as e:
             logger.warning(f"[DartAPI] Failed to get financial data for year={year}: {e}")
-            continue
+            return None
+
+    # 연도별 조회는 공유 클라이언트의 rate limit 안에서 병렬 실행 (연도 순서 유지)
+    results = await asyncio.gather(*(fetch_year(year) for year in years))
+    all_statements = [statement for statement in results if statement]
 
     logger.info(f"[DartAPI] Found {len(all_statements)} financial statements for corp_code={corp_code}")
     return all_statements
@@ -924,6 +925,24 @@ def _parse_financial_items(items: list[dict], bsns_year: str, reprt_code: str) -
     )
 
 
+def _financial_from_row(row: dict) -> FinancialStatement:
+    """rkyc_dart_financial row → FinancialStatement"""
+    return FinancialStatement(
+        bsns_year=row["bsns_year"],
+        revenue=row.get("revenue"),
+        operating_profit=row.get("operating_profit"),
+        net_income=row.get("net_income"),
+        total_assets=row.get("total_assets"),
+        total_liabilities=row.get("total_liabilities"),
+        total_equity=row.get("total_equity"),
+        retained_earnings=row.get("retained_earnings"),
+        debt_ratio=row.get("debt_ratio"),
+        report_code=row.get("reprt_code"),
+        source="DART",
+        confidence="HIGH",
+    )
+
+
 async def get_financial_statements_by_name(corp_name: str) -> list[FinancialStatement]:
     """
     기업명으로 재무제표 조회
@@ -1049,12 +1068,14 @@ async def get_major_events(
     bgn_de: Optional[str] = None,  # 시작일 (YYYYMMDD)
     end_de: Optional[str] = None,  # 종료일 (YYYYMMDD)
     pblntf_ty: str = "B",  # B: 주요사항보고
+    prefer_local: bool = True,
 ) -> list[MajorEvent]:
     """
     P3: DART 주요사항보고서 조회 (100% Fact)
 
     공시검색 API를 호출하여 주요사항보고서를 조회합니다.
     인수/합병, 유상증자, 소송, 감사의견 등 중요 이벤트를 추적합니다.
+    sync_dart_filings 배치로 최근 동기화된 기업은 로컬 사본(rkyc_dart_event)에서 읽습니다.
 
     API: https://opendart.fss.or.kr/api/list.json
 
@@ -1063,11 +1084,12 @@ async def get_major_events(
         bgn_de: 시작일 (YYYYMMDD, 미지정 시 1년 전)
         end_de: 종료일 (YYYYMMDD, 미지정 시 오늘)
         pblntf_ty: 공시유형 (B=주요사항보고)
+        prefer_local: 로컬 사본 우선 조회 (False면 항상 DART 호출)
 
     Returns:
         MajorEvent 객체 리스트
     """
-    url = f"{DART_BASE_URL}/list.json"
+    endpoint = "list.json"
 
     # 기본 기간: 최근 1년
     if not end_de:
@@ -1075,8 +1097,15 @@ async def get_major_events(
     if not bgn_de:
         bgn_de = (datetime.now() - timedelta(days=365)).strftime("%Y%m%d")
 
+    if prefer_local:
+        rows = await asyncio.to_thread(
+            get_dart_local_store().load_events, corp_code, bgn_de, end_de, pblntf_ty
+        )
+        if rows is not None:
+            logger.debug(f"[DartAPI] Local major events for corp_code={corp_code}: {len(rows)}")
+            return [_event_from_row(row) for row in rows]
+
     params = {
-        "crtfc_key": DART_API_KEY,
         "corp_code": corp_code,
         "bgn_de": bgn_de,
         "end_de": end_de,
@@ -1085,38 +1114,26 @@ async def get_major_events(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = await get_dart_client().get_json(endpoint, params)
 
-            status = data.get("status", "")
-            message = data.get("message", "")
+        status = data.get("status", "")
+        message = data.get("message", "")
 
-            if status == DART_STATUS_NO_DATA:
-                logger.info(f"[DartAPI] No major events for corp_code={corp_code}")
-                return []
+        if status == DART_STATUS_NO_DATA:
+            logger.info(f"[DartAPI] No major events for corp_code={corp_code}")
+            return []
 
-            if status != DART_STATUS_SUCCESS:
-                raise DartError(status, message)
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, message)
 
-            events = []
-            items = data.get("list", [])
+        events = []
+        items = data.get("list", [])
 
-            for item in items:
-                event = MajorEvent(
-                    rcept_no=item.get("rcept_no", ""),
-                    rcept_dt=item.get("rcept_dt", ""),
-                    report_nm=item.get("report_nm", ""),
-                    event_type=_classify_event_type(item.get("report_nm", "")),
-                    corp_name=item.get("corp_name", ""),
-                    flr_nm=item.get("flr_nm"),
-                    rm=item.get("rm"),
-                )
-                events.append(event)
+        for item in items:
+            events.append(_parse_event_item(item))
 
-            logger.info(f"[DartAPI] Found {len(events)} major events for corp_code={corp_code}")
-            return events
+        logger.info(f"[DartAPI] Found {len(events)} major events for corp_code={corp_code}")
+        return events
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] HTTP error getting major events: {e}")
@@ -1129,6 +1146,36 @@ async def get_major_events(
         return []
 
 
+def _parse_event_item(item: dict) -> MajorEvent:
+    """DART 공시검색(list.json) 항목 파싱"""
+    return MajorEvent(
+        rcept_no=item.get("rcept_no", ""),
+        rcept_dt=item.get("rcept_dt", ""),
+        report_nm=item.get("report_nm", ""),
+        event_type=_classify_event_type(item.get("report_nm", "")),
+        corp_name=item.get("corp_name", ""),
+        flr_nm=item.get("flr_nm"),
+        rm=item.get("rm"),
+    )
+
+
+def _event_from_row(row: dict) -> MajorEvent:
+    """rkyc_dart_event row → MajorEvent"""
+    try:
+        event_type = MajorEventType(row["event_type"])
+    except ValueError:
+        event_type = _classify_event_type(row.get("report_nm") or "")
+    return MajorEvent(
+        rcept_no=row["rcept_no"],
+        rcept_dt=row["rcept_dt"],
+        report_nm=row["report_nm"],
+        event_type=event_type,
+        corp_name=row.get("corp_name") or "",
+        flr_nm=row.get("flr_nm"),
+        rm=row.get("rm"),
+    )
+
+
 async def get_major_events_by_name(corp_name: str) -> list[MajorEvent]:
     """
     기업명으로 주요사항보고서 조회
@@ -1381,41 +1428,37 @@ async def get_major_shareholders(
     Returns:
         Shareholder 객체 리스트
     """
-    url = f"{DART_BASE_URL}/elestock.json"
+    endpoint = "elestock.json"
     params = {
-        "crtfc_key": DART_API_KEY,
         "corp_code": corp_code,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = await get_dart_client().get_json(endpoint, params)
 
-            status = data.get("status", "")
-            message = data.get("message", "")
+        status = data.get("status", "")
+        message = data.get("message", "")
 
-            if status == DART_STATUS_NO_DATA:
-                logger.info(f"[DartAPI] No shareholder data for corp_code={corp_code}")
-                return []
+        if status == DART_STATUS_NO_DATA:
+            logger.info(f"[DartAPI] No shareholder data for corp_code={corp_code}")
+            return []
 
-            if status != DART_STATUS_SUCCESS:
-                raise DartError(status, message)
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, message)
 
-            shareholders = []
-            items = data.get("list", [])
+        shareholders = []
+        items = data.get("list", [])
 
-            for item in items[:limit]:
-                shareholder = _parse_shareholder_item(item)
-                if shareholder:
-                    shareholders.append(shareholder)
+        for item in items[:limit]:
+            shareholder = _parse_shareholder_item(item)
+            if shareholder:
+                shareholders.append(shareholder)
 
-            # 지분율 기준 정렬
-            shareholders.sort(key=lambda s: s.ratio_pct, reverse=True)
+        # 지분율 기준 정렬
+        shareholders.sort(key=lambda s: s.ratio_pct, reverse=True)
 
-            logger.info(f"[DartAPI] Found {len(shareholders)} shareholders for corp_code={corp_code}")
-            return shareholders
+        logger.info(f"[DartAPI] Found {len(shareholders)} shareholders for corp_code={corp_code}")
+        return shareholders
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] HTTP error: {e}")
@@ -1781,53 +1824,49 @@ async def get_executives(
     Returns:
         Executive 객체 리스트
     """
-    url = f"{DART_BASE_URL}/exctvSttus.json"
+    endpoint = "exctvSttus.json"
 
     # 사업연도 미지정 시 전년도 사용
     if not bsns_year:
         bsns_year = str(datetime.now().year - 1)
 
     params = {
-        "crtfc_key": DART_API_KEY,
         "corp_code": corp_code,
         "bsns_year": bsns_year,
         "reprt_code": reprt_code,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=DART_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            status = data.get("status", "")
-            message = data.get("message", "")
-
-            if status == DART_STATUS_NO_DATA:
-                logger.info(f"[DartAPI] No executive data for corp_code={corp_code}, year={bsns_year}")
-                # 전년도 데이터가 없으면 2년 전 시도
-                if bsns_year == str(datetime.now().year - 1):
-                    logger.info(f"[DartAPI] Trying previous year for executives...")
-                    return await get_executives(
-                        corp_code,
-                        bsns_year=str(datetime.now().year - 2),
-                        reprt_code=reprt_code,
-                    )
-                return []
+        data = await get_dart_client().get_json(endpoint, params)
+
+        status = data.get("status", "")
+        message = data.get("message", "")
+
+        if status == DART_STATUS_NO_DATA:
+            logger.info(f"[DartAPI] No executive data for corp_code={corp_code}, year={bsns_year}")
+            # 전년도 데이터가 없으면 2년 전 시도
+            if bsns_year == str(datetime.now().year - 1):
+                logger.info(f"[DartAPI] Trying previous year for executives...")
+                return await get_executives(
+                    corp_code,
+                    bsns_year=str(datetime.now().year - 2),
+                    reprt_code=reprt_code,
+                )
+            return []
 
-            if status != DART_STATUS_SUCCESS:
-                raise DartError(status, message)
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, message)
 
-            executives = []
-            items = data.get("list", [])
+        executives = []
+        items = data.get("list", [])
 
-            for item in items:
-                executive = _parse_executive_item(item, bsns_year)
-                if executive:
-                    executives.append(executive)
+        for item in items:
+            executive = _parse_executive_item(item, bsns_year)
+            if executive:
+                executives.append(executive)
 
-            logger.info(f"[DartAPI] Found {len(executives)} executives for corp_code={corp_code}")
-            return executives
+        logger.info(f"[DartAPI] Found {len(executives)} executives for corp_code={corp_code}")
+        return executives
 
     except httpx.HTTPError as e:
         logger.error(f"[DartAPI] HTTP error getting executives: {e}")
@@ -1899,7 +1938,7 @@ async def initialize_dart_client():
     logger.info("[DartAPI] Initializing DART API client...")
     success = await load_corp_codes()
     if success:
-        logger.info(f"[DartAPI] Initialization complete. {len(_corp_code_cache)} corp codes loaded.")
+        logger.info(f"[DartAPI] Initialization complete. {get_corp_code_count()} corp codes loaded.")
     else:
         logger.warning("[DartAPI] Failed to initialize. DART features may not work.")
     return success
@@ -0,0 +1,522 @@
+"""
+Shared DART OpenAPI Client
+
+dart_api의 각 조회 함수가 호출마다 httpx.AsyncClient를 새로 만들고 응답을 캐시하지 않던
+구조를 대체한다. get_fact_based_profile / get_extended_fact_profile처럼 기업 하나에
+여러 API를 fan-out하는 경로에서 커넥션/쿼터/중복 호출을 한 곳에서 관리한다.
+
+1. Connection pooling
+   프로세스 수명 동안 유지되는 루프(워커 백그라운드 루프, register_loop()로 등록한 API 서버 루프)는
+   루프별 공유 AsyncClient (커넥션 풀은 루프에 종속되므로 루프마다 1개).
+   그 밖의 루프(asyncio.run / new_event_loop로 만든 단기 루프)는 닫힌 뒤 정리할 수 없으므로
+   요청마다 클라이언트를 열고 닫는다.
+2. Rate limiting
+   - 초당: Redis 1초 구간 카운터로 전체 프로세스 공유 (워커 수와 무관하게 RATE_PER_SECOND),
+           Redis가 없거나 실패하면 프로세스 내 token bucket
+   - 일일: OpenDART 키당 일일 한도 (Redis INCR로 프로세스 간 공유, 없으면 프로세스 로컬)
+   - DART status 020(요청 제한 초과) 응답 시 당일 쿼터 소진으로 간주
+3. Response cache (Memory LRU + Redis)
+   memory 복사본은 MEMORY_TTL_SECONDS까지만 유지 - clear()가 다른 프로세스의 memory에도 반영되도록
+   Key: rkyc:dart:v{version}:{endpoint}:{corp_code}:{bsns_year}:{reprt_code}:{sha256(기타 파라미터)}
+   Freshness (공시는 하루 단위로 바뀜):
+   - company.json / elestock.json      1일
+   - hyslrSttus / exctvSttus / fnlttSinglAcnt  7일 (지난 사업연도는 30일 - 정정공시 외 불변)
+   - list.json (공시검색)               3시간
+   - 013(조회된 데이터 없음)             6시간 (보고서 제출 후 반영되도록 짧게)
+   - 그 외 오류 응답은 캐시하지 않음
+4. Request coalescing
+   같은 키의 동시 요청은 in-flight 요청 1개를 공유.
+
+Usage:
+    data = await get_dart_client().get_json("company.json", {"corp_code": corp_code})
+    if data["status"] == "000": ...
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+DART_CLIENT_CACHE_VERSION = 1
+
+DART_STATUS_SUCCESS = "000"
+DART_STATUS_NO_DATA = "013"
+DART_STATUS_RATE_LIMITED = "020"  # 요청 제한 초과
+
+_KST = timezone(timedelta(hours=9))
+
+
+class DartQuotaExceeded(Exception):
+    """OpenDART 일일 요청 한도 초과"""
+
+
+@dataclass
+class DartClientConfig:
+    """DART client configuration (settings에서 로드)"""
+
+    API_KEY: str = ""
+    BASE_URL: str = "https://opendart.fss.or.kr/api"
+    TIMEOUT: float = 30.0
+    MAX_CONNECTIONS: int = 20
+    MAX_KEEPALIVE_CONNECTIONS: int = 10
+    RATE_PER_SECOND: float = 10.0
+    DAILY_QUOTA: int = 20000
+    CACHE_ENABLED: bool = True
+    ENDPOINT_TTL: dict[str, int] = field(default_factory=lambda: {
+        "company.json": 24 * 3600,
+        "elestock.json": 24 * 3600,
+        "hyslrSttus.json": 7 * 24 * 3600,
+        "exctvSttus.json": 7 * 24 * 3600,
+        "fnlttSinglAcnt.json": 7 * 24 * 3600,
+        "list.json": 3 * 3600,
+    })
+    DEFAULT_TTL: int = 6 * 3600
+    PAST_YEAR_TTL: int = 30 * 24 * 3600
+    NO_DATA_TTL: int = 6 * 3600
+    MEMORY_CACHE_SIZE: int = 2000
+    MEMORY_TTL_SECONDS: int = 300  # 프로세스 memory 복사본 유지 상한 (다른 프로세스의 clear 반영)
+    RATE_LOOKAHEAD_SECONDS: int = 30  # 초당 한도가 찬 경우 슬롯을 찾는 최대 구간
+    REDIS_KEY_PREFIX: str = "rkyc:dart"
+    REDIS_CACHE_DB: int = 2
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.API_KEY = settings.DART_API_KEY
+            self.RATE_PER_SECOND = settings.DART_RATE_PER_SECOND
+            self.DAILY_QUOTA = settings.DART_DAILY_QUOTA
+            self.MAX_CONNECTIONS = settings.DART_MAX_CONNECTIONS
+            self.CACHE_ENABLED = settings.DART_CACHE_ENABLED
+            self.REDIS_CACHE_DB = settings.LLM_CACHE_REDIS_DB
+        except Exception as e:
+            logger.warning(f"Failed to load DART client config from settings: {e}, using defaults")
+
+    def get_ttl(self, endpoint: str, params: dict, status: str) -> int:
+        """응답 freshness (0이면 캐시하지 않음)"""
+        if status == DART_STATUS_NO_DATA:
+            return self.NO_DATA_TTL
+        if status != DART_STATUS_SUCCESS:
+            return 0
+        year = str(params.get("bsns_year") or "")
+        if year.isdigit() and int(year) < datetime.now(_KST).year - 1:
+            return self.PAST_YEAR_TTL
+        return self.ENDPOINT_TTL.get(endpoint, self.DEFAULT_TTL)
+
+
+class TokenBucket:
+    """초당 요청 제한 (스레드/루프 공용, 예약 방식) - 프로세스 로컬, Redis 공유 한도의 fallback"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개 예약. Returns 대기해야 할 시간(초)."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class DartClient:
+    """Pooled, rate-limited, caching DART JSON client"""
+
+    def __init__(
+        self,
+        config: Optional[DartClientConfig] = None,
+        redis_client: Any = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config or DartClientConfig()
+        self._redis = redis_client
+        self._transport = transport
+        self._redis_checked = redis_client is not None
+
+        self._bucket = TokenBucket(self.config.RATE_PER_SECOND)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._persistent_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+        self._inflight: dict[tuple[int, str], asyncio.Future] = {}
+
+        self._memory: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._quota_day = ""
+        self._quota_used = 0
+        self._stats = {
+            "hits": 0, "misses": 0, "coalesced": 0, "requests": 0, "quota_rejected": 0,
+            "rate_waits": 0, "short_lived_clients": 0,
+        }
+
+    def _get_redis(self):
+        """Lazy Redis client; None이면 memory-only"""
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                import redis
+                from app.core.config import settings
+
+                base_url = settings.REDIS_URL.rstrip("/0123456789")
+                client = redis.from_url(
+                    f"{base_url}/{self.config.REDIS_CACHE_DB}",
+                    decode_responses=True,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"[DartClient] Redis unavailable, using memory only: {e}")
+                self._redis = None
+        return self._redis
+
+    def register_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """프로세스 수명 동안 유지되는 루프 등록 (API 서버 루프 - lifespan에서 호출)"""
+        self._persistent_loops.add(loop or asyncio.get_running_loop())
+
+    def _is_persistent(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if loop in self._persistent_loops:
+            return True
+        from app.worker.async_runtime import is_background_loop
+        return is_background_loop(loop)
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.config.BASE_URL,
+            timeout=self.config.TIMEOUT,
+            transport=self._transport,
+            limits=httpx.Limits(
+                max_connections=self.config.MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+    @contextlib.asynccontextmanager
+    async def _http_client(self):
+        """현재 루프의 공유 AsyncClient (단기 루프면 이번 요청용 클라이언트를 열고 닫음)"""
+        loop = asyncio.get_running_loop()
+        if not self._is_persistent(loop):
+            with self._lock:
+                self._stats["short_lived_clients"] += 1
+            async with self._new_http_client() as client:
+                yield client
+            return
+
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._new_http_client()
+            self._clients[loop] = client
+        yield client
+
+    async def aclose(self) -> None:
+        """현재 루프의 공유 AsyncClient 닫기 (API shutdown)"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def make_key(self, endpoint: str, params: dict) -> str:
+        """(endpoint, corp_code, 연도, 보고서 코드) + 기타 파라미터 해시"""
+        rest = {
+            k: v for k, v in params.items()
+            if k not in ("crtfc_key", "corp_code", "bsns_year", "reprt_code")
+        }
+        digest = hashlib.sha256(json.dumps(rest, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return ":".join([
+            self.config.REDIS_KEY_PREFIX,
+            f"v{DART_CLIENT_CACHE_VERSION}",
+            endpoint,
+            str(params.get("corp_code", "")),
+            str(params.get("bsns_year", "")),
+            str(params.get("reprt_code", "")),
+            digest,
+        ])
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _get_cached(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at >= now:
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+            if raw is None:
+                return None
+            value = json.loads(raw)
+            ttl = client.ttl(key)
+            if ttl and ttl > 0:
+                self._set_memory(key, value, ttl)  # MEMORY_TTL_SECONDS 상한
+            return value
+        except Exception as e:
+            logger.warning(f"[DartClient] Redis get failed: {e}")
+            return None
+
+    def _set_cached(self, key: str, value: dict, ttl: int) -> None:
+        self._set_memory(key, value, ttl)
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.setex(key, ttl, json.dumps(value, ensure_ascii=False))
+            except Exception as e:
+                logger.warning(f"[DartClient] Redis set failed: {e}")
+
+    def _set_memory(self, key: str, value: dict, ttl: int) -> None:
+        ttl = min(ttl, self.config.MEMORY_TTL_SECONDS)
+        with self._lock:
+            self._memory[key] = (value, time.time() + ttl)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.config.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Daily quota
+    # ------------------------------------------------------------------
+
+    def _consume_quota(self) -> None:
+        """일일 한도 1건 차감 (Redis 공유 카운터, 없으면 프로세스 로컬)"""
+        day = datetime.now(_KST).strftime("%Y%m%d")
+        client = self._get_redis()
+        used = None
+        if client is not None:
+            try:
+                quota_key = f"{self.config.REDIS_KEY_PREFIX}:quota:{day}"
+                used = client.incr(quota_key)
+                if used == 1:
+                    client.expire(quota_key, 2 * 24 * 3600)
+            except Exception as e:
+                logger.warning(f"[DartClient] Redis quota counter failed: {e}")
+                used = None
+
+        with self._lock:
+            if self._quota_day != day:
+                self._quota_day, self._quota_used = day, 0
+            self._quota_used += 1
+            if used is None:
+                used = self._quota_used
+            if used > self.config.DAILY_QUOTA:
+                self._stats["quota_rejected"] += 1
+                raise DartQuotaExceeded(f"OpenDART daily quota exhausted ({self.config.DAILY_QUOTA}/day)")
+
+    def _mark_quota_exhausted(self) -> None:
+        """DART가 020을 반환 → 당일 남은 요청 차단"""
+        day = datetime.now(_KST).strftime("%Y%m%d")
+        with self._lock:
+            self._quota_day, self._quota_used = day, self.config.DAILY_QUOTA
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.set(
+                    f"{self.config.REDIS_KEY_PREFIX}:quota:{day}",
+                    self.config.DAILY_QUOTA,
+                    ex=2 * 24 * 3600,
+                )
+            except Exception as e:
+                logger.warning(f"[DartClient] Redis quota mark failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Per-second rate
+    # ------------------------------------------------------------------
+
+    def _reserve_rate_slot(self) -> Optional[float]:
+        """
+        Redis 공유 초당 한도에서 슬롯 예약 (1초 구간별 INCR, 찬 구간은 다음 구간으로)
+
+        Returns:
+            대기 시간(초), Redis를 쓸 수 없으면 None (프로세스 token bucket 사용)
+        """
+        if self.config.RATE_PER_SECOND <= 0:
+            return 0.0
+        client = self._get_redis()
+        if client is None:
+            return None
+
+        limit = max(1, int(self.config.RATE_PER_SECOND))
+        now = time.time()
+        second = int(now)
+        try:
+            for offset in range(self.config.RATE_LOOKAHEAD_SECONDS):
+                rate_key = f"{self.config.REDIS_KEY_PREFIX}:rate:{second + offset}"
+                pipe = client.pipeline(transaction=False)
+                pipe.incr(rate_key)
+                pipe.expire(rate_key, self.config.RATE_LOOKAHEAD_SECONDS + 5)
+                used = pipe.execute()[0]
+                if used <= limit:
+                    return max(0.0, second + offset - now)
+        except Exception as e:
+            logger.warning(f"[DartClient] Redis rate counter failed: {e}")
+            return None
+        return float(self.config.RATE_LOOKAHEAD_SECONDS)
+
+    def _admit_request(self) -> Optional[float]:
+        """일일 쿼터 차감 + 초당 슬롯 예약 (동기 Redis 호출 - 스레드에서 실행)"""
+        self._consume_quota()
+        return self._reserve_rate_slot()
+
+    # ------------------------------------------------------------------
+    # Request
+    # ------------------------------------------------------------------
+
+    async def _fetch(self, endpoint: str, params: dict) -> dict:
+        wait = await asyncio.to_thread(self._admit_request)
+        if wait is None:
+            await self._bucket.acquire()
+        elif wait > 0:
+            with self._lock:
+                self._stats["rate_waits"] += 1
+            await asyncio.sleep(wait)
+
+        with self._lock:
+            self._stats["requests"] += 1
+        async with self._http_client() as http:
+            response = await http.get(
+                f"/{endpoint}", params={"crtfc_key": self.config.API_KEY, **params}
+            )
+        response.raise_for_status()
+        data = response.json()
+
+        if data.get("status") == DART_STATUS_RATE_LIMITED:
+            logger.error(f"[DartClient] Rate limited by DART: {data.get('message')}")
+            await asyncio.to_thread(self._mark_quota_exhausted)
+        return data
+
+    async def get_json(self, endpoint: str, params: dict, use_cache: bool = True) -> dict:
+        """
+        DART JSON API 호출 (캐시 → in-flight 공유 → 실제 요청)
+
+        Args:
+            endpoint: API 파일명 (예: "company.json")
+            params: crtfc_key를 제외한 요청 파라미터
+            use_cache: False면 캐시를 건너뛰고 새로 조회 (결과는 캐시에 저장)
+
+        Returns:
+            DART 응답 dict (status/message 포함)
+
+        Raises:
+            httpx.HTTPError: HTTP 오류
+            DartQuotaExceeded: 일일 한도 초과
+        """
+        params = {k: v for k, v in params.items() if k != "crtfc_key"}
+        key = self.make_key(endpoint, params)
+        caching = self.config.CACHE_ENABLED
+
+        if caching and use_cache:
+            cached = await asyncio.to_thread(self._get_cached, key)
+            if cached is not None:
+                with self._lock:
+                    self._stats["hits"] += 1
+                return cached
+
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            with self._lock:
+                self._stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        with self._lock:
+            self._stats["misses"] += 1
+        future = asyncio.ensure_future(self._fetch(endpoint, params))
+        self._inflight[inflight_key] = future
+        try:
+            data = await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._inflight.pop(inflight_key, None)
+            else:
+                future.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+
+        ttl = self.config.get_ttl(endpoint, params, data.get("status", "")) if caching else 0
+        if ttl > 0:
+            await asyncio.to_thread(self._set_cached, key, data, ttl)
+        return data
+
+    def clear(self) -> int:
+        """
+        응답 캐시 전체 삭제 (쿼터 카운터 제외). Returns number of keys removed.
+
+        다른 프로세스의 memory 복사본은 MEMORY_TTL_SECONDS 안에 만료됨.
+        """
+        with self._lock:
+            count = len(self._memory)
+            self._memory.clear()
+
+        client = self._get_redis()
+        if client is not None:
+            pattern = f"{self.config.REDIS_KEY_PREFIX}:v{DART_CLIENT_CACHE_VERSION}:*"
+            try:
+                cursor = 0
+                while True:
+                    cursor, keys = client.scan(cursor, match=pattern, count=100)
+                    if keys:
+                        count += client.delete(*keys)
+                    if cursor == 0:
+                        break
+            except Exception as e:
+                logger.warning(f"[DartClient] Redis clear failed: {e}")
+        return count
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "cache_enabled": self.config.CACHE_ENABLED,
+                "memory_entries": len(self._memory),
+                "redis_available": self._redis is not None,
+                "quota_used_local": self._quota_used,
+                "daily_quota": self.config.DAILY_QUOTA,
+                "rate_per_second": self.config.RATE_PER_SECOND,
+            }
+
+
+# Singleton instance
+_dart_client: Optional[DartClient] = None
+
+
+def get_dart_client() -> DartClient:
+    """Get singleton DART client"""
+    global _dart_client
+    if _dart_client is None:
+        _dart_client = DartClient()
+    return _dart_client
+
+
+def reset_dart_client() -> None:
+    """Reset singleton DART client (for testing)"""
+    global _dart_client
+    _dart_client = None
@@ -0,0 +1,346 @@
+"""
+DART Corp Code Store
+
+DART 기업 고유번호 목록(corpCode.xml, ~10만 건)을 프로세스마다 dict로 들고 있지 않고
+하나의 SQLite 파일에 저장해 모든 API/Celery worker가 읽기 전용으로 공유한다.
+
+- 빌드: ZIP 안의 XML을 iterparse로 스트리밍 파싱 → 임시 파일에 적재 → os.replace로 원자적 교체
+- 조회: 읽기 전용 연결 + mmap (페이지는 OS 캐시로 프로세스 간 공유, cold start 시 파싱 없음)
+- 교체 감지: 파일 inode/mtime이 바뀌면 다음 조회 때 다시 연결 (기존 연결은 이전 파일을 계속 읽음)
+
+Tables:
+- corp(corp_code PK, corp_name, stock_code)       고유번호 / 종목코드 조회
+- corp_name(id PK, normalized_name UNIQUE, corp_code) 기업명 exact/prefix 조회 (B-tree)
+- corp_gram(gram, name_id) PK                      bigram inverted index
+
+기업명 검색은 SqliteCorpNameIndex가 CorpNameIndex의 저장소 hook만 SQL로 바꿔 수행하므로
+점수/순위 규칙은 메모리 인덱스와 동일하다.
+
+Usage:
+    store = DartCorpCodeStore(path, normalizer=_normalize_corp_name)
+    if not store.is_fresh():
+        store.build_from_zip(zip_bytes)
+    store.get_by_stock("005930")
+    store.name_index().best("삼성전자")
+"""
+
+import io
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+from app.services.corp_name_index import CorpNameIndex, ngrams
+
+logger = logging.getLogger(__name__)
+
+STORE_SCHEMA_VERSION = 1
+_BATCH_SIZE = 5000
+_REOPEN_CHECK_SECONDS = 30
+_MMAP_SIZE = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE corp (
+    corp_code TEXT PRIMARY KEY,
+    corp_name TEXT NOT NULL,
+    stock_code TEXT
+) WITHOUT ROWID;
+CREATE TABLE corp_name (
+    id INTEGER PRIMARY KEY,
+    normalized_name TEXT NOT NULL UNIQUE,
+    corp_code TEXT NOT NULL
+);
+CREATE TABLE corp_gram (
+    gram TEXT NOT NULL,
+    name_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, name_id)
+) WITHOUT ROWID;
+"""
+
+
+def default_store_path() -> str:
+    """settings.DART_CORP_CODE_STORE_PATH, 미설정 시 임시 디렉토리"""
+    try:
+        from app.core.config import settings
+        if settings.DART_CORP_CODE_STORE_PATH:
+            return settings.DART_CORP_CODE_STORE_PATH
+    except Exception as e:
+        logger.warning(f"Failed to load DART corp store path from settings: {e}, using default")
+    return os.path.join(tempfile.gettempdir(), "dart_corp_codes.sqlite3")
+
+
+class DartCorpCodeStore:
+    """corpCode.xml 기반 읽기 전용 SQLite 저장소 (프로세스 간 파일 공유)"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        normalizer: Optional[Callable[[str], str]] = None,
+        ttl_hours: float = 24,
+    ):
+        self.path = path or default_store_path()
+        self._normalizer = normalizer or (lambda s: s.strip().lower())
+        self.ttl_hours = ttl_hours
+        self._conn: Optional[sqlite3.Connection] = None
+        self._file_id: Optional[tuple[int, float]] = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Build (streaming parse + atomic swap)
+    # ------------------------------------------------------------------
+
+    def build_from_zip(self, zip_bytes: bytes) -> int:
+        """DART corpCode ZIP으로 저장소 재빌드. Returns 적재된 기업 수."""
+        with zipfile.ZipFile(io.BytesIO(zip_bytes), 'r') as zf:
+            with zf.open(zf.namelist()[0]) as xml_file:
+                return self.build_from_xml(xml_file)
+
+    def build_from_xml(self, xml_file) -> int:
+        """
+        corpCode.xml 스트림으로 저장소 재빌드
+
+        임시 파일에 적재 후 os.replace로 교체하므로 읽는 중인 worker는
+        빌드 도중의 파일을 보지 않는다.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".dart_corp_codes.", suffix=".tmp", dir=directory)
+        os.close(fd)
+
+        try:
+            conn = sqlite3.connect(tmp_path)
+            try:
+                conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _SCHEMA)
+                count = self._load_corps(conn, xml_file)
+                self._load_grams(conn)
+                conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("schema_version", str(STORE_SCHEMA_VERSION)),
+                        ("corp_count", str(count)),
+                        ("updated_at", datetime.now().isoformat()),
+                    ],
+                )
+                conn.commit()
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.info(f"[DartCorpStore] Built {count} corp codes at {self.path}")
+        with self._lock:
+            self._checked_at = 0.0  # 다음 조회에서 새 파일로 재연결
+        return count
+
+    def _load_corps(self, conn: sqlite3.Connection, xml_file) -> int:
+        corps, names = [], []
+        count = 0
+
+        def flush():
+            conn.executemany(
+                "INSERT OR REPLACE INTO corp (corp_code, corp_name, stock_code) VALUES (?, ?, ?)",
+                corps,
+            )
+            # 정규화 이름이 같으면 마지막 값 사용 (기존 dict 동작과 동일)
+            conn.executemany(
+                """
+                INSERT INTO corp_name (normalized_name, corp_code) VALUES (?, ?)
+                ON CONFLICT (normalized_name) DO UPDATE SET corp_code = excluded.corp_code
+                """,
+                names,
+            )
+            corps.clear()
+            names.clear()
+
+        for _, elem in ET.iterparse(xml_file, events=("end",)):
+            if elem.tag != "list":
+                continue
+            corp_code = (elem.findtext("corp_code") or "").strip()
+            corp_name = (elem.findtext("corp_name") or "").strip()
+            stock_code = (elem.findtext("stock_code") or "").strip()  # 상장사만 있음
+            elem.clear()
+            if not corp_code or not corp_name:
+                continue
+
+            corps.append((corp_code, corp_name, stock_code or None))
+            normalized = self._normalizer(corp_name)
+            if normalized:
+                names.append((normalized, corp_code))
+            count += 1
+            if len(corps) >= _BATCH_SIZE:
+                flush()
+        flush()
+        conn.execute("CREATE INDEX ix_corp_stock ON corp (stock_code) WHERE stock_code IS NOT NULL")
+        return count
+
+    def _load_grams(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute("SELECT id, normalized_name FROM corp_name").fetchall()
+        batch = []
+        for name_id, name in rows:
+            batch.extend((gram, name_id) for gram in ngrams(name))
+            if len(batch) >= _BATCH_SIZE:
+                conn.executemany("INSERT OR IGNORE INTO corp_gram (gram, name_id) VALUES (?, ?)", batch)
+                batch.clear()
+        conn.executemany("INSERT OR IGNORE INTO corp_gram (gram, name_id) VALUES (?, ?)", batch)
+
+    # ------------------------------------------------------------------
+    # Read-only access
+    # ------------------------------------------------------------------
+
+    def _stat(self) -> Optional[tuple[int, float]]:
+        try:
+            st = os.stat(self.path)
+            return st.st_ino, st.st_mtime
+        except OSError:
+            return None
+
+    def exists(self) -> bool:
+        return self._stat() is not None
+
+    def is_fresh(self) -> bool:
+        """저장소 파일이 있고 TTL 이내인지"""
+        file_id = self._stat()
+        if file_id is None:
+            return False
+        return (time.time() - file_id[1]) / 3600 < self.ttl_hours
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """읽기 전용 연결 (파일이 교체되었으면 재연결). 호출자는 self._lock 보유."""
+        now = time.monotonic()
+        if self._conn is not None and now - self._checked_at < _REOPEN_CHECK_SECONDS:
+            return self._conn
+        self._checked_at = now
+
+        file_id = self._stat()
+        if file_id is None:
+            self.close()
+            return None
+        if self._conn is not None and file_id == self._file_id:
+            return self._conn
+
+        self.close()
+        try:
+            conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+            version = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if not version or int(version[0]) != STORE_SCHEMA_VERSION:
+                conn.close()
+                logger.warning(f"[DartCorpStore] Schema mismatch at {self.path}, rebuild required")
+                return None
+        except sqlite3.Error as e:
+            logger.warning(f"[DartCorpStore] Failed to open {self.path}: {e}")
+            return None
+
+        self._conn, self._file_id = conn, file_id
+        return conn
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """읽기 쿼리 (저장소가 없으면 빈 결과)"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            return conn.execute(sql, params).fetchall()
+
+    def is_available(self) -> bool:
+        with self._lock:
+            return self._connection() is not None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn, self._file_id = None, None
+
+    def count(self) -> int:
+        rows = self.query("SELECT value FROM meta WHERE key = 'corp_count'")
+        return int(rows[0][0]) if rows else 0
+
+    def get_by_stock(self, stock_code: str) -> Optional[str]:
+        rows = self.query(
+            "SELECT corp_code FROM corp WHERE stock_code = ? LIMIT 1", (stock_code.strip(),)
+        )
+        return rows[0][0] if rows else None
+
+    def get_corp_name(self, corp_code: str) -> Optional[str]:
+        rows = self.query("SELECT corp_name FROM corp WHERE corp_code = ?", (corp_code,))
+        return rows[0][0] if rows else None
+
+    def iter_corp_codes(self, listed_only: bool = False) -> Iterator[str]:
+        """전체 (또는 상장사) corp_code"""
+        where = " WHERE stock_code IS NOT NULL" if listed_only else ""
+        for (corp_code,) in self.query(f"SELECT corp_code FROM corp{where} ORDER BY corp_code"):
+            yield corp_code
+
+    def name_index(self) -> "SqliteCorpNameIndex":
+        return SqliteCorpNameIndex(self, self._normalizer)
+
+
+class SqliteCorpNameIndex(CorpNameIndex):
+    """DartCorpCodeStore 위의 기업명 인덱스 (CorpNameIndex 점수 규칙 그대로, 저장소만 SQL)"""
+
+    def __init__(self, store: DartCorpCodeStore, normalizer: Optional[Callable[[str], str]] = None):
+        super().__init__(normalizer)
+        self._store = store
+
+    def __len__(self) -> int:
+        return self._store.count()
+
+    def _exact_id(self, query: str) -> Optional[int]:
+        rows = self._store.query("SELECT id FROM corp_name WHERE normalized_name = ?", (query,))
+        return rows[0][0] if rows else None
+
+    def _prefix_candidates(self, query: str, limit: int) -> list[tuple[int, str]]:
+        return self._store.query(
+            """
+            SELECT id, normalized_name FROM corp_name
+            WHERE normalized_name >= ? AND normalized_name < ?
+            ORDER BY length(normalized_name), normalized_name
+            LIMIT ?
+            """,
+            (query, query + "\U0010ffff", limit),
+        )
+
+    def _gram_candidates(self, grams: set[str]) -> list[tuple[int, str, int]]:
+        if not grams:
+            return []
+        placeholders = ",".join("?" * len(grams))
+        return self._store.query(
+            f"""
+            SELECT n.id, n.normalized_name, COUNT(*)
+            FROM corp_gram g JOIN corp_name n ON n.id = g.name_id
+            WHERE g.gram IN ({placeholders})
+            GROUP BY n.id
+            """,
+            tuple(grams),
+        )
+
+    def _entries(self, ids: list[int]) -> dict[int, tuple[str, str]]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._store.query(
+            f"""
+            SELECT n.id, n.corp_code, COALESCE(c.corp_name, n.normalized_name)
+            FROM corp_name n LEFT JOIN corp c ON c.corp_code = n.corp_code
+            WHERE n.id IN ({placeholders})
+            """,
+            tuple(ids),
+        )
+        return {i: (code, name) for i, code, name in rows}
@@ -0,0 +1,352 @@
+"""
+DART Local Filing Store
+
+sync_dart_filings 배치가 적재한 DART 재무제표/주요사항보고서 로컬 사본 접근.
+조회 경로(get_financial_statements / get_major_events)는 동기화가 최근(MAX_AGE_HOURS 이내)에
+끝난 기업이면 DART 실시간 호출 대신 여기서 읽는다.
+
+Tables (migration_v20):
+- rkyc_dart_financial   (corp_code, bsns_year, reprt_code, fs_div) 주요계정
+- rkyc_dart_event       rcept_no PK, (corp_code, rcept_dt DESC) 인덱스
+- rkyc_dart_sync_state  기업별 high-water mark (events_last_rcept_no / events_last_rcept_dt)
+
+로컬 사본이 보장하는 범위:
+- 재무제표: 배치가 동기화하는 보고서(SYNC_REPRT_CODE / SYNC_FS_DIV)의 최근 SYNC_YEARS년
+- 공시: events_from 이후의 주요사항보고(pblntf_ty=B)
+범위 밖 요청이나 DB 오류는 None을 반환 → 호출측이 DART 실시간 조회로 fallback.
+
+Storage: 동기 세션 (API에서는 asyncio.to_thread, worker에서는 직접 호출)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+SYNC_REPRT_CODE = "11011"   # 사업보고서
+SYNC_FS_DIV = "OFS"         # 개별재무제표
+SYNC_EVENT_TYPE = "B"       # 주요사항보고
+
+FINANCIAL_COLUMNS = (
+    "revenue",
+    "operating_profit",
+    "net_income",
+    "total_assets",
+    "total_liabilities",
+    "total_equity",
+    "retained_earnings",
+    "debt_ratio",
+)
+
+EVENT_COLUMNS = ("rcept_no", "rcept_dt", "report_nm", "event_type", "corp_name", "flr_nm", "rm")
+
+STATE_COLUMNS = (
+    "events_from",
+    "events_last_rcept_no",
+    "events_last_rcept_dt",
+    "financials_checked_at",
+    "last_synced_at",
+    "last_error",
+)
+
+
+@dataclass
+class DartLocalConfig:
+    """DART local store configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    MAX_AGE_HOURS: int = 48  # 마지막 동기화 후 로컬 조회를 허용하는 시간
+    SYNC_YEARS: int = 3
+    SYNC_CONCURRENCY: int = 4
+    FINANCIALS_RECHECK_DAYS: int = 7  # 미제출 연도 재확인 주기
+    EVENTS_LOOKBACK_DAYS: int = 365  # 최초 동기화 시 공시 조회 기간
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.DART_LOCAL_ENABLED
+            self.MAX_AGE_HOURS = settings.DART_LOCAL_MAX_AGE_HOURS
+            self.SYNC_CONCURRENCY = settings.DART_SYNC_CONCURRENCY
+            self.FINANCIALS_RECHECK_DAYS = settings.DART_SYNC_FINANCIALS_RECHECK_DAYS
+        except Exception as e:
+            logger.warning(f"Failed to load DART local config from settings: {e}, using defaults")
+
+
+class DartLocalStore:
+    """rkyc_dart_* 테이블 접근 (DB 오류 시 None/False → 실시간 조회로 동작)"""
+
+    def __init__(
+        self,
+        config: Optional[DartLocalConfig] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.config = config or DartLocalConfig()
+        self._session_factory = session_factory
+
+    def _open_session(self):
+        if self._session_factory is None:
+            from app.worker.db import get_sync_session
+            self._session_factory = get_sync_session
+        return self._session_factory()
+
+    # ------------------------------------------------------------------
+    # Sync state
+    # ------------------------------------------------------------------
+
+    def get_state(self, corp_code: str) -> Optional[dict]:
+        """기업 동기화 상태 (없거나 오류면 None)"""
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            row = session.execute(
+                text(f"""
+                    SELECT {", ".join(STATE_COLUMNS)}
+                    FROM rkyc_dart_sync_state
+                    WHERE corp_code = :corp_code
+                """),
+                {"corp_code": corp_code},
+            ).fetchone()
+            return dict(row._mapping) if row else None
+        except Exception as e:
+            logger.warning(f"[DartLocal] State load failed for {corp_code}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def is_fresh(self, state: Optional[dict]) -> bool:
+        """최근 MAX_AGE_HOURS 이내에 동기화된 상태인지"""
+        if not self.config.ENABLED or not state or not state.get("last_synced_at"):
+            return False
+        synced_at = state["last_synced_at"]
+        if synced_at.tzinfo is None:
+            synced_at = synced_at.replace(tzinfo=UTC)
+        return datetime.now(UTC) - synced_at < timedelta(hours=self.config.MAX_AGE_HOURS)
+
+    def update_state(self, corp_code: str, **fields: Any) -> bool:
+        """동기화 상태 upsert (전달한 컬럼만 갱신)"""
+        from sqlalchemy import text
+
+        unknown = set(fields) - set(STATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown sync state columns: {sorted(unknown)}")
+        if not fields:
+            return False
+
+        columns = list(fields)
+        session = self._open_session()
+        try:
+            session.execute(
+                text(f"""
+                    INSERT INTO rkyc_dart_sync_state (corp_code, {", ".join(columns)})
+                    VALUES (:corp_code, {", ".join(f":{c}" for c in columns)})
+                    ON CONFLICT (corp_code) DO UPDATE SET
+                        {", ".join(f"{c} = EXCLUDED.{c}" for c in columns)}
+                """),
+                {"corp_code": corp_code, **fields},
+            )
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[DartLocal] State update failed for {corp_code}: {e}")
+            return False
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Financial statements
+    # ------------------------------------------------------------------
+
+    def load_financials(
+        self,
+        corp_code: str,
+        years: Iterable[str],
+        reprt_code: str = SYNC_REPRT_CODE,
+        fs_div: str = SYNC_FS_DIV,
+    ) -> Optional[list[dict]]:
+        """
+        로컬 재무제표 조회
+
+        Returns:
+            연도 내림차순 row 목록 (로컬에 없는 연도는 DART 미제출로 간주),
+            로컬 사본이 요청을 보장하지 못하면 None
+        """
+        years = list(years)
+        if reprt_code != SYNC_REPRT_CODE or fs_div != SYNC_FS_DIV:
+            return None
+        if not self.is_fresh(self.get_state(corp_code)):
+            return None
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            rows = session.execute(
+                text(f"""
+                    SELECT bsns_year, reprt_code, {", ".join(FINANCIAL_COLUMNS)}
+                    FROM rkyc_dart_financial
+                    WHERE corp_code = :corp_code AND reprt_code = :reprt_code
+                      AND fs_div = :fs_div AND bsns_year = ANY(:years)
+                    ORDER BY bsns_year DESC
+                """),
+                {"corp_code": corp_code, "reprt_code": reprt_code, "fs_div": fs_div, "years": years},
+            ).fetchall()
+            return [dict(row._mapping) for row in rows]
+        except Exception as e:
+            logger.warning(f"[DartLocal] Financials load failed for {corp_code}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def synced_years(self, corp_code: str) -> set[str]:
+        """로컬에 적재된 사업연도 (동기화 대상 보고서 기준)"""
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            rows = session.execute(
+                text("""
+                    SELECT bsns_year FROM rkyc_dart_financial
+                    WHERE corp_code = :corp_code AND reprt_code = :reprt_code AND fs_div = :fs_div
+                """),
+                {"corp_code": corp_code, "reprt_code": SYNC_REPRT_CODE, "fs_div": SYNC_FS_DIV},
+            ).fetchall()
+            return {row.bsns_year for row in rows}
+        except Exception as e:
+            logger.warning(f"[DartLocal] Year lookup failed for {corp_code}: {e}")
+            return set()
+        finally:
+            session.close()
+
+    def save_financials(
+        self,
+        corp_code: str,
+        rows: list[dict],
+        reprt_code: str = SYNC_REPRT_CODE,
+        fs_div: str = SYNC_FS_DIV,
+    ) -> int:
+        """재무제표 upsert (row: bsns_year + FINANCIAL_COLUMNS). Returns saved rows."""
+        if not rows:
+            return 0
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            session.execute(
+                text(f"""
+                    INSERT INTO rkyc_dart_financial (
+                        corp_code, bsns_year, reprt_code, fs_div, {", ".join(FINANCIAL_COLUMNS)}, synced_at
+                    ) VALUES (
+                        :corp_code, :bsns_year, :reprt_code, :fs_div,
+                        {", ".join(f":{c}" for c in FINANCIAL_COLUMNS)}, NOW()
+                    )
+                    ON CONFLICT (corp_code, bsns_year, reprt_code, fs_div) DO UPDATE SET
+                        {", ".join(f"{c} = EXCLUDED.{c}" for c in FINANCIAL_COLUMNS)},
+                        synced_at = EXCLUDED.synced_at
+                """),
+                [
+                    {
+                        "corp_code": corp_code,
+                        "bsns_year": row["bsns_year"],
+                        "reprt_code": reprt_code,
+                        "fs_div": fs_div,
+                        **{c: row.get(c) for c in FINANCIAL_COLUMNS},
+                    }
+                    for row in rows
+                ],
+            )
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[DartLocal] Financials save failed for {corp_code}: {e}")
+            raise
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Major events
+    # ------------------------------------------------------------------
+
+    def load_events(
+        self,
+        corp_code: str,
+        bgn_de: str,
+        end_de: str,
+        pblntf_ty: str = SYNC_EVENT_TYPE,
+    ) -> Optional[list[dict]]:
+        """
+        로컬 주요사항보고서 조회 (rcept_no 내림차순 = DART list.json 순서)
+
+        Returns:
+            row 목록, 로컬 사본이 기간/유형을 보장하지 못하면 None
+        """
+        if pblntf_ty != SYNC_EVENT_TYPE:
+            return None
+        state = self.get_state(corp_code)
+        if not self.is_fresh(state) or not state.get("events_from") or bgn_de < state["events_from"]:
+            return None
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            rows = session.execute(
+                text(f"""
+                    SELECT {", ".join(EVENT_COLUMNS)}
+                    FROM rkyc_dart_event
+                    WHERE corp_code = :corp_code AND rcept_dt BETWEEN :bgn_de AND :end_de
+                    ORDER BY rcept_dt DESC, rcept_no DESC
+                """),
+                {"corp_code": corp_code, "bgn_de": bgn_de, "end_de": end_de},
+            ).fetchall()
+            return [dict(row._mapping) for row in rows]
+        except Exception as e:
+            logger.warning(f"[DartLocal] Events load failed for {corp_code}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def save_events(self, corp_code: str, rows: list[dict]) -> int:
+        """공시 insert (이미 있는 rcept_no는 무시). Returns inserted rows."""
+        if not rows:
+            return 0
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            result = session.execute(
+                text(f"""
+                    INSERT INTO rkyc_dart_event (corp_code, {", ".join(EVENT_COLUMNS)}, synced_at)
+                    VALUES (:corp_code, {", ".join(f":{c}" for c in EVENT_COLUMNS)}, NOW())
+                    ON CONFLICT (rcept_no) DO NOTHING
+                """),
+                [{"corp_code": corp_code, **{c: row.get(c) for c in EVENT_COLUMNS}} for row in rows],
+            )
+            session.commit()
+            return max(result.rowcount or 0, 0)
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[DartLocal] Events save failed for {corp_code}: {e}")
+            raise
+        finally:
+            session.close()
+
+
+# Singleton instance
+_dart_local_store: Optional[DartLocalStore] = None
+
+
+def get_dart_local_store() -> DartLocalStore:
+    """Get singleton DartLocalStore instance"""
+    global _dart_local_store
+    if _dart_local_store is None:
+        _dart_local_store = DartLocalStore()
+    return _dart_local_store
+
+
+def reset_dart_local_store() -> None:
+    """Reset singleton (for testing)"""
+    global _dart_local_store
+    _dart_local_store = None
@@ -0,0 +1,194 @@
+"""
+Dashboard Summary Service
+
+GET /dashboard/summary 집계.
+
+기존: 요청마다 rkyc_signal_index JOIN rkyc_signal 전체 집계 (시그널 수에 비례)
+변경: 트리거로 유지되는 rkyc_dashboard_counter (migration_v22, 최대 27 row) 조회
+      - migration_v26: 트리거는 증감을 rkyc_dashboard_counter_delta에 append (공유 row 잠금 없음),
+        rollup_dashboard_counter 태스크가 1분마다 카운터에 합산
+        → 조회는 카운터 + 미합산 delta (rkyc_dashboard_counter_current view)
+      + 프로세스 내 짧은 TTL 캐시 (자동 새로고침하는 모든 분석가 요청이 한 번의 조회를 공유)
+
+- 캐시된 응답은 카운터를 읽은 시각(generated_at)을 그대로 유지
+- 같은 프로세스의 상태 변경 API는 invalidate()로 즉시 반영, 다른 프로세스는 TTL 이내 반영
+- 카운터 테이블이 없으면 (migration 미적용) 기존 전체 집계로 fallback
+
+Usage:
+    summary = await get_dashboard_summary_service().get(db)
+    get_dashboard_summary_service().invalidate()
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.signal import (
+    ImpactDirection,
+    Signal,
+    SignalIndex,
+    SignalStatus,
+    SignalType,
+)
+from app.schemas.signal import DashboardSummaryResponse
+
+logger = logging.getLogger(__name__)
+
+COUNTER_RETRY_SECONDS = 300  # 카운터 조회 실패 후 전체 집계로 버티는 시간
+
+
+@dataclass
+class DashboardSummaryConfig:
+    """Dashboard summary cache configuration (settings에서 로드)"""
+
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: float = 5.0
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.CACHE_TTL_SECONDS = settings.DASHBOARD_SUMMARY_CACHE_TTL_SECONDS
+            self.CACHE_ENABLED = self.CACHE_TTL_SECONDS > 0
+        except Exception as e:
+            logger.warning(f"Failed to load dashboard summary config from settings: {e}, using defaults")
+
+
+def build_summary(
+    rows: list[tuple],
+    generated_at: datetime,
+) -> DashboardSummaryResponse:
+    """
+    (signal_type, impact_direction, signal_status, count) 행 → 응답
+
+    signal_status가 NULL이면 NEW로 집계 (기존 집계와 동일).
+    """
+    by_type = {t.value: 0 for t in (SignalType.DIRECT, SignalType.INDUSTRY, SignalType.ENVIRONMENT)}
+    by_status = {s.value: 0 for s in (SignalStatus.NEW, SignalStatus.REVIEWED, SignalStatus.DISMISSED)}
+    by_direction = {d.value: 0 for d in ImpactDirection}
+    total = 0
+
+    for signal_type, impact_direction, signal_status, count in rows:
+        count = int(count or 0)
+        signal_type = getattr(signal_type, "value", signal_type)
+        impact_direction = getattr(impact_direction, "value", impact_direction)
+        signal_status = getattr(signal_status, "value", signal_status) or SignalStatus.NEW.value
+        total += count
+        by_type[signal_type] = by_type.get(signal_type, 0) + count
+        by_status[signal_status] = by_status.get(signal_status, 0) + count
+        by_direction[impact_direction] = by_direction.get(impact_direction, 0) + count
+
+    return DashboardSummaryResponse(
+        total_signals=total,
+        new_signals=by_status[SignalStatus.NEW.value],
+        risk_signals=by_direction[ImpactDirection.RISK.value],
+        opportunity_signals=by_direction[ImpactDirection.OPPORTUNITY.value],
+        by_type=by_type,
+        by_status=by_status,
+        generated_at=generated_at,
+    )
+
+
+class DashboardSummaryService:
+    """카운터 조회 + 프로세스 내 TTL 캐시 (동시 요청은 한 번만 조회)"""
+
+    def __init__(self, config: Optional[DashboardSummaryConfig] = None):
+        self.config = config or DashboardSummaryConfig()
+        self._cached: Optional[DashboardSummaryResponse] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self._counter_retry_at = 0.0
+        self._stats = {"hits": 0, "misses": 0, "fallbacks": 0}
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def get(self, db: AsyncSession) -> DashboardSummaryResponse:
+        """요약 통계 (TTL 내에는 캐시 응답)"""
+        if self.config.CACHE_ENABLED and self._cached is not None and time.monotonic() < self._expires_at:
+            self._stats["hits"] += 1
+            return self._cached
+
+        async with self._get_lock():
+            # 대기 중 다른 요청이 갱신했으면 재사용
+            if self.config.CACHE_ENABLED and self._cached is not None and time.monotonic() < self._expires_at:
+                self._stats["hits"] += 1
+                return self._cached
+
+            self._stats["misses"] += 1
+            summary = await self._load(db)
+            if self.config.CACHE_ENABLED:
+                self._cached = summary
+                self._expires_at = time.monotonic() + self.config.CACHE_TTL_SECONDS
+            return summary
+
+    async def _load(self, db: AsyncSession) -> DashboardSummaryResponse:
+        generated_at = datetime.now(UTC)
+        if time.monotonic() >= self._counter_retry_at:
+            try:
+                result = await db.execute(text("""
+                    SELECT signal_type, impact_direction, signal_status, signal_count
+                    FROM rkyc_dashboard_counter_current
+                    WHERE signal_count <> 0
+                """))
+                return build_summary([tuple(row) for row in result.all()], generated_at)
+            except Exception as e:
+                # migration_v22/v26 미적용 등 - 한동안 바로 전체 집계
+                logger.warning(f"[DashboardSummary] Counter unavailable, falling back to full aggregate: {e}")
+                self._counter_retry_at = time.monotonic() + COUNTER_RETRY_SECONDS
+                await db.rollback()
+
+        self._stats["fallbacks"] += 1
+        result = await db.execute(
+            select(
+                SignalIndex.signal_type,
+                SignalIndex.impact_direction,
+                Signal.signal_status,
+                func.count(),
+            )
+            .join(Signal, Signal.signal_id == SignalIndex.signal_id)
+            .group_by(SignalIndex.signal_type, SignalIndex.impact_direction, Signal.signal_status)
+        )
+        return build_summary([tuple(row) for row in result.all()], generated_at)
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (시그널 상태 변경 직후)"""
+        self._cached = None
+        self._expires_at = 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "cache_enabled": self.config.CACHE_ENABLED,
+            "ttl_seconds": self.config.CACHE_TTL_SECONDS,
+            "counter_available": time.monotonic() >= self._counter_retry_at,
+            "cached_generated_at": self._cached.generated_at.isoformat() if self._cached else None,
+        }
+
+
+# Singleton instance
+_dashboard_summary_service: Optional[DashboardSummaryService] = None
+
+
+def get_dashboard_summary_service() -> DashboardSummaryService:
+    """Get singleton DashboardSummaryService instance"""
+    global _dashboard_summary_service
+    if _dashboard_summary_service is None:
+        _dashboard_summary_service = DashboardSummaryService()
+    return _dashboard_summary_service
+
+
+def reset_dashboard_summary_service() -> None:
+    """Reset singleton (for testing)"""
+    global _dashboard_summary_service
+    _dashboard_summary_service = None
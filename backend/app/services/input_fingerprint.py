@@ -0,0 +1,299 @@
+"""
+Analysis Input Fingerprint (변경 감지 게이트)
+
+스케줄러(scan_all_corporations / scan_high_risk_corporations / DynamicScheduler)는
+마지막 분석 이후 기업 입력이 바뀌었는지와 관계없이 전체 분석 Job을 만들었고,
+대부분의 정기 실행이 같은 시그널을 다시 도출했다.
+
+기업별 입력 fingerprint = sha256(아래 구성요소의 canonical JSON):
+- snapshot        rkyc_internal_snapshot_latest (snapshot_version, snapshot_hash)
+- documents       rkyc_document doc_id:file_hash 목록
+- banking         rkyc_banking_data 최신 data_date
+- profile         rkyc_corp_profile 버전 (updated_at, 없으면 fetched_at)
+- news            외부 이벤트 watermark
+                  (rkyc_dart_sync_state.events_last_rcept_no + rkyc_external_event_target 최신 created_at)
+
+run_analysis_pipeline이 시작 시 fingerprint를 계산해 Job에 기록 (rkyc_job.input_fingerprint, migration_v24)
+→ DONE Job의 fingerprint = 그 분석이 읽은 입력.
+분석 자신이 쓰는 구성요소(ANALYSIS_WRITTEN_COMPONENTS: PROFILING 단계의 rkyc_corp_profile upsert)는
+완료 시 다시 읽어 교체 (finalize_job_fingerprint) - 그대로 두면 매 분석이 자기 fingerprint를 무효화해
+다음 스캔이 항상 INPUT_CHANGED가 된다. 나머지 구성요소는 시작 시점 값을 유지 (분석 중 바뀐 입력은 다음 스캔에서 감지).
+
+스케줄러는 아래 경우에만 Job 생성 (rkyc_job.queue_reason에 사유 기록):
+- NO_PRIOR_RUN       완료된 분석 없음 (또는 fingerprint 기록 이전 Job)
+- INPUT_CHANGED      fingerprint 변경
+- FRESHNESS_EXPIRED  마지막 완료 후 freshness SLA 경과 (실시간 뉴스 검색 결과는 DB에 남지 않으므로
+                     SLA가 뉴스 반영 주기를 보장)
+- GATE_DISABLED      게이트 비활성/구성요소 조회 실패 (기존처럼 전부 생성)
+API/수동 실행은 MANUAL로 기록되고 게이트를 거치지 않는다.
+포트폴리오 규칙 평가(evaluate_portfolio_rules)가 신규 시그널 후보를 찾은 기업은 RULE_TRIGGERED로 생성된다.
+
+Usage:
+    plan = plan_scan(db, corp_ids, freshness_hours=config.FRESHNESS_HOURS)
+    for decision in plan.queued: ...
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import text
+
+from app.models.job import QueueReason
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_VERSION = 1  # 구성요소가 바뀌면 증가 → 전체 기업 INPUT_CHANGED 1회
+
+# run_analysis_pipeline이 직접 갱신하는 구성요소 (완료 시 분석 후 값으로 교체)
+ANALYSIS_WRITTEN_COMPONENTS = ("profile",)
+
+COMPONENTS_SQL = text("""
+    SELECT
+        c.corp_id,
+        isl.snapshot_version,
+        isl.snapshot_hash,
+        docs.file_hashes,
+        bd.data_date AS banking_data_date,
+        COALESCE(p.updated_at, p.fetched_at) AS profile_version,
+        dss.events_last_rcept_no AS dart_last_rcept_no,
+        ext.last_event_at AS external_last_event_at,
+        lj.input_fingerprint AS last_fingerprint,
+        lj.finished_at AS last_finished_at
+    FROM corp c
+    LEFT JOIN rkyc_internal_snapshot_latest isl ON isl.corp_id = c.corp_id
+    LEFT JOIN LATERAL (
+        SELECT string_agg(d.doc_id::text || ':' || COALESCE(d.file_hash, ''), ',' ORDER BY d.doc_id) AS file_hashes
+        FROM rkyc_document d
+        WHERE d.corp_id = c.corp_id
+    ) docs ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT MAX(b.data_date) AS data_date
+        FROM rkyc_banking_data b
+        WHERE b.corp_id = c.corp_id
+    ) bd ON TRUE
+    LEFT JOIN rkyc_corp_profile p ON p.corp_id = c.corp_id
+    LEFT JOIN rkyc_dart_sync_state dss ON dss.corp_code = c.dart_corp_code
+    LEFT JOIN LATERAL (
+        SELECT MAX(t.created_at) AS last_event_at
+        FROM rkyc_external_event_target t
+        WHERE t.corp_id = c.corp_id
+    ) ext ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT j.input_fingerprint, j.finished_at
+        FROM rkyc_job j
+        WHERE j.corp_id = c.corp_id
+          AND j.job_type = 'ANALYZE'
+          AND j.status = 'DONE'
+        ORDER BY j.finished_at DESC NULLS LAST
+        LIMIT 1
+    ) lj ON TRUE
+    WHERE c.corp_id = ANY(:corp_ids)
+""")
+
+RECORD_SQL = text("""
+    UPDATE rkyc_job
+    SET input_fingerprint = :fingerprint
+    WHERE job_id = CAST(:job_id AS uuid)
+""")
+
+
+@dataclass
+class InputFingerprintConfig:
+    """Input fingerprint gate configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    FRESHNESS_HOURS: int = 72  # 입력이 같아도 이 시간이 지나면 재분석 (scan_all / DynamicScheduler)
+    HIGH_RISK_FRESHNESS_HOURS: int = 24  # scan_high_risk_corporations
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.INPUT_FINGERPRINT_ENABLED
+            self.FRESHNESS_HOURS = settings.ANALYSIS_FRESHNESS_HOURS
+            self.HIGH_RISK_FRESHNESS_HOURS = settings.HIGH_RISK_ANALYSIS_FRESHNESS_HOURS
+        except Exception as e:
+            logger.warning(f"Failed to load input fingerprint config from settings: {e}, using defaults")
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.astimezone(UTC).isoformat() if value.tzinfo else value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def fingerprint_components(row: Any) -> dict:
+    """COMPONENTS_SQL 행 → fingerprint 구성요소"""
+    return {
+        "v": FINGERPRINT_VERSION,
+        "snapshot": [_value(row.snapshot_version), _value(row.snapshot_hash)],
+        "documents": _value(row.file_hashes),
+        "banking": _value(row.banking_data_date),
+        "profile": _value(row.profile_version),
+        "news": [_value(row.dart_last_rcept_no), _value(row.external_last_event_at)],
+    }
+
+
+def compute_fingerprint(components: dict) -> str:
+    """구성요소 canonical JSON의 sha256"""
+    canonical = json.dumps(components, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def decide(
+    fingerprint: str,
+    last_fingerprint: Optional[str],
+    last_finished_at: Optional[datetime],
+    freshness_hours: float,
+    now: Optional[datetime] = None,
+) -> Optional[QueueReason]:
+    """Job 생성 사유 (None이면 건너뜀)"""
+    if not last_fingerprint or last_finished_at is None:
+        return QueueReason.NO_PRIOR_RUN
+    if fingerprint != last_fingerprint:
+        return QueueReason.INPUT_CHANGED
+    now = now or datetime.now(UTC)
+    if last_finished_at.tzinfo is None:
+        last_finished_at = last_finished_at.replace(tzinfo=UTC)
+    if now - last_finished_at >= timedelta(hours=freshness_hours):
+        return QueueReason.FRESHNESS_EXPIRED
+    return None
+
+
+@dataclass
+class ScanDecision:
+    """기업별 게이트 판정"""
+
+    corp_id: str
+    reason: Optional[QueueReason]
+    fingerprint: Optional[str] = None
+
+
+@dataclass
+class ScanPlan:
+    """스캔 대상 기업 판정 결과"""
+
+    decisions: list[ScanDecision] = field(default_factory=list)
+
+    @property
+    def queued(self) -> list[ScanDecision]:
+        return [d for d in self.decisions if d.reason is not None]
+
+    @property
+    def skipped(self) -> int:
+        return sum(1 for d in self.decisions if d.reason is None)
+
+    def reason_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for decision in self.queued:
+            counts[decision.reason.value] = counts.get(decision.reason.value, 0) + 1
+        return counts
+
+
+def load_fingerprints(session, corp_ids: Iterable[str]) -> dict[str, Any]:
+    """corp_id → COMPONENTS_SQL 행 (쿼리 1회)"""
+    corp_ids = list(corp_ids)
+    if not corp_ids:
+        return {}
+    rows = session.execute(COMPONENTS_SQL, {"corp_ids": corp_ids}).fetchall()
+    return {row.corp_id: row for row in rows}
+
+
+def plan_scan(
+    session,
+    corp_ids: Iterable[str],
+    freshness_hours: float,
+    config: Optional[InputFingerprintConfig] = None,
+    now: Optional[datetime] = None,
+    freshness_by_corp: Optional[dict[str, float]] = None,
+) -> ScanPlan:
+    """
+    스캔 대상 기업별 Job 생성 여부 판정
+
+    freshness_by_corp: 기업별 freshness SLA (없는 기업은 freshness_hours)
+    구성요소 조회 실패 (migration_v24 미적용 등) 시 전부 GATE_DISABLED로 생성 → 기존 동작
+    """
+    config = config or InputFingerprintConfig()
+    corp_ids = list(corp_ids)
+    if not config.ENABLED:
+        return ScanPlan([ScanDecision(c, QueueReason.GATE_DISABLED) for c in corp_ids])
+
+    try:
+        rows = load_fingerprints(session, corp_ids)
+    except Exception as e:
+        logger.warning(f"[InputFingerprint] Component load failed, queueing all: {e}")
+        session.rollback()
+        return ScanPlan([ScanDecision(c, QueueReason.GATE_DISABLED) for c in corp_ids])
+
+    plan = ScanPlan()
+    for corp_id in corp_ids:
+        row = rows.get(corp_id)
+        if row is None:
+            continue
+        fingerprint = compute_fingerprint(fingerprint_components(row))
+        sla = (freshness_by_corp or {}).get(corp_id, freshness_hours)
+        reason = decide(fingerprint, row.last_fingerprint, row.last_finished_at, sla, now)
+        plan.decisions.append(ScanDecision(corp_id, reason, fingerprint))
+
+    logger.info(
+        f"[InputFingerprint] {len(plan.queued)}/{len(plan.decisions)} corps queued "
+        f"({plan.reason_counts()}), {plan.skipped} unchanged"
+    )
+    return plan
+
+
+def record_job_fingerprint(session, job_id: str, corp_id: str) -> Optional[dict]:
+    """
+    분석 시작 시 현재 입력 fingerprint를 Job에 기록 (run_analysis_pipeline)
+
+    Returns:
+        시작 시점 구성요소 (finalize_job_fingerprint에 전달), 실패 시 None
+    실패해도 분석은 진행 (다음 스캔에서 NO_PRIOR_RUN으로 재분석될 뿐)
+    """
+    try:
+        row = load_fingerprints(session, [corp_id]).get(corp_id)
+        if row is None:
+            return None
+        components = fingerprint_components(row)
+        session.execute(RECORD_SQL, {"job_id": job_id, "fingerprint": compute_fingerprint(components)})
+        session.commit()
+        return components
+    except Exception as e:
+        logger.warning(f"[InputFingerprint] Failed to record fingerprint for job={job_id}: {e}")
+        session.rollback()
+        return None
+
+
+def finalize_job_fingerprint(session, job_id: str, corp_id: str, started: Optional[dict]) -> Optional[str]:
+    """
+    분석 완료 시 분석이 쓴 구성요소만 현재 값으로 교체해 다시 기록
+
+    실패하면 NULL로 기록 → 다음 스캔은 NO_PRIOR_RUN (시작 시점 fingerprint가 남으면 매번 INPUT_CHANGED)
+    """
+    if started is None:
+        return None
+    try:
+        row = load_fingerprints(session, [corp_id]).get(corp_id)
+        components = dict(started)
+        if row is not None:
+            current = fingerprint_components(row)
+            for name in ANALYSIS_WRITTEN_COMPONENTS:
+                components[name] = current[name]
+        fingerprint = compute_fingerprint(components)
+        session.execute(RECORD_SQL, {"job_id": job_id, "fingerprint": fingerprint})
+        session.commit()
+        return fingerprint
+    except Exception as e:
+        logger.warning(f"[InputFingerprint] Failed to finalize fingerprint for job={job_id}: {e}")
+        session.rollback()
+        try:
+            session.execute(RECORD_SQL, {"job_id": job_id, "fingerprint": None})
+            session.commit()
+        except Exception:
+            session.rollback()
+        return None
@@ -0,0 +1,429 @@
+"""
+Job Progress Events
+
+분석 작업 진행 상황 push 채널 (Redis pub/sub + Server-Sent Events).
+
+기존: 클라이언트가 GET /jobs/{job_id}, GET /new-kyc/jobs/{job_id}를 2~3초마다 폴링
+      → 폴링마다 DB 조회, Worker는 단계마다 세션 생성 + UPDATE + commit
+변경: Worker가 진행 이벤트를 Redis에 publish (app.worker.job_progress)
+      API는 작업별 / 기업별 SSE 스트림으로 전달, DB 쓰기는 상태 변경/종료/주기 checkpoint만
+
+채널:
+- rkyc:job:{job_id}            작업별 진행 이벤트
+- rkyc:job:corp:{corp_id}      기업별 (해당 기업의 모든 작업)
+- rkyc:job:last:{job_id}       마지막 이벤트 (pub/sub는 이력이 없으므로 접속 시 초기 상태용, TTL)
+
+이벤트: {"job_id", "corp_id", "status", "step", "percent", "error_code", "error_message", "ts"}
+
+Redis를 쓸 수 없으면:
+- Worker는 매 단계 DB에 기록 (기존 동작)
+- SSE는 서버 측에서 DB를 FALLBACK_POLL_SECONDS마다 조회해 변경분만 전달
+
+Usage:
+    # Worker
+    get_job_event_publisher().publish(make_event(job_id, "RUNNING", step="SIGNAL", percent=60))
+
+    # API
+    StreamingResponse(event_stream(job_channel(job_id), load_states, request.is_disconnected,
+                                   get_job_event_subscriber()), media_type="text/event-stream")
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "rkyc:job"
+TERMINAL_STATUSES = frozenset({"DONE", "FAILED"})
+REDIS_RETRY_SECONDS = 30  # API 측 Redis 실패 후 DB 상태만 사용하는 시간
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}  # 프록시 버퍼링 방지
+
+
+@dataclass
+class JobEventsConfig:
+    """Job progress events configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    REDIS_DB: int = 2
+    LAST_EVENT_TTL_SECONDS: int = 3600
+    CHECKPOINT_SECONDS: float = 15.0     # Worker DB checkpoint 주기 (진행률만 바뀔 때)
+    HEARTBEAT_SECONDS: float = 15.0      # SSE keep-alive 주석 전송 주기 (프록시 idle timeout 방지)
+    MAX_STREAM_SECONDS: float = 1800.0   # SSE 연결 최대 유지 시간 (클라이언트는 자동 재접속)
+    FALLBACK_POLL_SECONDS: float = 3.0   # Redis 없을 때 SSE 서버 측 DB 조회 주기
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.JOB_EVENTS_ENABLED
+            self.REDIS_DB = settings.LLM_CACHE_REDIS_DB
+            self.CHECKPOINT_SECONDS = settings.JOB_PROGRESS_CHECKPOINT_SECONDS
+            self.MAX_STREAM_SECONDS = settings.JOB_EVENTS_MAX_STREAM_SECONDS
+        except Exception as e:
+            logger.warning(f"Failed to load job events config from settings: {e}, using defaults")
+
+
+def job_channel(job_id: Any) -> str:
+    return f"{CHANNEL_PREFIX}:{job_id}"
+
+
+def corp_channel(corp_id: str) -> str:
+    return f"{CHANNEL_PREFIX}:corp:{corp_id}"
+
+
+def last_event_key(job_id: Any) -> str:
+    return f"{CHANNEL_PREFIX}:last:{job_id}"
+
+
+def _value(v: Any) -> Any:
+    return getattr(v, "value", v)
+
+
+def make_event(
+    job_id: Any,
+    status: Any,
+    step: Any = None,
+    percent: Optional[int] = 0,
+    corp_id: Optional[str] = None,
+    error_code: Optional[str] = None,
+    error_message: Optional[str] = None,
+    ts: Optional[datetime] = None,
+) -> dict:
+    """진행 이벤트 (Enum은 값으로)"""
+    return {
+        "job_id": str(job_id),
+        "corp_id": corp_id,
+        "status": _value(status),
+        "step": _value(step),
+        "percent": percent or 0,
+        "error_code": error_code,
+        "error_message": error_message,
+        "ts": (ts or datetime.now(UTC)).isoformat(),
+    }
+
+
+def event_from_job(job: Any) -> dict:
+    """rkyc_job 행/모델 → 이벤트 (DB 상태, ts는 마지막 갱신 시각 근사)"""
+    return make_event(
+        job.job_id,
+        job.status,
+        step=job.progress_step,
+        percent=job.progress_percent,
+        corp_id=job.corp_id,
+        error_code=job.error_code,
+        error_message=job.error_message,
+        ts=job.finished_at or job.started_at or job.queued_at,
+    )
+
+
+def is_terminal(event: dict) -> bool:
+    return event.get("status") in TERMINAL_STATUSES
+
+
+def format_sse(event: dict, name: str = "progress") -> str:
+    """SSE 메시지 (id는 작업 ID - 재접속 시 Last-Event-ID로 참고용)"""
+    data = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event.get('job_id', '')}\nevent: {name}\ndata: {data}\n\n"
+
+
+def _redis_url(db: int) -> str:
+    from app.core.config import settings
+    base_url = settings.REDIS_URL.rstrip("/0123456789")
+    return f"{base_url}/{db}"
+
+
+# =============================================================================
+# Publisher (Worker, sync)
+# =============================================================================
+
+
+class JobEventPublisher:
+    """진행 이벤트 publish + 마지막 이벤트 저장"""
+
+    def __init__(self, config: Optional[JobEventsConfig] = None, redis_client: Any = None):
+        self.config = config or JobEventsConfig()
+        self._redis = redis_client
+        self._redis_checked = redis_client is not None
+        self._stats = {"published": 0, "failed": 0}
+
+    def _get_redis(self):
+        """Lazy Redis client; None이면 publish 불가 (호출 측이 DB에 기록)"""
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                import redis
+
+                client = redis.from_url(
+                    _redis_url(self.config.REDIS_DB),
+                    decode_responses=True,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"[JobEvents] Redis unavailable, progress goes to DB only: {e}")
+                self._redis = None
+        return self._redis
+
+    def publish(self, event: dict) -> bool:
+        """
+        작업/기업 채널에 publish
+
+        Returns:
+            전달 여부 (False면 호출 측이 DB에 기록해야 폴링/SSE fallback이 최신 상태를 봄)
+        """
+        if not self.config.ENABLED:
+            return False
+        client = self._get_redis()
+        if client is None:
+            return False
+
+        payload = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.set(last_event_key(event["job_id"]), payload, ex=self.config.LAST_EVENT_TTL_SECONDS)
+            pipe.publish(job_channel(event["job_id"]), payload)
+            if event.get("corp_id"):
+                pipe.publish(corp_channel(event["corp_id"]), payload)
+            pipe.execute()
+            self._stats["published"] += 1
+            return True
+        except Exception as e:
+            logger.warning(f"[JobEvents] Publish failed for job {event.get('job_id')}: {e}")
+            self._stats["failed"] += 1
+            return False
+
+    def get_stats(self) -> dict:
+        return {**self._stats, "enabled": self.config.ENABLED, "redis": self._redis is not None}
+
+
+# =============================================================================
+# Subscriber (API, async)
+# =============================================================================
+
+
+class JobEventSubscription:
+    """하나의 SSE 연결이 사용하는 pub/sub 구독"""
+
+    def __init__(self, pubsub: Any):
+        self._pubsub = pubsub
+
+    async def next_event(self, timeout: float) -> Optional[dict]:
+        message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if not message or message.get("type") != "message":
+            return None
+        try:
+            return json.loads(message["data"])
+        except (TypeError, ValueError):
+            return None
+
+    async def close(self) -> None:
+        try:
+            await self._pubsub.aclose()
+        except Exception:
+            pass
+
+
+class JobEventSubscriber:
+    """API 프로세스의 공유 async Redis 클라이언트 (연결은 풀에서 구독별로 사용)"""
+
+    def __init__(self, config: Optional[JobEventsConfig] = None, redis_client: Any = None):
+        self.config = config or JobEventsConfig()
+        self._redis = redis_client
+        self._retry_at = 0.0
+
+    def _available(self) -> bool:
+        return self.config.ENABLED and time.monotonic() >= self._retry_at
+
+    def _unavailable(self, what: str, e: Exception) -> None:
+        # 연결 실패마다 요청이 connect timeout만큼 지연되지 않도록 한동안 DB만 사용
+        logger.warning(f"[JobEvents] {what} failed, using DB state for {REDIS_RETRY_SECONDS}s: {e}")
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                _redis_url(self.config.REDIS_DB),
+                decode_responses=True,
+                socket_connect_timeout=1.0,
+            )
+        return self._redis
+
+    async def subscribe(self, channel: str) -> Optional[JobEventSubscription]:
+        """구독 시작 (실패 시 None → DB 조회 fallback)"""
+        if not self._available():
+            return None
+        try:
+            pubsub = self._get_redis().pubsub()
+            await pubsub.subscribe(channel)
+            return JobEventSubscription(pubsub)
+        except Exception as e:
+            self._unavailable(f"Subscribe to {channel}", e)
+            return None
+
+    async def last_events(self, job_ids: list[str]) -> dict[str, dict]:
+        """작업별 마지막 이벤트 (없거나 실패하면 빈 dict)"""
+        if not job_ids or not self._available():
+            return {}
+        try:
+            values = await self._get_redis().mget([last_event_key(j) for j in job_ids])
+        except Exception as e:
+            self._unavailable("Reading last events", e)
+            return {}
+        return {j: json.loads(v) for j, v in zip(job_ids, values) if v}
+
+    async def overlay(self, state: dict) -> dict:
+        """
+        DB 상태에 Redis 마지막 이벤트 반영 (GET 폴링 응답용)
+
+        DB의 진행률은 checkpoint 주기만큼 늦을 수 있음 - 종료된 작업은 DB가 최종 상태
+        """
+        if is_terminal(state):
+            return state
+        last = (await self.last_events([state["job_id"]])).get(state["job_id"])
+        return last or state
+
+
+# =============================================================================
+# SSE stream
+# =============================================================================
+
+
+async def event_stream(
+    channel: str,
+    load_states: Callable[[], Awaitable[list[dict]]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    subscriber: Optional[JobEventSubscriber],
+    stop_on_terminal: bool = True,
+    config: Optional[JobEventsConfig] = None,
+) -> AsyncIterator[str]:
+    """
+    SSE 메시지 스트림
+
+    1. 채널 구독 (구독 후 초기 상태를 읽어 그 사이 이벤트 누락 방지)
+    2. 초기 상태: DB 상태 위에 Redis 마지막 이벤트를 덮어씀 (DB는 checkpoint 주기만큼 늦을 수 있음)
+    3. 이후 이벤트 전달, 변화 없으면 heartbeat 주석
+    4. stop_on_terminal이면 모든 작업이 DONE/FAILED가 되면 종료 (작업별 스트림)
+
+    Args:
+        load_states: DB 상태 조회 (작업별: [job] / 기업별: 진행 중 작업들) - 호출마다 짧은 세션 사용
+        is_disconnected: 클라이언트 연결 종료 확인 (Request.is_disconnected)
+        subscriber: None이면 DB 조회 fallback
+    """
+    config = config or (subscriber.config if subscriber else JobEventsConfig())
+    subscription = await subscriber.subscribe(channel) if subscriber else None
+    try:
+        states = {s["job_id"]: s for s in await load_states()}
+        if subscription:
+            # 종료 상태는 DB가 최종 (종료 publish 실패 시 Redis에는 이전 이벤트가 남음)
+            active = [j for j, s in states.items() if not is_terminal(s)]
+            states.update(await subscriber.last_events(active))
+
+        for state in states.values():
+            yield format_sse(state)
+        if stop_on_terminal and states and all(is_terminal(s) for s in states.values()):
+            return
+
+        started = last_sent = time.monotonic()
+        while time.monotonic() - started < config.MAX_STREAM_SECONDS:
+            if await is_disconnected():
+                return
+
+            changed: list[dict] = []
+            if subscription:
+                event = await subscription.next_event(timeout=1.0)
+                if event:
+                    changed.append(event)
+            else:
+                await asyncio.sleep(config.FALLBACK_POLL_SECONDS)
+                changed = [s for s in await load_states() if states.get(s["job_id"]) != s]
+
+            for event in changed:
+                states[event["job_id"]] = event
+                yield format_sse(event)
+                last_sent = time.monotonic()
+
+            if stop_on_terminal and changed and all(is_terminal(s) for s in states.values()):
+                return
+            if time.monotonic() - last_sent >= config.HEARTBEAT_SECONDS:
+                yield ": ping\n\n"
+                last_sent = time.monotonic()
+    finally:
+        if subscription:
+            await subscription.close()
+
+
+# =============================================================================
+# DB state (짧은 세션 - 스트림 동안 커넥션을 잡지 않음)
+# =============================================================================
+
+
+async def load_job_states(job_id: Any, session_factory: Any = None) -> list[dict]:
+    """작업 1건의 DB 상태 (없으면 빈 목록)"""
+    from sqlalchemy import select
+    from app.models.job import Job
+
+    session_factory = session_factory or _default_session_factory()
+    async with session_factory() as session:
+        job = (await session.execute(select(Job).where(Job.job_id == job_id))).scalar_one_or_none()
+        return [event_from_job(job)] if job else []
+
+
+async def load_corp_job_states(corp_id: str, since: datetime, session_factory: Any = None) -> list[dict]:
+    """기업의 진행 중 작업 + since 이후 종료된 작업 (종료 전이를 놓치지 않도록)"""
+    from sqlalchemy import or_, select
+    from app.models.job import Job, JobStatus
+
+    session_factory = session_factory or _default_session_factory()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Job)
+            .where(Job.corp_id == corp_id)
+            .where(or_(
+                Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+                Job.finished_at >= since,
+            ))
+            .order_by(Job.queued_at)
+        )
+        return [event_from_job(job) for job in result.scalars().all()]
+
+
+def _default_session_factory():
+    from app.core.database import AsyncSessionLocal
+    return AsyncSessionLocal
+
+
+# Singleton instances
+_job_event_publisher: Optional[JobEventPublisher] = None
+_job_event_subscriber: Optional[JobEventSubscriber] = None
+
+
+def get_job_event_publisher() -> JobEventPublisher:
+    """Get singleton JobEventPublisher instance (Worker)"""
+    global _job_event_publisher
+    if _job_event_publisher is None:
+        _job_event_publisher = JobEventPublisher()
+    return _job_event_publisher
+
+
+def get_job_event_subscriber() -> JobEventSubscriber:
+    """Get singleton JobEventSubscriber instance (API)"""
+    global _job_event_subscriber
+    if _job_event_subscriber is None:
+        _job_event_subscriber = JobEventSubscriber()
+    return _job_event_subscriber
+
+
+def reset_job_events() -> None:
+    """Reset singletons (for testing)"""
+    global _job_event_publisher, _job_event_subscriber
+    _job_event_publisher = None
+    _job_event_subscriber = None
@@ -0,0 +1,198 @@
+"""
+List Pagination Helpers
+
+목록 API(GET /signals, /corporations, /jobs)의 keyset(cursor) 페이지네이션과 total 계산.
+
+Keyset pagination:
+- 정렬 키 (sort DESC NULLS LAST, tie-breaker PK DESC) 마지막 행 값을 cursor로 전달
+- 다음 페이지는 WHERE (sort, pk) < (cursor) → 인덱스 범위 스캔으로 바로 시작
+  (offset은 건너뛸 행을 모두 읽고 버리므로 뒤 페이지일수록 느려짐)
+- cursor는 불투명 문자열 (urlsafe base64 JSON) - 클라이언트는 next_cursor를 그대로 전달
+
+Count modes:
+- exact     SELECT count(*) FROM (query) - 기존 동작 (기본값)
+- estimate  필터 없음 → pg_class.reltuples (ANALYZE/autovacuum 통계)
+            필터 있음 → EXPLAIN 추정 행 수
+            추정치가 ESTIMATE_EXACT_BELOW 미만이면 정확히 센다 (작은 결과는 count 비용도 작음)
+
+Usage:
+    query = apply_keyset(query, SignalIndex.detected_at, SignalIndex.signal_id, cursor)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    rows, next_cursor = split_page(rows, limit, lambda r: (r[0].detected_at, r[0].signal_id))
+    total, estimated = await count_rows(db, filtered_query, mode, table="rkyc_signal_index")
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import and_, func, or_, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+ESTIMATE_EXACT_BELOW = 1000
+
+
+class CountMode(str, Enum):
+    """목록 total 계산 방식"""
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+class InvalidCursor(ValueError):
+    """잘못된 cursor 문자열"""
+
+
+def encode_cursor(sort_value: Optional[datetime], key: Any) -> str:
+    """(정렬 값, PK) → cursor 문자열"""
+    payload = [sort_value.isoformat() if sort_value is not None else None, str(key)]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[datetime], str]:
+    """cursor 문자열 → (정렬 값, PK)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, key = json.loads(raw)
+        if not isinstance(key, str):
+            raise TypeError("key must be a string")
+        return (datetime.fromisoformat(sort_value) if sort_value is not None else None), key
+    except Exception as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_order(sort_column, key_column) -> tuple:
+    """
+    keyset 정렬 (offset 모드도 같은 정렬을 써서 페이지 경계가 안정적)
+
+    NOT NULL 정렬 컬럼은 NULLS LAST를 붙이지 않는다 - 기존 (필터, sort DESC) 인덱스를 그대로 사용.
+    """
+    sort = sort_column.desc().nulls_last() if _nullable(sort_column) else sort_column.desc()
+    return sort, key_column.desc()
+
+
+def apply_keyset(query, sort_column, key_column, cursor: Optional[str]):
+    """
+    cursor 이후 행만 선택하고 keyset 정렬 적용
+
+    정렬 값이 NULL인 행은 맨 뒤 (NULLS LAST) - NULL cursor는 NULL 구간 안에서 PK로만 진행.
+    NOT NULL 정렬 컬럼은 `sort <= cursor 값` 조건을 함께 붙여 월 파티션 테이블에서
+    cursor 이후 파티션만 읽도록 한다 (row 비교만으로는 partition pruning 불가, migration_v25).
+
+    Raises:
+        InvalidCursor: cursor 형식 오류
+    """
+    if cursor:
+        sort_value, key = decode_cursor(cursor)
+        key_value = key
+        if _has_python_type(key_column):
+            try:
+                key_value = key_column.type.python_type(key)
+            except ValueError as e:
+                raise InvalidCursor(f"Invalid cursor key: {key!r}") from e
+        after = tuple_(sort_column, key_column) < tuple_(sort_value, key_value)
+        if sort_value is None:
+            query = query.where(and_(sort_column.is_(None), key_column < key_value))
+        elif _nullable(sort_column):
+            query = query.where(or_(after, sort_column.is_(None)))
+        else:
+            query = query.where(and_(sort_column <= sort_value, after))
+    return query.order_by(*keyset_order(sort_column, key_column))
+
+
+def _nullable(column) -> bool:
+    return getattr(column, "nullable", True)
+
+
+def _has_python_type(column) -> bool:
+    try:
+        return column.type.python_type is not str
+    except NotImplementedError:
+        return False
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    key_of: Callable[[Any], tuple[Optional[datetime], Any]],
+) -> tuple[list[Any], Optional[str]]:
+    """
+    limit + 1개 조회 결과 → (페이지 행, next_cursor)
+
+    다음 페이지가 없으면 next_cursor는 None.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*key_of(page[-1]))
+
+
+async def count_rows(
+    db: AsyncSession,
+    query,
+    mode: CountMode = CountMode.EXACT,
+    table: Optional[str] = None,
+    filtered: bool = True,
+) -> tuple[int, bool]:
+    """
+    목록 total 계산
+
+    Args:
+        query: 필터가 적용된 SELECT (정렬/limit 전)
+        mode: exact | estimate
+        table: 필터 없는 목록의 기준 테이블 (reltuples 조회용)
+        filtered: 필터 적용 여부 (False면 table 통계 사용)
+
+    Returns:
+        (total, is_estimate)
+    """
+    if mode == CountMode.ESTIMATE:
+        estimate = None
+        try:
+            if not filtered and table:
+                estimate = await _reltuples(db, table)
+            else:
+                estimate = await _plan_rows(db, query)
+        except Exception as e:
+            logger.warning(f"[Pagination] Count estimate failed, using exact count: {e}")
+        if estimate is not None and estimate >= ESTIMATE_EXACT_BELOW:
+            return estimate, True
+
+    total = await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    return total or 0, False
+
+
+async def _reltuples(db: AsyncSession, table: str) -> Optional[int]:
+    """planner 통계의 테이블 행 수 (ANALYZE 전이면 None, 파티션 테이블은 파티션 합계)"""
+    value = await db.scalar(
+        text(
+            "SELECT CASE WHEN c.relkind = 'p' THEN ("
+            "  SELECT SUM(p.reltuples) FILTER (WHERE p.reltuples >= 0)"
+            "  FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhrelid"
+            "  WHERE i.inhparent = c.oid"
+            ") ELSE c.reltuples END::bigint "
+            "FROM pg_class c WHERE c.oid = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+    return int(value) if value is not None and value >= 0 else None
+
+
+async def _plan_rows(db: AsyncSession, query) -> Optional[int]:
+    """EXPLAIN 추정 행 수 (필터 값은 리터럴로 렌더링)"""
+    # text()는 ':name'을 바인드로 해석하므로 드라이버 SQL로 그대로 실행
+    conn = await db.connection()
+    sql = str(query.order_by(None).compile(
+        dialect=conn.dialect,
+        compile_kwargs={"literal_binds": True},
+    ))
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,526 @@
+"""
+Portfolio Rule Evaluation
+
+전체 포트폴리오에 대해 Banking Insights 규칙(app.services.banking_insights)과
+Rule-based 시그널 규칙(RuleBasedSignalGenerator)을 한 번에 평가한다.
+
+기존: 기업 상세 조회/분석 Job마다 기업 1곳의 중첩 dict를 규칙별로 평가
+변경:
+1. 조회 2회로 전체 기업 로드 (최신 banking data + 최신/이전 Internal Snapshot, 기업별 최근 시그널)
+2. 규칙 입력 필드를 JSON 경로별로 모아 기업 순서의 NumPy 컬럼으로 만들고, 파생 지표(수신/여신 비율)와
+   평가 대상 판정은 배열 연산으로 계산 (기업별 엔진 객체 생성 없음)
+3. 규칙 조건을 컬럼 단위 벡터 연산(mask)으로 평가 - 시그널 키워드 매칭도 np.char로 일괄 처리
+4. 조건을 만족한 (기업, 규칙)만 기존 엔진의 규칙을 실행해 인사이트/시그널 후보 생성
+   → 문구, 우선순위, event_signature가 기업별 경로와 동일 (mask는 판정, 생성은 기존 코드)
+
+LLM 호출 없이 연체/등급 변경/여신·담보 노출 변화/KYC 갱신을 주기적으로 전수 점검하는 용도
+(evaluate_portfolio_rules 태스크, GET /admin/portfolio-rules/evaluate).
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+
+from app.services.banking_insights import (
+    EXPORT_KEYWORDS,
+    INDUSTRY_DOWN_KEYWORDS,
+    INDUSTRY_UP_KEYWORDS,
+    REVENUE_DOWN_KEYWORDS,
+    REVENUE_UP_KEYWORDS,
+    BankingInsightsEngine,
+)
+from app.worker.pipelines.signal_agents.rule_based_generator import (
+    COLLATERAL_CHANGE_THRESHOLD,
+    KOREAN_GRADE_MAP,
+    KYC_REFRESH_DAYS,
+    LOAN_EXPOSURE_CHANGE_THRESHOLD,
+    RISK_GRADE_RANK,
+    RuleBasedSignalGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+SIGNALS_PER_CORP = 50  # GET /banking-data/{corp_id}/insights와 동일
+
+# 최신 banking data + 최신/이전 snapshot (둘 중 하나라도 있는 기업)
+LOAD_SQL = """
+    SELECT c.corp_id, c.corp_name,
+           b.loan_exposure, b.deposit_trend, b.collateral_detail,
+           b.trade_finance, b.financial_statements,
+           s.snapshot_json, prev.snapshot_json AS prev_snapshot_json
+    FROM corp c
+    LEFT JOIN rkyc_banking_data_latest b ON b.corp_id = c.corp_id
+    LEFT JOIN rkyc_internal_snapshot_latest isl ON isl.corp_id = c.corp_id
+    LEFT JOIN rkyc_internal_snapshot s ON s.snapshot_id = isl.snapshot_id
+    LEFT JOIN LATERAL (
+        SELECT p.snapshot_json
+        FROM rkyc_internal_snapshot p
+        WHERE p.corp_id = c.corp_id AND p.snapshot_version < isl.snapshot_version
+        ORDER BY p.snapshot_version DESC
+        LIMIT 1
+    ) prev ON TRUE
+    WHERE (b.corp_id IS NOT NULL OR isl.corp_id IS NOT NULL)
+"""
+
+SIGNALS_SQL = """
+    SELECT corp_id, signal_id, signal_type, event_type, summary, impact_direction, impact_strength
+    FROM (
+        SELECT corp_id, signal_id, signal_type, event_type, summary, impact_direction, impact_strength,
+               ROW_NUMBER() OVER (PARTITION BY corp_id ORDER BY created_at DESC) AS rn
+        FROM rkyc_signal
+        {where}
+    ) ranked
+    WHERE rn <= :per_corp
+"""
+
+EXISTING_SIGNATURES_SQL = text("""
+    SELECT event_signature FROM rkyc_signal WHERE event_signature = ANY(:signatures)
+""")
+
+
+def _load_queries(corp_ids: Optional[Sequence[str]]) -> tuple[Any, Any, dict]:
+    params: dict = {"per_corp": SIGNALS_PER_CORP}
+    load_sql, signals_where = LOAD_SQL, ""
+    if corp_ids:
+        load_sql += " AND c.corp_id = ANY(:corp_ids)"
+        signals_where = "WHERE corp_id = ANY(:corp_ids)"
+        params["corp_ids"] = list(corp_ids)
+    return (
+        text(load_sql + " ORDER BY c.corp_id"),
+        text(SIGNALS_SQL.format(where=signals_where)),
+        params,
+    )
+
+
+def _json(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _num(value: Any) -> float:
+    """숫자 컬럼 값 (숫자가 아니면 NaN → 크기 비교는 모두 False)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _signal_dict(row: Any) -> dict:
+    return {
+        "id": str(row.signal_id),
+        "signal_type": row.signal_type,
+        "event_type": row.event_type,
+        "title": (row.summary or "")[:50],  # summary의 앞 50자를 title로 사용
+        "summary": row.summary,
+        "impact_direction": row.impact_direction,
+        "impact_strength": row.impact_strength,
+    }
+
+
+# =============================================================================
+# Columnar frame
+# =============================================================================
+
+
+@dataclass
+class PortfolioFrame:
+    """기업 순서의 규칙 입력 컬럼 + 후보 생성에 필요한 원본"""
+
+    corp_ids: list[str]
+    corp_names: list[str]
+    banking: list[Optional[dict]]
+    snapshots: list[Optional[dict]]
+    prev_snapshots: list[Optional[dict]]
+    signals: list[list[dict]]
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.corp_ids)
+
+
+def build_frame(rows: Sequence[Any], signal_rows: Sequence[Any]) -> PortfolioFrame:
+    """조회 결과 → PortfolioFrame (JSON → 컬럼 추출은 기업당 1회)"""
+    corp_index = {row.corp_id: i for i, row in enumerate(rows)}
+    signals: list[list[dict]] = [[] for _ in rows]
+    for row in signal_rows:
+        i = corp_index.get(row.corp_id)
+        if i is not None:
+            signals[i].append(_signal_dict(row))
+
+    frame = PortfolioFrame(
+        corp_ids=[row.corp_id for row in rows],
+        corp_names=[row.corp_name or "" for row in rows],
+        banking=[],
+        snapshots=[_json(row.snapshot_json) for row in rows],
+        prev_snapshots=[_json(row.prev_snapshot_json) for row in rows],
+        signals=signals,
+    )
+    for row in rows:
+        blocks = {
+            key: _json(getattr(row, key))
+            for key in ("loan_exposure", "deposit_trend", "collateral_detail", "trade_finance", "financial_statements")
+        }
+        frame.banking.append(blocks if any(v is not None for v in blocks.values()) else None)
+
+    frame.columns.update(_banking_columns(frame))
+    frame.columns.update(_keyword_columns(frame))
+    frame.columns.update(_snapshot_columns(frame))
+    return frame
+
+
+# 컬럼 이름: (banking 블록, dot path, 기본값) - BankingInsightsEngine._extract_metrics의 `값 or 기본값` 규칙
+BANKING_NUMERIC_FIELDS = {
+    "total_loan": ("loan_exposure", "total_exposure_krw", 0),
+    "total_deposit": ("deposit_trend", "current_balance", 0),
+    "export_receivables": ("trade_finance", "export.current_receivables_usd", 0),
+    "hedge_ratio": ("trade_finance", "fx_exposure.hedge_ratio", 0),
+    "usance_util": ("trade_finance", "usance.utilization_rate", 100),
+    "unsecured_ratio": ("loan_exposure", "composition.unsecured_loan.ratio", 0),
+    "avg_ltv": ("collateral_detail", "avg_ltv", 0),
+    "total_collateral": ("collateral_detail", "total_collateral_value", 0),
+}
+BANKING_LABEL_FIELDS = {
+    "grade_change": ("loan_exposure", "risk_indicators.grade_change"),
+    "deposit_trend": ("deposit_trend", "trend"),
+    "financial_health": ("financial_statements", "financial_health"),
+}
+
+
+def _banking_field(frame: PortfolioFrame, block: str, path: str, default: Any = None) -> list:
+    """기업 순서의 banking 필드 값 (banking data가 없으면 None)"""
+    return [
+        None if banking is None else (_nested(banking.get(block), path) or default)
+        for banking in frame.banking
+    ]
+
+
+def _banking_columns(frame: PortfolioFrame) -> dict[str, np.ndarray]:
+    """
+    BankingInsightsEngine._extract_metrics와 같은 기본값 규칙으로 지표 컬럼 추출
+
+    JSON 필드는 경로별로 한 번에 모아 배열로 만들고, 파생 지표(수신/여신 비율)와
+    평가 대상 판정(has_banking)은 배열 연산으로 계산한다 - 기업별 엔진 객체를 만들지 않음.
+    """
+    numeric = {
+        name: np.array([_num(v) for v in _banking_field(frame, block, path, default)], dtype=float)
+        for name, (block, path, default) in BANKING_NUMERIC_FIELDS.items()
+    }
+    labels = {
+        name: np.array([v or "" for v in _banking_field(frame, block, path)], dtype=object)
+        for name, (block, path) in BANKING_LABEL_FIELDS.items()
+    }
+    overdue = np.array(
+        [bool(v) for v in _banking_field(frame, "loan_exposure", "risk_indicators.overdue_flag", False)],
+        dtype=bool,
+    )
+    # 금액 필드가 숫자 타입이 아니면 기업별 경로에서도 엔진 생성(비율 계산)이 실패 - 평가 대상에서 제외
+    amounts_numeric = np.array(
+        [
+            isinstance(loan, (int, float)) and (loan <= 0 or isinstance(deposit, (int, float)))
+            for loan, deposit in zip(
+                _banking_field(frame, "loan_exposure", "total_exposure_krw", 0),
+                _banking_field(frame, "deposit_trend", "current_balance", 0),
+            )
+        ],
+        dtype=bool,
+    )
+    blocks_valid = np.array(
+        [banking is not None and all(v is None or isinstance(v, dict) for v in banking.values())
+         for banking in frame.banking],
+        dtype=bool,
+    )
+
+    loan, deposit = numeric.pop("total_loan"), numeric.pop("total_deposit")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deposit_loan_ratio = np.where(loan > 0, deposit / loan * 100, 0.0)
+    has_banking = blocks_valid & amounts_numeric
+
+    return {
+        **numeric,
+        **labels,
+        "total_loan": loan,
+        "deposit_loan_ratio": deposit_loan_ratio,
+        "overdue_flag": overdue,
+        "has_banking": has_banking,
+    }
+
+
+def _keyword_columns(frame: PortfolioFrame) -> dict[str, np.ndarray]:
+    """기업별 시그널 키워드/영향 방향 보유 여부 (전체 시그널을 한 배열로 매칭)"""
+    owner = np.array([i for i, sigs in enumerate(frame.signals) for _ in sigs], dtype=np.int64)
+    texts = np.array(
+        [
+            f"{(s.get('title', '') or '').lower()} {(s.get('summary', '') or '').lower()}"
+            for sigs in frame.signals for s in sigs
+        ],
+        dtype=str,
+    )
+    impacts = np.array([s.get("impact_direction") for sigs in frame.signals for s in sigs], dtype=object)
+
+    def per_corp(hit: np.ndarray) -> np.ndarray:
+        return np.bincount(owner[hit], minlength=len(frame)) > 0
+
+    def any_keyword(keywords: list[str]) -> np.ndarray:
+        hit = np.zeros(len(texts), dtype=bool)
+        for keyword in keywords:
+            hit |= np.char.find(texts, keyword.lower()) >= 0
+        return per_corp(hit)
+
+    return {
+        "has_export_signal": any_keyword(EXPORT_KEYWORDS),
+        "has_revenue_down_signal": any_keyword(REVENUE_DOWN_KEYWORDS),
+        "has_revenue_up_signal": any_keyword(REVENUE_UP_KEYWORDS),
+        "has_industry_up_signal": any_keyword(INDUSTRY_UP_KEYWORDS),
+        "has_industry_down_signal": any_keyword(INDUSTRY_DOWN_KEYWORDS),
+        "has_risk_signal": per_corp(impacts == "RISK"),
+    }
+
+
+def _nested(data: Any, path: str, default: Any = None) -> Any:
+    """dot path 조회 (RuleBasedSignalGenerator._get_nested와 동일 규칙)"""
+    current = data
+    for key in path.split("."):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return default
+    return current
+
+
+def _grade_rank(snapshot: dict) -> int:
+    """내부등급 순위 (한글 등급 변환, 모르는 등급은 5, 없으면 -1)"""
+    grade = _nested(snapshot, "corp.kyc_status.internal_risk_grade")
+    if not grade:
+        return -1
+    return RISK_GRADE_RANK.get(KOREAN_GRADE_MAP.get(grade, grade), 5)
+
+
+def _snapshot_columns(frame: PortfolioFrame) -> dict[str, np.ndarray]:
+    """RuleBasedSignalGenerator 입력 필드 (Internal Snapshot 경로)"""
+    n = len(frame)
+    columns = {
+        "snap_overdue_flag": np.zeros(n, dtype=bool),
+        "grade_rank": np.full(n, -1, dtype=np.int64),
+        "prev_grade_rank": np.full(n, -1, dtype=np.int64),
+        "exposure": np.full(n, np.nan),
+        "prev_exposure": np.full(n, np.nan),
+        "collateral": np.full(n, np.nan),
+        "prev_collateral": np.full(n, np.nan),
+        "last_kyc_date": np.full(n, np.datetime64("NaT"), dtype="datetime64[D]"),
+        "has_prev_snapshot": np.array([bool(p) for p in frame.prev_snapshots], dtype=bool),
+    }
+
+    for i, (snapshot, prev) in enumerate(zip(frame.snapshots, frame.prev_snapshots)):
+        if not isinstance(snapshot, dict):
+            continue
+        try:
+            columns["snap_overdue_flag"][i] = bool(_nested(snapshot, "credit.loan_summary.overdue_flag", False))
+            columns["grade_rank"][i] = _grade_rank(snapshot)
+            columns["exposure"][i] = _num(_nested(snapshot, "credit.loan_summary.total_exposure_krw"))
+            columns["collateral"][i] = _num(_nested(snapshot, "collateral.total_collateral_value_krw"))
+            if isinstance(prev, dict):
+                columns["prev_grade_rank"][i] = _grade_rank(prev)
+                columns["prev_exposure"][i] = _num(_nested(prev, "credit.loan_summary.total_exposure_krw"))
+                columns["prev_collateral"][i] = _num(_nested(prev, "collateral.total_collateral_value_krw"))
+            last_kyc = _nested(snapshot, "corp.kyc_status.last_kyc_updated")
+            if isinstance(last_kyc, str):
+                columns["last_kyc_date"][i] = np.datetime64(datetime.strptime(last_kyc[:10], "%Y-%m-%d").date())
+        except Exception as e:
+            # 파싱할 수 없는 값 - 해당 필드는 결측 (기업별 경로도 시그널을 만들지 않음)
+            logger.debug(f"[PortfolioRules] Unparseable snapshot field for {frame.corp_ids[i]}: {e}")
+    return columns
+
+
+# =============================================================================
+# Vectorized rule predicates
+# =============================================================================
+
+
+def banking_rule_masks(frame: PortfolioFrame) -> dict[str, np.ndarray]:
+    """BankingInsightsEngine 규칙별 인사이트 발생 여부 (RULES 이름 → bool 배열)"""
+    c = frame.columns
+    with np.errstate(invalid="ignore"):
+        loan, ratio = c["total_loan"], c["deposit_loan_ratio"]
+        ltv, unsecured = c["avg_ltv"], c["unsecured_ratio"]
+        masks = {
+            "deposit_loan_ratio": (loan != 0) & ((ratio < 20) | (ratio > 80)),
+            "fx_hedge_export": (c["export_receivables"] != 0) & (
+                (c["hedge_ratio"] < 50) | ((c["usance_util"] < 60) & c["has_export_signal"])
+            ),
+            "unsecured_loan_revenue": (unsecured > 50) & (c["has_revenue_down_signal"] | c["has_revenue_up_signal"]),
+            "ltv_industry": (ltv != 0) & (c["total_collateral"] != 0) & (
+                ((ltv < 50) & c["has_industry_up_signal"]) | ((ltv > 70) & c["has_industry_down_signal"])
+            ),
+            "grade_change": np.isin(c["grade_change"], ["DOWN", "UP"]),
+            "overdue": c["overdue_flag"].copy(),
+            "deposit_trend": ((c["deposit_trend"] == "DECREASING") & c["has_risk_signal"])
+            | (c["deposit_trend"] == "INCREASING"),
+            "financial_health": np.isin(c["financial_health"], ["WARNING", "CRITICAL", "IMPROVING"]),
+        }
+    # NaN(결측/비숫자)과의 비교는 False, != 는 True이므로 has_banking으로 한 번 더 제한
+    return {name: mask & c["has_banking"] for name, mask in masks.items()}
+
+
+def _change_mask(current: np.ndarray, previous: np.ndarray, threshold: float) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (current - previous) / previous
+        return np.isfinite(current) & np.isfinite(previous) & (previous != 0) & (np.abs(ratio) >= threshold)
+
+
+def signal_rule_masks(frame: PortfolioFrame, today: Optional[date] = None) -> dict[str, np.ndarray]:
+    """RuleBasedSignalGenerator 규칙별 시그널 발생 여부 (event_type → bool 배열)"""
+    c = frame.columns
+    today64 = np.datetime64(today or datetime.now().date(), "D")
+    has_prev = c["has_prev_snapshot"]
+    grades_known = (c["grade_rank"] >= 0) & (c["prev_grade_rank"] >= 0)
+    kyc_known = ~np.isnat(c["last_kyc_date"])
+    days_since_kyc = np.where(kyc_known, (today64 - c["last_kyc_date"]).astype(np.int64), 0)
+    return {
+        "OVERDUE_FLAG_ON": c["snap_overdue_flag"].copy(),
+        "INTERNAL_RISK_GRADE_CHANGE": has_prev & grades_known & (c["grade_rank"] != c["prev_grade_rank"]),
+        "LOAN_EXPOSURE_CHANGE": has_prev & _change_mask(c["exposure"], c["prev_exposure"], LOAN_EXPOSURE_CHANGE_THRESHOLD),
+        "COLLATERAL_CHANGE": has_prev & _change_mask(c["collateral"], c["prev_collateral"], COLLATERAL_CHANGE_THRESHOLD),
+        "KYC_REFRESH": kyc_known & (days_since_kyc >= KYC_REFRESH_DAYS),
+    }
+
+
+# =============================================================================
+# Evaluation
+# =============================================================================
+
+
+@dataclass
+class PortfolioEvaluation:
+    """포트폴리오 평가 결과 (인사이트/시그널 후보가 있는 기업만)"""
+
+    corporations: int
+    results: list[dict]
+    insight_counts: dict[str, int]
+    signal_counts: dict[str, int]
+    elapsed_ms: dict[str, int]
+
+    def signal_candidates(self) -> list[dict]:
+        return [
+            {"corp_id": r["corp_id"], "corp_name": r["corp_name"], **signal}
+            for r in self.results for signal in r["signals"]
+        ]
+
+    def summary(self) -> dict:
+        return {
+            "corporations": self.corporations,
+            "flagged_corporations": len(self.results),
+            "insights": sum(self.insight_counts.values()),
+            "signal_candidates": sum(self.signal_counts.values()),
+            "insight_counts": self.insight_counts,
+            "signal_counts": self.signal_counts,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+
+def evaluate_frame(frame: PortfolioFrame, today: Optional[date] = None) -> PortfolioEvaluation:
+    """
+    벡터 mask로 대상 (기업, 규칙)을 고른 뒤 해당 규칙만 기존 엔진으로 생성
+
+    mask는 기업별 경로의 조건과 같으므로 생성 결과는 기업별 analyze()/generate()와 동일하다.
+    """
+    started = time.monotonic()
+    banking_masks = banking_rule_masks(frame)
+    signal_masks = signal_rule_masks(frame, today)
+    banking_hits = np.column_stack(list(banking_masks.values()))  # (기업 수, 규칙 수)
+    signal_hits = np.column_stack(list(signal_masks.values()))
+    flagged = np.flatnonzero(banking_hits.any(axis=1) | signal_hits.any(axis=1))
+    evaluated = time.monotonic()
+
+    banking_names, signal_names = list(banking_masks), list(signal_masks)
+    generator = RuleBasedSignalGenerator()
+    insight_counts = {name: int(np.count_nonzero(mask)) for name, mask in banking_masks.items()}
+    signal_counts = {name: 0 for name in signal_names}
+
+    results = []
+    for i in flagged:
+        corp_id, corp_name = frame.corp_ids[i], frame.corp_names[i]
+        rules = [name for name, hit in zip(banking_names, banking_hits[i]) if hit]
+        event_types = [name for name, hit in zip(signal_names, signal_hits[i]) if hit]
+        try:
+            insights = []
+            if rules:
+                engine = BankingInsightsEngine(frame.banking[i], frame.signals[i], corp_name)
+                insights = engine.analyze(rules=rules)
+            signals = []
+            if event_types:
+                signals = generator.generate(
+                    corp_id, corp_name, frame.snapshots[i], frame.prev_snapshots[i], rules=event_types
+                )
+        except Exception as e:
+            logger.warning(f"[PortfolioRules] Failed to generate results for {corp_id}: {e}")
+            continue
+
+        for signal in signals:
+            signal_counts[signal["event_type"]] += 1
+        if insights or signals:
+            results.append({"corp_id": corp_id, "corp_name": corp_name, "insights": insights, "signals": signals})
+
+    finished = time.monotonic()
+    return PortfolioEvaluation(
+        corporations=len(frame),
+        results=results,
+        insight_counts=insight_counts,
+        signal_counts=signal_counts,
+        elapsed_ms={
+            "evaluate": int((evaluated - started) * 1000),
+            "generate": int((finished - evaluated) * 1000),
+        },
+    )
+
+
+async def evaluate_portfolio(db, corp_ids: Optional[Sequence[str]] = None) -> PortfolioEvaluation:
+    """포트폴리오 평가 (API, AsyncSession)"""
+    load_sql, signals_sql, params = _load_queries(corp_ids)
+    started = time.monotonic()
+    rows = (await db.execute(load_sql, params)).fetchall()
+    signal_rows = (await db.execute(signals_sql, params)).fetchall() if rows else []
+    return _evaluate_loaded(rows, signal_rows, started)
+
+
+def evaluate_portfolio_sync(session, corp_ids: Optional[Sequence[str]] = None) -> PortfolioEvaluation:
+    """포트폴리오 평가 (Worker, sync Session)"""
+    load_sql, signals_sql, params = _load_queries(corp_ids)
+    started = time.monotonic()
+    rows = session.execute(load_sql, params).fetchall()
+    signal_rows = session.execute(signals_sql, params).fetchall() if rows else []
+    return _evaluate_loaded(rows, signal_rows, started)
+
+
+def _evaluate_loaded(rows, signal_rows, started: float) -> PortfolioEvaluation:
+    loaded = time.monotonic()
+    frame = build_frame(rows, signal_rows)
+    built = time.monotonic()
+    evaluation = evaluate_frame(frame)
+    evaluation.elapsed_ms = {
+        "load": int((loaded - started) * 1000),
+        "build": int((built - loaded) * 1000),
+        **evaluation.elapsed_ms,
+    }
+    return evaluation
+
+
+def find_new_signal_candidates(session, evaluation: PortfolioEvaluation) -> list[dict]:
+    """아직 rkyc_signal에 없는 시그널 후보 (event_signature 기준, Worker sync Session)"""
+    candidates = evaluation.signal_candidates()
+    if not candidates:
+        return []
+    signatures = [c["event_signature"] for c in candidates]
+    existing = {
+        row[0] for row in session.execute(EXISTING_SIGNATURES_SQL, {"signatures": signatures}).fetchall()
+    }
+    return [c for c in candidates if c["event_signature"] not in existing]
@@ -0,0 +1,240 @@
+"""
+Query Fan-out Helper
+
+상세 조회 API의 독립적인 하위 조회를 각자 별도 풀 커넥션(세션)에서 동시에 실행.
+
+기존: 하나의 AsyncSession에서 순차 await → 응답 시간 = 하위 조회 왕복 시간의 합
+      (Supabase까지 WAN 왕복이 조회마다 누적)
+변경: 하위 조회별 세션을 풀에서 빌려 asyncio.gather → 응답 시간 ≈ 가장 느린 하위 조회
+
+- 하위 조회별 timeout (기본 QUERY_FANOUT_TIMEOUT_SECONDS)
+- 부분 결과: required가 아닌 하위 조회는 실패/timeout 시 default로 대체하고 errors에 기록
+  required 하위 조회 실패는 원래 예외를 그대로 전달 (timeout은 TimeoutError)
+- 커넥션 풀 고갈 방지 (API 풀: DB_POOL_SIZE + DB_MAX_OVERFLOW)
+  - 요청당 동시 세션 수 제한 (MAX_CONCURRENCY)
+  - 프로세스 전체 하위 세션 수 제한 (MAX_SESSIONS, 기본 API 풀의 1/3) - 동시 요청이 몰려도
+    하위 세션이 풀을 다 차지하지 않고, 나머지 요청은 슬롯을 기다림
+  - 동시 실행 전에 요청 세션의 트랜잭션을 끝내 커넥션을 풀에 반환 (변경 사항이 없을 때만,
+    expire_on_commit=False이므로 이미 읽은 객체는 그대로 사용 가능)
+- 하위 세션은 요청 세션과 같은 엔진/세션 클래스로 생성 (get_read_db replica 세션이면 replica,
+  primary로 전환된 세션이면 primary) - 한 응답이 primary/replica 데이터를 섞지 않도록
+- 비활성화 또는 하위 조회 1개면 요청 세션에서 순차 실행 (기존 동작)
+
+Usage:
+    result = await get_query_fanout().run(db, [
+        SubQuery("evidences", lambda s: _load_evidences(s, signal_id), required=True),
+        SubQuery("corp_context", lambda s: _get_corp_context(s, corp_id)),
+        SubQuery("related", lambda s: _get_related(s, signal_id), default=[]),
+    ])
+    evidences = result["evidences"]
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryFanoutConfig:
+    """Query fan-out configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    MAX_CONCURRENCY: int = 4
+    MAX_SESSIONS: int = 3  # 프로세스 전체 하위 세션 수 (기본 풀 5 + overflow 5의 1/3)
+    TIMEOUT_SECONDS: float = 5.0
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.QUERY_FANOUT_ENABLED
+            self.MAX_CONCURRENCY = settings.QUERY_FANOUT_MAX_CONCURRENCY
+            self.MAX_SESSIONS = settings.QUERY_FANOUT_MAX_SESSIONS or max(
+                1, (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW) // 3
+            )
+            self.TIMEOUT_SECONDS = settings.QUERY_FANOUT_TIMEOUT_SECONDS
+        except Exception as e:
+            logger.warning(f"Failed to load query fan-out config from settings: {e}, using defaults")
+
+
+@dataclass
+class SubQuery:
+    """독립 하위 조회 (세션을 받아 결과를 반환하는 코루틴 함수)"""
+
+    name: str
+    run: Callable[[AsyncSession], Awaitable[Any]]
+    default: Any = None  # 실패 시 값 (callable이면 호출 결과, 예: list)
+    required: bool = False
+    timeout: Optional[float] = None  # None이면 config.TIMEOUT_SECONDS
+
+
+@dataclass
+class FanoutResult:
+    """하위 조회 결과 (실패한 선택 조회는 default)"""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    elapsed_ms: dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.errors)
+
+
+class QueryFanout:
+    """독립 하위 조회 동시 실행"""
+
+    def __init__(
+        self,
+        config: Optional[QueryFanoutConfig] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.config = config or QueryFanoutConfig()
+        self._session_factory = session_factory
+        self._factories: dict[Any, Callable[[], AsyncSession]] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {
+            "fanouts": 0, "sequential": 0, "subqueries": 0, "timeouts": 0, "errors": 0,
+            "released_request_sessions": 0,
+        }
+
+    def _get_session_slots(self) -> asyncio.Semaphore:
+        """프로세스 전체 하위 세션 슬롯 (이벤트 루프별 - API 프로세스는 루프 하나)"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(max(1, self.config.MAX_SESSIONS))
+            self._slots_loop = loop
+        return self._slots
+
+    async def _release_request_session(self, db: AsyncSession) -> None:
+        """요청 세션이 잡고 있는 커넥션 반환 (변경 사항이 있으면 그대로 둠)"""
+        if not db.in_transaction() or db.new or db.dirty or db.deleted:
+            return
+        try:
+            await db.commit()
+            self._stats["released_request_sessions"] += 1
+        except Exception as e:
+            logger.warning(f"[QueryFanout] Failed to release request session: {e}")
+
+    def _get_session_factory(self, db: AsyncSession) -> Callable[[], AsyncSession]:
+        """요청 세션의 bind(primary/replica 엔진)와 세션 클래스로 하위 세션 생성"""
+        if self._session_factory is not None:
+            return self._session_factory
+        bind = db.bind
+        key = (bind, type(db))
+        factory = self._factories.get(key)
+        if factory is None:
+            factory = async_sessionmaker(
+                bind,
+                class_=type(db),
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            )
+            self._factories[key] = factory
+        return factory
+
+    async def run(self, db: AsyncSession, subqueries: Sequence[SubQuery]) -> FanoutResult:
+        """
+        하위 조회 실행
+
+        Args:
+            db: 요청 세션 (순차 실행 시 사용, 동시 실행 시 하위 세션의 bind)
+            subqueries: 서로 독립적인 하위 조회
+
+        Raises:
+            required 하위 조회의 예외 (timeout은 TimeoutError)
+        """
+        result = FanoutResult()
+        self._stats["subqueries"] += len(subqueries)
+
+        if not self.config.ENABLED or len(subqueries) <= 1:
+            self._stats["sequential"] += 1
+            for sq in subqueries:
+                await self._run_one(sq, db, result, shared=True)
+            return result
+
+        self._stats["fanouts"] += 1
+        semaphore = asyncio.Semaphore(max(1, self.config.MAX_CONCURRENCY))
+        slots = self._get_session_slots()
+        session_factory = self._get_session_factory(db)
+        await self._release_request_session(db)
+
+        async def run_isolated(sq: SubQuery) -> None:
+            async with semaphore, slots:
+                async with session_factory() as session:
+                    await self._run_one(sq, session, result)
+
+        outcomes = await asyncio.gather(
+            *(run_isolated(sq) for sq in subqueries),
+            return_exceptions=True,
+        )
+        # required 실패는 모든 하위 조회가 끝난 뒤 전달 (세션 정리 보장)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return result
+
+    async def _run_one(
+        self,
+        sq: SubQuery,
+        session: AsyncSession,
+        result: FanoutResult,
+        shared: bool = False,
+    ) -> None:
+        timeout = sq.timeout if sq.timeout is not None else self.config.TIMEOUT_SECONDS
+        started = time.monotonic()
+        try:
+            if shared:
+                # 요청 세션 공유 - 실패가 트랜잭션을 중단시키지 않도록 SAVEPOINT 안에서 실행
+                async with session.begin_nested():
+                    value = await asyncio.wait_for(sq.run(session), timeout=timeout)
+            else:
+                value = await asyncio.wait_for(sq.run(session), timeout=timeout)
+            result.values[sq.name] = value
+        except Exception as e:
+            is_timeout = isinstance(e, asyncio.TimeoutError)
+            self._stats["timeouts" if is_timeout else "errors"] += 1
+            result.errors[sq.name] = f"timeout after {timeout}s" if is_timeout else f"{type(e).__name__}: {e}"
+            logger.warning(f"[QueryFanout] Sub-query '{sq.name}' failed: {result.errors[sq.name]}")
+            if sq.required:
+                raise
+            result.values[sq.name] = sq.default() if callable(sq.default) else sq.default
+        finally:
+            result.elapsed_ms[sq.name] = int((time.monotonic() - started) * 1000)
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "enabled": self.config.ENABLED,
+            "max_concurrency": self.config.MAX_CONCURRENCY,
+            "max_sessions": self.config.MAX_SESSIONS,
+            "timeout_seconds": self.config.TIMEOUT_SECONDS,
+        }
+
+
+# Singleton instance
+_query_fanout: Optional[QueryFanout] = None
+
+
+def get_query_fanout() -> QueryFanout:
+    """Get singleton QueryFanout instance"""
+    global _query_fanout
+    if _query_fanout is None:
+        _query_fanout = QueryFanout()
+    return _query_fanout
+
+
+def reset_query_fanout() -> None:
+    """Reset singleton (for testing)"""
+    global _query_fanout
+    _query_fanout = None
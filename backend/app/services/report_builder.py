@@ -0,0 +1,372 @@
+"""
+Corporation Report Builder
+
+GET /reports/corporation/{corp_id} 응답(FullReportResponse) 조립.
+
+조회 5개 (corp, 최근 시그널 50건 + 상태, 시그널별 최신 evidence 3건, loan insight, corp profile)는
+SQL 상수로 공유하고, 행 → 응답 변환은 순수 함수(assemble_report)로 분리했다.
+API(AsyncSession)와 Worker 스냅샷 재생성(sync Session)이 같은 조립 로직을 사용한다.
+API 경로는 독립 조회를 별도 커넥션에서 동시에 실행한다 (query_fanout).
+
+선택 조회(loan insight, corp profile)가 실패해 기본값으로 조립한 보고서는 partial=True로 반환한다
+→ 스냅샷 저장/ETag 대상에서 제외 (다음 열람 시 다시 조립).
+
+Usage:
+    report, partial = await build_report(db, corp_id)          # API
+    report, partial = build_report_sync(session, corp_id)      # Celery worker
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import text
+
+from app.schemas.report import (
+    CorporationInfo,
+    FullReportResponse,
+    LoanInsightResponse,
+    LoanInsightStance,
+    ReportCorpProfile,
+    ReportOverseasBusiness,
+    ReportSignalSummary,
+    ReportSupplyChain,
+)
+from app.schemas.signal import EvidenceResponse, SignalDetailResponse, SignalStatusEnum
+from app.services.query_fanout import SubQuery, get_query_fanout
+
+logger = logging.getLogger(__name__)
+
+REPORT_SIGNAL_LIMIT = 50
+REPORT_EVIDENCE_PER_SIGNAL = 3
+REPORT_EVIDENCE_LIST_LIMIT = 10
+
+CORP_SQL = text("""
+    SELECT corp_id, corp_name, biz_no, industry_code
+    FROM corp
+    WHERE corp_id = :corp_id
+    LIMIT 1
+""")
+
+SIGNALS_SQL = text(f"""
+    SELECT
+        si.signal_id, si.corp_id, si.corp_name, si.industry_code,
+        si.signal_type, si.event_type, si.impact_direction, si.impact_strength,
+        si.confidence, si.title, si.summary_short, si.evidence_count, si.detected_at,
+        s.summary, s.signal_status, s.reviewed_at, s.dismissed_at, s.dismiss_reason
+    FROM rkyc_signal_index si
+    LEFT JOIN rkyc_signal s ON s.signal_id = si.signal_id
+    WHERE si.corp_id = :corp_id
+    ORDER BY si.detected_at DESC
+    LIMIT {REPORT_SIGNAL_LIMIT}
+""")
+
+# ROW_NUMBER로 시그널별 최신 evidence만
+EVIDENCE_SQL = text(f"""
+    WITH ranked_evidence AS (
+        SELECT *,
+            ROW_NUMBER() OVER (PARTITION BY signal_id ORDER BY created_at DESC) as rn
+        FROM rkyc_evidence
+        WHERE signal_id = ANY(:signal_ids)
+    )
+    SELECT evidence_id, signal_id, evidence_type, ref_type, ref_value, snippet, meta, created_at
+    FROM ranked_evidence
+    WHERE rn <= {REPORT_EVIDENCE_PER_SIGNAL}
+    ORDER BY created_at DESC
+""")
+
+LOAN_INSIGHT_SQL = text("""
+    SELECT
+        stance_level, stance_label, stance_color,
+        narrative, key_risks, mitigating_factors, action_items
+    FROM rkyc_loan_insight
+    WHERE corp_id = :corp_id
+""")
+
+CORP_PROFILE_SQL = text("""
+    SELECT
+        business_summary, revenue_krw, export_ratio_pct,
+        country_exposure, key_materials, key_customers,
+        supply_chain, overseas_business,
+        competitors, macro_factors, shareholders,
+        profile_confidence
+    FROM rkyc_corp_profile
+    WHERE corp_id = :corp_id
+""")
+
+
+# =============================================================================
+# Row → Response
+# =============================================================================
+
+
+def default_loan_insight() -> LoanInsightResponse:
+    """Loan Insight 미생성 (분석 전 또는 테이블 없음)"""
+    return LoanInsightResponse(
+        stance=LoanInsightStance(
+            label="분석 대기",
+            level="STABLE",
+            color="grey",
+        ),
+        narrative="Loan Insight가 아직 생성되지 않았습니다. 분석 실행 후 확인해 주세요.",
+        key_risks=[],
+        mitigating_factors=[],
+        action_items=["분석 실행 필요"],
+    )
+
+
+def loan_insight_from_row(row: Any) -> LoanInsightResponse:
+    """rkyc_loan_insight 행 → 응답 (행 없으면 기본값)"""
+    if not row:
+        return default_loan_insight()
+
+    return LoanInsightResponse(
+        stance=LoanInsightStance(
+            label=row.stance_label,
+            level=row.stance_level,
+            color=row.stance_color,
+        ),
+        narrative=row.narrative,
+        key_risks=row.key_risks or [],
+        mitigating_factors=row.mitigating_factors or [],
+        action_items=row.action_items or [],
+    )
+
+
+def corp_profile_from_row(row: Any) -> Optional[ReportCorpProfile]:
+    """rkyc_corp_profile 행 → 보고서용 프로필 (행 없으면 None)"""
+    if not row:
+        return None
+
+    # Parse supply_chain JSONB
+    supply_chain = None
+    if row.supply_chain:
+        sc = row.supply_chain
+        supply_chain = ReportSupplyChain(
+            key_suppliers=sc.get("key_suppliers", []),
+            supplier_countries=sc.get("supplier_countries", {}),
+            single_source_risk=sc.get("single_source_risk", []),
+            material_import_ratio_pct=sc.get("material_import_ratio_pct"),
+        )
+
+    # Parse overseas_business JSONB
+    overseas_business = None
+    if row.overseas_business:
+        ob = row.overseas_business
+        overseas_business = ReportOverseasBusiness(
+            subsidiaries=ob.get("subsidiaries", []),
+            manufacturing_countries=ob.get("manufacturing_countries", []),
+        )
+
+    # Parse competitors (may be list of strings or list of dicts)
+    competitors = []
+    for c in row.competitors or []:
+        if isinstance(c, str):
+            competitors.append(c)
+        elif isinstance(c, dict):
+            competitors.append(c.get("name", str(c)))
+
+    macro_factors = [
+        {"factor": mf.get("factor", ""), "impact": mf.get("impact", "NEUTRAL")}
+        for mf in row.macro_factors or []
+        if isinstance(mf, dict)
+    ]
+
+    shareholders = [
+        {"name": sh.get("name", ""), "ownership_pct": sh.get("ownership_pct", 0)}
+        for sh in row.shareholders or []
+        if isinstance(sh, dict)
+    ]
+
+    return ReportCorpProfile(
+        business_summary=row.business_summary,
+        revenue_krw=row.revenue_krw,
+        export_ratio_pct=row.export_ratio_pct,
+        country_exposure=row.country_exposure or [],
+        key_materials=row.key_materials or [],
+        key_customers=row.key_customers or [],
+        supply_chain=supply_chain,
+        overseas_business=overseas_business,
+        competitors=competitors,
+        macro_factors=macro_factors,
+        shareholders=shareholders,
+        profile_confidence=row.profile_confidence,
+    )
+
+
+def _corporation_info(corp_id: str, corp_row: Any, signal_rows: Sequence[Any]) -> CorporationInfo:
+    if corp_row:
+        return CorporationInfo(
+            id=corp_row.corp_id,
+            name=corp_row.corp_name,
+            business_number=corp_row.biz_no or "",
+            industry=corp_row.industry_code or "",
+            industry_code=corp_row.industry_code or "",
+        )
+    if signal_rows:
+        # Fallback to first signal if corp not found
+        first_signal = signal_rows[0]
+        return CorporationInfo(
+            id=first_signal.corp_id,
+            name=first_signal.corp_name,
+            business_number="",
+            industry=first_signal.industry_code or "",
+            industry_code=first_signal.industry_code or "",
+        )
+    return CorporationInfo(id=corp_id, name=corp_id, business_number="", industry="", industry_code="")
+
+
+def assemble_report(
+    corp_id: str,
+    corp_row: Any,
+    signal_rows: Sequence[Any],
+    evidence_rows: Sequence[Any],
+    loan_insight: Optional[LoanInsightResponse],
+    corp_profile: Optional[ReportCorpProfile],
+    generated_at: Optional[datetime] = None,
+) -> FullReportResponse:
+    """조회 결과 → FullReportResponse (DB 접근 없음)"""
+    evidences_map: dict[Any, list] = {}
+    for ev in evidence_rows:
+        evidences_map.setdefault(ev.signal_id, []).append(ev)
+
+    signals_response: list[SignalDetailResponse] = []
+    summary_stats = {
+        "total": 0, "direct": 0, "industry": 0, "environment": 0,
+        "risk": 0, "opportunity": 0, "neutral": 0,
+    }
+    flattened_evidences: list[EvidenceResponse] = []
+
+    for row in signal_rows:
+        summary_stats["total"] += 1
+        signal_type_lower = (row.signal_type or "").lower()
+        impact_lower = (row.impact_direction or "neutral").lower()
+        if signal_type_lower in summary_stats:
+            summary_stats[signal_type_lower] += 1
+        if impact_lower in summary_stats:
+            summary_stats[impact_lower] += 1
+
+        ev_responses = [
+            EvidenceResponse(
+                evidence_id=e.evidence_id,
+                signal_id=e.signal_id,
+                evidence_type=e.evidence_type,
+                ref_type=e.ref_type,
+                ref_value=e.ref_value,
+                snippet=e.snippet,
+                meta=getattr(e, "meta", None),
+                created_at=e.created_at,
+            ) for e in evidences_map.get(row.signal_id, [])
+        ]
+        flattened_evidences.extend(ev_responses)
+
+        signals_response.append(SignalDetailResponse(
+            signal_id=row.signal_id,
+            corp_id=row.corp_id,
+            corp_name=row.corp_name,
+            industry_code=row.industry_code,
+            signal_type=row.signal_type,
+            event_type=row.event_type,
+            impact_direction=row.impact_direction,
+            impact_strength=row.impact_strength,
+            confidence=row.confidence,
+            title=row.title,
+            summary=row.summary or row.summary_short or "",
+            summary_short=row.summary_short,
+            signal_status=row.signal_status or SignalStatusEnum.NEW,
+            evidence_count=row.evidence_count or 0,
+            detected_at=row.detected_at,
+            reviewed_at=row.reviewed_at,
+            dismissed_at=row.dismissed_at,
+            dismiss_reason=row.dismiss_reason,
+            evidences=ev_responses,
+        ))
+
+    return FullReportResponse(
+        corporation=_corporation_info(corp_id, corp_row, signal_rows),
+        summary_stats=ReportSignalSummary(**summary_stats),
+        signals=signals_response,
+        evidence_list=flattened_evidences[:REPORT_EVIDENCE_LIST_LIMIT],
+        loan_insight=loan_insight,
+        corp_profile=corp_profile,
+        generated_at=generated_at or datetime.now(),
+    )
+
+
+# =============================================================================
+# Fetch + Assemble
+# =============================================================================
+
+
+async def build_report(db, corp_id: str) -> tuple[FullReportResponse, bool]:
+    """
+    AsyncSession으로 보고서 조립
+
+    corp / 시그널(+evidence) / loan insight / corp profile은 서로 독립적이므로
+    별도 커넥션에서 동시에 조회 (app.services.query_fanout).
+    Loan Insight / Corp Profile은 테이블이 없거나 실패하면 기본값으로 대체.
+
+    Returns:
+        (보고서, partial) - partial이면 선택 조회 실패로 기본값이 들어간 보고서
+    """
+    async def corp(session):
+        return (await session.execute(CORP_SQL, {"corp_id": corp_id})).fetchone()
+
+    async def signals(session):
+        signal_rows = (await session.execute(SIGNALS_SQL, {"corp_id": corp_id})).fetchall()
+        signal_ids = [row.signal_id for row in signal_rows]
+        if not signal_ids:
+            return signal_rows, []
+        return signal_rows, (await session.execute(EVIDENCE_SQL, {"signal_ids": signal_ids})).fetchall()
+
+    async def loan_insight(session):
+        return loan_insight_from_row((await session.execute(LOAN_INSIGHT_SQL, {"corp_id": corp_id})).fetchone())
+
+    async def corp_profile(session):
+        return corp_profile_from_row((await session.execute(CORP_PROFILE_SQL, {"corp_id": corp_id})).fetchone())
+
+    result = await get_query_fanout().run(db, [
+        SubQuery("corp", corp, required=True),
+        SubQuery("signals", signals, required=True),
+        SubQuery("loan_insight", loan_insight, default=default_loan_insight),
+        SubQuery("corp_profile", corp_profile),
+    ])
+    signal_rows, evidence_rows = result["signals"]
+    report = assemble_report(
+        corp_id, result["corp"], signal_rows, evidence_rows,
+        result["loan_insight"], result["corp_profile"],
+    )
+    return report, result.partial
+
+
+def build_report_sync(session, corp_id: str) -> tuple[FullReportResponse, bool]:
+    """sync Session으로 보고서 조립 (Worker). Returns (보고서, partial)"""
+    corp_row = session.execute(CORP_SQL, {"corp_id": corp_id}).fetchone()
+    signal_rows = session.execute(SIGNALS_SQL, {"corp_id": corp_id}).fetchall()
+
+    evidence_rows = []
+    signal_ids = [row.signal_id for row in signal_rows]
+    if signal_ids:
+        evidence_rows = session.execute(EVIDENCE_SQL, {"signal_ids": signal_ids}).fetchall()
+
+    partial = False
+    try:
+        loan_insight = loan_insight_from_row(
+            session.execute(LOAN_INSIGHT_SQL, {"corp_id": corp_id}).fetchone()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to fetch loan_insight for {corp_id}: {e}")
+        loan_insight = default_loan_insight()
+        partial = True
+
+    try:
+        corp_profile = corp_profile_from_row(
+            session.execute(CORP_PROFILE_SQL, {"corp_id": corp_id}).fetchone()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to fetch corp_profile for {corp_id}: {e}")
+        corp_profile = None
+        partial = True
+
+    report = assemble_report(corp_id, corp_row, signal_rows, evidence_rows, loan_insight, corp_profile)
+    return report, partial
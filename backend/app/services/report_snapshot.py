@@ -0,0 +1,252 @@
+"""
+Corporation Report Snapshot Store
+
+GET /reports/corporation/{corp_id} 는 조회 5회 + Python 조립을 매 요청 수행했지만,
+보고서는 바뀌는 빈도보다 열람 빈도가 훨씬 높다.
+
+rkyc_report_snapshot (migration_v23):
+- corp_id별 조립된 FullReportResponse JSON + ETag 저장
+- version: 보고서 원천 데이터(시그널 인덱스/상태, loan insight, corp profile, corp) 변경 시
+  트리거가 +1 → IndexPipeline, InsightPipeline, 프로필 갱신, 상태 변경 API, 수동 보정 모두 반영
+- built_version: 스냅샷을 조립할 때 읽은 version
+  built_version = version 인 스냅샷만 제공, 아니면 조립 후 저장
+  (조립 중 원천이 바뀌면 version 조건으로 저장을 건너뜀 → 오래된 스냅샷이 최신으로 기록되지 않음)
+
+재생성: 원천 변경 지점에서 rebuild_report_snapshot Celery 태스크를 예약 (다음 열람 전에 미리 조립).
+태스크가 늦거나 실패해도 열람 시 직접 조립하므로 정확성은 트리거 version에만 의존한다.
+
+ETag: generated_at을 제외한 보고서 내용의 해시 - 재조립 결과가 같으면 ETag(및 generated_at) 유지.
+선택 조회(loan insight / corp profile) 실패로 기본값이 들어간 보고서(partial)는 저장하지 않고 ETag도 없음
+→ 원천이 바뀌지 않아도 다음 열람/재생성이 다시 조립한다.
+테이블이 없으면 (migration 미적용) 매 요청 조립으로 fallback (ETag/304는 그대로 동작).
+
+Usage:
+    snapshot = await get_report_snapshot_service().get(db, corp_id)
+    if etag_matches(request.headers.get("If-None-Match"), snapshot.etag): 304
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import text
+
+from app.schemas.report import FullReportResponse
+from app.services.report_builder import build_report, build_report_sync
+
+logger = logging.getLogger(__name__)
+
+STORE_RETRY_SECONDS = 300  # 스냅샷 테이블 조회 실패 후 직접 조립으로 버티는 시간
+
+READ_SQL = text("""
+    SELECT version, built_version, etag, payload::text AS payload
+    FROM rkyc_report_snapshot
+    WHERE corp_id = :corp_id
+""")
+
+# 조립 시작 시 읽은 version이 그대로일 때만 저장 (행이 없었으면 version 0으로 생성)
+STORE_SQL = text("""
+    INSERT INTO rkyc_report_snapshot (corp_id, version, built_version, etag, payload, built_at, updated_at)
+    VALUES (:corp_id, :version, :version, :etag, CAST(:payload AS jsonb), NOW(), NOW())
+    ON CONFLICT (corp_id) DO UPDATE SET
+        built_version = EXCLUDED.built_version,
+        etag = EXCLUDED.etag,
+        payload = EXCLUDED.payload,
+        built_at = EXCLUDED.built_at,
+        updated_at = EXCLUDED.updated_at
+    WHERE rkyc_report_snapshot.version = :version
+""")
+
+
+@dataclass
+class ReportSnapshotConfig:
+    """Report snapshot configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    REBUILD_DELAY_SECONDS: int = 5  # 연속 변경을 한 번의 재생성으로 묶는 지연
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.REPORT_SNAPSHOT_ENABLED
+            self.REBUILD_DELAY_SECONDS = settings.REPORT_SNAPSHOT_REBUILD_DELAY_SECONDS
+        except Exception as e:
+            logger.warning(f"Failed to load report snapshot config from settings: {e}, using defaults")
+
+
+@dataclass
+class ReportSnapshot:
+    """직렬화된 보고서"""
+
+    corp_id: str
+    etag: Optional[str]  # partial이면 None (캐시 재검증 대상 아님)
+    body: str  # FullReportResponse JSON
+    from_snapshot: bool = False
+    partial: bool = False
+
+
+def report_etag(report: FullReportResponse) -> str:
+    """generated_at을 제외한 보고서 내용 해시 (loan_insight.generated_at도 조립 시각)"""
+    content = report.model_dump_json(exclude={"generated_at": True, "loan_insight": {"generated_at"}})
+    return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+
+def serialize_report(corp_id: str, report: FullReportResponse, partial: bool = False) -> ReportSnapshot:
+    return ReportSnapshot(
+        corp_id=corp_id,
+        etag=None if partial else report_etag(report),
+        body=report.model_dump_json(),
+        partial=partial,
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match 헤더가 현재 ETag를 포함하는지 (약한 비교, 목록/* 지원)"""
+    if not if_none_match or not etag:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def is_fresh(row: Any) -> bool:
+    """원천 변경 이후 조립된 스냅샷인지"""
+    return bool(row) and row.payload is not None and row.built_version == row.version
+
+
+def _prepare_store(row: Any, snapshot: ReportSnapshot) -> tuple[ReportSnapshot, dict, bool]:
+    """
+    저장할 스냅샷과 파라미터
+
+    내용이 같으면 기존 payload를 유지 (generated_at/ETag 불변) → (snapshot, params, changed)
+    """
+    changed = True
+    if row and row.payload is not None and row.etag == snapshot.etag:
+        snapshot = ReportSnapshot(snapshot.corp_id, row.etag, row.payload)
+        changed = False
+    params = {
+        "corp_id": snapshot.corp_id,
+        "version": row.version if row else 0,
+        "etag": snapshot.etag,
+        "payload": snapshot.body,
+    }
+    return snapshot, params, changed
+
+
+class ReportSnapshotService:
+    """스냅샷 조회 + 미스 시 조립/저장 (API용)"""
+
+    def __init__(self, config: Optional[ReportSnapshotConfig] = None):
+        self.config = config or ReportSnapshotConfig()
+        self._store_retry_at = 0.0
+        self._stats = {"hits": 0, "misses": 0, "stored": 0, "store_skipped": 0, "partial": 0, "errors": 0}
+
+    def _store_available(self) -> bool:
+        return self.config.ENABLED and time.monotonic() >= self._store_retry_at
+
+    def _store_unavailable(self, e: Exception) -> None:
+        # migration_v23 미적용 등 - 한동안 바로 조립
+        logger.warning(f"[ReportSnapshot] Snapshot store unavailable, building reports inline: {e}")
+        self._store_retry_at = time.monotonic() + STORE_RETRY_SECONDS
+        self._stats["errors"] += 1
+
+    async def get(self, db, corp_id: str) -> ReportSnapshot:
+        """최신 스냅샷 (없거나 원천이 바뀌었으면 조립 후 저장)"""
+        use_store = self._store_available()
+        row = None
+        if use_store:
+            try:
+                row = (await db.execute(READ_SQL, {"corp_id": corp_id})).fetchone()
+            except Exception as e:
+                self._store_unavailable(e)
+                await db.rollback()
+                use_store = False
+
+            if is_fresh(row):
+                self._stats["hits"] += 1
+                return ReportSnapshot(corp_id, row.etag, row.payload, from_snapshot=True)
+
+        self._stats["misses"] += 1
+        snapshot = serialize_report(corp_id, *await build_report(db, corp_id))
+        if snapshot.partial:
+            # 기본값으로 대체된 보고서를 최신 스냅샷으로 저장하지 않음
+            self._stats["partial"] += 1
+            return snapshot
+        if not use_store:
+            return snapshot
+
+        snapshot, params, _ = _prepare_store(row, snapshot)
+        try:
+            result = await db.execute(STORE_SQL, params)
+            await db.commit()
+            self._count_store(result)
+        except Exception as e:
+            logger.warning(f"[ReportSnapshot] Failed to store snapshot for {corp_id}: {e}")
+            self._stats["errors"] += 1
+            await db.rollback()
+        return snapshot
+
+    def _count_store(self, result) -> None:
+        # rowcount 0: 조립 중 원천 변경 → 다음 열람/재생성 태스크가 다시 조립
+        self._stats["stored" if result.rowcount else "store_skipped"] += 1
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "enabled": self.config.ENABLED,
+            "store_available": self._store_available(),
+            "rebuild_delay_seconds": self.config.REBUILD_DELAY_SECONDS,
+        }
+
+
+def rebuild_snapshot_sync(session, corp_id: str, force: bool = False) -> str:
+    """
+    스냅샷 재생성 (Worker, sync Session)
+
+    Returns:
+        "fresh"     이미 최신 (force가 아니면 조립하지 않음)
+        "rebuilt"   내용 변경 → 새 스냅샷 저장
+        "unchanged" 재조립 결과 동일 → built_version만 전진
+        "stale"     조립 중 원천 변경 → 저장 건너뜀
+        "partial"   선택 조회 실패로 기본값 포함 → 저장 건너뜀
+    """
+    row = session.execute(READ_SQL, {"corp_id": corp_id}).fetchone()
+    if not force and is_fresh(row):
+        return "fresh"
+
+    snapshot = serialize_report(corp_id, *build_report_sync(session, corp_id))
+    if snapshot.partial:
+        session.rollback()
+        return "partial"
+    snapshot, params, changed = _prepare_store(row, snapshot)
+    result = session.execute(STORE_SQL, params)
+    session.commit()
+    if not result.rowcount:
+        return "stale"
+    return "rebuilt" if changed else "unchanged"
+
+
+# Singleton instance
+_report_snapshot_service: Optional[ReportSnapshotService] = None
+
+
+def get_report_snapshot_service() -> ReportSnapshotService:
+    """Get singleton ReportSnapshotService instance"""
+    global _report_snapshot_service
+    if _report_snapshot_service is None:
+        _report_snapshot_service = ReportSnapshotService()
+    return _report_snapshot_service
+
+
+def reset_report_snapshot_service() -> None:
+    """Reset singleton (for testing)"""
+    global _report_snapshot_service
+    _report_snapshot_service = None
@@ -0,0 +1,192 @@
+"""
+Worker Async Runtime
+프로세스당 하나의 백그라운드 이벤트 루프 + 공유 httpx.AsyncClient
+
+Celery 태스크는 동기 함수이므로, async 코드를 실행할 때마다 새 이벤트 루프와
+HTTP 클라이언트를 만들면 TLS 핸드셰이크/커넥션 풀이 매번 버려진다.
+이 모듈은 데몬 스레드에서 영구 이벤트 루프를 돌리고, 그 루프에 묶인
+커넥션 풀(keep-alive)을 잡(job) 간에 재사용한다.
+
+Usage:
+    from app.worker.async_runtime import run_async, get_async_http_client
+
+    async def fetch():
+        client = get_async_http_client()
+        return await client.get(url)
+
+    result = run_async(fetch(), timeout=60.0)
+
+Fork safety:
+    Celery prefork는 import 이후 fork하므로, 루프는 최초 사용 시점에 생성하고
+    PID가 바뀌면(자식 프로세스) 새로 만든다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundLoop:
+    """데몬 스레드에서 실행되는 영구 이벤트 루프"""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        default_timeout: float = 45.0,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.default_timeout = default_timeout
+
+        self._loop = asyncio.new_event_loop()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="worker-async-loop", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._ready.set)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and self._loop.is_running()
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 백그라운드 루프에서 실행하고 결과를 기다림
+
+        Raises:
+            concurrent.futures.TimeoutError: timeout 초과 (코루틴은 취소됨)
+            RuntimeError: 백그라운드 루프 스레드 안에서 호출한 경우 (데드락 방지)
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("run() cannot be called from the background loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """코루틴을 백그라운드 루프에 예약하고 기다리지 않음 (fire-and-forget)"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        """
+        루프에 묶인 공유 AsyncClient (루프 스레드 안에서만 사용)
+
+        커넥션 풀은 이벤트 루프에 종속되므로 반드시 이 루프에서 실행되는
+        코루틴 안에서 호출해야 한다.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.default_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._client
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """공유 클라이언트를 닫고 루프 정지"""
+        if not self._loop.is_running():
+            return
+
+        if self._client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._client.aclose(), self._loop
+                ).result(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Failed to close shared AsyncClient: {e}")
+            self._client = None
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+
+# Per-process singleton
+_background_loop: Optional[BackgroundLoop] = None
+_background_loop_pid: Optional[int] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Get per-process background loop (created lazily, recreated after fork)"""
+    global _background_loop, _background_loop_pid
+
+    pid = os.getpid()
+    loop = _background_loop
+    if loop is not None and _background_loop_pid == pid and loop.is_running():
+        return loop
+
+    with _background_loop_lock:
+        if (
+            _background_loop is None
+            or _background_loop_pid != pid
+            or not _background_loop.is_running()
+        ):
+            try:
+                from app.core.config import settings
+                _background_loop = BackgroundLoop(
+                    max_connections=settings.ASYNC_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.ASYNC_HTTP_MAX_KEEPALIVE,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load async runtime config from settings: {e}, using defaults")
+                _background_loop = BackgroundLoop()
+            _background_loop_pid = pid
+            logger.info(f"Started worker background event loop (pid={pid})")
+        return _background_loop
+
+
+def run_async(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """동기 코드에서 코루틴 실행 (프로세스 공유 루프 사용)"""
+    return get_background_loop().run(coro, timeout=timeout)
+
+
+def submit_async(coro: Awaitable[Any]) -> concurrent.futures.Future:
+    """코루틴을 프로세스 공유 루프에서 백그라운드 실행 (호출한 루프가 닫혀도 계속 실행)"""
+    return get_background_loop().submit(coro)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """공유 AsyncClient (백그라운드 루프에서 실행 중인 코루틴 안에서 호출)"""
+    return get_background_loop().get_http_client()
+
+
+def is_background_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    """이 프로세스의 공유 백그라운드 루프인지 (루프를 새로 만들지 않음)"""
+    background = _background_loop
+    return background is not None and _background_loop_pid == os.getpid() and background.loop is loop
+
+
+def shutdown_background_loop() -> None:
+    """Shut down the background loop (worker shutdown / testing)"""
+    global _background_loop, _background_loop_pid
+    with _background_loop_lock:
+        if _background_loop is not None and _background_loop_pid == os.getpid():
+            _background_loop.shutdown()
+        _background_loop = None
+        _background_loop_pid = None
@@ -5,6 +5,7 @@ Celery worker configuration for background task processing
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import task_postrun, task_prerun, worker_process_init
 from kombu import Queue
 
 from app.core.config import settings
@@ -37,7 +38,7 @@ celery_app.conf.update(
 
     # Worker settings
     worker_prefetch_multiplier=1,  # For long-running tasks
-    worker_concurrency=2,  # Number of concurrent workers
+    worker_concurrency=settings.WORKER_CONCURRENCY,  # Number of concurrent workers (DB 풀 크기 계산에도 사용)
 
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
@@ -50,6 +51,9 @@ celery_app.conf.update(
     ],
     task_default_queue="default",
     task_default_routing_key="default",
+    # 워커는 task_queues 순서(high → default → low)대로 가져감 (기본값 round_robin은 큐를 번갈아 소비)
+    # → 사용자 요청 분석(high)이 정기 분석(low)보다 항상 먼저 실행
+    broker_transport_options={"queue_order_strategy": "priority"},
 
     # Retry settings
     task_default_retry_delay=60,  # 1 minute default retry delay
@@ -59,17 +63,12 @@ celery_app.conf.update(
     # Celery Beat Schedule (Periodic Tasks)
     # ===========================================
     beat_schedule={
-        # Full scan of all corporations - every 6 hours
-        "scan-all-corporations-every-6-hours": {
-            "task": "scan_all_corporations",
-            "schedule": crontab(minute=0, hour="*/6"),  # 00:00, 06:00, 12:00, 18:00
-            "options": {"queue": "default"},
-        },
-
-        # High-risk corporations scan - every hour
-        "scan-high-risk-every-hour": {
-            "task": "scan_high_risk_corporations",
-            "schedule": crontab(minute=30),  # Every hour at :30
+        # Analysis admission tick - every 5 minutes (app.worker.job_scheduler)
+        # 입력이 바뀌었거나 SLA가 지난 기업을 위험 점수 순으로, 큐 깊이/워커 슬롯 범위 안에서만 생성
+        # (기존 6시간 전체 스캔 / 1시간 고위험 스캔 대체 - 태스크는 수동 실행용으로 유지)
+        "schedule-analysis-jobs-every-5-minutes": {
+            "task": "schedule_analysis_jobs",
+            "schedule": crontab(minute="*/5"),
             "options": {"queue": "high"},
         },
 
@@ -80,16 +79,74 @@ celery_app.conf.update(
             "options": {"queue": "low"},
         },
 
-        # Cleanup old jobs - daily at 3 AM
+        # Monthly partitions (rkyc_job, rkyc_signal_index) - daily at 2:30 AM
+        # 미래 월 파티션 생성 + 보존 기간 지난 rkyc_signal_index 파티션 분리 (app.worker.partition_maintenance)
+        "maintain-partitions-daily": {
+            "task": "maintain_partitions",
+            "schedule": crontab(minute=30, hour=2),
+            "options": {"queue": "low"},
+        },
+
+        # Dashboard counter rollup - every minute (migration_v26)
+        # 트리거가 append한 증감 행을 rkyc_dashboard_counter에 합산 (대시보드는 카운터 + 미합산 증감을 읽음)
+        "rollup-dashboard-counter-every-minute": {
+            "task": "rollup_dashboard_counter",
+            "schedule": crontab(),
+            "options": {"queue": "low"},
+        },
+
+        # Cleanup old jobs - daily at 3 AM (파티션 테이블이면 지난 월 파티션 단위로 분리)
         "cleanup-old-jobs-daily": {
             "task": "cleanup_old_jobs",
             "schedule": crontab(minute=0, hour=3),
             "args": (30,),  # Keep jobs for 30 days
             "options": {"queue": "low"},
         },
+
+        # DART filings/financials incremental sync - daily at 5 AM
+        "sync-dart-filings-daily": {
+            "task": "sync_dart_filings",
+            "schedule": crontab(minute=0, hour=5),
+            "options": {"queue": "low"},
+        },
+
+        # Portfolio-wide rule checks (overdue, grade, exposure, KYC) - every 10 minutes, no LLM
+        "evaluate-portfolio-rules-every-10-minutes": {
+            "task": "evaluate_portfolio_rules",
+            "schedule": crontab(minute="*/10"),
+            "options": {"queue": "default"},
+        },
     },
 )
 
+# ===========================================
+# Worker DB lifecycle (app.worker.db)
+# ===========================================
+_job_session_tokens: dict = {}
+
+
+@worker_process_init.connect
+def _dispose_inherited_connections(**kwargs):
+    """prefork 자식 프로세스는 부모의 풀 커넥션을 쓰지 않음"""
+    from app.worker.db import dispose_after_fork
+    dispose_after_fork()
+
+
+@task_prerun.connect
+def _begin_job_session(task_id=None, **kwargs):
+    """태스크 실행 동안 get_sync_db()가 커넥션 하나를 공유 (unit of work)"""
+    from app.worker.db import begin_job_session
+    _job_session_tokens[task_id] = begin_job_session()
+
+
+@task_postrun.connect
+def _end_job_session(task_id=None, **kwargs):
+    token = _job_session_tokens.pop(task_id, None)
+    if token is not None:
+        from app.worker.db import end_job_session
+        end_job_session(token)
+
+
 # Auto-discover tasks by importing the package directly
 # This avoids RecursionError in autodiscover_tasks when tasks import celery_app
 import app.worker.tasks
@@ -1,17 +1,51 @@
 """
 Synchronous Database Access for Celery Workers
 Celery tasks are synchronous, so we need a sync database session
+
+Job 단위 세션 (unit of work):
+    분석 파이프라인은 단계마다 get_sync_db()로 짧은 세션을 열어, Job 하나가 풀 체크아웃
+    (+ pre-ping 왕복)을 수십 번 반복했다. 태스크 실행 동안(task_prerun ~ task_postrun)
+    커넥션 하나를 잡아 두고, 같은 스레드의 get_sync_db()는 그 커넥션에 묶인 세션을 재사용한다.
+    - 각 블록 종료 시 커밋되지 않은 작업은 롤백 (기존 close()와 동일) → 단계 간 트랜잭션 분리
+    - 중첩된 get_sync_db()는 별도 세션 (바깥 블록의 트랜잭션에 섞이지 않음)
+    - 다른 스레드(ThreadPoolExecutor, asyncio.to_thread)에서는 기존처럼 새 세션
+    - get_sync_session()은 항상 새 세션 (호출자가 close)
+
+풀 크기:
+    prefork 워커는 프로세스마다 엔진을 가지므로 노드 전체 상한(WORKER_DB_MAX_CONNECTIONS)을
+    WORKER_CONCURRENCY로 나눠 프로세스별 커넥션 수를 정하고, 이를 sync 풀과 async 풀이
+    나눠 갖는다 (async는 1/ASYNC_POOL_SHARE, 최소 1) - 두 풀 합계가 프로세스 몫을 넘지 않도록.
+
+pgbouncer transaction mode (Supabase Transaction Pooler, 6543):
+    - 시작 파라미터(options=-c statement_timeout)는 전달되지 않으므로 트랜잭션마다 SET LOCAL
+    - psycopg2는 서버측 prepared statement를 쓰지 않음, async 엔진은 statement cache 비활성
+
+Async 단계 (프로파일링 등):
+    worker_async_session()은 프로세스 백그라운드 루프(app.worker.async_runtime)에 묶인
+    asyncpg 풀을 사용하고, 다른 루프에서는 풀 없이(NullPool) 연결한다.
 """
 
-from contextlib import contextmanager
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from sqlalchemy import create_engine
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 
-def _prepare_sync_database_url(url: str) -> tuple[str, dict]:
+TRANSACTION_POOLER_PORT = 6543  # Supabase Transaction Pooler
+
+
+def _prepare_sync_database_url(url: str, transaction_pooler: bool = False) -> tuple[str, dict]:
     """
     Prepare DATABASE_URL for psycopg2 driver (sync).
 
@@ -35,26 +69,80 @@ def _prepare_sync_database_url(url: str) -> tuple[str, dict]:
     clean_url = clean_url.replace("postgresql+asyncpg://", "postgresql://")
     clean_url = clean_url.replace("postgres://", "postgresql://")
 
-    # pgbouncer compatibility connect_args
-    connect_args = {
-        "options": "-c statement_timeout=30000"  # 30 second timeout
-    }
+    # transaction pooler는 시작 파라미터를 서버 커넥션에 전달하지 않음 → SET LOCAL (_set_statement_timeout)
+    connect_args = {}
+    if not transaction_pooler:
+        connect_args["options"] = f"-c statement_timeout={settings.WORKER_DB_STATEMENT_TIMEOUT_MS}"
 
     return clean_url, connect_args
 
 
+def is_transaction_pooler(url: str, override: Optional[bool] = None) -> bool:
+    """pgbouncer transaction mode 여부 (설정이 없으면 포트로 판단)"""
+    if override is not None:
+        return override
+    try:
+        return urlparse(url).port == TRANSACTION_POOLER_PORT
+    except ValueError:
+        return False
+
+
+ASYNC_POOL_SHARE = 4  # 프로세스 몫 중 async 풀 비율 (1/4, 최소 1)
+
+
+def _split_process_budget(concurrency: int, max_connections: int) -> tuple[int, int]:
+    """
+    프로세스별 (sync 커넥션 수, async 커넥션 수)
+
+    노드 전체 상한을 프로세스 수로 나눈 뒤 async 풀 몫을 뗀다.
+    프로세스당 최소 3개 (Job 세션 + 단계 내부 스레드 1개 + async 단계 1개)
+    """
+    per_process = max(3, max_connections // max(1, concurrency))
+    async_connections = max(1, per_process // ASYNC_POOL_SHARE)
+    return per_process - async_connections, async_connections
+
+
+def _pool_split(connections: int) -> tuple[int, int]:
+    """커넥션 수 → (pool_size, max_overflow): 절반은 상시 유지, 나머지는 overflow"""
+    pool_size = max(1, connections // 2)
+    return pool_size, max(0, connections - pool_size)
+
+
+def derive_pool_settings(concurrency: int, max_connections: int) -> tuple[int, int]:
+    """프로세스별 sync 풀 (pool_size, max_overflow)"""
+    return _pool_split(_split_process_budget(concurrency, max_connections)[0])
+
+
+def derive_async_pool_settings(concurrency: int, max_connections: int) -> tuple[int, int]:
+    """프로세스별 async 풀 (pool_size, max_overflow)"""
+    return _pool_split(_split_process_budget(concurrency, max_connections)[1])
+
+
 # Prepare database URL
-sync_database_url, _connect_args = _prepare_sync_database_url(settings.DATABASE_URL)
+_transaction_pooler = is_transaction_pooler(settings.DATABASE_URL, settings.WORKER_DB_TRANSACTION_POOLER)
+sync_database_url, _connect_args = _prepare_sync_database_url(settings.DATABASE_URL, _transaction_pooler)
+_pool_size, _max_overflow = derive_pool_settings(
+    settings.WORKER_CONCURRENCY, settings.WORKER_DB_MAX_CONNECTIONS
+)
+_async_pool_size, _async_max_overflow = derive_async_pool_settings(
+    settings.WORKER_CONCURRENCY, settings.WORKER_DB_MAX_CONNECTIONS
+)
 
 # Create synchronous engine
 sync_engine = create_engine(
     sync_database_url,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=_pool_size,
+    max_overflow=_max_overflow,
     pool_pre_ping=True,
     connect_args=_connect_args,
 )
 
+if _transaction_pooler:
+    @event.listens_for(sync_engine, "begin")
+    def _set_statement_timeout(conn: Connection) -> None:
+        # 트랜잭션 범위 설정이라 pooler가 서버 커넥션을 다른 클라이언트에 넘겨도 남지 않음
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(settings.WORKER_DB_STATEMENT_TIMEOUT_MS)}")
+
 # Create session factory
 SyncSessionLocal = sessionmaker(
     bind=sync_engine,
@@ -63,15 +151,108 @@ SyncSessionLocal = sessionmaker(
 )
 
 
+class JobSession:
+    """태스크 실행 동안 유지되는 커넥션 + 세션 (최초 사용 시 체크아웃)"""
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self._engine = engine or sync_engine
+        self.thread_id = threading.get_ident()
+        self.connection: Optional[Connection] = None
+        self._session: Optional[Session] = None
+        self.active = False
+        self.uses = 0
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self.connection = self._engine.connect()
+            self._session = SyncSessionLocal(bind=self.connection)
+        return self._session
+
+    def owned_by_current_thread(self) -> bool:
+        return self.thread_id == threading.get_ident()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+_job_session: ContextVar[Optional[JobSession]] = ContextVar("worker_job_session", default=None)
+
+
+def current_job_session() -> Optional[JobSession]:
+    """현재 스레드에서 사용할 수 있는 Job 세션 (없으면 None)"""
+    job = _job_session.get()
+    if job is not None and job.owned_by_current_thread():
+        return job
+    return None
+
+
+def begin_job_session(engine: Optional[Engine] = None):
+    """Job 세션 시작 (task_prerun). 반환된 token을 end_job_session에 전달"""
+    return _job_session.set(JobSession(engine))
+
+
+def end_job_session(token) -> None:
+    """Job 세션 종료 + 커넥션 반환 (task_postrun)"""
+    job = _job_session.get()
+    _job_session.reset(token)
+    if job is not None:
+        try:
+            job.close()
+        except Exception as e:
+            logger.warning(f"[WorkerDB] Failed to close job session: {e}")
+
+
+@contextmanager
+def job_session(engine: Optional[Engine] = None):
+    """
+    블록 안의 get_sync_db()가 하나의 커넥션을 공유 (이미 Job 세션 안이면 그대로 사용)
+
+    Usage:
+        with job_session():
+            snapshot_pipeline.execute(corp_id)
+            doc_ingest_pipeline.execute(corp_id)
+    """
+    if current_job_session() is not None:
+        yield current_job_session()
+        return
+    token = begin_job_session(engine)
+    try:
+        yield _job_session.get()
+    finally:
+        end_job_session(token)
+
+
 @contextmanager
 def get_sync_db() -> Session:
     """
     Get a synchronous database session for Celery tasks.
 
+    Job 세션 안이면 그 세션을 재사용하고, 블록이 끝날 때 커밋되지 않은 작업을 롤백한다.
+    (get_sync_db 블록 안에서 다시 호출하면 기존처럼 별도 세션 - 바깥 트랜잭션과 분리)
+
     Usage:
         with get_sync_db() as db:
             result = db.execute(query)
     """
+    job = current_job_session()
+    if job is not None and not job.active:
+        db = job.session
+        job.active = True
+        job.uses += 1
+        try:
+            yield db
+        finally:
+            job.active = False
+            if db.in_transaction():
+                db.rollback()
+        return
+
     db = SyncSessionLocal()
     try:
         yield db
@@ -85,3 +266,90 @@ def get_sync_session() -> Session:
     Use get_sync_db() context manager when possible.
     """
     return SyncSessionLocal()
+
+
+def dispose_after_fork() -> None:
+    """prefork 자식 프로세스 시작 시 부모에서 상속한 풀 커넥션 폐기 (worker_process_init)"""
+    sync_engine.dispose(close=False)
+    global _async_engine
+    _async_engine = None
+
+
+def get_pool_stats() -> dict:
+    """워커 프로세스 풀 상태"""
+    pool = sync_engine.pool
+    return {
+        "pool_size": _pool_size,
+        "max_overflow": _max_overflow,
+        "async_pool_size": _async_pool_size,
+        "async_max_overflow": _async_max_overflow,
+        "checked_out": pool.checkedout(),
+        "transaction_pooler": _transaction_pooler,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Async engine (async 단계용)
+# ---------------------------------------------------------------------------
+
+_async_engine = None
+_async_fallback_engine = None
+_async_engine_lock = threading.Lock()
+
+
+def _create_async_engine(**pool_kwargs):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.core.database import _prepare_database_url
+
+    url, connect_args = _prepare_database_url(settings.DATABASE_URL)
+    if not _transaction_pooler:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.WORKER_DB_STATEMENT_TIMEOUT_MS)
+        }
+    engine = create_async_engine(url, connect_args=connect_args, **pool_kwargs)
+    if _transaction_pooler:
+        event.listen(engine.sync_engine, "begin", _set_async_statement_timeout)
+    return engine
+
+
+def _set_async_statement_timeout(conn: Connection) -> None:
+    conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(settings.WORKER_DB_STATEMENT_TIMEOUT_MS)}")
+
+
+def get_worker_async_engine():
+    """
+    현재 루프에서 사용할 async 엔진
+
+    asyncpg 커넥션은 생성한 루프에 묶이므로 풀은 백그라운드 루프에서만 사용하고,
+    다른 루프(asyncio.run 등)에서는 NullPool 엔진으로 연결한다.
+    """
+    global _async_engine, _async_fallback_engine
+    from app.worker.async_runtime import get_background_loop
+
+    on_background_loop = asyncio.get_running_loop() is get_background_loop().loop
+    with _async_engine_lock:
+        if on_background_loop:
+            if _async_engine is None:
+                _async_engine = _create_async_engine(
+                    pool_size=_async_pool_size, max_overflow=_async_max_overflow, pool_pre_ping=True,
+                )
+            return _async_engine
+        if _async_fallback_engine is None:
+            _async_fallback_engine = _create_async_engine(poolclass=NullPool)
+        return _async_fallback_engine
+
+
+@asynccontextmanager
+async def worker_async_session() -> AsyncIterator:
+    """
+    async 단계용 AsyncSession
+
+    Usage:
+        async with worker_async_session() as session:
+            result = await session.execute(query)
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with AsyncSession(get_worker_async_engine(), expire_on_commit=False, autoflush=False) as session:
+        yield session
@@ -0,0 +1,164 @@
+"""
+Analysis Job Admission (Worker)
+
+정기 스캔(scan_all_corporations / scan_high_risk_corporations / DynamicScheduler)의 Job 생성 공통 구현.
+
+기존: 기업마다 진행 중 Job SELECT + INSERT + commit + .delay() (포트폴리오 전체면 수천 회 왕복,
+      루프 동안 커넥션 점유)
+변경:
+- ADMIT_SQL 1회: 대상 기업 배열(unnest)에서 QUEUED/RUNNING Job이 없는 기업만 INSERT ... RETURNING
+- commit 후 broker 연결(producer) 하나로 Job별 태스크 publish
+- publish 실패 시 아직 publish되지 않은 Job만 한 번의 UPDATE로 FAILED(CELERY_DISPATCH_FAILED) 처리
+  (첫 실패 이후는 publish하지 않음 - broker 장애 시 Job마다 재시도 대기하지 않도록,
+   이미 publish된 Job은 워커가 실행하므로 그대로 둠)
+
+동시에 두 스케줄러가 같은 기업을 넣는 경합은 기존과 같다 (NOT EXISTS는 잠금 없이 판정).
+
+Usage:
+    with get_sync_db() as db:
+        admitted = admit_analysis_jobs(db, plan.queued, active_within=timedelta(hours=1))
+    dispatch_analysis_jobs(admitted)
+"""
+
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import text
+
+from app.services.input_fingerprint import ScanDecision
+from app.worker.db import get_sync_db
+
+logger = logging.getLogger(__name__)
+
+# active_since가 NULL이면 시간 제한 없이 진행 중 Job이 있는 기업 제외
+ADMIT_SQL = text("""
+    INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent,
+                          input_fingerprint, queue_reason)
+    SELECT gen_random_uuid(), 'ANALYZE', c.corp_id, 'QUEUED', NOW(), 0, c.input_fingerprint, c.queue_reason
+    FROM unnest(
+        CAST(:corp_ids AS varchar[]),
+        CAST(:fingerprints AS varchar[]),
+        CAST(:reasons AS varchar[])
+    ) AS c(corp_id, input_fingerprint, queue_reason)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM rkyc_job j
+        WHERE j.corp_id = c.corp_id
+          AND j.status IN ('QUEUED', 'RUNNING')
+          AND (CAST(:active_since AS timestamptz) IS NULL OR j.queued_at > CAST(:active_since AS timestamptz))
+    )
+    RETURNING job_id, corp_id, queue_reason
+""")
+
+DISPATCH_FAILED_SQL = text("""
+    UPDATE rkyc_job
+    SET status = 'FAILED',
+        error_code = 'CELERY_DISPATCH_FAILED',
+        error_message = :error_message,
+        finished_at = NOW()
+    WHERE job_id = ANY(CAST(:job_ids AS uuid[]))
+      AND status = 'QUEUED'
+""")
+
+
+@dataclass
+class AdmittedJob:
+    """생성된 분석 Job"""
+
+    job_id: str
+    corp_id: str
+    queue_reason: Optional[str] = None
+
+
+def admit_analysis_jobs(
+    db,
+    decisions: Iterable[ScanDecision],
+    active_within: Optional[timedelta] = None,
+) -> list[AdmittedJob]:
+    """
+    진행 중 Job이 없는 기업에 대해서만 Job 생성 (INSERT 1회 + commit)
+
+    Args:
+        decisions: 생성 대상 (plan_scan(...).queued)
+        active_within: 이 시간 이내에 대기열에 들어간 QUEUED/RUNNING Job만 진행 중으로 간주
+                       (None이면 시간 제한 없음)
+    """
+    decisions = [d for d in decisions if d.reason is not None]
+    if not decisions:
+        return []
+
+    active_since = datetime.now(UTC) - active_within if active_within is not None else None
+    rows = db.execute(ADMIT_SQL, {
+        "corp_ids": [d.corp_id for d in decisions],
+        "fingerprints": [d.fingerprint for d in decisions],
+        "reasons": [d.reason.value for d in decisions],
+        "active_since": active_since,
+    }).fetchall()
+    db.commit()
+
+    admitted = [AdmittedJob(str(row.job_id), row.corp_id, row.queue_reason) for row in rows]
+    logger.info(f"[JobAdmission] Admitted {len(admitted)}/{len(decisions)} corps ({len(decisions) - len(admitted)} in flight)")
+    return admitted
+
+
+@contextlib.contextmanager
+def _task_publisher(queue: Optional[str] = None):
+    """run_analysis_pipeline 태스크를 Job별로 publish하는 함수 (broker 연결 1개 재사용)"""
+    from app.worker.celery_app import celery_app
+    from app.worker.tasks.analysis import run_analysis_pipeline
+
+    options = {"queue": queue} if queue else {}
+    with celery_app.producer_or_acquire() as producer:
+        yield lambda job: run_analysis_pipeline.apply_async((job.job_id, job.corp_id), producer=producer, **options)
+
+
+def dispatch_analysis_jobs(
+    admitted: list[AdmittedJob],
+    publish: Optional[Callable[..., None]] = None,
+    db_factory: Optional[Callable] = None,
+    queue: Optional[str] = None,
+) -> int:
+    """
+    생성된 Job의 분석 태스크 publish (queue 미지정 시 task_default_queue)
+
+    Args:
+        publish: Job 1건 publish 함수 publish(job, queue=...) (기본: run_analysis_pipeline.apply_async)
+
+    Returns:
+        int: publish된 Job 수 (실패 이후의 Job은 FAILED로 기록)
+    """
+    if not admitted:
+        return 0
+
+    published: list[AdmittedJob] = []
+    try:
+        publisher = (
+            contextlib.nullcontext(lambda job: publish(job, queue=queue)) if publish else _task_publisher(queue)
+        )
+        with publisher as send:
+            for job in admitted:
+                send(job)
+                published.append(job)
+    except Exception as e:
+        published_ids = {job.job_id for job in published}
+        failed = [job for job in admitted if job.job_id not in published_ids]
+        if not failed:
+            # 모두 publish된 뒤 연결 반환 중 실패 - 워커가 실행하므로 Job은 그대로
+            logger.warning(f"[JobAdmission] Producer release failed after dispatching {len(published)} jobs: {e}")
+            return len(published)
+        logger.error(
+            f"[JobAdmission] Task dispatch failed for {len(failed)}/{len(admitted)} jobs "
+            f"({len(published)} already published): {e}"
+        )
+        try:
+            with (db_factory or get_sync_db)() as db:
+                db.execute(DISPATCH_FAILED_SQL, {
+                    "job_ids": [job.job_id for job in failed],
+                    "error_message": f"Worker 연결 실패: {str(e)[:200]}",
+                })
+                db.commit()
+        except Exception as update_error:
+            logger.error(f"[JobAdmission] Failed to mark undispatched jobs: {update_error}")
+    return len(published)
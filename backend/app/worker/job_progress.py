@@ -0,0 +1,170 @@
+"""
+Job Progress Reporter (Worker)
+
+update_job_progress / update_new_kyc_job_progress 공통 구현.
+
+기존: 단계마다 세션 생성 + started_at SELECT + UPDATE + commit (작업당 10회 이상 DB 왕복)
+변경:
+- 진행 이벤트는 매번 Redis로 publish (app.services.job_events → SSE)
+- DB 기록은 상태 변경 / 종료 / 오류 / publish 실패 / CHECKPOINT_SECONDS 경과 시에만
+- 기록은 UPDATE 1회 (started_at은 COALESCE, corp_id는 RETURNING으로 받아 기업 채널에 사용)
+
+DB의 progress_step/percent는 최대 CHECKPOINT_SECONDS만큼 늦을 수 있지만,
+상태(QUEUED/RUNNING/DONE/FAILED)와 오류는 항상 즉시 기록되고
+GET 조회/SSE 초기 상태는 Redis 마지막 이벤트로 보정한다.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import func, update
+
+from app.models.job import Job, JobStatus
+from app.services.job_events import (
+    JobEventPublisher,
+    JobEventsConfig,
+    TERMINAL_STATUSES,
+    get_job_event_publisher,
+    make_event,
+)
+from app.worker.db import get_sync_db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _JobState:
+    status: str
+    corp_id: Optional[str]
+    written_at: float
+
+
+class JobProgressReporter:
+    """진행 이벤트 publish + DB checkpoint (Worker 프로세스당 하나)"""
+
+    def __init__(
+        self,
+        config: Optional[JobEventsConfig] = None,
+        publisher: Optional[JobEventPublisher] = None,
+        db_factory: Any = None,
+    ):
+        self.config = config or JobEventsConfig()
+        self._publisher = publisher
+        self._db_factory = db_factory or get_sync_db
+        self._jobs: dict[str, _JobState] = {}
+        self._stats = {"reports": 0, "db_writes": 0, "coalesced": 0}
+
+    @property
+    def publisher(self) -> JobEventPublisher:
+        if self._publisher is None:
+            self._publisher = get_job_event_publisher()
+        return self._publisher
+
+    def report(
+        self,
+        job_id: str,
+        status: JobStatus,
+        step: Any = None,
+        percent: int = 0,
+        error_code: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """진행 상황 보고 (step: ProgressStep 또는 문자열)"""
+        self._stats["reports"] += 1
+        status_value = getattr(status, "value", status)
+        step_value = getattr(step, "value", step)
+        terminal = status_value in TERMINAL_STATUSES
+        state = self._jobs.get(job_id)
+        now = time.monotonic()
+
+        must_write = (
+            state is None
+            or state.status != status_value
+            or terminal
+            or bool(error_code or error_message)
+            or now - state.written_at >= self.config.CHECKPOINT_SECONDS
+        )
+        corp_id = state.corp_id if state else None
+        if must_write:
+            corp_id = self._write(job_id, status_value, step_value, percent, error_code, error_message)
+
+        # DB 기록 후 publish - 종료 이벤트를 받은 클라이언트가 결과를 조회하면 DB에 반영되어 있음
+        published = self.publisher.publish(make_event(
+            job_id, status_value, step=step_value, percent=percent, corp_id=corp_id,
+            error_code=error_code, error_message=error_message,
+        ))
+        if not published and not must_write:
+            # 구독자/GET 보정이 불가능 → 기존처럼 매 단계 DB 기록
+            corp_id = self._write(job_id, status_value, step_value, percent, error_code, error_message)
+            must_write = True
+
+        if terminal:
+            self._jobs.pop(job_id, None)
+        elif must_write:
+            self._jobs[job_id] = _JobState(status_value, corp_id, now)
+        else:
+            self._stats["coalesced"] += 1
+
+        logger.info(f"Job {job_id} progress: status={status_value}, step={step_value}, percent={percent}")
+
+    def _write(
+        self,
+        job_id: str,
+        status: str,
+        step: Any,
+        percent: int,
+        error_code: Optional[str],
+        error_message: Optional[str],
+    ) -> Optional[str]:
+        """UPDATE 1회, corp_id 반환"""
+        update_data: dict[str, Any] = {"status": status, "progress_percent": percent}
+        if step:
+            update_data["progress_step"] = step
+        if status == JobStatus.RUNNING.value:
+            update_data["started_at"] = func.coalesce(Job.started_at, datetime.now(UTC))
+        if status in TERMINAL_STATUSES:
+            update_data["finished_at"] = datetime.now(UTC)
+        if error_code:
+            update_data["error_code"] = error_code
+        if error_message:
+            update_data["error_message"] = error_message
+
+        with self._db_factory() as db:
+            corp_id = db.execute(
+                update(Job)
+                .where(Job.job_id == UUID(job_id))
+                .values(**update_data)
+                .returning(Job.corp_id)
+            ).scalar_one_or_none()
+            db.commit()
+        self._stats["db_writes"] += 1
+        return corp_id
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "active_jobs": len(self._jobs),
+            "checkpoint_seconds": self.config.CHECKPOINT_SECONDS,
+        }
+
+
+# Singleton instance
+_job_progress_reporter: Optional[JobProgressReporter] = None
+
+
+def get_job_progress_reporter() -> JobProgressReporter:
+    """Get singleton JobProgressReporter instance"""
+    global _job_progress_reporter
+    if _job_progress_reporter is None:
+        _job_progress_reporter = JobProgressReporter()
+    return _job_progress_reporter
+
+
+def reset_job_progress_reporter() -> None:
+    """Reset singleton (for testing)"""
+    global _job_progress_reporter
+    _job_progress_reporter = None
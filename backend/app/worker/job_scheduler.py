@@ -0,0 +1,444 @@
+"""
+Analysis Job Scheduler (우선순위 + SLA + 큐 깊이 backpressure)
+
+기존: scan_all_corporations(6시간) / scan_high_risk_corporations(1시간)가 대상 기업 Job을 한 번에
+default 큐에 넣음 → 전체 스캔 직후 사용자가 요청한 /jobs/analyze/run이 수백 건 뒤에서 대기.
+
+변경:
+- 사용자 요청 Job은 INTERACTIVE_QUEUE(high), 정기 분석은 BACKGROUND_QUEUE(low)
+  Celery broker는 queue_order_strategy=priority → 워커는 high → default → low 순으로 가져감
+- 정기 분석은 schedule_analysis_jobs tick(5분)이 admission window만큼만 생성/publish
+  window = 워커 슬롯 × (1 + BACKLOG_PER_SLOT) - 실행 중 Job - 백그라운드 큐 대기
+  high 큐에 대기 중인 메시지가 있으면 0 (사용자 요청 절대 우선)
+  → 사용자 요청 앞에 놓이는 정기 분석은 최대 슬롯 × BACKLOG_PER_SLOT 건
+- window 안에서는 위험 점수 순 (risk_score):
+  HIGH/MED RISK 시그널(7일), 연체, 내부등급, 마지막 분석 후 경과 시간(SLA 대비)
+- 대상은 입력 변경 게이트(app.services.input_fingerprint)를 통과한 기업만,
+  고위험 기업은 HIGH_RISK_FRESHNESS_HOURS, 나머지는 FRESHNESS_HOURS SLA
+
+큐 깊이: broker Redis LLEN (우선순위 suffix 키 포함, 실패 시 DB의 QUEUED Job 수)
+워커 슬롯: celery inspect stats의 pool max-concurrency 합 (WORKER_STATS_TTL_SECONDS 캐시, 실패 시 설정값)
+
+Usage:
+    get_job_scheduler().run()                                   # Celery Beat tick
+    await asyncio.to_thread(get_job_scheduler().preview)        # GET /scheduler/plan (dry-run)
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import text
+
+from app.models.job import QueueReason
+from app.services.input_fingerprint import InputFingerprintConfig, ScanDecision, plan_scan
+from app.worker.db import get_sync_db
+from app.worker.job_admission import AdmittedJob, admit_analysis_jobs, dispatch_analysis_jobs
+from app.worker.pipelines.signal_agents.rule_based_generator import KOREAN_GRADE_MAP, RISK_GRADE_RANK
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE_QUEUE = "high"
+BACKGROUND_QUEUE = "low"
+BROKER_QUEUES = ("high", "default", "low")
+PRIORITY_STEPS = (3, 6, 9)  # kombu Redis 우선순위 키 suffix (0은 queue 이름 그대로)
+PRIORITY_SEP = "\x06\x16"
+
+ELEVATED_GRADE_RANK = RISK_GRADE_RANK["BB"]  # BB 이하 = 고위험 SLA
+# Snapshot의 위험 수준 표기 (LOW/MED/HIGH) → 등급
+RISK_LEVEL_GRADE_MAP = {"LOW": "A", "MED": "BBB", "HIGH": "BB"}
+
+# 기업별 위험 요소 + 마지막 완료 분석 ({where}: 대상 기업 제한)
+RISK_SQL = """
+    SELECT
+        c.corp_id,
+        COALESCE(sig.high_signals, 0) AS high_signals,
+        COALESCE(sig.med_signals, 0) AS med_signals,
+        COALESCE(bd.loan_exposure->'risk_indicators'->>'overdue_flag', '') = 'true'
+            OR COALESCE(snap.snapshot_json->'credit'->'loan_summary'->>'overdue_flag', '') = 'true' AS overdue,
+        snap.snapshot_json->'corp'->'kyc_status'->>'internal_risk_grade' AS internal_grade,
+        lj.finished_at AS last_finished_at
+    FROM corp c
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) FILTER (WHERE si.impact_strength = 'HIGH') AS high_signals,
+               COUNT(*) FILTER (WHERE si.impact_strength = 'MED') AS med_signals
+        FROM rkyc_signal_index si
+        WHERE si.corp_id = c.corp_id
+          AND si.impact_direction = 'RISK'
+          AND si.detected_at > NOW() - INTERVAL '7 days'
+    ) sig ON TRUE
+    LEFT JOIN rkyc_banking_data_latest bd ON bd.corp_id = c.corp_id
+    LEFT JOIN rkyc_internal_snapshot_latest isl ON isl.corp_id = c.corp_id
+    LEFT JOIN rkyc_internal_snapshot snap ON snap.snapshot_id = isl.snapshot_id
+    LEFT JOIN LATERAL (
+        SELECT j.finished_at
+        FROM rkyc_job j
+        WHERE j.corp_id = c.corp_id
+          AND j.job_type = 'ANALYZE'
+          AND j.status = 'DONE'
+        ORDER BY j.finished_at DESC NULLS LAST
+        LIMIT 1
+    ) lj ON TRUE
+    {where}
+"""
+
+# 실행 중 / 대기 Job
+# task_time_limit을 넘긴 RUNNING 행은 유실된 Job으로 보고 제외 - QUEUED는 오래 기다린 만큼 backlog이므로 모두 포함
+LOAD_SQL = text("""
+    SELECT
+        COUNT(*) FILTER (WHERE status = 'RUNNING') AS running,
+        COUNT(*) FILTER (WHERE status = 'QUEUED' AND queue_reason = 'MANUAL') AS queued_interactive,
+        COUNT(*) FILTER (WHERE status = 'QUEUED' AND COALESCE(queue_reason, '') <> 'MANUAL') AS queued_background
+    FROM rkyc_job
+    WHERE status = 'QUEUED'
+       OR (status = 'RUNNING'
+           AND COALESCE(started_at, queued_at) > NOW() - make_interval(secs => :stale_seconds))
+""")
+
+
+@dataclass
+class JobSchedulerConfig:
+    """Job scheduler configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    WORKER_SLOTS: int = 2  # inspect 실패 시 사용 (Procfile --concurrency=2, 워커 1대)
+    BACKLOG_PER_SLOT: int = 1  # 슬롯당 미리 큐에 넣어두는 정기 분석 수 (워커 유휴 방지)
+    MAX_ADMIT_PER_TICK: int = 50
+    WORKER_STATS_TTL_SECONDS: int = 60
+    RUNNING_STALE_SECONDS: int = 900  # task_time_limit(600s) + 여유
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.JOB_SCHEDULER_ENABLED
+            self.WORKER_SLOTS = settings.JOB_SCHEDULER_WORKER_SLOTS
+            self.BACKLOG_PER_SLOT = settings.JOB_SCHEDULER_BACKLOG_PER_SLOT
+            self.MAX_ADMIT_PER_TICK = settings.JOB_SCHEDULER_MAX_ADMIT_PER_TICK
+        except Exception as e:
+            logger.warning(f"Failed to load job scheduler config from settings: {e}, using defaults")
+
+
+def grade_rank(grade: Optional[str]) -> int:
+    """내부등급 순위 (한글/위험 수준 표기 변환, 모르는 등급은 5, 없으면 -1)"""
+    if not grade:
+        return -1
+    grade = RISK_LEVEL_GRADE_MAP.get(grade, KOREAN_GRADE_MAP.get(grade, grade))
+    return RISK_GRADE_RANK.get(grade, 5)
+
+
+def is_high_risk(row: Any) -> bool:
+    """고위험 SLA 대상 (HIGH RISK 시그널 / 연체 / BB 이하 등급)"""
+    return bool(row.high_signals) or bool(row.overdue) or grade_rank(row.internal_grade) >= ELEVATED_GRADE_RANK
+
+
+def risk_score(row: Any, freshness_hours: float, now: Optional[datetime] = None) -> float:
+    """
+    정기 분석 우선순위 점수 (높을수록 먼저, 0~150)
+
+    - HIGH RISK 시그널(7일) 건당 15 (최대 45), MED 건당 5 (최대 15)
+    - 연체 25
+    - 내부등급 BBB 아래 한 단계당 5 (최대 30)
+    - 마지막 분석 후 경과 시간 / SLA × 35 (최대 35, 분석 이력 없으면 35)
+    """
+    score = min(45, 15 * (row.high_signals or 0)) + min(15, 5 * (row.med_signals or 0))
+    if row.overdue:
+        score += 25
+    score += min(30, max(0, grade_rank(row.internal_grade) - RISK_GRADE_RANK["BBB"]) * 5)
+
+    if row.last_finished_at is None:
+        score += 35
+    else:
+        now = now or datetime.now(UTC)
+        finished_at = row.last_finished_at
+        if finished_at.tzinfo is None:
+            finished_at = finished_at.replace(tzinfo=UTC)
+        age_hours = (now - finished_at).total_seconds() / 3600
+        score += 35 * min(1.0, max(0.0, age_hours / max(freshness_hours, 1)))
+    return round(score, 2)
+
+
+def admission_window(
+    slots: int,
+    running: int,
+    depths: dict[str, int],
+    config: JobSchedulerConfig,
+) -> int:
+    """이번 tick에 생성할 수 있는 정기 분석 Job 수 (비활성 시 backpressure 없이 MAX_ADMIT_PER_TICK)"""
+    if not config.ENABLED:
+        return config.MAX_ADMIT_PER_TICK
+    if depths.get(INTERACTIVE_QUEUE, 0) > 0:
+        return 0
+    background = sum(depth for queue, depth in depths.items() if queue != INTERACTIVE_QUEUE)
+    capacity = slots * (1 + config.BACKLOG_PER_SLOT)
+    return max(0, min(config.MAX_ADMIT_PER_TICK, capacity - running - background))
+
+
+class QueueProbe:
+    """broker 큐 깊이 + 워커 슬롯 조회"""
+
+    def __init__(self, config: Optional[JobSchedulerConfig] = None, redis_client: Any = None, celery: Any = None):
+        self.config = config or JobSchedulerConfig()
+        self._redis = redis_client
+        self._celery = celery
+        self._slots: Optional[int] = None
+        self._slots_at = 0.0
+
+    def _get_redis(self):
+        if self._redis is None:
+            import redis
+            from app.core.config import settings
+
+            self._redis = redis.from_url(
+                settings.CELERY_BROKER_URL,
+                socket_connect_timeout=1.0,
+                socket_timeout=2.0,
+            )
+        return self._redis
+
+    def depths(self) -> Optional[dict[str, int]]:
+        """큐별 대기 메시지 수 (Redis 실패 시 None)"""
+        try:
+            client = self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            for queue in BROKER_QUEUES:
+                pipe.llen(queue)
+                for step in PRIORITY_STEPS:
+                    pipe.llen(f"{queue}{PRIORITY_SEP}{step}")
+            lengths = pipe.execute()
+        except Exception as e:
+            logger.warning(f"[JobScheduler] Broker queue depth unavailable, using DB counts: {e}")
+            return None
+
+        per_queue = 1 + len(PRIORITY_STEPS)
+        return {
+            queue: sum(lengths[i * per_queue:(i + 1) * per_queue])
+            for i, queue in enumerate(BROKER_QUEUES)
+        }
+
+    def worker_slots(self) -> int:
+        """실행 중인 워커의 pool 슬롯 합 (캐시, 실패 시 WORKER_SLOTS)"""
+        now = time.monotonic()
+        if self._slots is not None and now - self._slots_at < self.config.WORKER_STATS_TTL_SECONDS:
+            return self._slots
+
+        slots = None
+        try:
+            celery = self._celery
+            if celery is None:
+                from app.worker.celery_app import celery_app as celery
+            stats = celery.control.inspect(timeout=1.0).stats() or {}
+            slots = sum(int(s.get("pool", {}).get("max-concurrency") or 0) for s in stats.values()) or None
+        except Exception as e:
+            logger.warning(f"[JobScheduler] Worker stats unavailable: {e}")
+
+        self._slots = slots or self.config.WORKER_SLOTS
+        self._slots_at = now
+        return self._slots
+
+
+@dataclass
+class ScheduledCandidate:
+    """정기 분석 후보"""
+
+    corp_id: str
+    score: float
+    reason: QueueReason
+    high_risk: bool
+    fingerprint: Optional[str] = None
+
+    def decision(self) -> ScanDecision:
+        return ScanDecision(self.corp_id, self.reason, self.fingerprint)
+
+
+@dataclass
+class SchedulePlan:
+    """tick 판단 결과 (window 안의 후보가 이번에 생성 대상)"""
+
+    generated_at: datetime
+    slots: int
+    running: int
+    depths: dict[str, int]
+    depth_source: str
+    window: int
+    candidates: list[ScheduledCandidate] = field(default_factory=list)
+    skipped_unchanged: int = 0
+    admitted: list[AdmittedJob] = field(default_factory=list)
+
+    @property
+    def selected(self) -> list[ScheduledCandidate]:
+        return self.candidates[:self.window]
+
+    def to_dict(self, limit: int = 20) -> dict:
+        return {
+            "generated_at": self.generated_at.isoformat(),
+            "worker_slots": self.slots,
+            "running": self.running,
+            "queue_depths": self.depths,
+            "queue_depth_source": self.depth_source,
+            "admission_window": self.window,
+            "interactive_waiting": self.depths.get(INTERACTIVE_QUEUE, 0),
+            "candidates": len(self.candidates),
+            "deferred": max(0, len(self.candidates) - self.window),
+            "skipped_unchanged": self.skipped_unchanged,
+            "admitted": len(self.admitted),
+            "top_candidates": [
+                {
+                    "corp_id": c.corp_id,
+                    "score": c.score,
+                    "reason": c.reason.value,
+                    "high_risk": c.high_risk,
+                    "selected": i < self.window,
+                }
+                for i, c in enumerate(self.candidates[:limit])
+            ],
+        }
+
+
+class JobScheduler:
+    """정기 분석 admission (프로세스당 하나)"""
+
+    def __init__(
+        self,
+        config: Optional[JobSchedulerConfig] = None,
+        probe: Optional[QueueProbe] = None,
+        gate_config: Optional[InputFingerprintConfig] = None,
+        db_factory: Optional[Callable] = None,
+        publish: Optional[Callable[..., None]] = None,
+    ):
+        self.config = config or JobSchedulerConfig()
+        self.probe = probe or QueueProbe(self.config)
+        self.gate_config = gate_config or InputFingerprintConfig()
+        self._db_factory = db_factory or get_sync_db
+        self._publish = publish
+        self._stats = {"ticks": 0, "admitted": 0, "deferred": 0, "blocked_by_interactive": 0}
+
+    def capacity(self, session, now: Optional[datetime] = None) -> SchedulePlan:
+        """현재 부하와 admission window (후보 없음 - 규칙 평가 등 다른 경로의 Job 생성 한도)"""
+        load = session.execute(LOAD_SQL, {"stale_seconds": self.config.RUNNING_STALE_SECONDS}).fetchone()
+        depths = self.probe.depths()
+        depth_source = "broker"
+        if depths is None:
+            depth_source = "database"
+            depths = {INTERACTIVE_QUEUE: load.queued_interactive, BACKGROUND_QUEUE: load.queued_background}
+        slots = self.probe.worker_slots()
+
+        return SchedulePlan(
+            generated_at=now or datetime.now(UTC),
+            slots=slots,
+            running=load.running,
+            depths=depths,
+            depth_source=depth_source,
+            window=admission_window(slots, load.running, depths, self.config),
+        )
+
+    def dispatch(self, admitted: list[AdmittedJob]) -> int:
+        """생성된 정기/규칙 분석 Job을 BACKGROUND_QUEUE로 publish"""
+        return dispatch_analysis_jobs(admitted, publish=self._publish, queue=BACKGROUND_QUEUE)
+
+    def plan(
+        self,
+        session,
+        corp_ids: Optional[Iterable[str]] = None,
+        now: Optional[datetime] = None,
+        rank_when_full: bool = False,
+    ) -> SchedulePlan:
+        """
+        admission window + 후보 점수 계산 (Job 생성 없음)
+
+        window가 0이면 후보를 만들 수 없으므로 위험/fingerprint 조회 없이 반환한다
+        (rank_when_full=True면 미리보기용으로 후보 점수까지 계산).
+        """
+        now = now or datetime.now(UTC)
+        plan = self.capacity(session, now)
+        if plan.window <= 0 and not rank_when_full:
+            return plan
+
+        params: dict[str, Any] = {}
+        where = ""
+        if corp_ids is not None:
+            where = "WHERE c.corp_id = ANY(:corp_ids)"
+            params["corp_ids"] = list(corp_ids)
+        rows = session.execute(text(RISK_SQL.format(where=where)), params).fetchall()
+
+        risk = {row.corp_id: row for row in rows}
+        freshness = {
+            corp_id: self.gate_config.HIGH_RISK_FRESHNESS_HOURS if is_high_risk(row) else self.gate_config.FRESHNESS_HOURS
+            for corp_id, row in risk.items()
+        }
+        gate = plan_scan(
+            session,
+            list(risk),
+            freshness_hours=self.gate_config.FRESHNESS_HOURS,
+            config=self.gate_config,
+            now=now,
+            freshness_by_corp=freshness,
+        )
+
+        plan.candidates = [
+            ScheduledCandidate(
+                corp_id=d.corp_id,
+                score=risk_score(risk[d.corp_id], freshness[d.corp_id], now),
+                reason=d.reason,
+                high_risk=is_high_risk(risk[d.corp_id]),
+                fingerprint=d.fingerprint,
+            )
+            for d in gate.queued
+            if d.corp_id in risk
+        ]
+        plan.candidates.sort(key=lambda c: (-c.score, c.corp_id))
+        plan.skipped_unchanged = gate.skipped
+        return plan
+
+    def preview(self, corp_ids: Optional[Iterable[str]] = None) -> SchedulePlan:
+        """현재 plan (Job 생성 없음, GET /scheduler/plan)"""
+        with self._db_factory() as db:
+            return self.plan(db, corp_ids, rank_when_full=True)
+
+    def run(self, corp_ids: Optional[Iterable[str]] = None) -> SchedulePlan:
+        """window 안의 상위 후보만 Job 생성 + BACKGROUND_QUEUE로 publish"""
+        with self._db_factory() as db:
+            plan = self.plan(db, corp_ids)
+            if plan.selected:
+                plan.admitted = admit_analysis_jobs(db, [c.decision() for c in plan.selected])
+
+        self.dispatch(plan.admitted)
+
+        self._stats["ticks"] += 1
+        self._stats["admitted"] += len(plan.admitted)
+        self._stats["deferred"] += max(0, len(plan.candidates) - plan.window)
+        if plan.window == 0 and plan.depths.get(INTERACTIVE_QUEUE, 0) > 0:
+            self._stats["blocked_by_interactive"] += 1
+        logger.info(
+            f"[JobScheduler] window={plan.window} (slots={plan.slots}, running={plan.running}, "
+            f"depths={plan.depths}), admitted {len(plan.admitted)}/{len(plan.candidates)} candidates, "
+            f"{plan.skipped_unchanged} unchanged"
+        )
+        return plan
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "enabled": self.config.ENABLED,
+            "backlog_per_slot": self.config.BACKLOG_PER_SLOT,
+            "max_admit_per_tick": self.config.MAX_ADMIT_PER_TICK,
+        }
+
+
+# Singleton instance
+_job_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get singleton JobScheduler instance"""
+    global _job_scheduler
+    if _job_scheduler is None:
+        _job_scheduler = JobScheduler()
+    return _job_scheduler
+
+
+def reset_job_scheduler() -> None:
+    """Reset singleton (for testing)"""
+    global _job_scheduler
+    _job_scheduler = None
@@ -30,6 +30,20 @@ from app.worker.llm.cache import (
     get_llm_cache,
     reset_llm_cache,
 )
+from app.worker.llm.search_cache import (
+    SharedSearchCache,
+    SearchScope,
+    SearchCacheConfig,
+    get_search_cache,
+    reset_search_cache,
+)
+from app.worker.llm.industry_knowledge import (
+    IndustryKnowledge,
+    IndustryKnowledgeStore,
+    IndustryKnowledgeConfig,
+    get_industry_knowledge_store,
+    reset_industry_knowledge_store,
+)
 from app.worker.llm.model_router import (
     ModelRouter,
     TaskComplexity,
@@ -261,6 +275,13 @@ from app.worker.llm.fact_checker import (
     get_fact_checker,
     reset_fact_checker,
 )
+from app.worker.llm.fact_check_cache import (
+    FactCheckCache,
+    FactCheckCacheConfig,
+    normalize_claim,
+    get_fact_check_cache,
+    reset_fact_check_cache,
+)
 
 # v2.0 - 4-Layer Analysis Architecture
 from app.worker.llm.layer_architecture import (
@@ -388,6 +409,18 @@ __all__ = [
     "MemoryLRUCache",
     "get_llm_cache",
     "reset_llm_cache",
+    # Shared Search Result Cache (INDUSTRY / ENVIRONMENT)
+    "SharedSearchCache",
+    "SearchScope",
+    "SearchCacheConfig",
+    "get_search_cache",
+    "reset_search_cache",
+    # Industry Knowledge Store (업종명/키워드/힌트)
+    "IndustryKnowledge",
+    "IndustryKnowledgeStore",
+    "IndustryKnowledgeConfig",
+    "get_industry_knowledge_store",
+    "reset_industry_knowledge_store",
     # v1.2 - Task-Aware Model Router
     "ModelRouter",
     "TaskComplexity",
@@ -610,6 +643,11 @@ __all__ = [
     "FactCheckResponse",
     "get_fact_checker",
     "reset_fact_checker",
+    "FactCheckCache",
+    "FactCheckCacheConfig",
+    "normalize_claim",
+    "get_fact_check_cache",
+    "reset_fact_check_cache",
     # Sprint 1 - Enhanced Prompts (Anti-Hallucination)
     "ForbiddenCategory",
     "CERTAINTY_PATTERNS",
@@ -0,0 +1,266 @@
+"""
+Fact-Check Result Cache for rKYC
+
+같은 뉴스 이벤트가 재스캔/영향받는 기업마다 반복 팩트체크되는 것을 방지
+
+Cache Key:
+    rkyc:factcheck:v{version}:{sha256(scope | normalized title | normalized summary)}
+
+    - DIRECT/PROFILE 주장: scope = 정규화된 기업명 (기업 일치 여부가 판정에 포함)
+    - INDUSTRY/ENVIRONMENT 주장: scope = "*" (기업 비특정 → 기업 간 공유)
+
+TTL by verdict:
+    - VERIFIED / FALSE: 길게 (확정 판정은 잘 바뀌지 않음)
+    - PARTIALLY_VERIFIED: 중간
+    - UNVERIFIED: 짧게 (검색 인덱스가 따라잡으면 판정이 바뀔 수 있음)
+    - ERROR: 캐시하지 않음
+
+2-Layer: Memory LRU (per-process) + Redis (shared, sync client)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트/판정 기준이 바뀌면 올려서 기존 캐시를 무효화
+FACT_CHECK_CACHE_VERSION = 1
+
+# 기업 비특정 주장 (기업 간 판정 공유)
+CORP_AGNOSTIC_SIGNAL_TYPES = {"INDUSTRY", "ENVIRONMENT"}
+
+_QUOTES_PATTERN = re.compile(r"[\"'“”‘’`«»\[\]\(\)<>「」『』]")
+_THOUSANDS_PATTERN = re.compile(r"(?<=\d),(?=\d{3}(?!\d))")
+# 숫자 사이(소수점 등)가 아닌 구두점
+_PUNCT_PATTERN = re.compile(r"(?<!\d)[.,!?…·~:;]|[.,!?…·~:;](?!\d)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_claim(text: Optional[str]) -> str:
+    """
+    주장 텍스트 정규화 (캐시 키용)
+
+    - NFKC (전각/반각 통일), 소문자
+    - 따옴표/괄호 제거, 천 단위 구분 쉼표 제거 (1,200억 → 1200억)
+    - 숫자 사이가 아닌 구두점 제거, 공백 정리
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _QUOTES_PATTERN.sub("", text)
+    text = _THOUSANDS_PATTERN.sub("", text)
+    text = _PUNCT_PATTERN.sub(" ", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+@dataclass
+class FactCheckCacheConfig:
+    """Fact-check cache configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    TTL_DECISIVE: int = 7 * 24 * 3600     # VERIFIED / FALSE
+    TTL_PARTIAL: int = 24 * 3600          # PARTIALLY_VERIFIED
+    TTL_UNVERIFIED: int = 3600            # UNVERIFIED
+    MEMORY_CACHE_SIZE: int = 1000
+    # 프로세스 memory tier 유지 시간 상한 - clear()는 호출한 프로세스의 memory와 Redis만 비우므로
+    # 다른 프로세스(워커)의 memory 복사본은 이 시간 안에 Redis에서 다시 읽음
+    MEMORY_TTL_SECONDS: int = 300
+    REDIS_KEY_PREFIX: str = "rkyc:factcheck"
+    REDIS_CACHE_DB: int = 2
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.FACT_CHECK_CACHE_ENABLED
+            self.TTL_DECISIVE = settings.FACT_CHECK_CACHE_TTL_DECISIVE
+            self.TTL_PARTIAL = settings.FACT_CHECK_CACHE_TTL_PARTIAL
+            self.TTL_UNVERIFIED = settings.FACT_CHECK_CACHE_TTL_UNVERIFIED
+            self.REDIS_CACHE_DB = settings.LLM_CACHE_REDIS_DB
+        except Exception as e:
+            logger.warning(f"Failed to load fact-check cache config from settings: {e}, using defaults")
+
+    def get_ttl(self, result: str) -> int:
+        """판정별 TTL (0이면 캐시하지 않음)"""
+        return {
+            "verified": self.TTL_DECISIVE,
+            "false": self.TTL_DECISIVE,
+            "partial": self.TTL_PARTIAL,
+            "unverified": self.TTL_UNVERIFIED,
+        }.get(result, 0)
+
+
+class FactCheckCache:
+    """Content-hash keyed cache of FactCheckResponse dicts"""
+
+    def __init__(self, config: Optional[FactCheckCacheConfig] = None, redis_client: Any = None):
+        self.config = config or FactCheckCacheConfig()
+        self._redis = redis_client
+        self._redis_checked = redis_client is not None
+
+        self._memory: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "sets": 0}
+
+    def _get_redis(self):
+        """Lazy Redis client; None이면 memory-only"""
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                import redis
+                from app.core.config import settings
+
+                base_url = settings.REDIS_URL.rstrip("/0123456789")
+                client = redis.from_url(
+                    f"{base_url}/{self.config.REDIS_CACHE_DB}",
+                    decode_responses=True,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"[FactCheckCache] Redis unavailable, using memory only: {e}")
+                self._redis = None
+        return self._redis
+
+    def make_key(self, signal: dict, corp_name: str) -> str:
+        """주장 내용 기반 캐시 키"""
+        signal_type = (signal.get("signal_type") or "").upper()
+        scope = "*" if signal_type in CORP_AGNOSTIC_SIGNAL_TYPES else normalize_claim(corp_name)
+        content = "|".join([
+            scope,
+            normalize_claim(signal.get("title")),
+            normalize_claim(signal.get("summary")),
+        ])
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        return f"{self.config.REDIS_KEY_PREFIX}:v{FACT_CHECK_CACHE_VERSION}:{digest}"
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        """Memory → Redis(MGET) 순서로 조회. Returns {key: response_dict} for hits."""
+        if not self.config.ENABLED or not keys:
+            return {}
+
+        found: dict[str, dict] = {}
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at >= now:
+                    self._memory.move_to_end(key)
+                    found[key] = value
+                else:
+                    del self._memory[key]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        client = self._get_redis()
+        if missing and client is not None:
+            try:
+                for key, raw in zip(missing, client.mget(missing)):
+                    if raw is None:
+                        continue
+                    value = json.loads(raw)
+                    found[key] = value
+                    ttl = self.config.get_ttl(value.get("result", ""))
+                    if ttl:
+                        self._set_memory(key, value, ttl)
+            except Exception as e:
+                logger.warning(f"[FactCheckCache] Redis mget failed: {e}")
+
+        hits = sum(1 for key in keys if key in found)
+        self._stats["hits"] += hits
+        self._stats["misses"] += len(keys) - hits
+        return found
+
+    def set(self, key: str, response: dict) -> int:
+        """판정별 TTL로 저장. Returns TTL used (0 = not cached)."""
+        if not self.config.ENABLED:
+            return 0
+        ttl = self.config.get_ttl(response.get("result", ""))
+        if ttl <= 0:
+            return 0
+
+        self._set_memory(key, response, ttl)
+        self._stats["sets"] += 1
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.setex(key, ttl, json.dumps(response, ensure_ascii=False))
+            except Exception as e:
+                logger.warning(f"[FactCheckCache] Redis set failed: {e}")
+        return ttl
+
+    def set_many(self, responses: dict[str, dict]) -> int:
+        """여러 판정 저장 (배치 검증 결과). Returns number cached."""
+        return sum(1 for key, response in responses.items() if self.set(key, response) > 0)
+
+    def _set_memory(self, key: str, value: dict, ttl: int) -> None:
+        ttl = min(ttl, self.config.MEMORY_TTL_SECONDS)
+        with self._lock:
+            self._memory[key] = (value, time.time() + ttl)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.config.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> int:
+        """
+        Clear all fact-check cache entries. Returns number of keys removed.
+
+        다른 프로세스의 memory tier는 MEMORY_TTL_SECONDS 안에 만료됨.
+        """
+        with self._lock:
+            count = len(self._memory)
+            self._memory.clear()
+
+        client = self._get_redis()
+        if client is not None:
+            pattern = f"{self.config.REDIS_KEY_PREFIX}:v{FACT_CHECK_CACHE_VERSION}:*"
+            try:
+                cursor = 0
+                while True:
+                    cursor, keys = client.scan(cursor, match=pattern, count=100)
+                    if keys:
+                        count += client.delete(*keys)
+                    if cursor == 0:
+                        break
+            except Exception as e:
+                logger.warning(f"[FactCheckCache] Redis clear failed: {e}")
+        return count
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "enabled": self.config.ENABLED,
+                "memory_entries": len(self._memory),
+                "redis_available": self._redis is not None,
+            }
+
+
+# Singleton instance
+_fact_check_cache: Optional[FactCheckCache] = None
+
+
+def get_fact_check_cache() -> FactCheckCache:
+    """Get singleton fact-check cache"""
+    global _fact_check_cache
+    if _fact_check_cache is None:
+        _fact_check_cache = FactCheckCache()
+    return _fact_check_cache
+
+
+def reset_fact_check_cache() -> None:
+    """Reset singleton fact-check cache (for testing)"""
+    global _fact_check_cache
+    _fact_check_cache = None
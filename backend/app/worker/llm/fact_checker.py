@@ -8,6 +8,10 @@ PRD v2.0 P0 Anti-Hallucination Layer:
 - 검증 실패 시 시그널 거부 또는 confidence 하향
 
 2026-02-08 구현
+
+Fact-check cache + claim batching:
+- 정규화된 주장 내용 해시로 FactCheckResponse 캐시 (판정별 TTL)
+- 캐시 미스 주장만 K개씩 하나의 grounded 프롬프트로 검증 (주장별 판정)
 """
 
 import asyncio
@@ -23,6 +27,7 @@ from enum import Enum
 from typing import Any, Optional
 
 from app.core.config import settings
+from app.worker.llm.fact_check_cache import FactCheckCache, get_fact_check_cache
 from app.worker.llm.key_rotator import get_key_rotator
 
 logger = logging.getLogger(__name__)
@@ -69,6 +74,7 @@ class FactCheckResponse:
     raw_response: str = ""  # Gemini 원본 응답
     latency_ms: int = 0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    cached: bool = False  # 팩트체크 캐시에서 가져온 결과
 
     def to_dict(self) -> dict:
         return {
@@ -79,8 +85,27 @@ class FactCheckResponse:
             "claims_checked": self.claims_checked,
             "latency_ms": self.latency_ms,
             "timestamp": self.timestamp,
+            "cached": self.cached,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "FactCheckResponse":
+        """to_dict() 결과로부터 복원 (캐시용)"""
+        try:
+            result = FactCheckResult(data.get("result", "unverified"))
+        except ValueError:
+            result = FactCheckResult.UNVERIFIED
+        return cls(
+            result=result,
+            confidence=float(data.get("confidence", 0.5)),
+            explanation=data.get("explanation", ""),
+            sources=list(data.get("sources", [])),
+            claims_checked=list(data.get("claims_checked", [])),
+            latency_ms=int(data.get("latency_ms", 0)),
+            timestamp=data.get("timestamp") or datetime.now().isoformat(),
+            cached=bool(data.get("cached", False)),
+        )
+
     @property
     def is_acceptable(self) -> bool:
         """시그널 저장 허용 여부"""
@@ -142,9 +167,62 @@ class GeminiFactChecker:
 
 이 정보가 사실인지 Google Search를 통해 검증하고 JSON 형식으로 응답해주세요."""
 
-    def __init__(self):
+    # 배치 팩트체크: K개 주장을 한 번의 grounded 호출로 검증
+    FACT_CHECK_BATCH_SYSTEM_PROMPT = """당신은 금융 뉴스 팩트체커입니다.
+번호가 붙은 여러 시그널(기업 리스크/기회 정보)의 핵심 주장을 각각 Google Search를 통해 검증하세요.
+
+검증 기준:
+1. 기업명이 정확히 일치하는지 (다른 기업 정보가 혼동되지 않았는지)
+2. 날짜/시점이 현재와 일치하는지
+3. 숫자(금액, 비율, 증감률 등)가 공신력 있는 출처와 일치하는지
+4. 이벤트(상장폐지, 부도, 합병 등)가 실제로 발생했는지
+
+특히 주의할 사항:
+- "상장폐지", "부도", "파산", "법정관리" 등 극단적 이벤트는 반드시 공식 공시 확인
+- 다른 기업의 뉴스가 혼동되었을 가능성 확인
+- 숫자가 50% 이상 차이나면 허위 가능성 높음
+- 각 시그널은 독립적으로 판정 (다른 시그널의 판정에 영향받지 않음)
+
+응답 형식 (JSON) - 모든 index에 대해 하나씩:
+{
+    "results": [
+        {
+            "index": 0,
+            "result": "verified" | "partial" | "unverified" | "false",
+            "confidence": 0.0 ~ 1.0,
+            "explanation": "검증 결과 상세 설명",
+            "sources": ["출처 URL 1", "출처 URL 2"],
+            "claims_checked": [
+                {"claim": "주장 내용", "verified": true/false, "source": "출처"}
+            ]
+        }
+    ]
+}"""
+
+    FACT_CHECK_BATCH_ITEM = """## [index {index}]
+기업명: {corp_name}
+시그널 유형: {signal_type} / {event_type}
+제목: {title}
+요약: {summary}
+영향: {impact_direction} ({impact_strength})"""
+
+    # 배치 응답 토큰 예산 (주장당)
+    BATCH_TOKENS_PER_CLAIM = 400
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        cache: Optional[FactCheckCache] = None,
+    ):
+        """
+        Args:
+            batch_size: 한 번의 grounded 호출로 검증할 주장 수 (1이면 단건 모드)
+            cache: 팩트체크 결과 캐시 (기본: 프로세스 싱글톤)
+        """
         self.key_rotator = get_key_rotator()
         self._enabled = True
+        self.batch_size = batch_size or getattr(settings, "FACT_CHECK_BATCH_SIZE", 5)
+        self.cache = cache or get_fact_check_cache()
 
     def is_available(self) -> bool:
         """Gemini API 사용 가능 여부"""
@@ -187,13 +265,7 @@ class GeminiFactChecker:
         try:
             # 프롬프트 생성
             user_prompt = self.FACT_CHECK_USER_PROMPT.format(
-                corp_name=corp_name,
-                signal_type=signal.get("signal_type", "UNKNOWN"),
-                event_type=signal.get("event_type", "UNKNOWN"),
-                title=signal.get("title", ""),
-                summary=signal.get("summary", ""),
-                impact_direction=signal.get("impact_direction", "NEUTRAL"),
-                impact_strength=signal.get("impact_strength", "LOW"),
+                **self._signal_fields(signal, corp_name)
             )
 
             # Gemini 호출 (Google Search Grounding 사용)
@@ -214,7 +286,103 @@ class GeminiFactChecker:
                 latency_ms=latency_ms,
             )
 
-    async def _call_gemini_with_grounding(self, prompt: str) -> str:
+    @staticmethod
+    def _signal_fields(signal: dict, corp_name: str) -> dict:
+        """프롬프트 포맷용 시그널 필드"""
+        return {
+            "corp_name": corp_name,
+            "signal_type": signal.get("signal_type", "UNKNOWN"),
+            "event_type": signal.get("event_type", "UNKNOWN"),
+            "title": signal.get("title", ""),
+            "summary": signal.get("summary", ""),
+            "impact_direction": signal.get("impact_direction", "NEUTRAL"),
+            "impact_strength": signal.get("impact_strength", "LOW"),
+        }
+
+    async def check_claims_batch(
+        self,
+        signals: list[dict],
+        corp_name: str,
+    ) -> list[FactCheckResponse]:
+        """
+        여러 주장을 하나의 grounded 프롬프트로 검증 (주장별 판정)
+
+        응답에서 누락되거나 파싱 불가한 주장만 단건 check_signal로 재검증.
+
+        Returns:
+            signals와 같은 순서의 FactCheckResponse 리스트
+        """
+        if len(signals) == 1:
+            return [await self.check_signal(signals[0], corp_name)]
+
+        start_time = time.time()
+        items = "\n\n".join(
+            self.FACT_CHECK_BATCH_ITEM.format(index=i, **self._signal_fields(signal, corp_name))
+            for i, signal in enumerate(signals)
+        )
+        user_prompt = (
+            f"다음 {len(signals)}개 시그널을 각각 팩트체크해주세요:\n\n{items}\n\n"
+            "각 시그널이 사실인지 Google Search를 통해 검증하고 JSON 형식으로 응답해주세요."
+        )
+
+        responses: list[Optional[FactCheckResponse]] = [None] * len(signals)
+        try:
+            response_text = await self._call_gemini_with_grounding(
+                user_prompt,
+                system_prompt=self.FACT_CHECK_BATCH_SYSTEM_PROMPT,
+                max_tokens=min(8192, 512 + self.BATCH_TOKENS_PER_CLAIM * len(signals)),
+            )
+            latency_ms = int((time.time() - start_time) * 1000)
+            responses = self._parse_batch_response(response_text, len(signals), latency_ms)
+        except Exception as e:
+            logger.warning(f"[FactChecker] Batch call failed, falling back to single checks: {e}")
+
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            logger.info(f"[FactChecker] Batch fallback for {len(missing)}/{len(signals)} claims")
+            fallback = await asyncio.gather(
+                *(self.check_signal(signals[i], corp_name) for i in missing)
+            )
+            for i, response in zip(missing, fallback):
+                responses[i] = response
+
+        return responses
+
+    def _parse_batch_response(
+        self,
+        response_text: str,
+        count: int,
+        latency_ms: int,
+    ) -> list[Optional[FactCheckResponse]]:
+        """배치 응답 파싱 - index로 매칭, 누락 항목은 None"""
+        responses: list[Optional[FactCheckResponse]] = [None] * count
+        json_match = re.search(r'\{[\s\S]*\}', response_text or "")
+        if not json_match:
+            return responses
+        try:
+            data = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.warning(f"[FactChecker] Batch JSON parse error: {e}")
+            return responses
+
+        items = data.get("results", []) if isinstance(data, dict) else []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < count and responses[index] is None and item.get("result"):
+                responses[index] = self._response_from_data(item, "", latency_ms)
+        return responses
+
+    async def _call_gemini_with_grounding(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024,
+    ) -> str:
         """
         Gemini 3 Pro + Google Search Grounding 호출
 
@@ -241,11 +409,11 @@ class GeminiFactChecker:
             lambda: litellm.completion(
                 model="gemini/gemini-2.0-flash",
                 messages=[
-                    {"role": "system", "content": self.FACT_CHECK_SYSTEM_PROMPT},
+                    {"role": "system", "content": system_prompt or self.FACT_CHECK_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.1,
-                max_tokens=1024,
+                max_tokens=max_tokens,
                 timeout=30,
             )
         )
@@ -284,25 +452,7 @@ class GeminiFactChecker:
             json_match = re.search(r'\{[\s\S]*\}', response_text)
             if json_match:
                 data = json.loads(json_match.group())
-
-                result_str = data.get("result", "unverified").lower()
-                result_map = {
-                    "verified": FactCheckResult.VERIFIED,
-                    "partial": FactCheckResult.PARTIALLY_VERIFIED,
-                    "unverified": FactCheckResult.UNVERIFIED,
-                    "false": FactCheckResult.FALSE,
-                }
-                result = result_map.get(result_str, FactCheckResult.UNVERIFIED)
-
-                return FactCheckResponse(
-                    result=result,
-                    confidence=float(data.get("confidence", 0.5)),
-                    explanation=data.get("explanation", ""),
-                    sources=data.get("sources", []),
-                    claims_checked=data.get("claims_checked", []),
-                    raw_response=response_text,
-                    latency_ms=latency_ms,
-                )
+                return self._response_from_data(data, response_text, latency_ms)
             else:
                 # JSON 파싱 실패 시 텍스트 분석
                 return self._analyze_text_response(response_text, latency_ms)
@@ -311,6 +461,27 @@ class GeminiFactChecker:
             logger.warning(f"[FactChecker] JSON parse error: {e}")
             return self._analyze_text_response(response_text, latency_ms)
 
+    def _response_from_data(self, data: dict, raw_response: str, latency_ms: int) -> FactCheckResponse:
+        """파싱된 JSON(단건 또는 배치 항목) → FactCheckResponse"""
+        result_str = str(data.get("result", "unverified")).lower()
+        result_map = {
+            "verified": FactCheckResult.VERIFIED,
+            "partial": FactCheckResult.PARTIALLY_VERIFIED,
+            "unverified": FactCheckResult.UNVERIFIED,
+            "false": FactCheckResult.FALSE,
+        }
+        result = result_map.get(result_str, FactCheckResult.UNVERIFIED)
+
+        return FactCheckResponse(
+            result=result,
+            confidence=float(data.get("confidence", 0.5)),
+            explanation=data.get("explanation", ""),
+            sources=data.get("sources", []),
+            claims_checked=data.get("claims_checked", []),
+            raw_response=raw_response,
+            latency_ms=latency_ms,
+        )
+
     def _analyze_text_response(self, text: str, latency_ms: int) -> FactCheckResponse:
         """텍스트 응답 분석 (JSON 파싱 실패 시)"""
         text_lower = text.lower()
@@ -342,14 +513,21 @@ class GeminiFactChecker:
         signals: list[dict],
         corp_name: str,
         max_concurrent: int = 3,
+        use_cache: bool = True,
     ) -> list[tuple[dict, FactCheckResponse]]:
         """
         여러 시그널 배치 팩트체크
 
+        1. 정규화된 주장 해시로 캐시 조회 (hit는 Gemini 호출 없음)
+        2. 같은 주장이 여러 번 있으면 한 번만 검증
+        3. 캐시 미스 주장은 batch_size개씩 하나의 grounded 프롬프트로 검증
+        4. 판정별 TTL로 캐시 저장 (ERROR는 저장 안 함)
+
         Args:
             signals: 시그널 리스트
             corp_name: 기업명
-            max_concurrent: 최대 동시 요청 수
+            max_concurrent: 최대 동시 요청 수 (배치 호출 단위)
+            use_cache: 팩트체크 캐시 사용 여부
 
         Returns:
             [(signal, FactCheckResponse), ...] 리스트
@@ -357,33 +535,76 @@ class GeminiFactChecker:
         if not signals:
             return []
 
-        # Semaphore로 동시 요청 제한
-        semaphore = asyncio.Semaphore(max_concurrent)
+        keys = [self.cache.make_key(signal, corp_name) for signal in signals]
+        # 캐시 조회/저장은 동기 Redis 호출 - 공유 이벤트 루프를 막지 않도록 스레드에서 실행
+        cached = await asyncio.to_thread(self.cache.get_many, keys) if use_cache else {}
 
-        async def check_with_semaphore(signal: dict) -> tuple[dict, FactCheckResponse]:
-            async with semaphore:
-                response = await self.check_signal(signal, corp_name)
-                return (signal, response)
+        # 캐시 미스 주장 (중복 제거, 첫 등장 순서 유지)
+        pending: dict[str, dict] = {}
+        for key, signal in zip(keys, signals):
+            if key not in cached and key not in pending:
+                pending[key] = signal
 
-        # 병렬 실행
-        tasks = [check_with_semaphore(s) for s in signals]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if cached:
+            logger.info(
+                f"[FactChecker] Cache hit {len(signals) - len(pending)}/{len(signals)} "
+                f"(corp: {corp_name})"
+            )
 
-        # 예외 처리
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"[FactChecker] Batch error for signal {i}: {result}")
-                final_results.append((
-                    signals[i],
-                    FactCheckResponse(
-                        result=FactCheckResult.ERROR,
-                        confidence=0.5,
-                        explanation=f"배치 검증 오류: {str(result)}",
+        fresh: dict[str, FactCheckResponse] = {}
+        if pending and self.is_available():
+            pending_keys = list(pending)
+            batch_size = max(1, self.batch_size)
+            chunks = [
+                pending_keys[i:i + batch_size]
+                for i in range(0, len(pending_keys), batch_size)
+            ]
+
+            # Semaphore로 동시 요청 제한
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def check_chunk(chunk_keys: list[str]) -> list[FactCheckResponse]:
+                async with semaphore:
+                    return await self.check_claims_batch(
+                        [pending[key] for key in chunk_keys], corp_name
                     )
-                ))
+
+            # 병렬 실행
+            results = await asyncio.gather(
+                *(check_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+
+            # 예외 처리
+            for chunk_keys, result in zip(chunks, results):
+                if isinstance(result, Exception):
+                    logger.error(f"[FactChecker] Batch error for {len(chunk_keys)} signals: {result}")
+                    result = [
+                        FactCheckResponse(
+                            result=FactCheckResult.ERROR,
+                            confidence=0.5,
+                            explanation=f"배치 검증 오류: {str(result)}",
+                        )
+                        for _ in chunk_keys
+                    ]
+                for key, response in zip(chunk_keys, result):
+                    fresh[key] = response
+            if use_cache:
+                await asyncio.to_thread(
+                    self.cache.set_many, {key: response.to_dict() for key, response in fresh.items()}
+                )
+        elif pending:
+            # check_signal과 동일한 불가 응답
+            for key, signal in pending.items():
+                fresh[key] = await self.check_signal(signal, corp_name)
+
+        final_results = []
+        for key, signal in zip(keys, signals):
+            if key in fresh:
+                final_results.append((signal, fresh[key]))
             else:
-                final_results.append(result)
+                response = FactCheckResponse.from_dict(cached[key])
+                response.cached = True
+                final_results.append((signal, response))
 
         return final_results
 
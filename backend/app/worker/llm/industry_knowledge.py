@@ -0,0 +1,678 @@
+"""
+Industry Knowledge Store for rKYC
+
+업종 단위 지식(업종명 / 검색 키워드 / LLM 업종 힌트)의 계층형 저장소
+
+기존에는 업종명·키워드가 코드에 정적으로 있고, LLM 업종 힌트는 프로세스별 dict에만
+캐시되어 워커 재시작/fork마다 다시 생성했다. 이 모듈은 업종 지식을 한 곳에서 관리한다.
+
+3-Tier:
+- Tier 1: Memory LRU (per-process, 짧은 TTL → 다른 프로세스의 무효화가 수 분 내 반영)
+- Tier 2: Redis (shared across workers)
+- Tier 3: DB (rkyc_industry_knowledge, 배포 시 CLI로 사전 적재)
+- 어디에도 없으면 코드의 seed 값 사용 (저장하지 않음)
+
+Versioning / Refresh:
+- INDUSTRY_KNOWLEDGE_VERSION: 힌트 프롬프트/스키마가 바뀌면 올림
+- 버전이 다르거나 REFRESH_AFTER보다 오래된 힌트는 stale → 기존 값을 그대로 반환하고
+  프로세스 공유 백그라운드 루프에서 재생성 (stale-while-revalidate)
+
+Usage:
+    store = get_industry_knowledge_store()
+    entry = store.resolve("C26")
+    entry.industry_name, entry.keywords, entry.hints
+
+    get_industry_name("C26")        # "전자부품 제조업"
+    get_industry_keywords("C26")    # {"supply_chain": [...], ...}
+
+    # 무효화 (corp_profiling.clear_industry_hints_cache 경유)
+    store.invalidate("C26")
+
+Pre-populate:
+    python scripts/prepopulate_industry_knowledge.py
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 힌트 프롬프트/스키마가 바뀌면 올려서 기존 힌트를 stale 처리
+INDUSTRY_KNOWLEDGE_VERSION = 1
+
+
+# =============================================================================
+# Seed Data (코드 기본값 - DB/Redis에 없을 때 사용, CLI로 DB에 적재)
+# =============================================================================
+
+SEED_INDUSTRY_NAMES = {
+    "C10": "식료품 제조업",
+    "C21": "의약품 제조업",
+    "C26": "전자부품 제조업",
+    "C29": "기계 제조업",
+    "D35": "전기 가스 증기 공급업",
+    "F41": "건설업",
+    "G45": "자동차 판매업",
+    "G46": "도매업",
+    "G47": "소매업",
+    "H49": "육상 운송업",
+    "J58": "출판업",
+    "J62": "소프트웨어 개발업",
+    "K64": "금융업",
+    "L68": "부동산업",
+    "M70": "경영 컨설팅업",
+    "N74": "전문 서비스업",
+}
+
+SEED_INDUSTRY_KEYWORDS = {
+    "C10": {  # 식품제조업
+        "supply_chain": ["농산물", "원료", "식자재", "수입", "가격"],
+        "regulation": ["식약처", "HACCP", "위생", "표시제", "영양성분"],
+        "market": ["소비자", "유통", "마트", "편의점", "프랜차이즈"],
+    },
+    "C21": {  # 의약품제조업
+        "supply_chain": ["원료의약품", "API", "바이오", "CMO", "CDMO"],
+        "regulation": ["식약처", "FDA", "EMA", "임상시험", "허가", "약가"],
+        "market": ["신약", "제네릭", "바이오시밀러", "건강보험", "급여"],
+    },
+    "C26": {  # 전자부품제조업
+        "supply_chain": ["반도체", "디스플레이", "배터리", "소재", "장비"],
+        "regulation": ["수출규제", "기술이전", "IRA", "CHIPS법", "탄소중립"],
+        "market": ["AI", "HBM", "전기차", "스마트폰", "데이터센터"],
+    },
+    "C29": {  # 기계장비제조업
+        "supply_chain": ["철강", "알루미늄", "유압", "베어링", "모터"],
+        "regulation": ["안전인증", "환경규제", "탄소세", "에너지효율"],
+        "market": ["자동화", "로봇", "스마트공장", "수주", "플랜트"],
+    },
+    "D35": {  # 전기업
+        "supply_chain": ["연료", "LNG", "석탄", "재생에너지", "ESS"],
+        "regulation": ["전기요금", "RPS", "RE100", "탄소배출권", "원전"],
+        "market": ["전력수요", "피크", "계통", "송전", "배전"],
+    },
+    "F41": {  # 건설업
+        "supply_chain": ["시멘트", "레미콘", "철근", "인건비", "자재"],
+        "regulation": ["분양가상한제", "재건축", "인허가", "안전점검"],
+        "market": ["분양", "미분양", "PF", "부동산", "금리"],
+    },
+}
+
+# Default keywords for industries not in the map
+DEFAULT_INDUSTRY_KEYWORDS = {
+    "supply_chain": ["원자재", "부품", "조달", "물류", "재고"],
+    "regulation": ["규제", "인허가", "정책", "법률", "감독"],
+    "market": ["수요", "경쟁", "시장점유율", "가격", "고객"],
+}
+
+# LLM 없이 사용하는 기본 힌트 (반도체 C26은 특화)
+SEED_INDUSTRY_HINTS = {
+    "C26": {
+        "typical_materials": ["금 (Au)", "은 (Ag)", "구리 (Cu)", "실리콘", "리드프레임"],
+        "typical_suppliers": ["다나까 금속 (Tanaka)", "헤라우스 그룹 (Heraeus)", "니폰 금속 (NIPPON)", "스미토모", "듀폰"],
+        "export_markets": ["중국", "미국", "대만", "베트남", "일본"],
+        "risk_factors": ["반도체 사이클", "미중 무역분쟁", "금 가격 변동"],
+        "growth_drivers": ["AI 수요", "전기차", "HBM"],
+    },
+}
+
+DEFAULT_INDUSTRY_HINTS = {
+    "typical_materials": ["원자재", "부품", "소재"],
+    "typical_suppliers": ["원자재 공급사", "부품 공급사", "장비 공급사"],
+    "export_markets": ["중국", "미국", "베트남", "일본", "유럽"],
+    "risk_factors": ["경기 변동", "환율 리스크", "공급망 리스크"],
+    "growth_drivers": ["기술 혁신", "시장 확대", "정부 정책"],
+}
+
+
+def default_industry_name(industry_code: str) -> str:
+    return f"업종코드 {industry_code}"
+
+
+def default_industry_hints(industry_code: str) -> dict:
+    """LLM 없이 사용하는 기본 힌트 (copy)"""
+    return copy.deepcopy(SEED_INDUSTRY_HINTS.get(industry_code, DEFAULT_INDUSTRY_HINTS))
+
+
+# =============================================================================
+# Entry / Config
+# =============================================================================
+
+
+class KnowledgeSource:
+    """업종 지식 출처"""
+
+    SEED = "seed"      # 코드 기본값 (CLI 적재 포함)
+    LLM = "llm"        # LLM 생성 힌트
+    MANUAL = "manual"  # 운영자 수정
+
+
+@dataclass
+class IndustryKnowledge:
+    """업종 단위 지식 (업종명 + 검색 키워드 + 업종 힌트)"""
+
+    industry_code: str
+    industry_name: str
+    keywords: dict = field(default_factory=dict)
+    # None이면 힌트 미생성 (무효화 직후 포함)
+    hints: Optional[dict] = None
+    version: int = INDUSTRY_KNOWLEDGE_VERSION
+    source: str = KnowledgeSource.SEED
+    # 힌트 생성 시각 (epoch seconds), None이면 생성 이력 없음
+    refreshed_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndustryKnowledge":
+        return cls(
+            industry_code=data["industry_code"],
+            industry_name=data.get("industry_name") or default_industry_name(data["industry_code"]),
+            keywords=data.get("keywords") or {},
+            hints=data.get("hints"),
+            version=int(data.get("version") or 0),
+            source=data.get("source") or KnowledgeSource.SEED,
+            refreshed_at=data.get("refreshed_at"),
+        )
+
+
+def build_seed_entry(industry_code: str, industry_name: Optional[str] = None) -> IndustryKnowledge:
+    """코드 seed 값으로 엔트리 생성 (힌트는 기본 힌트, refreshed_at=None → stale)"""
+    return IndustryKnowledge(
+        industry_code=industry_code,
+        industry_name=industry_name or SEED_INDUSTRY_NAMES.get(industry_code) or default_industry_name(industry_code),
+        keywords=copy.deepcopy(SEED_INDUSTRY_KEYWORDS.get(industry_code, DEFAULT_INDUSTRY_KEYWORDS)),
+        hints=default_industry_hints(industry_code),
+        source=KnowledgeSource.SEED,
+    )
+
+
+@dataclass
+class IndustryKnowledgeConfig:
+    """Industry knowledge store configuration (settings에서 로드)"""
+
+    DB_ENABLED: bool = True
+    MEMORY_TTL_SECONDS: int = 300
+    MEMORY_CACHE_SIZE: int = 256
+    REDIS_TTL_SECONDS: int = 24 * 3600
+    # LLM 힌트 재생성 주기
+    REFRESH_AFTER_SECONDS: int = 30 * 24 * 3600
+    # 재생성 실패 후 재시도 대기
+    REFRESH_RETRY_SECONDS: int = 600
+    # DB 오류 후 재시도 대기 (그동안 DB tier 건너뜀)
+    DB_RETRY_SECONDS: int = 60
+    REDIS_KEY_PREFIX: str = "rkyc:industry"
+    REDIS_CACHE_DB: int = 2
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.DB_ENABLED = settings.INDUSTRY_KNOWLEDGE_DB_ENABLED
+            self.MEMORY_TTL_SECONDS = settings.INDUSTRY_KNOWLEDGE_MEMORY_TTL
+            self.REDIS_TTL_SECONDS = settings.INDUSTRY_KNOWLEDGE_REDIS_TTL
+            self.REFRESH_AFTER_SECONDS = settings.INDUSTRY_KNOWLEDGE_REFRESH_AFTER
+            self.REDIS_CACHE_DB = settings.LLM_CACHE_REDIS_DB
+        except Exception as e:
+            logger.warning(f"Failed to load industry knowledge config from settings: {e}, using defaults")
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class IndustryKnowledgeStore:
+    """
+    업종 지식 3-Tier 저장소 (Memory → Redis → DB)
+
+    Redis/DB 모두 동기 클라이언트 - 이벤트 루프에 묶이지 않아 API 프로세스와
+    워커(단명 루프 / 백그라운드 루프) 어디서든 사용 가능.
+    """
+
+    def __init__(
+        self,
+        config: Optional[IndustryKnowledgeConfig] = None,
+        redis_client: Any = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.config = config or IndustryKnowledgeConfig()
+        self._redis = redis_client
+        self._redis_checked = redis_client is not None
+        self._session_factory = session_factory
+        self._db_retry_at = 0.0
+
+        self._memory: OrderedDict[str, tuple[IndustryKnowledge, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_failed_at: dict[str, float] = {}
+
+        self._stats = {
+            "memory_hits": 0,
+            "redis_hits": 0,
+            "db_hits": 0,
+            "seed_fallbacks": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+        }
+
+    # =========================================================================
+    # Backends
+    # =========================================================================
+
+    def _get_redis(self):
+        """Lazy Redis client; None이면 Redis tier 건너뜀"""
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                import redis
+                from app.core.config import settings
+
+                base_url = settings.REDIS_URL.rstrip("/0123456789")
+                client = redis.from_url(
+                    f"{base_url}/{self.config.REDIS_CACHE_DB}",
+                    decode_responses=True,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"[IndustryKnowledge] Redis unavailable: {e}")
+                self._redis = None
+        return self._redis
+
+    def _open_session(self):
+        """DB 세션 (비활성/오류 대기 중이면 None)"""
+        if not self.config.DB_ENABLED or time.time() < self._db_retry_at:
+            return None
+        if self._session_factory is None:
+            from app.worker.db import get_sync_session
+            self._session_factory = get_sync_session
+        return self._session_factory()
+
+    def _db_failed(self, action: str, error: Exception) -> None:
+        self._db_retry_at = time.time() + self.config.DB_RETRY_SECONDS
+        logger.warning(f"[IndustryKnowledge] DB {action} failed, skipping DB tier for {self.config.DB_RETRY_SECONDS}s: {error}")
+
+    def _redis_key(self, industry_code: str) -> str:
+        return f"{self.config.REDIS_KEY_PREFIX}:v{INDUSTRY_KNOWLEDGE_VERSION}:{industry_code}"
+
+    # =========================================================================
+    # Tier 1: Memory
+    # =========================================================================
+
+    def _get_memory(self, industry_code: str) -> Optional[IndustryKnowledge]:
+        with self._lock:
+            entry = self._memory.get(industry_code)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._memory[industry_code]
+                return None
+            self._memory.move_to_end(industry_code)
+            return value
+
+    def _set_memory(self, entry: IndustryKnowledge) -> None:
+        with self._lock:
+            self._memory[entry.industry_code] = (entry, time.time() + self.config.MEMORY_TTL_SECONDS)
+            self._memory.move_to_end(entry.industry_code)
+            while len(self._memory) > self.config.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    # =========================================================================
+    # Tier 2: Redis
+    # =========================================================================
+
+    def _get_redis_entry(self, industry_code: str) -> Optional[IndustryKnowledge]:
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(self._redis_key(industry_code))
+            return IndustryKnowledge.from_dict(json.loads(raw)) if raw else None
+        except Exception as e:
+            logger.warning(f"[IndustryKnowledge] Redis get failed: {e}")
+            return None
+
+    def _set_redis_entry(self, entry: IndustryKnowledge) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.setex(
+                self._redis_key(entry.industry_code),
+                self.config.REDIS_TTL_SECONDS,
+                json.dumps(entry.to_dict(), ensure_ascii=False),
+            )
+        except Exception as e:
+            logger.warning(f"[IndustryKnowledge] Redis set failed: {e}")
+
+    def _delete_redis_entries(self, industry_code: Optional[str]) -> set[str]:
+        """Redis 엔트리 삭제. Returns deleted industry codes."""
+        client = self._get_redis()
+        if client is None:
+            return set()
+        deleted: set[str] = set()
+        try:
+            if industry_code:
+                if client.delete(self._redis_key(industry_code)):
+                    deleted.add(industry_code)
+                return deleted
+
+            # 전체 삭제는 이전 버전 키까지 포함
+            cursor = 0
+            while True:
+                cursor, keys = client.scan(cursor, match=f"{self.config.REDIS_KEY_PREFIX}:*", count=100)
+                if keys:
+                    client.delete(*keys)
+                    deleted.update(key.rsplit(":", 1)[-1] for key in keys)
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.warning(f"[IndustryKnowledge] Redis delete failed: {e}")
+        return deleted
+
+    # =========================================================================
+    # Tier 3: DB
+    # =========================================================================
+
+    def _get_db_entry(self, industry_code: str) -> Optional[IndustryKnowledge]:
+        session = self._open_session()
+        if session is None:
+            return None
+        try:
+            from sqlalchemy import text
+
+            row = session.execute(
+                text("""
+                    SELECT industry_code, industry_name, keywords, hints, version, source,
+                           EXTRACT(EPOCH FROM refreshed_at) AS refreshed_at
+                    FROM rkyc_industry_knowledge
+                    WHERE industry_code = :industry_code
+                """),
+                {"industry_code": industry_code},
+            ).mappings().fetchone()
+            if row is None:
+                return None
+            data = dict(row)
+            if data["refreshed_at"] is not None:
+                data["refreshed_at"] = float(data["refreshed_at"])
+            return IndustryKnowledge.from_dict(data)
+        except Exception as e:
+            self._db_failed("read", e)
+            return None
+        finally:
+            session.close()
+
+    def _upsert_db_entry(self, entry: IndustryKnowledge) -> bool:
+        session = self._open_session()
+        if session is None:
+            return False
+        try:
+            from sqlalchemy import text
+
+            session.execute(
+                text("""
+                    INSERT INTO rkyc_industry_knowledge (
+                        industry_code, industry_name, keywords, hints, version, source,
+                        refreshed_at, updated_at
+                    ) VALUES (
+                        :industry_code, :industry_name, CAST(:keywords AS jsonb), CAST(:hints AS jsonb),
+                        :version, :source, to_timestamp(:refreshed_at), NOW()
+                    )
+                    ON CONFLICT (industry_code) DO UPDATE SET
+                        industry_name = EXCLUDED.industry_name,
+                        keywords = EXCLUDED.keywords,
+                        hints = EXCLUDED.hints,
+                        version = EXCLUDED.version,
+                        source = EXCLUDED.source,
+                        refreshed_at = EXCLUDED.refreshed_at,
+                        updated_at = NOW()
+                """),
+                {
+                    "industry_code": entry.industry_code,
+                    "industry_name": entry.industry_name,
+                    "keywords": json.dumps(entry.keywords, ensure_ascii=False),
+                    "hints": json.dumps(entry.hints, ensure_ascii=False) if entry.hints is not None else None,
+                    "version": entry.version,
+                    "source": entry.source,
+                    "refreshed_at": entry.refreshed_at,
+                },
+            )
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            self._db_failed("upsert", e)
+            return False
+        finally:
+            session.close()
+
+    def _clear_db_hints(self, industry_code: Optional[str]) -> set[str]:
+        """DB 힌트만 비움 (업종명/키워드는 유지). Returns cleared industry codes."""
+        session = self._open_session()
+        if session is None:
+            return set()
+        try:
+            from sqlalchemy import text
+
+            where = "WHERE industry_code = :industry_code" if industry_code else ""
+            rows = session.execute(
+                text(f"""
+                    UPDATE rkyc_industry_knowledge
+                    SET hints = NULL, refreshed_at = NULL, updated_at = NOW()
+                    {where}
+                    RETURNING industry_code
+                """),
+                {"industry_code": industry_code},
+            ).fetchall()
+            session.commit()
+            return {row[0] for row in rows}
+        except Exception as e:
+            session.rollback()
+            self._db_failed("invalidate", e)
+            return set()
+        finally:
+            session.close()
+
+    def load_master_names(self) -> dict[str, str]:
+        """industry_master 업종명 (CLI 사전 적재용)"""
+        session = self._open_session()
+        if session is None:
+            return {}
+        try:
+            from sqlalchemy import text
+
+            rows = session.execute(
+                text("SELECT industry_code, industry_name FROM industry_master")
+            ).fetchall()
+            return {row[0]: row[1] for row in rows}
+        except Exception as e:
+            self._db_failed("read industry_master", e)
+            return {}
+        finally:
+            session.close()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def get(self, industry_code: str) -> Optional[IndustryKnowledge]:
+        """Memory → Redis → DB 순서로 조회, 하위 tier에서 찾으면 상위 tier 채움"""
+        entry = self._get_memory(industry_code)
+        if entry is not None:
+            self._stats["memory_hits"] += 1
+            return entry
+
+        entry = self._get_redis_entry(industry_code)
+        if entry is not None:
+            self._stats["redis_hits"] += 1
+            self._set_memory(entry)
+            return entry
+
+        entry = self._get_db_entry(industry_code)
+        if entry is not None:
+            self._stats["db_hits"] += 1
+            self._set_redis_entry(entry)
+            self._set_memory(entry)
+            return entry
+        return None
+
+    def resolve(self, industry_code: str) -> IndustryKnowledge:
+        """get() 또는 코드 seed 엔트리 (항상 값 반환, seed는 memory에만 보관)"""
+        entry = self.get(industry_code)
+        if entry is not None:
+            return entry
+        self._stats["seed_fallbacks"] += 1
+        entry = build_seed_entry(industry_code)
+        self._set_memory(entry)
+        return entry
+
+    def put(self, entry: IndustryKnowledge) -> None:
+        """전 tier 저장 (DB → Redis → Memory)"""
+        self._upsert_db_entry(entry)
+        self._set_redis_entry(entry)
+        self._set_memory(entry)
+
+    def update_hints(self, industry_code: str, hints: dict, source: str = KnowledgeSource.LLM) -> IndustryKnowledge:
+        """힌트만 갱신 (현재 버전, refreshed_at=now)"""
+        entry = replace(
+            self.resolve(industry_code),
+            hints=hints,
+            version=INDUSTRY_KNOWLEDGE_VERSION,
+            source=source,
+            refreshed_at=time.time(),
+        )
+        self.put(entry)
+        return entry
+
+    def is_stale(self, entry: IndustryKnowledge) -> bool:
+        """힌트 재생성이 필요한지 (없음 / 이전 버전 / 생성 이력 없음 / 오래됨)"""
+        if entry.hints is None or entry.version != INDUSTRY_KNOWLEDGE_VERSION:
+            return True
+        if entry.refreshed_at is None:
+            return True
+        return time.time() - entry.refreshed_at > self.config.REFRESH_AFTER_SECONDS
+
+    def invalidate(self, industry_code: Optional[str] = None) -> int:
+        """
+        업종 힌트 무효화 (전 tier)
+
+        업종명/키워드는 유지하고 힌트만 비움 → 다음 조회 시 재생성.
+        다른 프로세스의 memory tier는 MEMORY_TTL_SECONDS 안에 만료됨.
+
+        Returns:
+            무효화된 업종 수
+        """
+        with self._lock:
+            if industry_code:
+                cleared = {industry_code} if self._memory.pop(industry_code, None) else set()
+                self._refresh_failed_at.pop(industry_code, None)
+            else:
+                cleared = set(self._memory.keys())
+                self._memory.clear()
+                self._refresh_failed_at.clear()
+
+        cleared |= self._delete_redis_entries(industry_code)
+        cleared |= self._clear_db_hints(industry_code)
+        return len(cleared)
+
+    def schedule_refresh(
+        self,
+        industry_code: str,
+        generate: Callable[[], Awaitable[dict]],
+    ) -> bool:
+        """
+        힌트 백그라운드 재생성 예약 (프로세스 내 single-flight)
+
+        호출한 이벤트 루프는 파이프라인 종료와 함께 닫히므로 프로세스 공유
+        백그라운드 루프에서 실행한다.
+
+        Returns:
+            True if a refresh was scheduled
+        """
+        with self._lock:
+            if industry_code in self._refreshing:
+                return False
+            failed_at = self._refresh_failed_at.get(industry_code)
+            if failed_at and time.time() - failed_at < self.config.REFRESH_RETRY_SECONDS:
+                return False
+            self._refreshing.add(industry_code)
+
+        async def refresh():
+            try:
+                hints = await generate()
+                # DB upsert + Redis 쓰기는 동기 호출 - 공유 루프의 다른 refresh를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(self.update_hints, industry_code, hints)
+                self._stats["refreshes"] += 1
+                logger.info(f"[IndustryKnowledge] Refreshed hints for {industry_code}")
+            except Exception as e:
+                self._stats["refresh_failures"] += 1
+                with self._lock:
+                    self._refresh_failed_at[industry_code] = time.time()
+                logger.warning(f"[IndustryKnowledge] Background refresh failed for {industry_code}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(industry_code)
+
+        try:
+            from app.worker.async_runtime import submit_async
+            submit_async(refresh())
+            return True
+        except Exception as e:
+            with self._lock:
+                self._refreshing.discard(industry_code)
+            logger.warning(f"[IndustryKnowledge] Failed to schedule refresh for {industry_code}: {e}")
+            return False
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "version": INDUSTRY_KNOWLEDGE_VERSION,
+                "memory_entries": len(self._memory),
+                "memory_codes": list(self._memory.keys()),
+                "refreshing": sorted(self._refreshing),
+                "redis_available": self._redis is not None,
+                "db_enabled": self.config.DB_ENABLED,
+            }
+
+
+# Singleton instance
+_industry_knowledge_store: Optional[IndustryKnowledgeStore] = None
+
+
+def get_industry_knowledge_store() -> IndustryKnowledgeStore:
+    """Get singleton industry knowledge store"""
+    global _industry_knowledge_store
+    if _industry_knowledge_store is None:
+        _industry_knowledge_store = IndustryKnowledgeStore()
+    return _industry_knowledge_store
+
+
+def reset_industry_knowledge_store() -> None:
+    """Reset singleton industry knowledge store (for testing)"""
+    global _industry_knowledge_store
+    _industry_knowledge_store = None
+
+
+def get_industry_name(industry_code: str) -> str:
+    """Get industry name from code (store → seed)."""
+    if not industry_code:
+        return default_industry_name(industry_code)
+    return get_industry_knowledge_store().resolve(industry_code).industry_name
+
+
+def get_industry_keywords(industry_code: str) -> dict:
+    """Get industry search keywords (store → seed → default)."""
+    if not industry_code:
+        return DEFAULT_INDUSTRY_KEYWORDS
+    return get_industry_knowledge_store().resolve(industry_code).keywords or DEFAULT_INDUSTRY_KEYWORDS
@@ -300,6 +300,7 @@ class MultiAgentOrchestrator:
         industry_code: str,
         existing_profile: Optional[dict] = None,
         skip_cache: bool = False,
+        phase_memo=None,
     ) -> OrchestratorResult:
         """
         4-Layer Fallback 실행
@@ -310,6 +311,7 @@ class MultiAgentOrchestrator:
             industry_code: 업종코드
             existing_profile: 기존 프로필 (있으면 보완용)
             skip_cache: True면 캐시 무시하고 항상 새로 검색
+            phase_memo: PhaseMemo (있으면 Gemini 검색 결과를 phase 단위로 재사용)
 
         Returns:
             OrchestratorResult: 실행 결과 (프로필, fallback layer, 메타데이터)
@@ -376,7 +378,7 @@ class MultiAgentOrchestrator:
 
         try:
             perplexity_result, gemini_validation = self._try_perplexity_gemini(
-                corp_name, industry_name, provenance, error_messages
+                corp_name, industry_name, provenance, error_messages, phase_memo
             )
             retry_count += 1
 
@@ -626,6 +628,7 @@ class MultiAgentOrchestrator:
         industry_name: str,
         provenance: dict,
         error_messages: list[str],
+        phase_memo=None,
     ) -> tuple[Optional[dict], Optional[dict]]:
         """
         Perplexity 검색 + Gemini 검증
@@ -642,7 +645,7 @@ class MultiAgentOrchestrator:
 
         if self.parallel_mode:
             return self._try_perplexity_gemini_parallel(
-                corp_name, industry_name, provenance, error_messages
+                corp_name, industry_name, provenance, error_messages, phase_memo
             )
         else:
             return self._try_perplexity_gemini_sequential(
@@ -655,6 +658,7 @@ class MultiAgentOrchestrator:
         industry_name: str,
         provenance: dict,
         error_messages: list[str],
+        phase_memo=None,
     ) -> tuple[Optional[dict], Optional[dict]]:
         """
         병렬 모드: Perplexity + Gemini 동시 실행
@@ -685,9 +689,19 @@ class MultiAgentOrchestrator:
 
         # Gemini도 병렬로 독립 검색 (검증이 아닌 독립 검색 역할)
         if self.circuit_breaker.is_available("gemini"):
-            futures["gemini"] = self._executor.submit(
-                self._safe_gemini_search, corp_name, industry_name
-            )
+            if phase_memo is not None:
+                # 미만료 Gemini 검색 결과 재사용 (실패 결과는 저장하지 않음)
+                futures["gemini"] = self._executor.submit(
+                    phase_memo.get_or_compute,
+                    "gemini",
+                    f"{corp_name}|{industry_name}",
+                    lambda: self._safe_gemini_search(corp_name, industry_name),
+                    lambda result: bool(result) and not result.get("error"),
+                )
+            else:
+                futures["gemini"] = self._executor.submit(
+                    self._safe_gemini_search, corp_name, industry_name
+                )
         else:
             error_messages.append("Gemini circuit breaker is OPEN")
             provenance["gemini_circuit_open"] = True
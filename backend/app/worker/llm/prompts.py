@@ -1434,30 +1434,11 @@ def get_doc_extraction_prompt(doc_type: str) -> str:
     return DOC_EXTRACTION_PROMPTS.get(doc_type, EXTRACT_BIZ_REG_PROMPT)
 
 
-# Industry code to name mapping
-INDUSTRY_CODE_MAP = {
-    "C10": "식품제조업",
-    "C21": "의약품제조업",
-    "C26": "전자부품제조업",
-    "C29": "기계장비제조업",
-    "D35": "전기업",
-    "F41": "건설업",
-    "G45": "자동차판매업",
-    "G46": "도매업",
-    "G47": "소매업",
-    "H49": "육상운송업",
-    "J58": "출판업",
-    "J62": "소프트웨어개발업",
-    "K64": "금융업",
-    "L68": "부동산업",
-    "M70": "경영컨설팅업",
-    "N74": "전문서비스업",
-}
-
-
 def get_industry_name(industry_code: str) -> str:
-    """Get industry name from code"""
-    return INDUSTRY_CODE_MAP.get(industry_code, f"기타 ({industry_code})")
+    """Get industry name from code (industry knowledge store → seed)"""
+    from app.worker.llm.industry_knowledge import get_industry_name as resolve_industry_name
+
+    return resolve_industry_name(industry_code)
 
 
 # =============================================================================
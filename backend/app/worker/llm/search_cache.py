@@ -0,0 +1,435 @@
+"""
+Shared Search Result Cache for rKYC
+
+기업 간 공유되는 외부 검색 결과 캐시 (INDUSTRY / ENVIRONMENT)
+
+INDUSTRY 검색은 업종(industry_code)과 업종 키워드만으로, ENVIRONMENT 검색은
+업종 + 주제(FX_RISK, COMMODITY, ...)만으로 결정되므로 같은 업종의 기업들은
+freshness window 안에서 하나의 검색 결과를 재사용한다.
+
+2-Layer Cache:
+- Layer 1: Memory LRU (per-process)
+- Layer 2: Redis (shared across workers)
+
+Single-flight:
+- 프로세스 내: 같은 키의 동시 요청은 하나의 fill을 공유 (asyncio.Future)
+- 프로세스 간: Redis SET NX 락을 잡은 워커만 검색, 나머지는 결과를 기다림
+
+fill은 실패(타임아웃/HTTP 오류)를 예외로 알려야 한다 - 반환값은 그대로 캐시되므로
+빈 리스트는 "검색 결과 없음"일 때만 반환 (ExternalSearchPipeline._call_perplexity_async).
+get_or_fill 경로의 Redis 호출(동기 클라이언트)은 asyncio.to_thread로 실행해 공유 루프를 막지 않음.
+
+Cache Key:
+    rkyc:search:cache:v{version}:{scope}:{industry_code}:{topic_hash}
+
+Usage:
+    cache = get_search_cache()
+    events = await cache.get_or_fill(
+        SearchScope.INDUSTRY, industry_code, industry_name,
+        fill=lambda: call_perplexity(...),
+    )
+
+    # 명시적 무효화 (업종/범위 단위)
+    cache.invalidate(scope=SearchScope.INDUSTRY, industry_code="C26")
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트/파싱 로직이 바뀌면 올려서 기존 캐시를 무효화
+SEARCH_CACHE_VERSION = 1
+
+# 락 해제: 자신이 잡은 락만 삭제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SearchScope(str, Enum):
+    """기업 비특정 검색 범위"""
+    INDUSTRY = "industry"
+    ENVIRONMENT = "environment"
+
+
+@dataclass
+class SearchCacheConfig:
+    """Search cache configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    # 결과가 있는 검색의 freshness window
+    TTL_SECONDS: int = 6 * 3600
+    # 결과 없음(NOT_FOUND/실패)은 짧게 - 전체 스캔 중 반복 호출만 막음
+    EMPTY_TTL_SECONDS: int = 600
+    # fill 중인 워커의 락 유지 시간 (검색 타임아웃보다 길게)
+    LOCK_TTL_SECONDS: int = 90
+    # 다른 워커의 fill 결과 대기 polling 간격
+    POLL_INTERVAL_SECONDS: float = 0.5
+    MEMORY_CACHE_SIZE: int = 256
+    # 프로세스 memory tier 유지 시간 상한 - 다른 프로세스(API)의 invalidate가 Redis에만 반영되므로
+    # 워커의 memory 복사본은 이 시간 안에 Redis에서 다시 읽음
+    MEMORY_TTL_SECONDS: int = 300
+    REDIS_KEY_PREFIX: str = "rkyc:search:cache"
+    REDIS_CACHE_DB: int = 2
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.EXTERNAL_SEARCH_CACHE_ENABLED
+            self.TTL_SECONDS = settings.EXTERNAL_SEARCH_CACHE_TTL
+            self.EMPTY_TTL_SECONDS = settings.EXTERNAL_SEARCH_CACHE_EMPTY_TTL
+            self.LOCK_TTL_SECONDS = settings.EXTERNAL_SEARCH_CACHE_LOCK_TTL
+            self.REDIS_CACHE_DB = settings.LLM_CACHE_REDIS_DB
+        except Exception as e:
+            logger.warning(f"Failed to load search cache config from settings: {e}, using defaults")
+
+
+class SharedSearchCache:
+    """
+    업종/주제 단위 검색 결과 캐시
+
+    Redis 연결은 동기 클라이언트(circuit_breaker와 동일) - 이벤트 루프에 묶이지 않아
+    워커의 백그라운드 루프와 API 프로세스 양쪽에서 무효화 호출 가능.
+    """
+
+    def __init__(self, config: Optional[SearchCacheConfig] = None, redis_client: Any = None):
+        self.config = config or SearchCacheConfig()
+        self._redis = redis_client
+        self._redis_checked = redis_client is not None
+
+        self._memory: OrderedDict[str, tuple[list[dict], float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self._stats = {"hits": 0, "misses": 0, "shared": 0, "fills": 0}
+
+    # =========================================================================
+    # Redis
+    # =========================================================================
+
+    def _get_redis(self):
+        """Lazy Redis client; None이면 memory-only"""
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                import redis
+                from app.core.config import settings
+
+                base_url = settings.REDIS_URL.rstrip("/0123456789")
+                client = redis.from_url(
+                    f"{base_url}/{self.config.REDIS_CACHE_DB}",
+                    decode_responses=True,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"[SearchCache] Redis unavailable, using memory only: {e}")
+                self._redis = None
+        return self._redis
+
+    # =========================================================================
+    # Keys
+    # =========================================================================
+
+    def make_key(self, scope: SearchScope, industry_code: str, topic: str) -> str:
+        """Deterministic cache key (topic은 정규화 후 해시)"""
+        topic_normalized = " ".join(topic.split()).lower()
+        topic_hash = hashlib.sha256(topic_normalized.encode()).hexdigest()[:16]
+        return (
+            f"{self.config.REDIS_KEY_PREFIX}:v{SEARCH_CACHE_VERSION}:"
+            f"{scope.value}:{industry_code or 'UNKNOWN'}:{topic_hash}"
+        )
+
+    # =========================================================================
+    # Get / Set
+    # =========================================================================
+
+    def get(self, key: str) -> Optional[list[dict]]:
+        """Memory → Redis 순서로 조회 (복사본 반환)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                events, expires_at = entry
+                if expires_at >= time.time():
+                    self._memory.move_to_end(key)
+                    return copy.deepcopy(events)
+                del self._memory[key]
+
+        client = self._get_redis()
+        if client is None:
+            return None
+
+        try:
+            raw = client.get(key)
+            if raw is None:
+                return None
+            payload = json.loads(raw)
+            ttl = client.ttl(key)
+        except Exception as e:
+            logger.warning(f"[SearchCache] Redis get failed: {e}")
+            return None
+
+        events = payload.get("events", [])
+        # Promote to memory with the remaining Redis TTL (MEMORY_TTL_SECONDS 상한)
+        if ttl and ttl > 0:
+            self._set_memory(key, events, ttl)
+        return copy.deepcopy(events)
+
+    def set(self, key: str, events: list[dict]) -> int:
+        """Store result; 빈 결과는 EMPTY_TTL 적용. Returns TTL used."""
+        ttl = self.config.TTL_SECONDS if events else self.config.EMPTY_TTL_SECONDS
+        self._set_memory(key, copy.deepcopy(events), ttl)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.setex(
+                    key,
+                    ttl,
+                    json.dumps({"events": events, "cached_at": time.time()}, ensure_ascii=False),
+                )
+            except Exception as e:
+                logger.warning(f"[SearchCache] Redis set failed: {e}")
+        return ttl
+
+    def _set_memory(self, key: str, events: list[dict], ttl: int) -> None:
+        ttl = min(ttl, self.config.MEMORY_TTL_SECONDS)
+        with self._lock:
+            self._memory[key] = (events, time.time() + ttl)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.config.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    # =========================================================================
+    # Single-flight fill
+    # =========================================================================
+
+    async def get_or_fill(
+        self,
+        scope: SearchScope,
+        industry_code: str,
+        topic: str,
+        fill: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """
+        Cached result or run `fill` once across processes.
+
+        fill에서 발생한 예외(타임아웃 등)는 캐시하지 않고 그대로 전파한다.
+        """
+        if not self.config.ENABLED:
+            return await fill()
+
+        key = self.make_key(scope, industry_code, topic)
+
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            self._stats["hits"] += 1
+            logger.debug(f"[SearchCache] HIT {scope.value}:{industry_code}")
+            return cached
+
+        # 프로세스 내 single-flight
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                events = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # fill 하던 쪽이 취소됨 - 다시 시도
+                return await self.get_or_fill(scope, industry_code, topic, fill)
+            self._stats["shared"] += 1
+            return copy.deepcopy(events)
+
+        future = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            events = await self._fill_with_lock(key, fill)
+            future.set_result(events)
+            return copy.deepcopy(events)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fill_with_lock(
+        self,
+        key: str,
+        fill: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """프로세스 간 single-flight: 락 보유자만 fill, 나머지는 결과 대기"""
+        client = await asyncio.to_thread(self._get_redis)
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+
+        acquired = True
+        if client is not None:
+            try:
+                acquired = bool(await asyncio.to_thread(
+                    client.set, lock_key, token, nx=True, ex=self.config.LOCK_TTL_SECONDS
+                ))
+            except Exception as e:
+                logger.warning(f"[SearchCache] Redis lock failed: {e}")
+
+        if not acquired:
+            # 다른 워커가 검색 중 - 결과가 생기거나 락이 풀릴 때까지 대기
+            # (호출 측 타임아웃이 전체 대기 시간을 제한)
+            while True:
+                await asyncio.sleep(self.config.POLL_INTERVAL_SECONDS)
+                cached = await asyncio.to_thread(self.get, key)
+                if cached is not None:
+                    self._stats["shared"] += 1
+                    return cached
+                try:
+                    if not await asyncio.to_thread(client.exists, lock_key):
+                        break
+                except Exception:
+                    break
+            # 락 보유자가 실패 - 직접 검색 (락 없이)
+
+        self._stats["misses"] += 1
+        try:
+            events = await fill()
+            self._stats["fills"] += 1
+            await asyncio.to_thread(self.set, key, events)
+            return events
+        finally:
+            if client is not None and acquired:
+                try:
+                    await asyncio.to_thread(client.eval, _RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f"[SearchCache] Redis unlock failed: {e}")
+
+    # =========================================================================
+    # Invalidation / Stats
+    # =========================================================================
+
+    def invalidate(
+        self,
+        scope: Optional[SearchScope] = None,
+        industry_code: Optional[str] = None,
+    ) -> int:
+        """
+        업종/범위 단위 무효화
+
+        Args:
+            scope: None이면 INDUSTRY + ENVIRONMENT 전체
+            industry_code: None이면 전체 업종
+
+        Returns:
+            삭제된 엔트리 수 (memory + Redis)
+
+        다른 프로세스의 memory tier는 MEMORY_TTL_SECONDS 안에 만료됨.
+        """
+        scope_part = scope.value if scope else "*"
+        industry_part = industry_code or "*"
+        prefix = f"{self.config.REDIS_KEY_PREFIX}:v{SEARCH_CACHE_VERSION}:"
+
+        def matches(key: str) -> bool:
+            parts = key[len(prefix):].split(":")
+            return (
+                len(parts) == 3
+                and (scope is None or parts[0] == scope.value)
+                and (industry_code is None or parts[1] == industry_code)
+            )
+
+        with self._lock:
+            keys = [key for key in self._memory if matches(key)]
+            for key in keys:
+                del self._memory[key]
+        count = len(keys)
+
+        client = self._get_redis()
+        if client is not None:
+            pattern = f"{prefix}{scope_part}:{industry_part}:*"
+            try:
+                for batch in _scan_batches(client, pattern):
+                    batch = [key for key in batch if not key.endswith(":lock")]
+                    if batch:
+                        count += client.delete(*batch)
+            except Exception as e:
+                logger.warning(f"[SearchCache] Redis invalidate failed: {e}")
+
+        logger.info(
+            f"[SearchCache] Invalidated {count} entries "
+            f"(scope={scope_part}, industry_code={industry_part})"
+        )
+        return count
+
+    def get_stats(self) -> dict:
+        """Cache statistics (per-process counters + Redis key count)"""
+        with self._lock:
+            stats = {
+                **self._stats,
+                "enabled": self.config.ENABLED,
+                "memory_entries": len(self._memory),
+                "ttl_seconds": self.config.TTL_SECONDS,
+                "empty_ttl_seconds": self.config.EMPTY_TTL_SECONDS,
+            }
+
+        client = self._get_redis()
+        stats["redis_available"] = client is not None
+        if client is not None:
+            pattern = f"{self.config.REDIS_KEY_PREFIX}:v{SEARCH_CACHE_VERSION}:*"
+            try:
+                redis_counts = {scope.value: 0 for scope in SearchScope}
+                for batch in _scan_batches(client, pattern):
+                    for key in batch:
+                        if key.endswith(":lock"):
+                            continue
+                        scope_value = key.split(":")[4]
+                        if scope_value in redis_counts:
+                            redis_counts[scope_value] += 1
+                stats["redis"] = redis_counts
+            except Exception as e:
+                stats["redis_error"] = str(e)
+        return stats
+
+
+def _scan_batches(client, pattern: str):
+    cursor = 0
+    while True:
+        cursor, keys = client.scan(cursor, match=pattern, count=100)
+        if keys:
+            yield keys
+        if cursor == 0:
+            break
+
+
+# Singleton instance
+_search_cache_instance: Optional[SharedSearchCache] = None
+
+
+def get_search_cache() -> SharedSearchCache:
+    """Get singleton search cache instance"""
+    global _search_cache_instance
+    if _search_cache_instance is None:
+        _search_cache_instance = SharedSearchCache()
+    return _search_cache_instance
+
+
+def reset_search_cache() -> None:
+    """Reset singleton search cache (for testing)"""
+    global _search_cache_instance
+    _search_cache_instance = None
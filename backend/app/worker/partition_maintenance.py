@@ -0,0 +1,289 @@
+"""
+Monthly Partition Maintenance (rkyc_job, rkyc_signal_index)
+
+migration_v25가 두 테이블을 월 단위 RANGE 파티션으로 전환:
+    rkyc_job           queued_at   → rkyc_job_pYYYYMM
+    rkyc_signal_index  detected_at → rkyc_signal_index_pYYYYMM
+    (범위 밖 행은 <table>_default)
+
+- 미래 파티션: maintain_partitions 태스크(매일)가 이번 달 ~ MONTHS_AHEAD개월 뒤까지 생성
+  (rkyc_ensure_monthly_partitions - default 파티션에 들어간 행이 있으면 새 파티션으로 이동)
+- 보존 기간: 기간이 지난 월 파티션은 DELETE 대신 DETACH(보관) 또는 DROP
+  - rkyc_job: cleanup_old_jobs(days) - 파티션의 모든 행이 DONE/FAILED이고 cutoff 전에 끝난 경우만
+    (아니면 기존 행 단위 DELETE가 처리)
+  - rkyc_signal_index: SIGNAL_INDEX_RETENTION_MONTHS (0 = 무기한)
+    DETACH는 행 트리거를 거치지 않으므로 대시보드 카운터(v22) 차감 + 리포트 스냅샷(v23) 갱신을 먼저 수행
+- 분리 시 잠금은 조회와 같은 순서(부모 → 파티션)로 잡는다 - 반대 순서면 부모를 거쳐 파티션을 읽는
+  조회와 교착. DETACH ... CONCURRENTLY는 default 파티션이 있는 테이블에서 쓸 수 없으므로 사용하지 않고,
+  대신 LOCK_TIMEOUT_SECONDS 안에 잠금을 얻지 못하면 다음 실행으로 미룸 (대기 중인 ACCESS EXCLUSIVE
+  요청이 뒤따르는 조회를 막지 않도록)
+- 파티션 테이블이 아니면(migration 전) 모든 작업을 건너뜀
+
+Usage:
+    maintainer = get_partition_maintainer()
+    with get_sync_db() as db:
+        maintainer.run(db)                                   # Celery Beat (maintain_partitions)
+        maintainer.retire_expired(db, "rkyc_job", cutoff)    # cleanup_old_jobs
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, UTC
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# 파티션 테이블 → 파티션 키
+PARTITION_KEYS = {
+    "rkyc_job": "queued_at",
+    "rkyc_signal_index": "detected_at",
+}
+
+RETENTION_MODES = ("detach", "drop")
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+IS_PARTITIONED_SQL = """
+    SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))
+"""
+
+LIST_PARTITIONS_SQL = """
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass(:table)
+"""
+
+# 보존 대상이 아닌 행 (미완료 / cutoff 이후 종료) - cleanup_old_jobs 조건과 동일
+JOB_PARTITION_SQL = """
+    SELECT COUNT(*) AS total,
+           COUNT(*) FILTER (
+               WHERE status NOT IN ('DONE', 'FAILED') OR finished_at IS NULL OR finished_at >= :cutoff
+           ) AS kept
+    FROM {partition}
+"""
+
+# DETACH 전에 트리거(rkyc_dashboard_counter_on_index_delete)가 했을 차감을 한 번에 반영 (delta 행)
+SIGNAL_INDEX_COUNTER_SQL = """
+    SELECT rkyc_dashboard_counter_add(si.signal_type, si.impact_direction, s.signal_status, -COUNT(*))
+    FROM {partition} si
+    LEFT JOIN rkyc_signal s ON s.signal_id = si.signal_id
+    GROUP BY si.signal_type, si.impact_direction, s.signal_status
+"""
+
+SIGNAL_INDEX_SNAPSHOT_SQL = """
+    SELECT rkyc_report_snapshot_touch(corp_id)
+    FROM (SELECT DISTINCT corp_id FROM {partition}) c
+"""
+
+
+@dataclass
+class PartitionMaintenanceConfig:
+    """Partition maintenance configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    MONTHS_AHEAD: int = 3
+    SIGNAL_INDEX_RETENTION_MONTHS: int = 0  # 0 = 무기한 보존
+    RETENTION_MODE: str = "detach"  # detach | drop
+    LOCK_TIMEOUT_SECONDS: int = 5  # 분리 잠금 대기 상한 (초과 시 다음 실행에서 재시도)
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.PARTITION_MAINTENANCE_ENABLED
+            self.MONTHS_AHEAD = settings.PARTITION_MONTHS_AHEAD
+            self.SIGNAL_INDEX_RETENTION_MONTHS = settings.SIGNAL_INDEX_RETENTION_MONTHS
+            self.RETENTION_MODE = settings.PARTITION_RETENTION_MODE
+        except Exception as e:
+            logger.warning(f"Failed to load partition maintenance config from settings: {e}, using defaults")
+        if self.RETENTION_MODE not in RETENTION_MODES:
+            logger.warning(f"Unknown partition retention mode {self.RETENTION_MODE!r}, using 'detach'")
+            self.RETENTION_MODE = "detach"
+
+
+def month_start(value: datetime) -> date:
+    """UTC 기준 월 첫날"""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_month(name: str) -> Optional[date]:
+    """파티션 이름의 월 (rkyc_job_p202501 → 2025-01-01, default 파티션은 None)"""
+    match = _PARTITION_SUFFIX.search(name)
+    if not match:
+        return None
+    year, month = int(match.group(1)), int(match.group(2))
+    if not 1 <= month <= 12:
+        return None
+    return date(year, month, 1)
+
+
+def expired_partitions(names: list[str], cutoff: datetime) -> list[str]:
+    """월 전체가 cutoff 이전인 파티션 (오래된 순)"""
+    expired = []
+    for name in names:
+        month = partition_month(name)
+        if month is None:
+            continue
+        # 파티션 상한 = 다음 달 1일 00:00 UTC
+        upper = add_months(month, 1)
+        if datetime(upper.year, upper.month, 1, tzinfo=UTC) <= cutoff:
+            expired.append((month, name))
+    return [name for _, name in sorted(expired)]
+
+
+def _quote(name: str) -> str:
+    """카탈로그에서 읽은 파티션 이름만 SQL에 넣음 (형식 확인 후 인용)"""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Unexpected partition name: {name!r}")
+    return f'"{name}"'
+
+
+class PartitionMaintainer:
+    """월 파티션 생성 / 보존 기간 지난 파티션 분리"""
+
+    def __init__(self, config: Optional[PartitionMaintenanceConfig] = None):
+        self.config = config or PartitionMaintenanceConfig()
+        self._stats = {
+            "runs": 0,
+            "partitions_created": 0,
+            "partitions_retired": 0,
+            "rows_retired": 0,
+            "partitions_kept": 0,
+            "lock_timeouts": 0,
+        }
+
+    def is_partitioned(self, db, table: str) -> bool:
+        return bool(db.execute(text(IS_PARTITIONED_SQL), {"table": table}).scalar())
+
+    def list_partitions(self, db, table: str) -> list[str]:
+        """연결된 파티션 이름 (default 포함, 이름순)"""
+        return sorted(row[0] for row in db.execute(text(LIST_PARTITIONS_SQL), {"table": table}).fetchall())
+
+    def ensure_partitions(self, db, table: str, now: Optional[datetime] = None) -> int:
+        """이번 달 ~ MONTHS_AHEAD개월 뒤 파티션 보장 (새로 만든 수)"""
+        created = db.execute(
+            text("SELECT rkyc_ensure_monthly_partitions(:table, :key, :from_month, :months_ahead)"),
+            {
+                "table": table,
+                "key": PARTITION_KEYS[table],
+                "from_month": month_start(now or datetime.now(UTC)),
+                "months_ahead": self.config.MONTHS_AHEAD,
+            },
+        ).scalar() or 0
+        db.commit()
+        self._stats["partitions_created"] += created
+        if created:
+            logger.info(f"[Partitions] {table}: created {created} monthly partition(s)")
+        return created
+
+    def retire_partition(self, db, table: str, partition: str, cutoff: datetime) -> Optional[int]:
+        """
+        파티션 분리(DETACH) 또는 삭제(DROP)
+
+        Returns:
+            분리된 행 수, 보존해야 할 행이 있거나 잠금을 얻지 못해 건너뛰면 None
+        """
+        quoted = _quote(partition)
+        # 분리 전 새 행 유입/상태 변경 차단 - 조회와 같은 부모 → 파티션 순서 (LOCK TABLE은 나열 순서로 잠금)
+        db.execute(text(f"SET LOCAL lock_timeout = '{int(self.config.LOCK_TIMEOUT_SECONDS)}s'"))
+        try:
+            db.execute(text(f"LOCK TABLE {_quote(table)}, {quoted} IN ACCESS EXCLUSIVE MODE"))
+        except OperationalError as e:
+            db.rollback()
+            self._stats["lock_timeouts"] += 1
+            logger.warning(f"[Partitions] {partition}: lock not acquired, retrying next run: {e}")
+            return None
+
+        if table == "rkyc_job":
+            row = db.execute(text(JOB_PARTITION_SQL.format(partition=quoted)), {"cutoff": cutoff}).one()
+            if row.kept:
+                db.rollback()
+                self._stats["partitions_kept"] += 1
+                logger.info(f"[Partitions] {partition}: {row.kept} job(s) not expired, keeping partition")
+                return None
+            rows = row.total
+        else:
+            rows = db.execute(text(f"SELECT COUNT(*) FROM {quoted}")).scalar() or 0
+            db.execute(text(SIGNAL_INDEX_COUNTER_SQL.format(partition=quoted)))
+            db.execute(text(SIGNAL_INDEX_SNAPSHOT_SQL.format(partition=quoted)))
+
+        db.execute(text(f"ALTER TABLE {_quote(table)} DETACH PARTITION {quoted}"))
+        if self.config.RETENTION_MODE == "drop":
+            db.execute(text(f"DROP TABLE {quoted}"))
+        db.commit()
+
+        self._stats["partitions_retired"] += 1
+        self._stats["rows_retired"] += rows
+        logger.info(f"[Partitions] {partition}: {self.config.RETENTION_MODE} ({rows} rows)")
+        return rows
+
+    def retire_expired(self, db, table: str, cutoff: datetime) -> dict:
+        """월 전체가 cutoff 이전인 파티션 분리 (파티션 테이블이 아니면 건너뜀)"""
+        if not self.config.ENABLED or not self.is_partitioned(db, table):
+            return {"partitioned": False, "retired": [], "rows": 0}
+
+        retired, rows = [], 0
+        for partition in expired_partitions(self.list_partitions(db, table), cutoff):
+            count = self.retire_partition(db, table, partition, cutoff)
+            if count is not None:
+                retired.append(partition)
+                rows += count
+        return {"partitioned": True, "retired": retired, "rows": rows}
+
+    def run(self, db, now: Optional[datetime] = None) -> dict:
+        """미래 파티션 생성 + rkyc_signal_index 보존 기간 적용 (Celery Beat)"""
+        if not self.config.ENABLED:
+            return {"enabled": False}
+
+        now = now or datetime.now(UTC)
+        self._stats["runs"] += 1
+        result = {"enabled": True, "created": {}, "retired": {}}
+        for table in PARTITION_KEYS:
+            if not self.is_partitioned(db, table):
+                logger.info(f"[Partitions] {table} is not partitioned (migration_v25 not applied), skipping")
+                continue
+            result["created"][table] = self.ensure_partitions(db, table, now)
+
+        months = self.config.SIGNAL_INDEX_RETENTION_MONTHS
+        if months > 0:
+            cutoff_month = add_months(month_start(now), -months)
+            cutoff = datetime(cutoff_month.year, cutoff_month.month, 1, tzinfo=UTC)
+            result["retired"]["rkyc_signal_index"] = self.retire_expired(db, "rkyc_signal_index", cutoff)["retired"]
+        return result
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "months_ahead": self.config.MONTHS_AHEAD,
+            "signal_index_retention_months": self.config.SIGNAL_INDEX_RETENTION_MONTHS,
+            "retention_mode": self.config.RETENTION_MODE,
+        }
+
+
+_partition_maintainer: Optional[PartitionMaintainer] = None
+
+
+def get_partition_maintainer() -> PartitionMaintainer:
+    """Get singleton PartitionMaintainer instance"""
+    global _partition_maintainer
+    if _partition_maintainer is None:
+        _partition_maintainer = PartitionMaintainer()
+    return _partition_maintainer
+
+
+def reset_partition_maintainer() -> None:
+    """Reset singleton (for testing)"""
+    global _partition_maintainer
+    _partition_maintainer = None
@@ -10,7 +10,10 @@ Bank Interpretation Pipeline
 2026-02-09 MVP 구현
 """
 
+import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,6 +22,13 @@ from app.worker.llm.service import LLMService
 
 logger = logging.getLogger(__name__)
 
+# 배치 모드: 한 번의 LLM 호출에 묶는 최대 시그널 수 (K)
+BATCH_SIZE = 8
+# 배치 청크 동시 실행 수
+BATCH_MAX_CONCURRENCY = 2
+# 시그널당 응답 토큰 예산 (단건 호출 max_tokens=500 기준)
+TOKENS_PER_SIGNAL = 450
+
 
 # =============================================================================
 # Data Classes
@@ -191,6 +201,65 @@ JSON 형식으로 응답하세요.
     return prompt
 
 
+BANK_INTERPRETATION_BATCH_OUTPUT_FORMAT = """
+# 일괄 처리 출력 형식 (위 출력 형식 대신 사용)
+여러 시그널이 index와 함께 주어집니다. 각 시그널을 독립적으로 재해석하고,
+입력된 모든 index에 대해 하나씩 결과를 작성하세요.
+```json
+{
+  "results": [
+    {
+      "index": 0,
+      "interpretation": "당행 관점 해석 (2-3문장)",
+      "portfolio_impact": "HIGH|MED|LOW",
+      "recommended_action": "권고 조치 (1문장)",
+      "action_priority": "URGENT|NORMAL|LOW"
+    }
+  ]
+}
+```
+"""
+
+BANK_INTERPRETATION_BATCH_SYSTEM_PROMPT = (
+    BANK_INTERPRETATION_SYSTEM_PROMPT + BANK_INTERPRETATION_BATCH_OUTPUT_FORMAT
+)
+
+
+def build_bank_interpretation_batch_prompt(
+    signals: list[dict],
+    bank_context: BankContext,
+) -> str:
+    """여러 시그널을 공유 Bank Context와 함께 하나의 User Prompt로 생성"""
+
+    signal_blocks = []
+    for index, signal in enumerate(signals):
+        signal_blocks.append(
+            f"""## [index {index}]
+- 유형: {signal.get("signal_type", "")} / {signal.get("event_type", "")}
+- 영향: {signal.get("impact_direction", "")} ({signal.get("impact_strength", "")})
+- 제목: {signal.get("title", "")}
+- 요약: {signal.get("summary", "")}"""
+        )
+
+    signals_text = "\n\n".join(signal_blocks)
+
+    prompt = f"""# 시그널 목록 ({len(signals)}건)
+{signals_text}
+
+{bank_context.to_prompt_context()}
+
+# 요청
+위 시그널 각각을 당행 관점에서 재해석하세요.
+- 당행 여신 {bank_context._format_krw(bank_context.total_exposure_krw) if bank_context.total_exposure_krw else "정보 없음"}에 미치는 영향 분석
+- 담보 비율 {f"{bank_context.collateral_ratio_pct:.1f}%" if bank_context.collateral_ratio_pct else "정보 없음"} 고려
+- 내부 등급 {bank_context.internal_risk_grade or "정보 없음"} 기준 평가
+
+index 0부터 {len(signals) - 1}까지 모든 시그널에 대한 결과를 JSON 형식으로 응답하세요.
+"""
+
+    return prompt
+
+
 # =============================================================================
 # Service Class
 # =============================================================================
@@ -205,8 +274,14 @@ class BankInterpretationService:
     - 권고 조치만 (결정 사항 아님)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        batch_size: int = BATCH_SIZE,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ):
         self.llm = LLMService()
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
 
     def interpret(
         self,
@@ -225,11 +300,16 @@ class BankInterpretationService:
         Returns:
             BankInterpretation 또는 None (실패 시)
         """
-        try:
-            # 1. Bank Context 구축
-            bank_context = self._build_bank_context(signal, snapshot, corp_profile)
+        bank_context = self._build_bank_context(signal, snapshot, corp_profile)
+        return self._interpret_single(signal, bank_context)
 
-            # 2. LLM 호출
+    def _interpret_single(
+        self,
+        signal: dict,
+        bank_context: BankContext,
+    ) -> Optional[BankInterpretation]:
+        """단건 LLM 호출 (배치 파싱 실패 항목의 fallback 경로)"""
+        try:
             user_prompt = build_bank_interpretation_prompt(signal, bank_context)
 
             messages = [
@@ -243,7 +323,6 @@ class BankInterpretationService:
                 max_tokens=500,
             )
 
-            # 3. 응답 파싱
             interpretation = self._parse_response(response)
 
             if interpretation:
@@ -268,14 +347,83 @@ class BankInterpretationService:
         """
         여러 시그널 일괄 재해석
 
+        Bank Context는 한 번만 구축하고, 최대 batch_size개 시그널을 하나의
+        구조화 JSON 프롬프트로 묶어 호출합니다. 결과는 index로 매칭하며,
+        파싱에 실패한 항목만 단건 호출로 재시도합니다.
+
         Returns:
-            List of (signal, interpretation) tuples
+            List of (signal, interpretation) tuples (입력 순서 유지)
         """
-        results = []
+        if not signals:
+            return []
+
+        # 동일 기업 시그널이므로 Bank Context는 공유
+        try:
+            bank_context = self._build_bank_context(signals[0], snapshot or {}, corp_profile)
+        except Exception as e:
+            logger.error(f"[BankInterpretation] Failed to build bank context: {e}")
+            return [(signal, None) for signal in signals]
+
+        chunks = [
+            signals[i:i + self.batch_size]
+            for i in range(0, len(signals), self.batch_size)
+        ]
+
+        if len(chunks) > 1 and self.max_concurrency > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+                chunk_results = list(executor.map(
+                    lambda chunk: self._interpret_chunk(chunk, bank_context),
+                    chunks,
+                ))
+        else:
+            chunk_results = [self._interpret_chunk(chunk, bank_context) for chunk in chunks]
+
+        interpretations = [item for chunk in chunk_results for item in chunk]
+        return list(zip(signals, interpretations))
 
-        for signal in signals:
-            interpretation = self.interpret(signal, snapshot, corp_profile)
-            results.append((signal, interpretation))
+    def _interpret_chunk(
+        self,
+        signals: list[dict],
+        bank_context: BankContext,
+    ) -> list[Optional[BankInterpretation]]:
+        """시그널 청크를 한 번의 LLM 호출로 재해석, 실패 항목은 단건 fallback"""
+        if len(signals) == 1:
+            return [self._interpret_single(signals[0], bank_context)]
+
+        results: list[Optional[BankInterpretation]] = [None] * len(signals)
+
+        try:
+            user_prompt = build_bank_interpretation_batch_prompt(signals, bank_context)
+
+            messages = [
+                {"role": "system", "content": BANK_INTERPRETATION_BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ]
+
+            response = self.llm.call_with_fallback(
+                messages=messages,
+                temperature=0.3,  # 일관성 중시
+                max_tokens=TOKENS_PER_SIGNAL * len(signals) + 200,
+            )
+
+            results = self._parse_batch_response(response, len(signals))
+
+        except Exception as e:
+            logger.error(f"[BankInterpretation] Batch call failed ({len(signals)} signals): {e}")
+
+        failed = [i for i, result in enumerate(results) if result is None]
+        if failed:
+            logger.warning(
+                f"[BankInterpretation] Batch parse missed {len(failed)}/{len(signals)} "
+                f"signals, falling back to per-signal calls"
+            )
+            for i in failed:
+                results[i] = self._interpret_single(signals[i], bank_context)
+
+        logger.info(
+            f"[BankInterpretation] Batch generated for {bank_context.corp_name}: "
+            f"{len(signals) - len(failed)}/{len(signals)} from batch call"
+        )
 
         return results
 
@@ -320,9 +468,6 @@ class BankInterpretationService:
 
     def _parse_response(self, response: str) -> Optional[BankInterpretation]:
         """LLM 응답 파싱"""
-        import json
-        import re
-
         try:
             # JSON 블록 추출
             json_match = re.search(r'\{[\s\S]*\}', response)
@@ -331,36 +476,7 @@ class BankInterpretationService:
                 return None
 
             data = json.loads(json_match.group())
-
-            # 필수 필드 검증
-            interpretation = data.get("interpretation", "")
-            portfolio_impact = data.get("portfolio_impact", "MED")
-            recommended_action = data.get("recommended_action", "")
-            action_priority = data.get("action_priority", "NORMAL")
-
-            # Enum 검증
-            if portfolio_impact not in ("HIGH", "MED", "LOW"):
-                portfolio_impact = "MED"
-            if action_priority not in ("URGENT", "NORMAL", "LOW"):
-                action_priority = "NORMAL"
-
-            # 금지 표현 체크
-            forbidden = ["즉시 조치", "반드시", "확실히", "대출 회수", "여신 축소"]
-            for word in forbidden:
-                if word in interpretation or word in recommended_action:
-                    logger.warning(f"[BankInterpretation] Forbidden word detected: {word}")
-                    # 표현 완화
-                    interpretation = interpretation.replace(word, "검토 권고")
-                    recommended_action = recommended_action.replace(word, "검토 권고")
-
-            return BankInterpretation(
-                interpretation=interpretation,
-                portfolio_impact=portfolio_impact,
-                recommended_action=recommended_action,
-                action_priority=action_priority,
-                generated_at=datetime.utcnow(),
-                exposure_mentioned="여신" in interpretation or "노출" in interpretation,
-            )
+            return self._parse_item(data)
 
         except json.JSONDecodeError as e:
             logger.error(f"[BankInterpretation] JSON parse error: {e}")
@@ -369,6 +485,88 @@ class BankInterpretationService:
             logger.error(f"[BankInterpretation] Parse error: {e}")
             return None
 
+    def _parse_batch_response(
+        self,
+        response: str,
+        expected_count: int,
+    ) -> list[Optional[BankInterpretation]]:
+        """
+        배치 응답 파싱 (index 기준 매칭)
+
+        Returns:
+            expected_count 길이의 리스트 (파싱 실패 항목은 None)
+        """
+        results: list[Optional[BankInterpretation]] = [None] * expected_count
+
+        try:
+            json_match = re.search(r'[\{\[][\s\S]*[\}\]]', response)
+            if not json_match:
+                logger.warning("[BankInterpretation] No JSON found in batch response")
+                return results
+
+            data = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.error(f"[BankInterpretation] Batch JSON parse error: {e}")
+            return results
+
+        items = data.get("results", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return results
+
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+
+            index = item.get("index", position)
+            try:
+                index = int(index)
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < expected_count or results[index] is not None:
+                continue
+
+            try:
+                results[index] = self._parse_item(item)
+            except Exception as e:
+                logger.warning(f"[BankInterpretation] Batch item {index} parse error: {e}")
+
+        return results
+
+    def _parse_item(self, data: dict) -> Optional[BankInterpretation]:
+        """단일 해석 JSON 객체 검증 및 변환"""
+        # 필수 필드 검증
+        interpretation = data.get("interpretation", "")
+        portfolio_impact = data.get("portfolio_impact", "MED")
+        recommended_action = data.get("recommended_action", "")
+        action_priority = data.get("action_priority", "NORMAL")
+
+        if not interpretation:
+            return None
+
+        # Enum 검증
+        if portfolio_impact not in ("HIGH", "MED", "LOW"):
+            portfolio_impact = "MED"
+        if action_priority not in ("URGENT", "NORMAL", "LOW"):
+            action_priority = "NORMAL"
+
+        # 금지 표현 체크
+        forbidden = ["즉시 조치", "반드시", "확실히", "대출 회수", "여신 축소"]
+        for word in forbidden:
+            if word in interpretation or word in recommended_action:
+                logger.warning(f"[BankInterpretation] Forbidden word detected: {word}")
+                # 표현 완화
+                interpretation = interpretation.replace(word, "검토 권고")
+                recommended_action = recommended_action.replace(word, "검토 권고")
+
+        return BankInterpretation(
+            interpretation=interpretation,
+            portfolio_impact=portfolio_impact,
+            recommended_action=recommended_action,
+            action_priority=action_priority,
+            generated_at=datetime.utcnow(),
+            exposure_mentioned="여신" in interpretation or "노출" in interpretation,
+        )
+
 
 # =============================================================================
 # Pipeline Class
@@ -414,9 +612,10 @@ class BankInterpretationPipeline:
         enriched_signals = []
         success_count = 0
 
-        for signal in signals:
-            interpretation = self.service.interpret(signal, snapshot, corp_profile)
+        # 배치 모드: K개 시그널당 1회 LLM 호출
+        results = self.service.interpret_batch(signals, snapshot, corp_profile)
 
+        for signal, interpretation in results:
             if interpretation:
                 # 시그널에 은행 관점 해석 추가
                 signal["bank_interpretation"] = interpretation.interpretation
@@ -13,7 +13,7 @@ from typing import Optional
 from sqlalchemy import select
 
 from app.worker.db import get_sync_db
-from app.worker.llm.prompts import get_industry_name
+from app.worker.llm.industry_knowledge import get_industry_name
 from app.models.banking_data import BankingData
 
 logger = logging.getLogger(__name__)
@@ -30,12 +30,11 @@ import logging
 import hashlib
 import json
 import re
-import threading
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, UTC
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID, uuid4
 
 from app.core.config import settings
@@ -50,6 +49,20 @@ from app.worker.llm.key_rotator import get_key_rotator
 from app.worker.llm.validator import get_validator, ValidationResult
 from app.worker.llm.search_providers import get_multi_search_manager
 from app.worker.llm.fact_checker import get_fact_checker, FactCheckResult, FactCheckResponse
+from app.worker.llm.industry_knowledge import (
+    SEED_INDUSTRY_NAMES,
+    KnowledgeSource,
+    default_industry_hints,
+    get_industry_knowledge_store,
+    get_industry_name,
+)
+from app.worker.pipelines.profile_phase_cache import (
+    ALL_PHASES,
+    PhaseMemo,
+    ProfilePhase,
+    get_profile_phase_cache,
+    summary_phase,
+)
 
 # DART API for shareholder verification and Fact-based data (P0/P1/P4)
 from app.services.dart_api import (
@@ -1665,25 +1678,17 @@ class ProfileEvidenceCreator:
 # ============================================================================
 # Industry Master Helper
 # ============================================================================
+# 업종명/업종 힌트는 IndustryKnowledgeStore (Memory → Redis → DB) 에서 조회
+# INDUSTRY_NAMES는 seed 값 (하위 호환용 별칭)
 
-INDUSTRY_NAMES = {
-    "C10": "식료품 제조업",
-    "C21": "의약품 제조업",
-    "C26": "전자부품 제조업",
-    "C29": "기계 제조업",
-    "D35": "전기 가스 증기 공급업",
-    "F41": "건설업",
-}
-
-# 업종별 힌트 캐시 (메모리 캐시, 서버 재시작 시 초기화)
-# P1-4 Fix: Thread-safety를 위한 Lock 추가
-_industry_hints_cache: dict[str, dict] = {}
-_industry_hints_lock = threading.Lock()
+INDUSTRY_NAMES = SEED_INDUSTRY_NAMES
 
 
 def clear_industry_hints_cache(industry_code: str = None) -> int:
     """
-    업종 힌트 캐시 클리어.
+    업종 힌트 캐시 클리어 (Memory + Redis + DB 전 tier).
+
+    업종명/키워드는 유지하고 힌트만 비우므로 다음 조회 시 재생성된다.
 
     Args:
         industry_code: 특정 업종만 클리어 (None이면 전체 클리어)
@@ -1691,23 +1696,9 @@ def clear_industry_hints_cache(industry_code: str = None) -> int:
     Returns:
         클리어된 항목 수
     """
-    with _industry_hints_lock:
-        if industry_code:
-            if industry_code in _industry_hints_cache:
-                del _industry_hints_cache[industry_code]
-                logger.info(f"Cleared industry hints cache for {industry_code}")
-                return 1
-            return 0
-        else:
-            count = len(_industry_hints_cache)
-            _industry_hints_cache.clear()
-            logger.info(f"Cleared all industry hints cache ({count} items)")
-            return count
-
-
-def get_industry_name(industry_code: str) -> str:
-    """Get industry name from code."""
-    return INDUSTRY_NAMES.get(industry_code, f"업종코드 {industry_code}")
+    count = get_industry_knowledge_store().invalidate(industry_code)
+    logger.info(f"Cleared industry hints for {industry_code or 'ALL'} ({count} items)")
+    return count
 
 
 INDUSTRY_HINTS_PROMPT = """업종코드 {industry_code} ({industry_name})의 일반적인 특성을 분석하세요.
@@ -1732,71 +1723,66 @@ INDUSTRY_HINTS_PROMPT = """업종코드 {industry_code} ({industry_name})의 일
 """
 
 
+async def _generate_industry_hints(industry_code: str, industry_name: str, llm_service) -> dict:
+    """LLM으로 업종 힌트 생성 (실패 시 예외)"""
+    prompt = INDUSTRY_HINTS_PROMPT.format(
+        industry_code=industry_code,
+        industry_name=industry_name
+    )
+
+    response = await llm_service.generate(
+        prompt=prompt,
+        system_prompt="당신은 산업 분석 전문가입니다. JSON 형식으로만 응답하세요.",
+        temperature=0.3,
+    )
+
+    # JSON 파싱
+    json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+    if json_match:
+        return json.loads(json_match.group(1))
+    return json.loads(response)
+
+
 async def get_industry_hints(industry_code: str, llm_service=None) -> dict:
     """
-    업종 코드에 대한 힌트를 LLM으로 동적 생성 (캐싱 적용)
+    업종 코드에 대한 힌트 조회 (IndustryKnowledgeStore, 없으면 LLM으로 생성)
+
+    - 저장된 힌트가 최신이면 그대로 반환
+    - 저장된 LLM 힌트가 stale(이전 버전/오래됨)이면 그대로 반환하고 백그라운드 재생성
+    - 힌트가 없거나 seed 힌트뿐이면 LLM으로 생성 후 전 tier에 저장
 
     Args:
         industry_code: 업종 코드 (예: C26)
-        llm_service: LLM 서비스 인스턴스 (없으면 기본 힌트 반환)
+        llm_service: LLM 서비스 인스턴스 (없으면 저장된 힌트 또는 기본 힌트 반환)
 
     Returns:
         dict with typical_materials, typical_suppliers, export_markets, etc.
     """
-    # P1-4 Fix: Thread-safe 캐시 조회
-    with _industry_hints_lock:
-        if industry_code in _industry_hints_cache:
-            logger.debug(f"Industry hints cache hit for {industry_code}")
-            return _industry_hints_cache[industry_code]
+    store = get_industry_knowledge_store()
+    # Redis/DB 조회는 동기 I/O → 스레드에서 실행 (memory hit이면 즉시 반환)
+    entry = await asyncio.to_thread(store.resolve, industry_code)
 
-    industry_name = get_industry_name(industry_code)
+    if entry.hints is not None and not store.is_stale(entry):
+        logger.debug(f"Industry hints store hit for {industry_code}")
+        return entry.hints
 
-    # LLM 서비스가 없으면 기본 힌트 반환
+    # LLM 서비스가 없으면 저장된 힌트 또는 기본 힌트 반환
     if llm_service is None:
-        # 반도체 업종(C26)인 경우 특화된 힌트 제공
-        if industry_code == "C26":
-            default_hints = {
-                "typical_materials": ["금 (Au)", "은 (Ag)", "구리 (Cu)", "실리콘", "리드프레임"],
-                "typical_suppliers": ["다나까 금속 (Tanaka)", "헤라우스 그룹 (Heraeus)", "니폰 금속 (NIPPON)", "스미토모", "듀폰"],
-                "export_markets": ["중국", "미국", "대만", "베트남", "일본"],
-                "risk_factors": ["반도체 사이클", "미중 무역분쟁", "금 가격 변동"],
-                "growth_drivers": ["AI 수요", "전기차", "HBM"],
-            }
-        else:
-            default_hints = {
-                "typical_materials": ["원자재", "부품", "소재"],
-                "typical_suppliers": ["원자재 공급사", "부품 공급사", "장비 공급사"],
-                "export_markets": ["중국", "미국", "베트남", "일본", "유럽"],
-                "risk_factors": ["경기 변동", "환율 리스크", "공급망 리스크"],
-                "growth_drivers": ["기술 혁신", "시장 확대", "정부 정책"],
-            }
-        return default_hints
-
-    try:
-        # LLM으로 업종 힌트 생성
-        prompt = INDUSTRY_HINTS_PROMPT.format(
-            industry_code=industry_code,
-            industry_name=industry_name
-        )
-
-        response = await llm_service.generate(
-            prompt=prompt,
-            system_prompt="당신은 산업 분석 전문가입니다. JSON 형식으로만 응답하세요.",
-            temperature=0.3,
+        return entry.hints if entry.hints is not None else default_industry_hints(industry_code)
+
+    # Stale-while-revalidate: 이전에 생성된 힌트는 반환 + 백그라운드 재생성
+    # (seed 힌트뿐이면 아래에서 즉시 생성)
+    if entry.hints is not None and entry.source != KnowledgeSource.SEED:
+        store.schedule_refresh(
+            industry_code,
+            lambda: _generate_industry_hints(industry_code, entry.industry_name, llm_service),
         )
+        return entry.hints
 
-        # JSON 파싱
-        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-        if json_match:
-            hints = json.loads(json_match.group(1))
-        else:
-            hints = json.loads(response)
-
-        # P1-4 Fix: Thread-safe 캐시 저장
-        with _industry_hints_lock:
-            _industry_hints_cache[industry_code] = hints
-        logger.info(f"Generated and cached industry hints for {industry_code}")
-
+    try:
+        hints = await _generate_industry_hints(industry_code, entry.industry_name, llm_service)
+        await asyncio.to_thread(store.update_hints, industry_code, hints)
+        logger.info(f"Generated and stored industry hints for {industry_code}")
         return hints
 
     except Exception as e:
@@ -2077,6 +2063,7 @@ class CorpProfilingPipeline:
         llm_service=None,
         perplexity_api_key: Optional[str] = None,
         skip_cache: bool = False,
+        rerun_phases: Optional[Iterable[str]] = None,
     ) -> CorpProfileResult:
         """
         Execute corp profiling with full anti-hallucination pipeline
@@ -2090,10 +2077,18 @@ class CorpProfilingPipeline:
             llm_service: LLM 서비스 (옵션)
             perplexity_api_key: Perplexity API 키 (옵션)
             skip_cache: True면 캐시 무시하고 항상 새로 검색
+            rerun_phases: 항상 재실행할 phase (ProfilePhase). None이면 skip_cache 시 전체 재실행,
+                빈 값이면 만료/입력 변경된 phase만 재실행 후 재병합
         """
         logger.info(f"PROFILING stage starting for corp_id={corp_id}, skip_cache={skip_cache}")
 
-        industry_name = get_industry_name(industry_code)
+        # Phase memoization: 미만료 phase 결과 재사용
+        if rerun_phases is None:
+            rerun_phases = ALL_PHASES if skip_cache else ()
+        phase_memo = get_profile_phase_cache().memo(corp_id, rerun=rerun_phases)
+
+        # Redis/DB 조회는 동기 I/O → 스레드에서 실행
+        industry_name = await asyncio.to_thread(get_industry_name, industry_code)
         self._llm_service = llm_service
         self._db_session = db_session
         self._perplexity_api_key = perplexity_api_key
@@ -2155,11 +2150,11 @@ class CorpProfilingPipeline:
             lambda cn, ic: None  # P0-2: orchestrator 내부 캐시 조회 비활성화
         )
         self.orchestrator.set_perplexity_search(
-            lambda cn, ind: self._sync_perplexity_search(cn, ind, perplexity_api_key)
+            lambda cn, ind: self._sync_perplexity_search(cn, ind, perplexity_api_key, phase_memo)
         )
         self.orchestrator.set_claude_synthesis(
             lambda sources, corp_name, industry_name, industry_code, gemini_discrepancies: self._sync_claude_synthesis(
-                sources, corp_name, industry_name, industry_code, gemini_discrepancies, llm_service
+                sources, corp_name, industry_name, industry_code, gemini_discrepancies, llm_service, phase_memo
             )
         )
 
@@ -2207,9 +2202,15 @@ class CorpProfilingPipeline:
                 industry_code=industry_code,
                 existing_profile=existing_profile,
                 skip_cache=skip_cache,
+                phase_memo=phase_memo,
             )
         )
 
+        phase_report = phase_memo.report()
+        if phase_report and isinstance(orchestrator_result.provenance, dict):
+            orchestrator_result.provenance["phase_cache"] = phase_report
+            logger.info(f"[PhaseCache] {corp_id}: {phase_report}")
+
         # Build final profile with orchestrator result
         # P1: dart_fact_data 전달하여 DART Fact 데이터 우선 적용
         profile = self._build_final_profile(
@@ -2878,6 +2879,7 @@ class CorpProfilingPipeline:
         corp_name: str,
         industry_name: str,
         api_key: Optional[str],
+        phase_memo: Optional[PhaseMemo] = None,
     ) -> dict:
         """
         Sync wrapper for Perplexity search using 3-Phase strategy.
@@ -2886,6 +2888,9 @@ class CorpProfilingPipeline:
         - Phase 1: 기본 정보 + 재무
         - Phase 2: 해외 사업
         - Phase 3: 공급망 + 고객 + 경쟁사
+
+        phase_memo가 있으면 phase별 검색/요약 결과를 TTL 내에서 재사용
+        (검색은 쿼리 해시, 요약은 검색 본문 해시가 같을 때만).
         """
         import httpx
         import concurrent.futures
@@ -2939,13 +2944,24 @@ class CorpProfilingPipeline:
                 logger.error(f"{phase_name} search failed: {e}")
                 return phase_name, {"content": "", "citations": [], "error": str(e)}
 
+        def search_phase(phase_name: str, query: str) -> tuple[str, dict]:
+            if phase_memo is None:
+                return execute_single_query(phase_name, query)
+            result = phase_memo.get_or_compute(
+                phase_name,
+                query,
+                lambda: execute_single_query(phase_name, query)[1],
+                cacheable=lambda parsed: bool(parsed.get("content")) and not parsed.get("error"),
+            )
+            return phase_name, result
+
         # Execute 3 phases in parallel
         logger.info(f"Starting 3-Phase Perplexity search for {corp_name}")
         phase_results = {}
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
             futures = {
-                executor.submit(execute_single_query, phase, query): phase
+                executor.submit(search_phase, phase, query): phase
                 for phase, query in queries.items()
             }
 
@@ -2963,13 +2979,27 @@ class CorpProfilingPipeline:
             citations = parsed.get("citations", [])
 
             if content and self._llm_service:
-                try:
-                    summary = summarize_with_preservation(content, citations, self._llm_service)
-                    logger.info(f"{phase_name} summarization completed")
+                def summarize() -> Optional[dict]:
+                    try:
+                        summary = summarize_with_preservation(content, citations, self._llm_service)
+                        logger.info(f"{phase_name} summarization completed")
+                        return summary
+                    except Exception as e:
+                        logger.warning(f"{phase_name} summarization failed: {e}")
+                        return None
+
+                if phase_memo is None:
+                    summary = summarize()
+                else:
+                    summary = phase_memo.get_or_compute(
+                        summary_phase(phase_name),
+                        {"content": content, "citations": citations},
+                        summarize,
+                        cacheable=lambda result: result is not None,
+                    )
+                if summary is not None:
                     return phase_name, summary
-                except Exception as e:
-                    logger.warning(f"{phase_name} summarization failed: {e}")
-                    return phase_name, {"narrative": {"business_summary": content[:500]}}
+                return phase_name, {"narrative": {"business_summary": content[:500]}}
             else:
                 return phase_name, {"narrative": {"business_summary": content[:500] if content else ""}}
 
@@ -3346,8 +3376,14 @@ class CorpProfilingPipeline:
         industry_code: str,
         discrepancies: list[dict],
         llm_service,
+        phase_memo: Optional[PhaseMemo] = None,
     ) -> Optional[dict]:
-        """Sync wrapper for Claude synthesis (for orchestrator injection)."""
+        """
+        Sync wrapper for Claude synthesis (for orchestrator injection).
+
+        phase_memo가 있으면 합성 프롬프트가 같을 때(= 모든 입력 phase가 재사용됨)
+        이전 합성 결과를 재사용. Provenance 기록은 매번 수행.
+        """
         if not llm_service:
             return None
 
@@ -3363,10 +3399,21 @@ class CorpProfilingPipeline:
                 {"role": "user", "content": user_prompt},
             ]
 
-            result = llm_service.call_with_json_response(
-                messages=messages,
-                temperature=0.1,
-            )
+            def synthesize() -> dict:
+                return llm_service.call_with_json_response(
+                    messages=messages,
+                    temperature=0.1,
+                )
+
+            if phase_memo is None:
+                result = synthesize()
+            else:
+                result = phase_memo.get_or_compute(
+                    ProfilePhase.CONSENSUS,
+                    messages,
+                    synthesize,
+                    cacheable=lambda synthesized: isinstance(synthesized, dict) and bool(synthesized),
+                )
 
             # Track provenance
             extracted = {}
@@ -3,20 +3,23 @@ Document Ingest Pipeline Stage
 Stage 2: DOC_INGEST - PDF text parsing + regex + LLM fallback
 
 Processing approach:
-1. PDF text extraction using pdfplumber (fast, cheap)
+1. PDF text/table extraction via the shared extraction engine
+   (one read per PDF, per-page cache keyed by file_hash + page_no)
 2. Regex patterns for structured field extraction
 3. LLM fallback only for fields that regex fails to extract
 """
 
-import hashlib
+import json
 import logging
+import math
 import time
 from datetime import datetime, UTC
+from decimal import Decimal
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
 
 from app.worker.db import get_sync_db
 from app.worker.llm.service import LLMService
@@ -31,10 +34,15 @@ from app.worker.pipelines.doc_parsers import (
     ShareholdersParser,
     AoiParser,
     FinStatementParser,
+    get_extraction_engine,
 )
 
 logger = logging.getLogger(__name__)
 
+# rkyc_fact 컬럼 길이 (String(50) / String(100))
+FACT_TYPE_MAX_LENGTH = 50
+FIELD_KEY_MAX_LENGTH = 100
+
 
 class DocumentNotFoundError(Exception):
     """Raised when document is not found"""
@@ -46,6 +54,43 @@ class DocumentProcessingError(Exception):
     pass
 
 
+def _validate_fact_row(row: dict) -> Optional[str]:
+    """
+    Check (and normalize in place) a fact row before INSERT.
+
+    Returns:
+        Reason the row cannot be stored, or None
+    """
+    for key, max_length in (("fact_type", FACT_TYPE_MAX_LENGTH), ("field_key", FIELD_KEY_MAX_LENGTH)):
+        value = row.get(key)
+        if not isinstance(value, str) or not value:
+            return f"{key} is empty"
+        if len(value) > max_length:
+            return f"{key} longer than {max_length} characters"
+
+    # PostgreSQL text cannot contain NUL (common in PDF text extraction)
+    for key in ("field_value_text", "evidence_snippet"):
+        if isinstance(row.get(key), str):
+            row[key] = row[key].replace("\x00", "")
+
+    num = row.get("field_value_num")
+    if num is not None and isinstance(num, float) and not math.isfinite(num):
+        return f"field_value_num is not finite ({num})"
+
+    if row.get("field_value_json") is not None:
+        try:
+            json.dumps(row["field_value_json"])
+        except (TypeError, ValueError) as e:
+            return f"field_value_json is not JSON serializable ({e})"
+
+    try:
+        row["evidence_page_no"] = int(row["evidence_page_no"]) if row.get("evidence_page_no") is not None else None
+    except (TypeError, ValueError):
+        row["evidence_page_no"] = None
+
+    return None
+
+
 class DocIngestPipeline:
     """
     Stage 2: DOC_INGEST - PDF text parsing + regex + LLM fallback
@@ -60,7 +105,7 @@ class DocIngestPipeline:
     Processing flow (optimized for cost and speed):
     1. Query rkyc_document for corp_id's documents
     2. For each document with PENDING/FAILED status:
-       a. Extract text from PDF using pdfplumber
+       a. Extract text/tables from PDF (shared extraction engine)
        b. Apply regex patterns for structured extraction
        c. LLM fallback only for failed fields
        d. Save to rkyc_fact table
@@ -76,13 +121,16 @@ class DocIngestPipeline:
     def __init__(self):
         self.llm = LLMService()
 
+        # All parsers share one extraction engine (page cache + process pool)
+        self.extraction_engine = get_extraction_engine()
+
         # Document type to parser mapping
         self.parsers = {
-            DocType.BIZ_REG: BizRegParser(self.llm),
-            DocType.REGISTRY: RegistryParser(self.llm),
-            DocType.SHAREHOLDERS: ShareholdersParser(self.llm),
-            DocType.AOI: AoiParser(self.llm),
-            DocType.FIN_STATEMENT: FinStatementParser(self.llm),
+            DocType.BIZ_REG: BizRegParser(self.llm, self.extraction_engine),
+            DocType.REGISTRY: RegistryParser(self.llm, self.extraction_engine),
+            DocType.SHAREHOLDERS: ShareholdersParser(self.llm, self.extraction_engine),
+            DocType.AOI: AoiParser(self.llm, self.extraction_engine),
+            DocType.FIN_STATEMENT: FinStatementParser(self.llm, self.extraction_engine),
         }
 
     def execute(self, corp_id: str) -> dict:
@@ -125,20 +173,41 @@ class DocIngestPipeline:
 
             logger.info(f"Found {len(documents)} documents for corp_id={corp_id}")
 
+            # Documents that are DONE and unchanged on disk
+            unchanged = {
+                doc.doc_id for doc in documents
+                if doc.ingest_status == IngestStatus.DONE and not self._needs_reprocessing(doc)
+            }
+
+            # Single query for unchanged documents without a valid digest (legacy rows)
+            missing_digest = [
+                doc.doc_id for doc in documents
+                if doc.doc_id in unchanged and self._get_valid_digest(doc) is None
+            ]
+            facts_by_doc = self._get_existing_facts_bulk(db, missing_digest)
+
             for doc in documents:
                 # Skip already processed documents (unless re-processing is needed)
-                if doc.ingest_status == IngestStatus.DONE:
-                    # Check if file_hash changed (document updated)
-                    if not self._needs_reprocessing(doc):
-                        logger.debug(f"Skipping already processed doc {doc.doc_id}")
-                        # Still include in summaries if facts exist
-                        facts = self._get_existing_facts(db, doc.doc_id)
+                if doc.doc_id in unchanged:
+                    logger.debug(f"Skipping already processed doc {doc.doc_id}")
+                    digest = self._get_valid_digest(doc)
+                    if digest is None:
+                        facts = facts_by_doc.get(doc.doc_id, [])
+                        summary = self._facts_to_summary(facts)
                         if facts:
-                            result["doc_summaries"][doc.doc_type.value] = self._facts_to_summary(facts)
-                            # v2.1: 기존 facts도 결과에 포함 (context.py 연동)
-                            result["facts"].extend(facts)
-                            result["facts_extracted"] += len(facts)
-                        continue
+                            # Backfill digest so the next run skips the fact query
+                            self._store_digest(db, doc, doc.file_hash, facts, summary)
+                    else:
+                        facts = digest.get("facts", [])
+                        summary = digest.get("summary", {})
+
+                    # Still include in summaries if facts exist
+                    if facts:
+                        result["doc_summaries"][doc.doc_type.value] = summary
+                        # v2.1: 기존 facts도 결과에 포함 (context.py 연동)
+                        result["facts"].extend(facts)
+                        result["facts_extracted"] += len(facts)
+                    continue
 
                 try:
                     # Process document
@@ -149,8 +218,8 @@ class DocIngestPipeline:
                         result["documents_processed"] += 1
                         result["facts_extracted"] += len(extracted_facts)
                         result["facts"].extend(extracted_facts)  # v2.1: facts 리스트에 추가
-                        result["doc_summaries"][doc.doc_type.value] = self._facts_to_summary(
-                            extracted_facts
+                        result["doc_summaries"][doc.doc_type.value] = facts_data.get(
+                            "summary", self._facts_to_summary(extracted_facts)
                         )
 
                 except DocumentProcessingError as e:
@@ -205,16 +274,8 @@ class DocIngestPipeline:
         return False
 
     def _compute_file_hash(self, file_path: str) -> str:
-        """Compute SHA256 hash of file"""
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        sha256_hash = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        """Compute SHA256 hash of file (memoized by the extraction engine)"""
+        return self.extraction_engine.file_hash(file_path)
 
     def _process_document(self, db, doc: Document, corp_id: str) -> Optional[dict]:
         """
@@ -253,6 +314,7 @@ class DocIngestPipeline:
             # Parse and save facts
             facts = extraction_result.get("facts", [])
             saved_facts = self._save_facts(db, doc, corp_id, facts)
+            summary = self._facts_to_summary(saved_facts)
 
             # Update document status to DONE
             self._update_document_status(db, doc.doc_id, IngestStatus.DONE)
@@ -264,9 +326,14 @@ class DocIngestPipeline:
                 .values(last_ingested_at=datetime.now(UTC))
             )
 
+            # Store digest with the hash of the file that was actually parsed
+            file_hash = self._compute_file_hash(str(pdf_path))
+            self._store_digest(db, doc, file_hash, saved_facts, summary)
+
             return {
                 "doc_type": doc.doc_type.value,
                 "facts": saved_facts,
+                "summary": summary,
                 "extraction_time_ms": extraction_time_ms,
                 "extraction_method": "pdf_parser",
             }
@@ -325,7 +392,8 @@ class DocIngestPipeline:
             Fact.__table__.delete().where(Fact.doc_id == doc.doc_id)
         )
 
-        saved_facts = []
+        pending = []  # (row, saved fact dict)
+        extracted_at = datetime.now(UTC)
 
         for fact_data in facts:
             try:
@@ -351,39 +419,77 @@ class DocIngestPipeline:
                 else:
                     field_value_text = str(field_value) if field_value else None
 
-                # Create fact record
-                fact = Fact(
-                    fact_id=uuid4(),
-                    corp_id=corp_id,
-                    doc_id=doc.doc_id,
-                    doc_type=doc.doc_type,
-                    fact_type=fact_data.get("fact_type", "UNKNOWN"),
-                    field_key=fact_data.get("field_key", "unknown"),
-                    field_value_text=field_value_text,
-                    field_value_num=field_value_num,
-                    field_value_json=field_value_json,
-                    confidence=confidence,
-                    evidence_snippet=fact_data.get("evidence_snippet", "")[:400],
-                    evidence_page_no=fact_data.get("page_no", 1),
-                    extracted_by="vision-llm",
-                    extracted_at=datetime.now(UTC),
-                )
-                db.add(fact)
-
-                saved_facts.append({
-                    "fact_type": fact.fact_type,
-                    "field_key": fact.field_key,
+                fact_type = fact_data.get("fact_type", "UNKNOWN")
+                field_key = fact_data.get("field_key", "unknown")
+
+                row = {
+                    "fact_id": uuid4(),
+                    "corp_id": corp_id,
+                    "doc_id": doc.doc_id,
+                    "doc_type": doc.doc_type,
+                    "fact_type": fact_type,
+                    "field_key": field_key,
+                    "field_value_text": field_value_text,
+                    "field_value_num": field_value_num,
+                    "field_value_json": field_value_json,
+                    "confidence": confidence,
+                    "evidence_snippet": (fact_data.get("evidence_snippet") or "")[:400],
+                    "evidence_page_no": fact_data.get("page_no", 1),
+                    "extracted_by": "vision-llm",
+                    "extracted_at": extracted_at,
+                }
+                error = _validate_fact_row(row)
+                if error:
+                    logger.warning(f"Skipping invalid fact {fact_type}/{field_key} for document {doc.doc_id}: {error}")
+                    continue
+
+                pending.append((row, {
+                    "fact_type": fact_type,
+                    "field_key": field_key,
                     "field_value": field_value,
                     "confidence": confidence.value,
-                })
+                }))
 
             except Exception as e:
                 logger.error(f"Failed to save fact: {e}")
                 continue
 
+        saved_facts = self._insert_fact_rows(db, doc, pending)
+
         logger.info(f"Saved {len(saved_facts)} facts for document {doc.doc_id}")
         return saved_facts
 
+    def _insert_fact_rows(self, db, doc: Document, pending: list[tuple[dict, dict]]) -> list[dict]:
+        """
+        Insert validated fact rows.
+
+        Single executemany INSERT inside a SAVEPOINT; if the database still
+        rejects it, retry row by row so one bad fact does not fail the whole
+        document.
+
+        Returns:
+            Saved fact dicts for the rows that were inserted
+        """
+        if not pending:
+            return []
+
+        try:
+            with db.begin_nested():
+                db.execute(insert(Fact), [row for row, _ in pending])
+            return [saved for _, saved in pending]
+        except Exception as e:
+            logger.warning(f"Bulk fact insert failed for document {doc.doc_id}, retrying per row: {e}")
+
+        saved_facts = []
+        for row, saved in pending:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Fact), [row])
+                saved_facts.append(saved)
+            except Exception as e:
+                logger.error(f"Failed to save fact {row['fact_type']}/{row['field_key']}: {e}")
+        return saved_facts
+
     def _update_document_status(self, db, doc_id, status: IngestStatus):
         """Update document ingest status"""
         db.execute(
@@ -392,21 +498,69 @@ class DocIngestPipeline:
             .values(ingest_status=status)
         )
 
-    def _get_existing_facts(self, db, doc_id) -> list[dict]:
-        """Get existing facts for a document"""
+    def _get_existing_facts_bulk(self, db, doc_ids: list) -> dict:
+        """
+        Get existing facts for several documents in a single query.
+
+        Returns:
+            dict: {doc_id: [fact dicts]}
+        """
+        if not doc_ids:
+            return {}
+
         facts = db.execute(
-            select(Fact).where(Fact.doc_id == doc_id)
+            select(Fact).where(Fact.doc_id.in_(doc_ids))
         ).scalars().all()
 
-        return [
-            {
+        facts_by_doc: dict = {}
+        for f in facts:
+            field_value = f.field_value_text or f.field_value_num or f.field_value_json
+            if isinstance(field_value, Decimal):
+                field_value = float(field_value)
+
+            facts_by_doc.setdefault(f.doc_id, []).append({
                 "fact_type": f.fact_type,
                 "field_key": f.field_key,
-                "field_value": f.field_value_text or f.field_value_num or f.field_value_json,
+                "field_value": field_value,
                 "confidence": f.confidence.value if f.confidence else "MED",
-            }
-            for f in facts
-        ]
+            })
+
+        return facts_by_doc
+
+    def _get_valid_digest(self, doc: Document) -> Optional[dict]:
+        """Return the stored fact digest if it was built from the current file_hash"""
+        digest = doc.fact_digest
+        if not isinstance(digest, dict) or not doc.file_hash:
+            return None
+        if digest.get("file_hash") != doc.file_hash:
+            return None
+        return digest
+
+    def _store_digest(
+        self,
+        db,
+        doc: Document,
+        file_hash: str,
+        facts: list[dict],
+        summary: dict,
+    ) -> None:
+        """
+        Store the fact digest (and the parsed file's hash) on the document row.
+
+        The digest is only trusted while rkyc_document.file_hash matches,
+        so updating both together keeps change detection consistent.
+        """
+        digest = {
+            "file_hash": file_hash,
+            "facts": facts,
+            "summary": summary,
+            "generated_at": datetime.now(UTC).isoformat(),
+        }
+        db.execute(
+            update(Document)
+            .where(Document.doc_id == doc.doc_id)
+            .values(file_hash=file_hash, fact_digest=digest)
+        )
 
     def _facts_to_summary(self, facts: list[dict]) -> dict:
         """
@@ -425,6 +579,79 @@ class DocIngestPipeline:
 
         return summary
 
+    def process_uploaded_document(self, doc_id, progress_every: int = 5) -> dict:
+        """
+        Process a freshly uploaded document page by page (streaming upload path).
+
+        Each extracted page is recorded in rkyc_document_page (committed every
+        `progress_every` pages), so GET /documents/{doc_id}/status can report
+        per-page progress while parsing is still running. The parser then runs
+        on the cached pages and facts are saved as in execute().
+
+        Args:
+            doc_id: Document ID (already stored on disk and registered)
+            progress_every: Pages per progress commit
+
+        Returns:
+            dict with extracted facts (same shape as _process_document)
+        """
+        with get_sync_db() as db:
+            doc = db.execute(
+                select(Document).where(Document.doc_id == doc_id)
+            ).scalar_one_or_none()
+
+            if not doc:
+                raise DocumentNotFoundError(f"Document {doc_id} not found")
+
+            if not doc.storage_path or not Path(doc.storage_path).exists():
+                self._update_document_status(db, doc.doc_id, IngestStatus.FAILED)
+                db.commit()
+                raise DocumentProcessingError(f"PDF file not found: {doc.storage_path}")
+
+            self._update_document_status(db, doc.doc_id, IngestStatus.RUNNING)
+            db.execute(
+                DocumentPage.__table__.delete().where(DocumentPage.doc_id == doc.doc_id)
+            )
+            db.commit()
+
+            pending_pages: list[DocumentPage] = []
+
+            def flush_pages(page_count: int) -> None:
+                db.add_all(pending_pages)
+                db.execute(
+                    update(Document)
+                    .where(Document.doc_id == doc.doc_id)
+                    .values(page_count=page_count)
+                )
+                db.commit()
+                pending_pages.clear()
+
+            def on_page(page, page_count: int) -> None:
+                pending_pages.append(DocumentPage(
+                    page_id=uuid4(),
+                    doc_id=doc.doc_id,
+                    page_no=page.page_no,
+                    width=page.width,
+                    height=page.height,
+                ))
+                if len(pending_pages) >= progress_every:
+                    flush_pages(page_count)
+
+            try:
+                document = self.extraction_engine.extract(doc.storage_path, on_page=on_page)
+                flush_pages(document.page_count)
+
+                facts_data = self._process_document(db, doc, doc.corp_id)
+                db.commit()
+                return facts_data
+
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Streaming ingest failed for document {doc_id}: {e}")
+                self._update_document_status(db, doc.doc_id, IngestStatus.FAILED)
+                db.commit()
+                raise
+
     def process_single_document(
         self,
         corp_id: str,
@@ -4,6 +4,13 @@ PDF text parsing + regex + LLM fallback for KYC documents
 """
 
 from .base import BaseDocParser
+from .extraction import (
+    PdfExtractionEngine,
+    ExtractedDocument,
+    PageContent,
+    get_extraction_engine,
+    reset_extraction_engine,
+)
 from .biz_reg_parser import BizRegParser
 from .registry_parser import RegistryParser
 from .shareholders_parser import ShareholdersParser
@@ -12,6 +19,11 @@ from .fin_statement_parser import FinStatementParser
 
 __all__ = [
     "BaseDocParser",
+    "PdfExtractionEngine",
+    "ExtractedDocument",
+    "PageContent",
+    "get_extraction_engine",
+    "reset_extraction_engine",
     "BizRegParser",
     "RegistryParser",
     "ShareholdersParser",
@@ -7,10 +7,9 @@ import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Optional
 
-import pdfplumber
+from .extraction import ExtractedDocument, PdfExtractionEngine, get_extraction_engine
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +19,7 @@ class BaseDocParser(ABC):
     Base class for document parsers.
 
     Processing flow:
-    1. Extract text from PDF using pdfplumber
+    1. Extract text/tables from PDF via the shared extraction engine
     2. Apply regex patterns to extract structured data
     3. For failed fields, fall back to LLM extraction
     4. Return structured facts
@@ -28,14 +27,35 @@ class BaseDocParser(ABC):
 
     DOC_TYPE: str = "UNKNOWN"
 
-    def __init__(self, llm_service=None):
+    def __init__(
+        self,
+        llm_service=None,
+        extraction_engine: Optional[PdfExtractionEngine] = None,
+    ):
         """
         Initialize parser with optional LLM service for fallback.
 
         Args:
             llm_service: LLMService instance for fallback extraction
+            extraction_engine: Shared PDF extraction engine (default: singleton)
         """
         self.llm = llm_service
+        self.extraction_engine = extraction_engine or get_extraction_engine()
+
+    def extract_document(self, pdf_path: str) -> ExtractedDocument:
+        """
+        Extract all pages (text + tables) via the shared extraction engine.
+
+        The PDF is opened once and page results are cached by
+        (file_hash, page_no), so text and table access share one read.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            ExtractedDocument: Per-page text and tables
+        """
+        return self.extraction_engine.extract(pdf_path)
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -47,23 +67,14 @@ class BaseDocParser(ABC):
         Returns:
             str: Extracted text content
         """
-        text_content = []
-        path = Path(pdf_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
         try:
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
-
-            full_text = "\n".join(text_content)
+            full_text = self.extract_document(pdf_path).text
             logger.debug(f"Extracted {len(full_text)} characters from {pdf_path}")
             return full_text
 
+        except FileNotFoundError:
+            raise
+
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {e}")
             raise
@@ -78,22 +89,14 @@ class BaseDocParser(ABC):
         Returns:
             list[list]: List of tables (each table is a list of rows)
         """
-        tables = []
-        path = Path(pdf_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
         try:
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        tables.extend(page_tables)
-
+            tables = self.extract_document(pdf_path).tables
             logger.debug(f"Extracted {len(tables)} tables from {pdf_path}")
             return tables
 
+        except FileNotFoundError:
+            raise
+
         except Exception as e:
             logger.error(f"Failed to extract tables from PDF: {e}")
             return []
@@ -0,0 +1,388 @@
+"""
+PDF Extraction Engine
+페이지 단위 텍스트/테이블 추출 + 페이지 캐시
+
+Processing flow:
+1. Hash the file (SHA256, memoized by path/mtime/size)
+2. Look up per-page results cached under (file_hash, page_no)
+3. Extract only missing pages - text and tables in a single pass per page
+4. Large PDFs are split into contiguous page ranges and extracted in a
+   process pool (each worker opens the PDF once for its range)
+
+All doc parsers share one engine, so a parser that needs both text and
+tables (FIN_STATEMENT, SHAREHOLDERS) reads the PDF only once.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PageContent:
+    """Extraction result for a single PDF page"""
+    page_no: int  # 1-based
+    text: str = ""
+    tables: list[list] = field(default_factory=list)
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+
+@dataclass
+class ExtractedDocument:
+    """All pages of a PDF, in page order"""
+    file_hash: str
+    pages: list[PageContent]
+    cached_pages: int = 0
+    extraction_time_ms: int = 0
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def text(self) -> str:
+        """Full text (same format as the legacy extract_text_from_pdf)"""
+        return "\n".join(page.text for page in self.pages if page.text)
+
+    @property
+    def tables(self) -> list[list]:
+        """All tables flattened in page order"""
+        tables = []
+        for page in self.pages:
+            tables.extend(page.tables)
+        return tables
+
+
+# (page_no, text, tables, width, height)
+PageTuple = tuple[int, str, list, Optional[int], Optional[int]]
+
+# Progress callback: (page, page_count)
+PageCallback = Callable[[PageContent, int], None]
+
+
+def _iter_pages(pdf_path: str, page_numbers: list[int]) -> Iterator[PageTuple]:
+    """Extract text and tables page by page, opening the PDF once"""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_no in page_numbers:
+            page = pdf.pages[page_no - 1]
+            text = page.extract_text() or ""
+            try:
+                tables = page.extract_tables() or []
+            except Exception as e:
+                logger.warning(f"Table extraction failed on page {page_no}: {e}")
+                tables = []
+            yield page_no, text, tables, int(page.width), int(page.height)
+
+
+def _extract_pages(pdf_path: str, page_numbers: list[int]) -> list[PageTuple]:
+    """
+    Extract a page range in one call.
+
+    Module-level so it can be pickled into a process pool worker.
+    """
+    return list(_iter_pages(pdf_path, page_numbers))
+
+
+class PdfExtractionEngine:
+    """
+    Shared PDF extraction engine with per-page result caching.
+
+    Cache:
+    - Key: (file_hash, page_no)
+    - Memory LRU bounded by page count (per worker process)
+    - Content-addressed, so a changed file never hits stale pages
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_min_pages: int = 20,
+        cache_max_pages: int = 2000,
+    ):
+        """
+        Args:
+            max_workers: Process pool size (default: min(4, cpu_count))
+            parallel_min_pages: Minimum page count for process pool extraction
+            cache_max_pages: Maximum number of cached pages
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.parallel_min_pages = parallel_min_pages
+        self.cache_max_pages = cache_max_pages
+
+        self._page_cache: OrderedDict[tuple[str, int], PageContent] = OrderedDict()
+        self._page_counts: dict[str, int] = {}
+        self._hash_memo: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_disabled = False
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def extract(
+        self,
+        pdf_path: str,
+        on_page: Optional[PageCallback] = None,
+    ) -> ExtractedDocument:
+        """
+        Extract all pages of a PDF (text + tables), using cached pages when possible.
+
+        Args:
+            pdf_path: Path to PDF file
+            on_page: Optional callback invoked as each page becomes available
+                (cached pages first, then extracted pages in completion order)
+
+        Returns:
+            ExtractedDocument
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(pdf_path)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        start_time = time.time()
+        file_hash = self.file_hash(str(path))
+
+        with self._lock:
+            page_count = self._page_counts.get(file_hash)
+
+        if page_count is None:
+            with pdfplumber.open(path) as pdf:
+                page_count = len(pdf.pages)
+            with self._lock:
+                self._page_counts[file_hash] = page_count
+
+        pages, missing = self._get_cached_pages(file_hash, page_count)
+        cached_count = page_count - len(missing)
+
+        if on_page:
+            for page in pages:
+                if page is not None:
+                    on_page(page, page_count)
+
+        if missing:
+            for page_no, text, tables, width, height in self._extract_missing(str(path), missing):
+                page = PageContent(
+                    page_no=page_no, text=text, tables=tables, width=width, height=height
+                )
+                pages[page_no - 1] = page
+                self._cache_page(file_hash, page)
+                if on_page:
+                    on_page(page, page_count)
+
+        extraction_time_ms = int((time.time() - start_time) * 1000)
+        logger.debug(
+            f"Extracted {page_count} pages from {pdf_path} "
+            f"(cached={cached_count}, extracted={len(missing)}, {extraction_time_ms}ms)"
+        )
+
+        return ExtractedDocument(
+            file_hash=file_hash,
+            pages=pages,
+            cached_pages=cached_count,
+            extraction_time_ms=extraction_time_ms,
+        )
+
+    def file_hash(self, file_path: str) -> str:
+        """
+        Compute SHA256 of a file, memoized by (path, mtime, size).
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        stat = path.stat()
+        memo_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._hash_memo.get(memo_key)
+        if cached:
+            return cached
+
+        sha256_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                sha256_hash.update(chunk)
+        digest = sha256_hash.hexdigest()
+
+        with self._lock:
+            if len(self._hash_memo) >= self.cache_max_pages:
+                self._hash_memo.clear()
+            self._hash_memo[memo_key] = digest
+        return digest
+
+    def remember_hash(self, file_path: str, file_hash: str) -> None:
+        """Seed the hash memo with a hash computed elsewhere (e.g. while streaming an upload)"""
+        path = Path(file_path)
+        stat = path.stat()
+        with self._lock:
+            self._hash_memo[(str(path.resolve()), stat.st_mtime_ns, stat.st_size)] = file_hash
+
+    def invalidate(self, file_hash: str) -> int:
+        """Drop all cached pages for a file hash. Returns number of pages removed."""
+        with self._lock:
+            keys = [key for key in self._page_cache if key[0] == file_hash]
+            for key in keys:
+                del self._page_cache[key]
+            self._page_counts.pop(file_hash, None)
+        return len(keys)
+
+    def clear_cache(self) -> None:
+        """Clear all cached pages and hashes"""
+        with self._lock:
+            self._page_cache.clear()
+            self._page_counts.clear()
+            self._hash_memo.clear()
+
+    def get_stats(self) -> dict:
+        """Cache statistics"""
+        with self._lock:
+            return {
+                "cached_pages": len(self._page_cache),
+                "cached_files": len(self._page_counts),
+                "cache_max_pages": self.cache_max_pages,
+                "max_workers": self.max_workers,
+                "pool_active": self._pool is not None,
+            }
+
+    def shutdown(self) -> None:
+        """Shut down the process pool (if started)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # =========================================================================
+    # Internal
+    # =========================================================================
+
+    def _get_cached_pages(
+        self, file_hash: str, page_count: int
+    ) -> tuple[list[Optional[PageContent]], list[int]]:
+        """Return (pages with None for misses, missing page numbers)"""
+        pages: list[Optional[PageContent]] = [None] * page_count
+        missing = []
+        with self._lock:
+            for page_no in range(1, page_count + 1):
+                key = (file_hash, page_no)
+                page = self._page_cache.get(key)
+                if page is None:
+                    missing.append(page_no)
+                else:
+                    self._page_cache.move_to_end(key)
+                    pages[page_no - 1] = page
+        return pages, missing
+
+    def _cache_page(self, file_hash: str, page: PageContent) -> None:
+        key = (file_hash, page.page_no)
+        with self._lock:
+            self._page_cache[key] = page
+            self._page_cache.move_to_end(key)
+            while len(self._page_cache) > self.cache_max_pages:
+                self._page_cache.popitem(last=False)
+
+    def _extract_missing(self, pdf_path: str, page_numbers: list[int]) -> Iterator[PageTuple]:
+        """Yield pages serially or from the process pool depending on size"""
+        pool = None
+        if len(page_numbers) >= self.parallel_min_pages and self.max_workers > 1:
+            pool = self._get_pool()
+
+        if pool is None:
+            yield from _iter_pages(pdf_path, page_numbers)
+            return
+
+        # Contiguous ranges keep each worker's page reads local
+        chunk_size = -(-len(page_numbers) // self.max_workers)
+        chunks = [
+            page_numbers[i:i + chunk_size]
+            for i in range(0, len(page_numbers), chunk_size)
+        ]
+
+        try:
+            futures = [pool.submit(_extract_pages, pdf_path, chunk) for chunk in chunks]
+        except Exception as e:
+            # Worker processes are spawned on the first submit(); a spawn failure (daemonic Celery
+            # child: AssertionError, fork limits: OSError) repeats for every pool, so stop using it.
+            # BrokenProcessPool means an earlier worker died - a new pool may still work.
+            if not isinstance(e, BrokenProcessPool):
+                self._pool_disabled = True
+            logger.warning(f"Process pool unavailable, using serial extraction: {e}")
+            self.shutdown()
+            yield from _iter_pages(pdf_path, page_numbers)
+            return
+
+        done: set[int] = set()
+        try:
+            for future in as_completed(futures):
+                for result in future.result():
+                    done.add(result[0])
+                    yield result
+        except Exception as e:
+            # Broken pool (e.g. worker killed) - fall back to in-process extraction
+            logger.warning(f"Process pool extraction failed, falling back to serial: {e}")
+            self.shutdown()
+            remaining = [page_no for page_no in page_numbers if page_no not in done]
+            yield from _iter_pages(pdf_path, remaining)
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the process pool; disabled once the host process fails to spawn children"""
+        if self._pool_disabled:
+            return None
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            except Exception as e:
+                # Construction only validates arguments / creates the call queue; spawn failures
+                # (e.g. daemonic Celery children) surface on the first submit() in _extract_missing
+                logger.warning(f"Process pool unavailable, using serial extraction: {e}")
+                self._pool_disabled = True
+                return None
+        return self._pool
+
+
+# Singleton instance
+_engine_instance: Optional[PdfExtractionEngine] = None
+
+
+def get_extraction_engine() -> PdfExtractionEngine:
+    """Get singleton extraction engine (configured from settings)"""
+    global _engine_instance
+    if _engine_instance is None:
+        try:
+            from app.core.config import settings
+            _engine_instance = PdfExtractionEngine(
+                max_workers=settings.DOC_EXTRACTION_MAX_WORKERS or None,
+                parallel_min_pages=settings.DOC_EXTRACTION_PARALLEL_MIN_PAGES,
+                cache_max_pages=settings.DOC_EXTRACTION_CACHE_MAX_PAGES,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load extraction config from settings: {e}, using defaults")
+            _engine_instance = PdfExtractionEngine()
+    return _engine_instance
+
+
+def reset_extraction_engine() -> None:
+    """Reset singleton engine (for testing)"""
+    global _engine_instance
+    if _engine_instance:
+        _engine_instance.shutdown()
+    _engine_instance = None
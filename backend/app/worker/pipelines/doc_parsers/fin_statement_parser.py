@@ -84,15 +84,16 @@ class FinStatementParser(BaseDocParser):
         """
         logger.info(f"Parsing financial statement: {pdf_path}")
 
-        # Step 1: Extract text from PDF
-        text = self.extract_text_from_pdf(pdf_path)
+        # Step 1: Extract text and tables from PDF (single read)
+        document = self.extract_document(pdf_path)
+        text = document.text
 
         if not text.strip():
             logger.warning("Empty text extracted from PDF")
             return {"facts": [], "raw_text": ""}
 
         # Step 2: Try to extract from tables first
-        tables = self.extract_tables_from_pdf(pdf_path)
+        tables = document.tables
         table_results = self._parse_financial_tables(tables)
 
         # Step 3: Apply regex patterns
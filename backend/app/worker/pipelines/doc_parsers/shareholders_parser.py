@@ -59,15 +59,16 @@ class ShareholdersParser(BaseDocParser):
         """
         logger.info(f"Parsing shareholder registry: {pdf_path}")
 
-        # Step 1: Extract text from PDF
-        text = self.extract_text_from_pdf(pdf_path)
+        # Step 1: Extract text and tables from PDF (single read)
+        document = self.extract_document(pdf_path)
+        text = document.text
 
         if not text.strip():
             logger.warning("Empty text extracted from PDF")
             return {"facts": [], "raw_text": ""}
 
         # Step 2: Try to extract table data
-        tables = self.extract_tables_from_pdf(pdf_path)
+        tables = document.tables
         shareholders = self._parse_shareholder_table(tables)
 
         # Step 3: Apply regex patterns
@@ -31,6 +31,7 @@ Buffett Enhancement (2026-02-08):
 """
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import time
@@ -41,8 +42,15 @@ from typing import Optional
 import httpx
 
 from app.core.config import settings
+from app.worker.async_runtime import get_async_http_client, run_async
 from app.worker.llm.key_rotator import get_key_rotator
 from app.worker.llm.fact_checker import get_fact_checker, FactCheckResult
+from app.worker.llm.industry_knowledge import (
+    SEED_INDUSTRY_KEYWORDS,
+    get_industry_keywords,
+    get_industry_name,
+)
+from app.worker.llm.search_cache import SearchScope, get_search_cache
 
 # DART API for Fact-based verification context
 try:
@@ -59,6 +67,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class ExternalSearchError(Exception):
+    """Perplexity 호출 실패 (HTTP 오류/네트워크 등) - 검색 결과 없음(NOT_FOUND)과 구분, 캐시하지 않음"""
+
+
+class ExternalSearchTimeout(ExternalSearchError, TimeoutError):
+    """Perplexity 호출 타임아웃"""
+
+
 # =============================================================================
 # DART Context for LLM Verification
 # =============================================================================
@@ -208,45 +224,9 @@ PRIORITY_SOURCES = {
 # Industry-Specific Keywords
 # =============================================================================
 
-INDUSTRY_KEYWORDS = {
-    "C10": {  # 식품제조업
-        "supply_chain": ["농산물", "원료", "식자재", "수입", "가격"],
-        "regulation": ["식약처", "HACCP", "위생", "표시제", "영양성분"],
-        "market": ["소비자", "유통", "마트", "편의점", "프랜차이즈"],
-    },
-    "C21": {  # 의약품제조업
-        "supply_chain": ["원료의약품", "API", "바이오", "CMO", "CDMO"],
-        "regulation": ["식약처", "FDA", "EMA", "임상시험", "허가", "약가"],
-        "market": ["신약", "제네릭", "바이오시밀러", "건강보험", "급여"],
-    },
-    "C26": {  # 전자부품제조업
-        "supply_chain": ["반도체", "디스플레이", "배터리", "소재", "장비"],
-        "regulation": ["수출규제", "기술이전", "IRA", "CHIPS법", "탄소중립"],
-        "market": ["AI", "HBM", "전기차", "스마트폰", "데이터센터"],
-    },
-    "C29": {  # 기계장비제조업
-        "supply_chain": ["철강", "알루미늄", "유압", "베어링", "모터"],
-        "regulation": ["안전인증", "환경규제", "탄소세", "에너지효율"],
-        "market": ["자동화", "로봇", "스마트공장", "수주", "플랜트"],
-    },
-    "D35": {  # 전기업
-        "supply_chain": ["연료", "LNG", "석탄", "재생에너지", "ESS"],
-        "regulation": ["전기요금", "RPS", "RE100", "탄소배출권", "원전"],
-        "market": ["전력수요", "피크", "계통", "송전", "배전"],
-    },
-    "F41": {  # 건설업
-        "supply_chain": ["시멘트", "레미콘", "철근", "인건비", "자재"],
-        "regulation": ["분양가상한제", "재건축", "인허가", "안전점검"],
-        "market": ["분양", "미분양", "PF", "부동산", "금리"],
-    },
-}
-
-# Default keywords for industries not in the map
-DEFAULT_INDUSTRY_KEYWORDS = {
-    "supply_chain": ["원자재", "부품", "조달", "물류", "재고"],
-    "regulation": ["규제", "인허가", "정책", "법률", "감독"],
-    "market": ["수요", "경쟁", "시장점유율", "가격", "고객"],
-}
+# 업종별 키워드는 IndustryKnowledgeStore (Memory → Redis → DB) 에서 조회
+# 아래는 seed 값 (하위 호환용 별칭) - 조회는 get_industry_keywords() 사용
+INDUSTRY_KEYWORDS = SEED_INDUSTRY_KEYWORDS
 
 
 # =============================================================================
@@ -487,6 +467,10 @@ class ExternalSearchPipeline:
         self.api_key = self.key_rotator.get_key("perplexity")
         self.enabled = bool(self.api_key)
         self.parallel_mode = parallel_mode
+        self.env_max_concurrency = settings.EXTERNAL_SEARCH_ENV_MAX_CONCURRENCY
+        self.query_timeout = settings.EXTERNAL_SEARCH_QUERY_TIMEOUT
+        self.total_timeout = settings.EXTERNAL_SEARCH_TOTAL_TIMEOUT
+        self.search_cache = get_search_cache()
 
         if not self.enabled:
             logger.warning("Perplexity API key not configured - external search disabled")
@@ -584,6 +568,9 @@ class ExternalSearchPipeline:
         ADR-009 Sprint 1 구현:
         - asyncio.gather()로 3개 API 동시 호출
         - 개별 실패는 빈 리스트로 처리 (Graceful Degradation)
+        - 트랙별 타임아웃(total_timeout) - 완료된 트랙 결과는 유지, 실패/타임아웃 트랙은 metadata.failed_tracks
+        - 프로세스당 영구 이벤트 루프 + 공유 AsyncClient (app.worker.async_runtime)
+        - ENVIRONMENT 주제별 쿼리 동시 실행, 타임아웃 시 부분 결과
 
         개선사항 (2026-02-08):
         - DART 컨텍스트를 프롬프트에 주입하여 검증 기준 제공
@@ -593,51 +580,41 @@ class ExternalSearchPipeline:
         # DART 컨텍스트 프롬프트 생성
         dart_prompt = dart_context.to_prompt_context() if dart_context else ""
 
+        environment_stats: dict = {}
+
         async def run_parallel():
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                tasks = [
+            # 프로세스 공유 루프 + 커넥션 풀 재사용 (잡마다 클라이언트 생성 X)
+            client = get_async_http_client()
+            # 트랙별 타임아웃 - 먼저 끝난 트랙 결과는 다른 트랙이 늦어도 유지
+            # ENVIRONMENT는 남은 시간 안에서만 주제별 쿼리를 시작 (완료된 주제는 유지)
+            deadline = asyncio.get_running_loop().time() + self.total_timeout
+            tasks = [
+                asyncio.wait_for(
                     self._search_direct_events_async(
                         client, corp_name, industry_name, corp_reg_no,
                         dart_context=dart_prompt
                     ),
+                    timeout=self.total_timeout,
+                ),
+                asyncio.wait_for(
                     self._search_industry_events_async(
                         client, corp_name, industry_name, industry_code
                     ),
-                    self._search_environment_events_async(
-                        client, industry_name, industry_code, selected_queries
-                    ),
-                ]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                return results
-
-        # P0-3 Fix: 안전한 asyncio 이벤트 루프 실행
-        # Celery Worker 환경에서도 안전하게 동작하도록 개선
-        import concurrent.futures
-
-        def run_in_new_loop():
-            """새 이벤트 루프에서 async 함수 실행 (Celery 호환)"""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(run_parallel())
-            finally:
-                new_loop.close()
+                    timeout=self.total_timeout,
+                ),
+                self._search_environment_events_async(
+                    client, industry_name, industry_code, selected_queries,
+                    query_stats=environment_stats,
+                    deadline=deadline,
+                ),
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
         try:
-            # 먼저 현재 이벤트 루프 확인 (Python 3.10+ 호환)
-            try:
-                loop = asyncio.get_running_loop()
-                # 이미 실행 중인 루프가 있는 경우 (Celery/FastAPI 등)
-                # 별도 스레드에서 새 이벤트 루프 사용
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(run_in_new_loop)
-                    results = future.result(timeout=60.0)
-            except RuntimeError:
-                # 실행 중인 루프가 없는 경우 → 직접 asyncio.run 사용
-                results = asyncio.run(run_parallel())
-
+            # 트랙별 타임아웃이 먼저 동작 - 여기는 루프가 응답하지 않을 때만
+            results = run_async(run_parallel(), timeout=self.total_timeout + 5.0)
         except concurrent.futures.TimeoutError:
-            logger.error("Parallel external search timed out after 60s")
+            logger.error(f"Parallel external search timed out after {self.total_timeout}s")
             results = [[], [], []]
         except Exception as e:
             logger.error(f"Parallel external search failed: {e}")
@@ -649,13 +626,18 @@ class ExternalSearchPipeline:
         environment_events = results[2] if not isinstance(results[2], Exception) else []
 
         # 예외 로깅
+        failed_tracks = []
         for i, (name, result) in enumerate([
             ("DIRECT", results[0]),
             ("INDUSTRY", results[1]),
             ("ENVIRONMENT", results[2])
         ]):
             if isinstance(result, Exception):
-                logger.warning(f"{name} search failed in parallel mode: {result}")
+                failed_tracks.append(name)
+                if isinstance(result, TimeoutError):
+                    logger.warning(f"{name} search timed out in parallel mode")
+                else:
+                    logger.warning(f"{name} search failed in parallel mode: {result}")
 
         elapsed_ms = int((time.time() - start_time) * 1000)
         all_events = direct_events + industry_events + environment_events
@@ -676,6 +658,9 @@ class ExternalSearchPipeline:
                 "search_timestamp": datetime.now().isoformat(),
                 "parallel_mode": True,
                 "execution_time_ms": elapsed_ms,
+                "environment_queries": environment_stats,
+                "failed_tracks": failed_tracks,
+                "partial": bool(environment_stats.get("partial")) or bool(failed_tracks),
                 "events_count": {
                     "direct": len(direct_events),
                     "industry": len(industry_events),
@@ -893,7 +878,7 @@ class ExternalSearchPipeline:
         today = datetime.now().strftime("%Y-%m-%d")
 
         # Get industry-specific keywords
-        keywords = INDUSTRY_KEYWORDS.get(industry_code, DEFAULT_INDUSTRY_KEYWORDS)
+        keywords = get_industry_keywords(industry_code)
         supply_keywords = ", ".join(keywords.get("supply_chain", []))
 
         prompt = f"""## 검색 대상
@@ -971,7 +956,11 @@ class ExternalSearchPipeline:
 업종 전체 뉴스가 없으면:
 {{"status": "NOT_FOUND", "facts": [], "not_found": ["해당 기간 내 업종 전체 영향 뉴스 없음"]}}"""
 
-        events = self._call_perplexity(prompt, "industry")
+        # 업종 단위 검색 → 같은 업종 기업 간 결과 공유
+        events = self._call_perplexity_cached(
+            SearchScope.INDUSTRY, industry_code, f"{industry_name}|{supply_keywords}",
+            prompt, "industry",
+        )
 
         # Tag as INDUSTRY
         for event in events:
@@ -998,8 +987,26 @@ class ExternalSearchPipeline:
         - Few-shot 예시 추가 (3번 개선)
         - source_type 출처 분리 (4번 개선)
         """
-        today = datetime.now().strftime("%Y-%m-%d")
+        query_topics = self._build_environment_query_topics(industry_name, selected_queries)
+        prompt = self._build_environment_prompt(industry_name, query_topics)
 
+        events = self._call_perplexity_cached(
+            SearchScope.ENVIRONMENT, industry_code, "\n".join(query_topics),
+            prompt, "environment",
+        )
+
+        # Tag as ENVIRONMENT
+        for event in events:
+            event["event_category"] = "ENVIRONMENT"
+
+        return events
+
+    def _build_environment_query_topics(
+        self,
+        industry_name: str,
+        selected_queries: list[str],
+    ) -> list[str]:
+        """Profile 기반 ENVIRONMENT 검색 주제 (최대 5개, 없으면 기본 주제)"""
         # Build targeted queries based on profile
         query_topics = []
 
@@ -1018,6 +1025,11 @@ class ExternalSearchPipeline:
                 f"{industry_name} 환율 금리 영향",
             ]
 
+        return query_topics
+
+    def _build_environment_prompt(self, industry_name: str, query_topics: list[str]) -> str:
+        """ENVIRONMENT 검색 프롬프트 (query_topics → '찾아야 할 정보')"""
+        today = datetime.now().strftime("%Y-%m-%d")
         query_focus = "\n".join(f"- {topic}" for topic in query_topics)
 
         prompt = f"""## 검색 대상
@@ -1107,13 +1119,7 @@ class ExternalSearchPipeline:
 확정된 정책 뉴스가 없으면:
 {{"status": "NOT_FOUND", "facts": [], "not_found": ["해당 기간 내 확정된 정책 변화 없음"]}}"""
 
-        events = self._call_perplexity(prompt, "environment")
-
-        # Tag as ENVIRONMENT
-        for event in events:
-            event["event_category"] = "ENVIRONMENT"
-
-        return events
+        return prompt
 
     def _call_perplexity(self, prompt: str, search_type: str) -> list[dict]:
         """
@@ -1124,46 +1130,46 @@ class ExternalSearchPipeline:
         - 새로운 System Prompt (간결하고 엄격)
         - status 필드 기반 응답 파싱
         - source_excerpt 검증
-        """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
 
-        payload = {
-            "model": self.MODEL,
-            "messages": [
-                {"role": "system", "content": PERPLEXITY_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.0,  # P0: 창의성 완전 차단
-            "max_tokens": 4000,  # 증가: 긴 summary 허용
-            "top_p": 1.0,
-        }
+        동기 래퍼: 프로세스 공유 이벤트 루프에서 _call_perplexity_async 실행
+        """
+        async def call() -> list[dict]:
+            return await self._call_perplexity_async(
+                get_async_http_client(), prompt, search_type
+            )
 
+        # 순차 모드도 프로세스 공유 커넥션 풀 사용
         try:
-            with httpx.Client(timeout=self.TIMEOUT) as client:
-                response = client.post(
-                    self.PERPLEXITY_API_URL,
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-
-            result = response.json()
-            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-            citations = result.get("citations", [])
+            return run_async(call(), timeout=self.TIMEOUT + 5.0)
+        except (concurrent.futures.TimeoutError, ExternalSearchTimeout):
+            logger.warning(f"[SEARCH_FAILED] Perplexity API timeout for {search_type} search")
+            return []
+        except Exception as e:
+            logger.error(f"[SEARCH_FAILED] Perplexity call failed for {search_type}: {e}")
+            return []
 
-            # P0: 새로운 파싱 로직 (status 필드 지원)
-            events = self._parse_events_v2(content, citations, search_type)
-            return events
+    def _call_perplexity_cached(
+        self,
+        scope: SearchScope,
+        industry_code: str,
+        topic: str,
+        prompt: str,
+        search_type: str,
+    ) -> list[dict]:
+        """기업 비특정 검색(INDUSTRY/ENVIRONMENT)용: 공유 검색 캐시 경유 동기 호출"""
+        async def call() -> list[dict]:
+            return await self.search_cache.get_or_fill(
+                scope, industry_code, topic,
+                lambda: self._call_perplexity_async(
+                    get_async_http_client(), prompt, search_type
+                ),
+            )
 
-        except httpx.TimeoutException:
+        try:
+            return run_async(call(), timeout=self.TIMEOUT + 5.0)
+        except (concurrent.futures.TimeoutError, ExternalSearchTimeout):
             logger.warning(f"[SEARCH_FAILED] Perplexity API timeout for {search_type} search")
             return []
-        except httpx.HTTPStatusError as e:
-            logger.error(f"[SEARCH_FAILED] Perplexity API error for {search_type}: {e.response.status_code}")
-            return []
         except Exception as e:
             logger.error(f"[SEARCH_FAILED] Perplexity call failed for {search_type}: {e}")
             return []
@@ -1617,26 +1623,8 @@ class ExternalSearchPipeline:
         return "tier4"  # Unknown/other sources
 
     def _get_industry_name(self, industry_code: str) -> str:
-        """Get industry name from code."""
-        industry_names = {
-            "C10": "식품제조업",
-            "C21": "의약품제조업",
-            "C26": "전자부품제조업",
-            "C29": "기계장비제조업",
-            "D35": "전기업",
-            "F41": "건설업",
-            "G45": "자동차판매업",
-            "G46": "도매업",
-            "G47": "소매업",
-            "H49": "육상운송업",
-            "J58": "출판업",
-            "J62": "소프트웨어개발업",
-            "K64": "금융업",
-            "L68": "부동산업",
-            "M70": "경영컨설팅업",
-            "N74": "전문서비스업",
-        }
-        return industry_names.get(industry_code, f"기타업종 ({industry_code})")
+        """Get industry name from code (industry knowledge store → seed)."""
+        return get_industry_name(industry_code)
 
     # =========================================================================
     # P2: Buffett 10-K Test - 자동화된 원문 대조 검증
@@ -1891,6 +1879,10 @@ class ExternalSearchPipeline:
         - PERPLEXITY_SYSTEM_PROMPT 사용 (Elon-style)
         - max_tokens 4000 (더 긴 응답 허용)
         - status 필드로 검색 상태 구분
+
+        Raises:
+            ExternalSearchTimeout / ExternalSearchError: 호출 실패
+            (빈 리스트는 실제 검색 결과 없음만 의미 - 공유 검색 캐시가 실패를 결과로 저장하지 않도록)
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -1905,6 +1897,7 @@ class ExternalSearchPipeline:
             ],
             "temperature": 0.0,  # P0: 창의성 완전 차단
             "max_tokens": 4000,  # P0: 더 긴 응답 허용
+            "top_p": 1.0,
         }
 
         try:
@@ -1912,6 +1905,7 @@ class ExternalSearchPipeline:
                 self.PERPLEXITY_API_URL,
                 headers=headers,
                 json=payload,
+                timeout=self.TIMEOUT,
             )
             response.raise_for_status()
 
@@ -1923,15 +1917,15 @@ class ExternalSearchPipeline:
             events = self._parse_events_v2(content, citations, search_type)
             return events
 
-        except httpx.TimeoutException:
+        except httpx.TimeoutException as e:
             logger.warning(f"[P0] Perplexity API timeout for {search_type} search (async)")
-            return []
+            raise ExternalSearchTimeout(f"Perplexity timeout ({search_type})") from e
         except httpx.HTTPStatusError as e:
             logger.error(f"[P0] Perplexity API error for {search_type}: {e.response.status_code} (async)")
-            return []
+            raise ExternalSearchError(f"Perplexity HTTP {e.response.status_code} ({search_type})") from e
         except Exception as e:
             logger.error(f"[P0] Perplexity call failed for {search_type}: {e} (async)")
-            return []
+            raise ExternalSearchError(f"Perplexity call failed ({search_type}): {e}") from e
 
     async def _search_direct_events_async(
         self,
@@ -2065,8 +2059,8 @@ class ExternalSearchPipeline:
         """
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # Get industry-specific keywords
-        keywords = INDUSTRY_KEYWORDS.get(industry_code, DEFAULT_INDUSTRY_KEYWORDS)
+        # Get industry-specific keywords (Redis/DB 조회는 동기 I/O → 스레드에서 실행)
+        keywords = await asyncio.to_thread(get_industry_keywords, industry_code)
         supply_keywords = ", ".join(keywords.get("supply_chain", []))
 
         prompt = f"""## 검색 대상
@@ -2144,7 +2138,11 @@ class ExternalSearchPipeline:
 업종 전체 뉴스가 없으면:
 {{"status": "NOT_FOUND", "facts": [], "not_found": ["해당 기간 내 업종 전체 영향 뉴스 없음"]}}"""
 
-        events = await self._call_perplexity_async(client, prompt, "industry")
+        # 업종 단위 검색 → 같은 업종 기업 간 결과 공유 (single-flight)
+        events = await self.search_cache.get_or_fill(
+            SearchScope.INDUSTRY, industry_code, f"{industry_name}|{supply_keywords}",
+            lambda: self._call_perplexity_async(client, prompt, "industry"),
+        )
 
         # Tag as INDUSTRY
         for event in events:
@@ -2159,10 +2157,20 @@ class ExternalSearchPipeline:
         industry_code: str,
         selected_queries: list[str],
         corp_name: Optional[str] = None,
+        query_stats: Optional[dict] = None,
+        deadline: Optional[float] = None,
     ) -> list[dict]:
         """
         Async version of ENVIRONMENT search.
 
+        선택된 주제(EnvironmentQuerySelector)마다 개별 쿼리를 동시 실행:
+        - env_max_concurrency로 동시성 제한
+        - 쿼리별 query_timeout 초과 시 해당 주제만 제외 (부분 결과 반환)
+        - deadline(loop.time())이 주어지면 남은 시간으로 쿼리 타임아웃을 줄이고,
+          시간이 없으면 시작하지 않음 (timed_out) - 트랙 전체가 취소되어 완료된 주제를 잃지 않도록
+        - query_stats가 주어지면 queries/completed/timed_out/failed/partial 기록
+        - 업종+주제 단위 공유 검색 캐시 사용 (기업 간 재사용)
+
         P0 Fix (2026-02-08):
         - 스키마 단순화 (6개 핵심 필드)
         - 현실적 출처만 (경제지 정책 기사)
@@ -2172,116 +2180,72 @@ class ExternalSearchPipeline:
         - Few-shot 예시 추가 (3번 개선)
         - source_type 출처 분리 (4번 개선)
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Build targeted queries based on profile
-        query_topics = []
-
-        if selected_queries:
-            for query_key in selected_queries[:5]:
-                if query_key in ENVIRONMENT_QUERY_TEMPLATES:
-                    query_topics.append(
-                        ENVIRONMENT_QUERY_TEMPLATES[query_key].format(
-                            industry_name=industry_name
-                        )
+        query_topics = self._build_environment_query_topics(industry_name, selected_queries)
+        if query_stats is None:
+            query_stats = {}
+        query_stats.update({
+            "queries": len(query_topics),
+            "completed": 0,
+            "timed_out": 0,
+            "failed": 0,
+        })
+
+        # 주제별 개별 쿼리를 동시 실행 (동시성 제한 + 쿼리별 타임아웃)
+        semaphore = asyncio.Semaphore(max(1, self.env_max_concurrency))
+
+        async def run_query(topic: str) -> list[dict]:
+            async with semaphore:
+                timeout = self.query_timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - asyncio.get_running_loop().time())
+                if timeout <= 0:
+                    logger.warning(f"[ENVIRONMENT] No time left for query: {topic}")
+                    query_stats["timed_out"] += 1
+                    return []
+                prompt = self._build_environment_prompt(industry_name, [topic])
+                try:
+                    # 업종+주제 단위 캐시 (기업 비특정), 실패/타임아웃 결과는 캐시하지 않음
+                    events = await asyncio.wait_for(
+                        self.search_cache.get_or_fill(
+                            SearchScope.ENVIRONMENT, industry_code, topic,
+                            lambda: self._call_perplexity_async(client, prompt, "environment"),
+                        ),
+                        timeout=timeout,
                     )
-        else:
-            query_topics = [
-                f"{industry_name} 정책 규제 변경",
-                f"{industry_name} 정부 지원 보조금",
-                f"{industry_name} 환율 금리 영향",
-            ]
-
-        query_focus = "\n".join(f"- {topic}" for topic in query_topics)
-
-        prompt = f"""## 검색 대상
-- 업종: {industry_name}
-- 검색일: {today}
-- 검색기간: 최근 90일
-
-## 검색 요청
-"{industry_name}" 업종에 영향을 미치는 정책/규제/거시경제 뉴스를 찾아주세요.
-
-### 찾아야 할 정보
-{query_focus}
-
-### 구체적 항목
-1. **정책 변화**: 법률 제정/개정, 시행령 변경, 정부 발표
-2. **규제 변화**: 인허가 기준, 환경규제, 안전기준
-3. **금융/통화**: 금리 결정, 환율 동향, 자금 지원
-4. **무역/통상**: 관세, FTA, 수출규제
-
-### 제외 대상
-❌ "검토 중", "논의 중" 등 미확정 정책
-❌ "~할 전망", "~할 예정" 등 추측성 기사
-❌ 업계 요청/건의 (정책 아님)
-
----
-## 예시 (Few-shot)
-
-### ✅ 좋은 응답:
-{{
-  "status": "FOUND",
-  "facts": [
-    {{
-      "title": "한은 기준금리 0.25%p 인하, 3.25%로 결정",
-      "summary": "한국은행 금융통화위원회가 2025년 1월 기준금리를 0.25%p 인하하여 3.25%로 결정했다. 경기 둔화 우려에 대응한 조치다.",
-      "source_url": "https://www.bok.or.kr/press/12345",
-      "date": "2025-01-16",
-      "impact": "OPPORTUNITY",
-      "source_type": "disclosure",
-      "policy_area": "monetary"
-    }},
-    {{
-      "title": "{industry_name} 탄소배출권 의무 강화, 2026년부터 적용",
-      "summary": "환경부가 {industry_name} 업종의 탄소배출권 할당량을 10% 축소한다고 발표했다. 2026년 1월부터 적용된다.",
-      "source_url": "https://www.me.go.kr/policy/12345",
-      "date": "2025-01-10",
-      "impact": "RISK",
-      "source_type": "disclosure",
-      "policy_area": "regulatory"
-    }}
-  ]
-}}
-
-### ❌ 나쁜 응답:
-- "금리 인하 전망" → 확정된 것만
-- "업계, 규제 완화 요청" → 정책 아님
-- "환경부 검토 중" → 미확정 정책
-
----
-### 출력 형식 (JSON)
-{{
-  "status": "FOUND" | "NOT_FOUND",
-  "facts": [
-    {{
-      "title": "정책/규제 제목 (50자 이내)",
-      "summary": "핵심 내용 2-3문장 (확정된 사실만, 숫자 포함)",
-      "source_url": "기사 URL (필수)",
-      "date": "YYYY-MM-DD",
-      "impact": "RISK | OPPORTUNITY | NEUTRAL",
-      "source_type": "disclosure | news | report",
-      "policy_area": "regulatory | fiscal | trade | monetary"
-    }}
-  ],
-  "not_found": ["찾지 못한 항목"]
-}}
-
-### source_type 분류:
-- disclosure: 정부/기관 공식 발표 (me.go.kr, bok.or.kr 등)
-- report: 연구기관 정책 분석
-- news: 정책 관련 일반 뉴스
-
-### policy_area 분류:
-- regulatory: 규제/인허가
-- fiscal: 세금/보조금
-- trade: 무역/관세
-- monetary: 금리/환율
-
-확정된 정책 뉴스가 없으면:
-{{"status": "NOT_FOUND", "facts": [], "not_found": ["해당 기간 내 확정된 정책 변화 없음"]}}"""
-
-        events = await self._call_perplexity_async(client, prompt, "environment")
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"[ENVIRONMENT] Query timed out after {timeout:.1f}s: {topic}"
+                    )
+                    query_stats["timed_out"] += 1
+                    return []
+                except Exception as e:
+                    logger.warning(f"[ENVIRONMENT] Query failed: {topic} - {e}")
+                    query_stats["failed"] += 1
+                    return []
+                query_stats["completed"] += 1
+                return events
+
+        per_query_events = await asyncio.gather(*(run_query(topic) for topic in query_topics))
+
+        # 쿼리 간 중복 제거 (같은 기사가 여러 주제에 걸릴 수 있음)
+        events = []
+        seen = set()
+        for query_events in per_query_events:
+            for event in query_events:
+                key = event.get("source_url") or event.get("title")
+                if key and key in seen:
+                    continue
+                if key:
+                    seen.add(key)
+                events.append(event)
+
+        query_stats["partial"] = query_stats["completed"] < query_stats["queries"]
+        if query_stats["partial"]:
+            logger.warning(
+                f"[ENVIRONMENT] Partial results: {query_stats['completed']}/"
+                f"{query_stats['queries']} queries completed "
+                f"(timed_out={query_stats['timed_out']}, failed={query_stats['failed']})"
+            )
 
         # Tag as ENVIRONMENT
         for event in events:
@@ -2338,28 +2302,16 @@ class ExternalSearchPipeline:
                 "impact_strength": "MED",
             })
 
-        # 비동기 팩트체크 실행
+        # 비동기 팩트체크 실행 (프로세스 공유 이벤트 루프, Celery 호환)
         try:
-            import concurrent.futures
-
-            def run_fact_check():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(
-                        fact_checker.check_signals_batch(
-                            signals=signals,
-                            corp_name=corp_name,
-                            max_concurrent=max_concurrent,
-                        )
-                    )
-                finally:
-                    loop.close()
-
-            # 별도 스레드에서 실행 (Celery 호환)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_fact_check)
-                fact_results = future.result(timeout=60.0)
+            fact_results = run_async(
+                fact_checker.check_signals_batch(
+                    signals=signals,
+                    corp_name=corp_name,
+                    max_concurrent=max_concurrent,
+                ),
+                timeout=60.0,
+            )
 
         except Exception as e:
             logger.error(f"[FACT_CHECK] Failed: {e}")
@@ -0,0 +1,314 @@
+"""
+Corp Profile Phase Cache
+
+CorpProfilingPipeline의 단계(phase)별 산출물을 따로 저장하여, 프로필 갱신 시
+만료된 단계만 다시 실행하고 나머지는 재사용한 뒤 재병합한다.
+
+Phases (TTL은 데이터 변화 속도에 맞춤):
+- phase1       Perplexity 기본정보/재무   7일 (실적/경영진 뉴스)
+- phase2       Perplexity 해외사업       30일
+- phase3       Perplexity 공급망/고객    30일 (월 1회)
+- phaseN_summary  phase 요약            30일 (검색 본문 해시가 같을 때만 재사용)
+- gemini       Gemini Grounding 검색    7일
+- consensus    Claude 합성 결과          30일 (합성 프롬프트 해시가 같을 때만 재사용)
+
+각 엔트리는 input_hash(쿼리/본문/프롬프트의 sha256)를 함께 저장하므로 입력이
+바뀌면(업종 힌트 갱신, 상위 단계 재실행 등) TTL과 무관하게 다시 계산된다.
+하위 단계가 모두 재사용되면 합성 프롬프트도 동일 → consensus까지 재사용.
+
+주주 정보는 LLM 단계가 아니라 매 실행 DART 공시에서 직접 가져오므로
+DART 보고서가 바뀔 때만 바뀐다 (별도 phase 없음).
+
+Storage: rkyc_corp_profile_phase (corp_id, phase) - 동기 세션
+(phase 함수들은 orchestrator 스레드 풀에서 실행됨)
+
+Usage:
+    memo = get_profile_phase_cache().memo(corp_id, rerun=ALL_PHASES if force else ())
+    result = memo.get_or_compute("phase1", query, lambda: search(query),
+                                 cacheable=lambda r: not r.get("error"))
+    memo.report()  # {"phase1": "HIT", "phase2": "MISS", ...}
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilePhase:
+    """Profile phase names"""
+
+    PHASE1 = "phase1"
+    PHASE2 = "phase2"
+    PHASE3 = "phase3"
+    PHASE1_SUMMARY = "phase1_summary"
+    PHASE2_SUMMARY = "phase2_summary"
+    PHASE3_SUMMARY = "phase3_summary"
+    GEMINI = "gemini"
+    CONSENSUS = "consensus"
+
+
+ALL_PHASES = frozenset({
+    ProfilePhase.PHASE1,
+    ProfilePhase.PHASE2,
+    ProfilePhase.PHASE3,
+    ProfilePhase.PHASE1_SUMMARY,
+    ProfilePhase.PHASE2_SUMMARY,
+    ProfilePhase.PHASE3_SUMMARY,
+    ProfilePhase.GEMINI,
+    ProfilePhase.CONSENSUS,
+})
+
+
+def summary_phase(phase: str) -> str:
+    """phase1 → phase1_summary"""
+    return f"{phase}_summary"
+
+
+def hash_input(value: Any) -> str:
+    """Phase 입력 해시 (문자열은 그대로, 그 외는 정렬된 JSON)"""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+@dataclass
+class ProfilePhaseCacheConfig:
+    """Phase cache configuration (settings에서 로드)"""
+
+    ENABLED: bool = True
+    TTL_SECONDS: dict[str, int] = field(default_factory=lambda: {
+        ProfilePhase.PHASE1: 7 * 24 * 3600,
+        ProfilePhase.PHASE2: 30 * 24 * 3600,
+        ProfilePhase.PHASE3: 30 * 24 * 3600,
+        ProfilePhase.PHASE1_SUMMARY: 30 * 24 * 3600,
+        ProfilePhase.PHASE2_SUMMARY: 30 * 24 * 3600,
+        ProfilePhase.PHASE3_SUMMARY: 30 * 24 * 3600,
+        ProfilePhase.GEMINI: 7 * 24 * 3600,
+        ProfilePhase.CONSENSUS: 30 * 24 * 3600,
+    })
+
+    def __post_init__(self):
+        try:
+            from app.core.config import settings
+            self.ENABLED = settings.PROFILE_PHASE_CACHE_ENABLED
+            summary_ttl = settings.PROFILE_PHASE_TTL_SUMMARY
+            self.TTL_SECONDS = {
+                ProfilePhase.PHASE1: settings.PROFILE_PHASE_TTL_PHASE1,
+                ProfilePhase.PHASE2: settings.PROFILE_PHASE_TTL_PHASE2,
+                ProfilePhase.PHASE3: settings.PROFILE_PHASE_TTL_PHASE3,
+                ProfilePhase.PHASE1_SUMMARY: summary_ttl,
+                ProfilePhase.PHASE2_SUMMARY: summary_ttl,
+                ProfilePhase.PHASE3_SUMMARY: summary_ttl,
+                ProfilePhase.GEMINI: settings.PROFILE_PHASE_TTL_GEMINI,
+                ProfilePhase.CONSENSUS: settings.PROFILE_PHASE_TTL_CONSENSUS,
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load profile phase cache config from settings: {e}, using defaults")
+
+    def get_ttl(self, phase: str) -> int:
+        return self.TTL_SECONDS.get(phase, 24 * 3600)
+
+
+class ProfilePhaseCache:
+    """rkyc_corp_profile_phase 접근 (DB 오류 시 캐시 없이 동작)"""
+
+    def __init__(
+        self,
+        config: Optional[ProfilePhaseCacheConfig] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.config = config or ProfilePhaseCacheConfig()
+        self._session_factory = session_factory
+
+    def _open_session(self):
+        if self._session_factory is None:
+            from app.worker.db import get_sync_session
+            self._session_factory = get_sync_session
+        return self._session_factory()
+
+    def load(self, corp_id: str) -> dict[str, dict]:
+        """
+        기업의 유효한(미만료) phase 엔트리 전체 조회
+
+        Returns:
+            {phase: {"input_hash": str, "payload": Any}}
+        """
+        if not self.config.ENABLED or not corp_id:
+            return {}
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            rows = session.execute(
+                text("""
+                    SELECT phase, input_hash, payload
+                    FROM rkyc_corp_profile_phase
+                    WHERE corp_id = :corp_id AND expires_at > NOW()
+                """),
+                {"corp_id": corp_id},
+            ).fetchall()
+            return {
+                row.phase: {"input_hash": row.input_hash, "payload": row.payload}
+                for row in rows
+            }
+        except Exception as e:
+            logger.warning(f"[PhaseCache] Load failed for {corp_id}: {e}")
+            return {}
+        finally:
+            session.close()
+
+    def save(self, corp_id: str, phase: str, input_hash: str, payload: Any) -> bool:
+        """phase 엔트리 upsert (phase별 TTL 적용)"""
+        if not self.config.ENABLED or not corp_id:
+            return False
+        from sqlalchemy import text
+
+        now = datetime.now(UTC)
+        session = self._open_session()
+        try:
+            session.execute(
+                text("""
+                    INSERT INTO rkyc_corp_profile_phase (
+                        corp_id, phase, input_hash, payload, generated_at, expires_at
+                    ) VALUES (
+                        :corp_id, :phase, :input_hash, CAST(:payload AS jsonb), :generated_at, :expires_at
+                    )
+                    ON CONFLICT (corp_id, phase) DO UPDATE SET
+                        input_hash = EXCLUDED.input_hash,
+                        payload = EXCLUDED.payload,
+                        generated_at = EXCLUDED.generated_at,
+                        expires_at = EXCLUDED.expires_at
+                """),
+                {
+                    "corp_id": corp_id,
+                    "phase": phase,
+                    "input_hash": input_hash,
+                    "payload": json.dumps(payload, ensure_ascii=False, default=str),
+                    "generated_at": now,
+                    "expires_at": now + timedelta(seconds=self.config.get_ttl(phase)),
+                },
+            )
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[PhaseCache] Save failed for {corp_id}/{phase}: {e}")
+            return False
+        finally:
+            session.close()
+
+    def invalidate(self, corp_id: str, phases: Optional[Iterable[str]] = None) -> int:
+        """phase 엔트리 삭제 (phases=None이면 전체). Returns deleted rows."""
+        from sqlalchemy import text
+
+        session = self._open_session()
+        try:
+            if phases is None:
+                result = session.execute(
+                    text("DELETE FROM rkyc_corp_profile_phase WHERE corp_id = :corp_id"),
+                    {"corp_id": corp_id},
+                )
+            else:
+                result = session.execute(
+                    text("""
+                        DELETE FROM rkyc_corp_profile_phase
+                        WHERE corp_id = :corp_id AND phase = ANY(:phases)
+                    """),
+                    {"corp_id": corp_id, "phases": list(phases)},
+                )
+            session.commit()
+            return result.rowcount or 0
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[PhaseCache] Invalidate failed for {corp_id}: {e}")
+            return 0
+        finally:
+            session.close()
+
+    def memo(self, corp_id: str, rerun: Iterable[str] = ()) -> "PhaseMemo":
+        """한 번의 프로파일링 실행에 쓰는 memo (rerun에 포함된 phase는 항상 재실행)"""
+        return PhaseMemo(self, corp_id, rerun)
+
+
+class PhaseMemo:
+    """
+    프로파일링 1회 실행 범위의 phase memoization
+
+    orchestrator 스레드 풀에서 동시에 호출되므로 thread-safe.
+    저장된 엔트리는 첫 조회 시 한 번에 로드.
+    """
+
+    def __init__(self, cache: ProfilePhaseCache, corp_id: str, rerun: Iterable[str] = ()):
+        self.cache = cache
+        self.corp_id = corp_id
+        self.rerun = frozenset(rerun)
+        self._entries: Optional[dict[str, dict]] = None
+        self._lock = threading.Lock()
+        self._report: dict[str, str] = {}
+
+    def _get_entries(self) -> dict[str, dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self.cache.load(self.corp_id)
+            return self._entries
+
+    def get_or_compute(
+        self,
+        phase: str,
+        input_value: Any,
+        compute: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        저장된 phase 결과가 있고 입력 해시가 같으면 재사용, 아니면 compute() 후 저장
+
+        Args:
+            phase: ProfilePhase 값
+            input_value: phase 입력 (쿼리/본문/프롬프트) - 해시로 비교
+            compute: 실제 실행 함수
+            cacheable: 결과 저장 여부 판단 (실패/빈 결과는 저장하지 않음)
+        """
+        input_hash = hash_input(input_value)
+
+        if phase not in self.rerun:
+            entry = self._get_entries().get(phase)
+            if entry and entry["input_hash"] == input_hash:
+                with self._lock:
+                    self._report[phase] = "HIT"
+                logger.info(f"[PhaseCache] {self.corp_id}/{phase} reused")
+                return entry["payload"]
+
+        result = compute()
+        stored = False
+        if cacheable is None or cacheable(result):
+            stored = self.cache.save(self.corp_id, phase, input_hash, result)
+            if stored:
+                with self._lock:
+                    if self._entries is not None:
+                        self._entries[phase] = {"input_hash": input_hash, "payload": result}
+        with self._lock:
+            self._report[phase] = "MISS" if stored else "MISS_NOT_STORED"
+        return result
+
+    def report(self) -> dict[str, str]:
+        """phase별 HIT / MISS / MISS_NOT_STORED"""
+        with self._lock:
+            return dict(self._report)
+
+
+# Singleton instance
+_profile_phase_cache: Optional[ProfilePhaseCache] = None
+
+
+def get_profile_phase_cache() -> ProfilePhaseCache:
+    """Get singleton profile phase cache"""
+    global _profile_phase_cache
+    if _profile_phase_cache is None:
+        _profile_phase_cache = ProfilePhaseCache()
+    return _profile_phase_cache
@@ -23,7 +23,7 @@ import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,15 @@ COLLATERAL_CHANGE_THRESHOLD = 0.10  # ±10%
 FINANCIAL_CHANGE_THRESHOLD = 0.20  # ±20%
 KYC_REFRESH_DAYS = 365  # 1년
 
+# 규칙 (event_type, 실행 순서)
+RULE_EVENT_TYPES = (
+    "OVERDUE_FLAG_ON",
+    "INTERNAL_RISK_GRADE_CHANGE",
+    "LOAN_EXPOSURE_CHANGE",
+    "COLLATERAL_CHANGE",
+    "KYC_REFRESH",
+)
+
 # 등급 순서 (높은 등급 → 낮은 등급)
 RISK_GRADE_ORDER = ["AAA", "AA", "A", "BBB", "BB", "B", "CCC", "CC", "C", "D"]
 RISK_GRADE_RANK = {grade: idx for idx, grade in enumerate(RISK_GRADE_ORDER)}
@@ -97,6 +106,7 @@ class RuleBasedSignalGenerator:
         corp_name: str,
         snapshot: dict,
         prev_snapshot: Optional[dict] = None,
+        rules: Optional[Iterable[str]] = None,
     ) -> list[dict]:
         """
         Internal Snapshot에서 결정론적 시그널 생성
@@ -106,39 +116,44 @@ class RuleBasedSignalGenerator:
             corp_name: 기업명
             snapshot: 현재 Internal Snapshot JSON
             prev_snapshot: 이전 Internal Snapshot JSON (변화 감지용)
+            rules: 실행할 event_type (None이면 전체) - 포트폴리오 평가에서
+                   조건을 만족한 규칙만 실행할 때 사용 (app.services.portfolio_rules)
 
         Returns:
             list[dict]: 생성된 시그널 목록
         """
         signals = []
+        selected = set(RULE_EVENT_TYPES if rules is None else rules)
 
         # Rule 1: OVERDUE_FLAG_ON (이전 스냅샷 불필요)
-        overdue_signal = self._check_overdue(corp_id, corp_name, snapshot)
-        if overdue_signal:
-            signals.append(overdue_signal)
+        if "OVERDUE_FLAG_ON" in selected:
+            overdue_signal = self._check_overdue(corp_id, corp_name, snapshot)
+            if overdue_signal:
+                signals.append(overdue_signal)
 
         # Rule 2: INTERNAL_RISK_GRADE_CHANGE (이전 스냅샷 필요)
-        if prev_snapshot:
+        if prev_snapshot and "INTERNAL_RISK_GRADE_CHANGE" in selected:
             grade_signal = self._check_grade_change(corp_id, corp_name, snapshot, prev_snapshot)
             if grade_signal:
                 signals.append(grade_signal)
 
         # Rule 3: LOAN_EXPOSURE_CHANGE (이전 스냅샷 필요)
-        if prev_snapshot:
+        if prev_snapshot and "LOAN_EXPOSURE_CHANGE" in selected:
             loan_signal = self._check_loan_exposure_change(corp_id, corp_name, snapshot, prev_snapshot)
             if loan_signal:
                 signals.append(loan_signal)
 
         # Rule 4: COLLATERAL_CHANGE (이전 스냅샷 필요)
-        if prev_snapshot:
+        if prev_snapshot and "COLLATERAL_CHANGE" in selected:
             collateral_signal = self._check_collateral_change(corp_id, corp_name, snapshot, prev_snapshot)
             if collateral_signal:
                 signals.append(collateral_signal)
 
         # Rule 5: KYC_REFRESH (이전 스냅샷 불필요)
-        kyc_signal = self._check_kyc_refresh(corp_id, corp_name, snapshot)
-        if kyc_signal:
-            signals.append(kyc_signal)
+        if "KYC_REFRESH" in selected:
+            kyc_signal = self._check_kyc_refresh(corp_id, corp_name, snapshot)
+            if kyc_signal:
+                signals.append(kyc_signal)
 
         self.generated_count = len(signals)
         logger.info(
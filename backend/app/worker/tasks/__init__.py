@@ -8,11 +8,18 @@ from app.worker.tasks.profile_refresh import (
     trigger_profile_refresh_on_signal,
 )
 from app.worker.tasks.scheduled import (
+    schedule_analysis_jobs,
     scan_all_corporations,
     scan_single_corporation,
     scan_high_risk_corporations,
     cleanup_old_jobs,
+    maintain_partitions,
+    rollup_dashboard_counter,
 )
+from app.worker.tasks.dart_sync import sync_dart_filings
+from app.worker.tasks.report_snapshot import rebuild_report_snapshot
+from app.worker.tasks.document_ingest import ingest_uploaded_document
+from app.worker.tasks.portfolio_rules import evaluate_portfolio_rules
 from app.worker.tasks.dynamic_scheduler import (
     get_scheduler,
     start_dynamic_scheduler,
@@ -28,10 +35,20 @@ __all__ = [
     "refresh_all_profiles",
     "trigger_profile_refresh_on_signal",
     # Scheduled Tasks (Celery Beat)
+    "schedule_analysis_jobs",
     "scan_all_corporations",
     "scan_single_corporation",
     "scan_high_risk_corporations",
     "cleanup_old_jobs",
+    "maintain_partitions",
+    "rollup_dashboard_counter",
+    "sync_dart_filings",
+    # Document Ingest (POST /documents/upload-stream)
+    "ingest_uploaded_document",
+    # Report Snapshot
+    "rebuild_report_snapshot",
+    # Portfolio Rules (Celery Beat)
+    "evaluate_portfolio_rules",
     # Dynamic Scheduler (Demo Mode)
     "get_scheduler",
     "start_dynamic_scheduler",
@@ -4,14 +4,12 @@ Main Celery tasks for corporate risk analysis
 """
 
 import logging
-from datetime import datetime, UTC
-from uuid import UUID
-
-from sqlalchemy import update
 
 from app.worker.celery_app import celery_app
+from app.worker.async_runtime import run_async
 from app.worker.db import get_sync_db
-from app.models.job import Job, JobStatus, ProgressStep
+from app.worker.job_progress import get_job_progress_reporter
+from app.models.job import JobStatus, ProgressStep
 from app.worker.pipelines import (
     SnapshotPipeline,
     DocIngestPipeline,
@@ -32,7 +30,9 @@ from app.worker.llm.exceptions import (
     TimeoutError as LLMTimeoutError,
     AllProvidersFailedError,
 )
+from app.services.input_fingerprint import finalize_job_fingerprint, record_job_fingerprint
 from app.worker.pipelines.corp_profiling import get_corp_profiling_pipeline
+from app.worker.tasks.report_snapshot import schedule_report_rebuild
 
 logger = logging.getLogger(__name__)
 
@@ -45,41 +45,15 @@ def update_job_progress(
     error_code: str = None,
     error_message: str = None,
 ):
-    """Update job progress in database"""
-    with get_sync_db() as db:
-        update_data = {
-            "status": status.value,
-            "progress_percent": percent,
-        }
-
-        if step:
-            update_data["progress_step"] = step.value
-
-        if status == JobStatus.RUNNING:
-            # Set started_at if not already set
-            job = db.execute(
-                Job.__table__.select().where(Job.job_id == UUID(job_id))
-            ).fetchone()
-            if job and not job.started_at:
-                update_data["started_at"] = datetime.now(UTC)
-
-        if status in (JobStatus.DONE, JobStatus.FAILED):
-            update_data["finished_at"] = datetime.now(UTC)
-
-        if error_code:
-            update_data["error_code"] = error_code
-        if error_message:
-            update_data["error_message"] = error_message
-
-        stmt = (
-            update(Job)
-            .where(Job.job_id == UUID(job_id))
-            .values(**update_data)
-        )
-        db.execute(stmt)
-        db.commit()
-
-        logger.info(f"Job {job_id} updated: status={status.value}, step={step}, percent={percent}")
+    """Update job progress (Redis publish + coalesced DB checkpoint, app.worker.job_progress)"""
+    get_job_progress_reporter().report(
+        job_id,
+        status,
+        step=step,
+        percent=percent,
+        error_code=error_code,
+        error_message=error_message,
+    )
 
 
 def _strip_markdown(text: str) -> str:
@@ -297,6 +271,10 @@ def run_analysis_pipeline(self, job_id: str, corp_id: str, skip_cache: bool = Fa
     insight_pipeline = InsightPipeline()
 
     try:
+        # 이번 분석이 읽는 입력의 fingerprint 기록 (정기 스캔 변경 감지 기준, app.services.input_fingerprint)
+        with get_sync_db() as db:
+            started_fingerprint = record_job_fingerprint(db, job_id, corp_id)
+
         # Stage 1: SNAPSHOT
         update_job_progress(job_id, JobStatus.RUNNING, ProgressStep.SNAPSHOT, 5)
         try:
@@ -332,45 +310,24 @@ def run_analysis_pipeline(self, job_id: str, corp_id: str, skip_cache: bool = Fa
         corp_name = snapshot_data.get("corporation", {}).get("corp_name", "")
         industry_code = snapshot_data.get("corporation", {}).get("industry_code", "")
 
-        # Run async profiling pipeline in sync context (Celery-safe)
-        import asyncio
+        # Run async profiling pipeline on the per-process background loop
+        # db_session=None 유지: 기존 프로파일을 캐시/보강 입력으로 읽지 않고, 저장은 sync 세션
+        # (_save_profile_sync → Job 세션 재사용)
         profiling_pipeline = get_corp_profiling_pipeline()
+        llm_service = signal_pipeline.llm if hasattr(signal_pipeline, 'llm') else None
+
         try:
-            # Check if event loop is already running (e.g., nested async context)
-            try:
-                loop = asyncio.get_running_loop()
-                # If we get here, there's already a running loop - use thread executor
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        profiling_pipeline.execute(
-                            corp_id=corp_id,
-                            corp_name=corp_name,
-                            industry_code=industry_code,
-                            db_session=None,
-                            llm_service=signal_pipeline.llm if hasattr(signal_pipeline, 'llm') else None,
-                            skip_cache=skip_cache,
-                        )
-                    )
-                    profile_result = future.result(timeout=120)  # 2 min timeout
-            except RuntimeError:
-                # No running loop - safe to create new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    profile_result = loop.run_until_complete(
-                        profiling_pipeline.execute(
-                            corp_id=corp_id,
-                            corp_name=corp_name,
-                            industry_code=industry_code,
-                            db_session=None,
-                            llm_service=signal_pipeline.llm if hasattr(signal_pipeline, 'llm') else None,
-                            skip_cache=skip_cache,
-                        )
-                    )
-                finally:
-                    loop.close()
+            profile_result = run_async(
+                profiling_pipeline.execute(
+                    corp_id=corp_id,
+                    corp_name=corp_name,
+                    industry_code=industry_code,
+                    db_session=None,
+                    llm_service=llm_service,
+                    skip_cache=skip_cache,
+                ),
+                timeout=120,  # 2 min timeout
+            )
             # P0 Fix: profile이 None일 수 있음
             profile_confidence = (
                 profile_result.profile.get('profile_confidence')
@@ -388,7 +345,7 @@ def run_analysis_pipeline(self, job_id: str, corp_id: str, skip_cache: bool = Fa
                 "query_details": profile_result.query_details,
             }
 
-            # Save profile to DB using sync session (async pipeline doesn't have db_session)
+            # Save cleaned profile (markdown 제거) using sync session
             if profile_result.profile:
                 _save_profile_sync(profile_result.profile)
 
@@ -456,8 +413,15 @@ def run_analysis_pipeline(self, job_id: str, corp_id: str, skip_cache: bool = Fa
         # Stage 8: INSIGHT (LLM-based briefing generation)
         update_job_progress(job_id, JobStatus.RUNNING, ProgressStep.INSIGHT, 95)
         insight = insight_pipeline.execute(validated_signals, context)
+
+        # PROFILING 단계가 갱신한 프로필을 fingerprint에 반영 (자기 쓰기로 다음 스캔이 INPUT_CHANGED가 되지 않도록)
+        with get_sync_db() as db:
+            finalize_job_fingerprint(db, job_id, corp_id, started_fingerprint)
         update_job_progress(job_id, JobStatus.DONE, ProgressStep.INSIGHT, 100)
 
+        # 시그널/Loan Insight/프로필이 바뀌었으므로 보고서 스냅샷 미리 조립
+        schedule_report_rebuild(corp_id)
+
         logger.info(f"Pipeline completed for job={job_id}, signals_created={len(signal_ids)}")
 
         return {
@@ -0,0 +1,270 @@
+"""
+DART Filing Sync Task
+
+포트폴리오 전체(dart_corp_code가 있는 기업)의 DART 재무제표/주요사항보고서를
+로컬 테이블(migration_v20)로 증분 동기화한다. 조회 경로는 동기화된 기업이면
+DART 실시간 호출 대신 로컬 사본을 읽는다 (app.services.dart_local).
+
+기업별 처리:
+1. 공시: 마지막 동기화일(포함)부터 오늘까지 list.json 전 페이지 조회
+   → high-water mark(events_last_rcept_no) 이후 접수번호만 insert, mark 전진
+   (최초/강제 동기화는 EVENTS_LOOKBACK_DAYS 전부터)
+2. 재무제표: 최근 SYNC_YEARS년 중 로컬에 없는 연도만 조회
+   (미제출 연도는 FINANCIALS_RECHECK_DAYS마다 재확인, 제출된 사업보고서는 재조회하지 않음)
+3. 성공 시 last_synced_at 갱신, 실패 시 last_error만 기록 (로컬 조회 대상에서 자연히 제외)
+
+동시성: 기업 단위 asyncio.Semaphore(SYNC_CONCURRENCY), 요청 속도/일일 한도는 DartClient가 관리.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.worker.async_runtime import run_async
+from app.worker.celery_app import celery_app
+from app.worker.db import get_sync_db
+
+logger = logging.getLogger(__name__)
+
+EVENTS_PAGE_COUNT = 100  # list.json 페이지당 최대 건수
+EVENTS_MAX_PAGES = 20
+
+
+async def fetch_events_since(corp_code: str, bgn_de: str, end_de: str) -> list:
+    """
+    기간 내 주요사항보고서 전체 조회 (페이지 순회, 캐시 미사용)
+
+    get_major_events와 달리 오류를 삼키지 않는다 - 실패를 "공시 없음"으로
+    착각하면 high-water mark가 공시를 건너뛰고 미제출 연도로 기록되기 때문.
+    """
+    from app.services.dart_api import (
+        DART_STATUS_NO_DATA,
+        DART_STATUS_SUCCESS,
+        DartError,
+        _parse_event_item,
+    )
+    from app.services.dart_client import get_dart_client
+    from app.services.dart_local import SYNC_EVENT_TYPE
+
+    events = []
+    page_no = 1
+    while page_no <= EVENTS_MAX_PAGES:
+        data = await get_dart_client().get_json(
+            "list.json",
+            {
+                "corp_code": corp_code,
+                "bgn_de": bgn_de,
+                "end_de": end_de,
+                "pblntf_ty": SYNC_EVENT_TYPE,
+                "page_no": page_no,
+                "page_count": EVENTS_PAGE_COUNT,
+            },
+            use_cache=False,
+        )
+        status = data.get("status", "")
+        if status == DART_STATUS_NO_DATA:
+            break
+        if status != DART_STATUS_SUCCESS:
+            raise DartError(status, data.get("message", ""))
+
+        events.extend(_parse_event_item(item) for item in data.get("list", []))
+        if page_no >= int(data.get("total_page") or 1):
+            break
+        page_no += 1
+    return events
+
+
+async def fetch_financial_year(corp_code: str, bsns_year: str):
+    """사업연도 재무제표 조회 (미제출이면 None, 오류는 예외 - 캐시 미사용)"""
+    from app.services.dart_api import (
+        DART_STATUS_NO_DATA,
+        DART_STATUS_SUCCESS,
+        DartError,
+        _parse_financial_items,
+    )
+    from app.services.dart_client import get_dart_client
+    from app.services.dart_local import SYNC_FS_DIV, SYNC_REPRT_CODE
+
+    data = await get_dart_client().get_json(
+        "fnlttSinglAcnt.json",
+        {
+            "corp_code": corp_code,
+            "bsns_year": bsns_year,
+            "reprt_code": SYNC_REPRT_CODE,
+            "fs_div": SYNC_FS_DIV,
+        },
+        use_cache=False,
+    )
+    status = data.get("status", "")
+    if status == DART_STATUS_NO_DATA:
+        return None
+    if status != DART_STATUS_SUCCESS:
+        raise DartError(status, data.get("message", ""))
+    return _parse_financial_items(data.get("list", []), bsns_year, SYNC_REPRT_CODE)
+
+
+async def sync_corp_filings(
+    corp_code: str,
+    force: bool = False,
+    store=None,
+    today: Optional[datetime] = None,
+) -> dict:
+    """
+    단일 기업 DART 공시/재무제표 증분 동기화
+
+    Returns:
+        {"corp_code", "events", "financials", "error"}
+    """
+    from app.services.dart_local import get_dart_local_store
+
+    store = store or get_dart_local_store()
+    config = store.config
+    now = datetime.now(UTC)
+    today = today or datetime.now()
+    end_de = today.strftime("%Y%m%d")
+    result = {"corp_code": corp_code, "events": 0, "financials": 0, "error": None}
+
+    state = None if force else await asyncio.to_thread(store.get_state, corp_code)
+    state = state or {}
+
+    try:
+        # 1. 공시 (high-water mark 이후)
+        if state.get("last_synced_at") and state.get("events_from"):
+            bgn_de = min(state["last_synced_at"].strftime("%Y%m%d"), end_de)
+            events_from = state["events_from"]
+        else:
+            bgn_de = (today - timedelta(days=config.EVENTS_LOOKBACK_DAYS)).strftime("%Y%m%d")
+            events_from = bgn_de
+
+        last_rcept_no = state.get("events_last_rcept_no") or ""
+        events = [e for e in await fetch_events_since(corp_code, bgn_de, end_de) if e.rcept_no > last_rcept_no]
+        rows = [
+            {
+                "rcept_no": e.rcept_no,
+                "rcept_dt": e.rcept_dt,
+                "report_nm": e.report_nm,
+                "event_type": e.event_type.value,
+                "corp_name": e.corp_name,
+                "flr_nm": e.flr_nm,
+                "rm": e.rm,
+            }
+            for e in events
+        ]
+        result["events"] = await asyncio.to_thread(store.save_events, corp_code, rows)
+        newest = max(events, key=lambda e: e.rcept_no, default=None)
+
+        # 2. 재무제표 (로컬에 없는 연도만)
+        checked_at = state.get("financials_checked_at")
+        if checked_at is not None and checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=UTC)
+        recheck = force or checked_at is None or now - checked_at >= timedelta(days=config.FINANCIALS_RECHECK_DAYS)
+        financials_checked_at = checked_at
+        if recheck:
+            years = [str(today.year - i) for i in range(1, config.SYNC_YEARS + 1)]
+            synced = set() if force else await asyncio.to_thread(store.synced_years, corp_code)
+            missing = [year for year in years if year not in synced]
+            statements = [
+                statement
+                for statement in await asyncio.gather(*(fetch_financial_year(corp_code, year) for year in missing))
+                if statement
+            ]
+            result["financials"] = await asyncio.to_thread(
+                store.save_financials,
+                corp_code,
+                [
+                    {
+                        "bsns_year": s.bsns_year,
+                        "revenue": s.revenue,
+                        "operating_profit": s.operating_profit,
+                        "net_income": s.net_income,
+                        "total_assets": s.total_assets,
+                        "total_liabilities": s.total_liabilities,
+                        "total_equity": s.total_equity,
+                        "retained_earnings": s.retained_earnings,
+                        "debt_ratio": s.debt_ratio,
+                    }
+                    for s in statements
+                ],
+            )
+            financials_checked_at = now
+
+        # 3. 상태 갱신
+        await asyncio.to_thread(
+            store.update_state,
+            corp_code,
+            events_from=events_from,
+            events_last_rcept_no=newest.rcept_no if newest else state.get("events_last_rcept_no"),
+            events_last_rcept_dt=newest.rcept_dt if newest else state.get("events_last_rcept_dt"),
+            financials_checked_at=financials_checked_at,
+            last_synced_at=now,
+            last_error=None,
+        )
+
+    except Exception as e:
+        logger.warning(f"[DartSync] Sync failed for corp_code={corp_code}: {e}")
+        result["error"] = str(e)
+        await asyncio.to_thread(store.update_state, corp_code, last_error=str(e)[:1000])
+
+    return result
+
+
+async def sync_portfolio_filings(corp_codes: list[str], force: bool = False, store=None) -> list[dict]:
+    """여러 기업 동기화 (기업 단위 동시성 제한)"""
+    from app.services.dart_local import get_dart_local_store
+
+    store = store or get_dart_local_store()
+    semaphore = asyncio.Semaphore(max(1, store.config.SYNC_CONCURRENCY))
+
+    async def run(corp_code: str) -> dict:
+        async with semaphore:
+            return await sync_corp_filings(corp_code, force=force, store=store)
+
+    return await asyncio.gather(*(run(corp_code) for corp_code in corp_codes))
+
+
+@celery_app.task(name="sync_dart_filings")
+def sync_dart_filings(corp_ids: Optional[list[str]] = None, force: bool = False):
+    """
+    DART 재무제표/주요사항보고서 일괄 동기화
+    Triggered daily by Celery Beat.
+
+    Args:
+        corp_ids: 대상 기업 (미지정 시 dart_corp_code가 있는 전체 기업)
+        force: high-water mark 무시하고 전체 기간/연도 재동기화
+    """
+    logger.info(f"[DartSync] Starting DART filing sync (corp_ids={corp_ids}, force={force})")
+
+    with get_sync_db() as db:
+        query = """
+            SELECT DISTINCT dart_corp_code
+            FROM corp
+            WHERE dart_corp_code IS NOT NULL AND dart_corp_code <> ''
+        """
+        params = {}
+        if corp_ids:
+            query += " AND corp_id = ANY(:corp_ids)"
+            params["corp_ids"] = list(corp_ids)
+        corp_codes = [row[0] for row in db.execute(text(query), params).fetchall()]
+
+    if not corp_codes:
+        logger.info("[DartSync] No corporations with dart_corp_code")
+        return {"status": "success", "corporations": 0, "events": 0, "financials": 0, "failed": 0}
+
+    results = run_async(sync_portfolio_filings(sorted(corp_codes), force=force))
+    failed = [r["corp_code"] for r in results if r["error"]]
+    summary = {
+        "status": "success",
+        "corporations": len(results),
+        "events": sum(r["events"] for r in results),
+        "financials": sum(r["financials"] for r in results),
+        "failed": len(failed),
+        "failed_corp_codes": failed[:50],
+    }
+    logger.info(
+        f"[DartSync] Completed: {summary['corporations']} corps, "
+        f"{summary['events']} new events, {summary['financials']} statements, {summary['failed']} failed"
+    )
+    return summary
@@ -0,0 +1,55 @@
+"""
+Uploaded Document Ingest Task
+
+POST /documents/upload-stream 으로 올라온 대용량 PDF를 워커에서 페이지 단위로 처리한다
+(DocIngestPipeline.process_uploaded_document). 파싱/LLM 추출이 API 프로세스의 이벤트 루프와
+스레드풀을 점유하지 않도록 BackgroundTasks 대신 Celery로 실행한다.
+
+진행 상황은 rkyc_document_page / rkyc_document.ingest_status 로 기록되어
+GET /documents/{doc_id}/status 에서 조회된다.
+"""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="ingest_uploaded_document",
+    time_limit=1800,  # 200MB 스캔 PDF - 기본 10분 제한보다 길게
+    soft_time_limit=1740,
+)
+def ingest_uploaded_document(doc_id: str, storage_path: Optional[str] = None, file_hash: Optional[str] = None):
+    """
+    업로드된 문서 페이지 단위 처리
+
+    Args:
+        doc_id: 문서 ID (이미 디스크에 저장되고 DB에 등록됨)
+        storage_path: 저장 경로 (업로드 중 계산한 해시를 추출 엔진에 등록할 때 사용)
+        file_hash: 업로드 중 계산한 SHA256 (워커에서 파일을 다시 해시하지 않도록)
+
+    Returns:
+        dict: {"doc_id", "status": success | failed, "facts"}
+    """
+    from app.worker.pipelines.doc_ingest import DocIngestPipeline
+
+    if storage_path and file_hash:
+        try:
+            from app.worker.pipelines.doc_parsers import get_extraction_engine
+            get_extraction_engine().remember_hash(storage_path, file_hash)
+        except Exception as e:
+            logger.debug(f"Failed to seed extraction engine hash: {e}")
+
+    try:
+        result = DocIngestPipeline().process_uploaded_document(UUID(doc_id))
+    except Exception as e:
+        logger.error(f"Streaming ingest failed for document {doc_id}: {e}")
+        return {"doc_id": doc_id, "status": "failed", "error": str(e)[:200]}
+
+    facts = len(result.get("facts", [])) if result else 0
+    logger.info(f"Streaming ingest completed for document {doc_id}: {facts} facts")
+    return {"doc_id": doc_id, "status": "success", "facts": facts}
@@ -14,13 +14,12 @@ import time
 from datetime import datetime, UTC
 from enum import Enum
 from typing import Optional
-from uuid import uuid4
 
 from sqlalchemy import text
 
 from app.worker.celery_app import celery_app
 from app.worker.db import get_sync_db
-from app.worker.tasks.analysis import run_analysis_pipeline
+from app.worker.job_scheduler import get_job_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -275,40 +274,10 @@ class DynamicScheduler:
         signals_before = self._get_total_signals()
 
         try:
-            with get_sync_db() as db:
-                # Scan all corporations (or round-robin one at a time for demo)
-                for corp in self._corporations:
-                    corp_id = corp["corp_id"]
-                    corp_name = corp["corp_name"]
-
-                    # Check for recent job
-                    recent_job = db.execute(text("""
-                        SELECT job_id FROM rkyc_job
-                        WHERE corp_id = :corp_id
-                          AND status IN ('QUEUED', 'RUNNING')
-                        LIMIT 1
-                    """), {"corp_id": corp_id}).fetchone()
-
-                    if recent_job:
-                        logger.debug(f"Skipping {corp_name} - job in progress")
-                        continue
-
-                    # Create new job
-                    job_id = str(uuid4())
-                    db.execute(text("""
-                        INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent)
-                        VALUES (:job_id, 'ANALYZE', :corp_id, 'QUEUED', :queued_at, 0)
-                    """), {
-                        "job_id": job_id,
-                        "corp_id": corp_id,
-                        "queued_at": datetime.now(UTC)
-                    })
-                    db.commit()
-
-                    # Queue analysis task
-                    run_analysis_pipeline.delay(job_id, corp_id)
-                    jobs_created += 1
-                    logger.info(f"Queued analysis for {corp_name}")
+            # 입력 변경 게이트 + 위험 점수 순 + 큐 깊이 기반 admission window (app.worker.job_scheduler)
+            plan = get_job_scheduler().run(corp_ids=[corp["corp_id"] for corp in self._corporations])
+            jobs_created = len(plan.admitted)
+            skipped_unchanged = plan.skipped_unchanged
 
             # Update signal count
             signals_after = self._get_total_signals()
@@ -319,6 +288,8 @@ class DynamicScheduler:
                 "cycle": self._total_runs,
                 "jobs_created": jobs_created,
                 "corporations_scanned": len(self._corporations),
+                "skipped_unchanged": skipped_unchanged,
+                "deferred": max(0, len(plan.candidates) - plan.window),
                 "new_signals": new_signals,
                 "timestamp": self._last_run.isoformat()
             }
@@ -16,15 +16,12 @@ Architecture:
 import json
 import logging
 import os
-import uuid
 from datetime import datetime, UTC
 from typing import Optional
 
-from sqlalchemy import update
-
 from app.worker.celery_app import celery_app
-from app.worker.db import get_sync_db
-from app.models.job import Job, JobStatus
+from app.worker.job_progress import get_job_progress_reporter
+from app.models.job import JobStatus
 from app.worker.llm.exceptions import (
     RateLimitError,
     TimeoutError as LLMTimeoutError,
@@ -42,40 +39,15 @@ def update_new_kyc_job_progress(
     error_code: str = None,
     error_message: str = None,
 ):
-    """Update new KYC job progress in database"""
-    with get_sync_db() as db:
-        update_data = {
-            "status": status.value,
-            "progress_percent": percent,
-        }
-
-        if step:
-            update_data["progress_step"] = step
-
-        if status == JobStatus.RUNNING:
-            job = db.execute(
-                Job.__table__.select().where(Job.job_id == uuid.UUID(job_id))
-            ).fetchone()
-            if job and not job.started_at:
-                update_data["started_at"] = datetime.now(UTC)
-
-        if status in (JobStatus.DONE, JobStatus.FAILED):
-            update_data["finished_at"] = datetime.now(UTC)
-
-        if error_code:
-            update_data["error_code"] = error_code
-        if error_message:
-            update_data["error_message"] = error_message
-
-        stmt = (
-            update(Job)
-            .where(Job.job_id == uuid.UUID(job_id))
-            .values(**update_data)
-        )
-        db.execute(stmt)
-        db.commit()
-
-        logger.info(f"New KYC Job {job_id} updated: status={status.value}, step={step}, percent={percent}")
+    """Update job progress (Redis publish + coalesced DB checkpoint, app.worker.job_progress)"""
+    get_job_progress_reporter().report(
+        job_id,
+        status,
+        step=step,
+        percent=percent,
+        error_code=error_code,
+        error_message=error_message,
+    )
 
 
 def _save_result(job_dir: str, result: dict):
@@ -0,0 +1,112 @@
+"""
+Portfolio Rule Evaluation Task
+
+전체 포트폴리오의 Banking Insights / Rule-based 시그널 규칙을 한 번에 평가한다
+(app.services.portfolio_rules). LLM 호출이 없으므로 Celery Beat로 짧은 주기 실행.
+
+아직 rkyc_signal에 없는 시그널 후보(event_signature 기준)가 있는 기업은 분석 Job을 생성해
+기존 분석 파이프라인이 시그널을 저장하도록 한다 (queue_reason = RULE_TRIGGERED).
+- 진행 중(QUEUED/RUNNING) Job이 있는 기업은 admit_analysis_jobs가 제외
+- RULE_JOB_COOLDOWN 이내에 분석 Job이 생성된 기업은 제외 (분석이 같은 후보를 저장하지 않아도
+  10분마다 다시 넣지 않도록)
+- 1회 최대 MAX_RULE_JOBS 기업, 그리고 JobScheduler의 현재 admission window 이내
+  (정기 분석과 같은 BACKGROUND_QUEUE로 publish - 사용자 요청 Job과 정기 분석의 backpressure를 공유)
+"""
+
+import logging
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.worker.celery_app import celery_app
+from app.worker.db import get_sync_db
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTED_CANDIDATES = 50
+MAX_RULE_JOBS = 50
+RULE_JOB_COOLDOWN = timedelta(hours=6)
+
+RECENT_JOBS_SQL = text("""
+    SELECT DISTINCT corp_id FROM rkyc_job
+    WHERE corp_id = ANY(CAST(:corp_ids AS varchar[]))
+      AND job_type = 'ANALYZE'
+      AND queued_at > CAST(:since AS timestamptz)
+""")
+
+
+def admit_rule_triggered_jobs(session, candidates: list[dict], limit: int = MAX_RULE_JOBS) -> list:
+    """신규 시그널 후보가 있는 기업의 분석 Job 생성 (최근 분석 Job이 있는 기업 제외, 최대 limit)"""
+    from app.models.job import QueueReason
+    from app.services.input_fingerprint import ScanDecision
+    from app.worker.job_admission import admit_analysis_jobs
+
+    corp_ids = list(dict.fromkeys(c["corp_id"] for c in candidates))
+    limit = min(limit, MAX_RULE_JOBS)
+    if not corp_ids or limit <= 0:
+        return []
+
+    recent = {
+        row[0] for row in session.execute(RECENT_JOBS_SQL, {
+            "corp_ids": corp_ids,
+            "since": datetime.now(UTC) - RULE_JOB_COOLDOWN,
+        }).fetchall()
+    }
+    targets = [corp_id for corp_id in corp_ids if corp_id not in recent][:limit]
+    return admit_analysis_jobs(session, [ScanDecision(corp_id, QueueReason.RULE_TRIGGERED) for corp_id in targets])
+
+
+@celery_app.task(name="evaluate_portfolio_rules")
+def evaluate_portfolio_rules(corp_ids: Optional[list[str]] = None):
+    """
+    포트폴리오 규칙 일괄 평가 + 신규 시그널 후보 기업 분석 Job 생성
+    Triggered by Celery Beat.
+
+    Args:
+        corp_ids: 대상 기업 (미지정 시 banking data 또는 Internal Snapshot이 있는 전체 기업)
+
+    Returns:
+        dict: 평가 요약 + new_signal_candidates (최대 MAX_REPORTED_CANDIDATES) + 생성/publish한 Job 수
+    """
+    from app.services.portfolio_rules import evaluate_portfolio_sync, find_new_signal_candidates
+    from app.worker.job_scheduler import get_job_scheduler
+
+    scheduler = get_job_scheduler()
+    window = 0
+    with get_sync_db() as session:
+        evaluation = evaluate_portfolio_sync(session, corp_ids)
+        new_candidates = find_new_signal_candidates(session, evaluation)
+        admitted = []
+        if new_candidates:
+            window = scheduler.capacity(session).window
+            admitted = admit_rule_triggered_jobs(session, new_candidates, limit=window)
+    dispatched = scheduler.dispatch(admitted)
+
+    summary = {
+        "status": "success",
+        **evaluation.summary(),
+        "new_signal_candidates": len(new_candidates),
+        "new_signal_candidate_list": [
+            {
+                "corp_id": c["corp_id"],
+                "event_type": c["event_type"],
+                "impact_direction": c["impact_direction"],
+                "impact_strength": c["impact_strength"],
+                "title": c["title"],
+                "event_signature": c["event_signature"],
+            }
+            for c in new_candidates[:MAX_REPORTED_CANDIDATES]
+        ],
+        "admission_window": window,
+        "jobs_queued": len(admitted),
+        "jobs_dispatched": dispatched,
+        "job_ids": [job.job_id for job in admitted],
+    }
+    logger.info(
+        f"[PortfolioRules] Evaluated {summary['corporations']} corps: "
+        f"{summary['flagged_corporations']} flagged, {summary['insights']} insights, "
+        f"{summary['signal_candidates']} signal candidates ({summary['new_signal_candidates']} new), "
+        f"{dispatched}/{len(admitted)} analysis jobs dispatched"
+    )
+    return summary
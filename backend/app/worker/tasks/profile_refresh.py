@@ -17,7 +17,9 @@ from sqlalchemy import text
 
 from app.worker.db import get_sync_db
 from app.worker.pipelines.corp_profiling import CorpProfilingPipeline, get_corp_profiling_pipeline
+from app.worker.pipelines.profile_phase_cache import ALL_PHASES
 from app.worker.llm.circuit_breaker import get_circuit_breaker_manager
+from app.worker.tasks.report_snapshot import schedule_report_rebuild
 
 logger = logging.getLogger(__name__)
 
@@ -38,19 +40,27 @@ def refresh_corp_profile(
     corp_id: str,
     force: bool = False,
     trigger_source: str = "manual",
+    phases: Optional[list[str]] = None,
 ):
     """
     단일 기업 프로필 갱신
 
+    프로필이 만료되면 phase 캐시(rkyc_corp_profile_phase)에서 미만료 phase는
+    재사용하고 만료/입력 변경된 phase만 재실행한 뒤 재병합한다.
+
     Args:
         corp_id: 기업 ID
-        force: 캐시 무시 강제 갱신
+        force: 캐시 무시 강제 갱신 (모든 phase 재실행)
         trigger_source: 트리거 소스 (page_visit, signal, batch, manual)
+        phases: 만료 여부와 관계없이 재실행할 phase (ProfilePhase 값, 예: ["phase3"])
 
     Returns:
         dict: 갱신 결과
     """
-    logger.info(f"[ProfileRefresh] Starting for {corp_id} (force={force}, source={trigger_source})")
+    logger.info(
+        f"[ProfileRefresh] Starting for {corp_id} "
+        f"(force={force}, phases={phases}, source={trigger_source})"
+    )
 
     try:
         with get_sync_db() as session:
@@ -72,8 +82,8 @@ def refresh_corp_profile(
             industry_code = corp.industry_code
             industry_name = corp.industry_nm or f"업종코드 {industry_code}"
 
-            # 캐시 확인 (force가 아닌 경우)
-            if not force:
+            # 캐시 확인 (force / phase 지정이 아닌 경우)
+            if not force and not phases:
                 cache_query = text("""
                     SELECT profile_id, expires_at, profile_confidence
                     FROM rkyc_corp_profile
@@ -101,12 +111,18 @@ def refresh_corp_profile(
             # 동기 실행을 위한 wrapper
             import asyncio
 
+            # 프로필 캐시는 위에서 확인했으므로 재병합 (skip_cache)
+            # phase는 force면 전체, 아니면 지정 phase + 만료된 phase만 재실행
+            rerun_phases = ALL_PHASES if force else (phases or ())
+
             async def run_pipeline():
                 return await pipeline.execute(
                     corp_id=corp_id,
                     corp_name=corp_name,
                     industry_code=industry_code,
                     db_session=None,  # 파이프라인 내부에서 별도 세션 사용
+                    skip_cache=True,
+                    rerun_phases=rerun_phases,
                 )
 
             # 이벤트 루프 실행
@@ -117,6 +133,9 @@ def refresh_corp_profile(
             finally:
                 loop.close()
 
+            if not result.is_cached:
+                schedule_report_rebuild(corp_id)
+
             logger.info(
                 f"[ProfileRefresh] Completed for {corp_id}: "
                 f"cached={result.is_cached}, "
@@ -129,6 +148,7 @@ def refresh_corp_profile(
                 "profile_id": result.profile.get("profile_id"),
                 "confidence": result.profile.get("profile_confidence"),
                 "selected_queries": result.selected_queries,
+                "phase_cache": (result.profile.get("field_provenance") or {}).get("phase_cache", {}),
             }
 
     except Exception as e:
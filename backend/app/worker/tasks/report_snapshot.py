@@ -0,0 +1,69 @@
+"""
+Report Snapshot Rebuild Task
+
+보고서 원천(시그널, loan insight, corp profile)이 바뀐 기업의 스냅샷(migration_v23)을
+다음 열람 전에 미리 조립한다 (app.services.report_snapshot).
+
+무효화는 DB 트리거가 담당하므로 이 태스크는 캐시 예열일 뿐이다 - 예약이 실패하거나 늦어도
+열람 시 직접 조립한다. 짧은 지연(REBUILD_DELAY_SECONDS) 후 실행해 연속 변경을 한 번에 반영하고,
+이미 최신인 스냅샷은 다시 조립하지 않는다.
+"""
+
+import logging
+from typing import Optional
+
+from app.worker.celery_app import celery_app
+from app.worker.db import get_sync_db
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="rebuild_report_snapshot")
+def rebuild_report_snapshot(corp_id: str, force: bool = False):
+    """
+    기업 보고서 스냅샷 재생성
+
+    Args:
+        corp_id: 기업 ID
+        force: 최신 스냅샷도 다시 조립
+
+    Returns:
+        dict: {"corp_id", "result": fresh | rebuilt | unchanged | stale | partial | failed}
+    """
+    from app.services.report_snapshot import rebuild_snapshot_sync
+
+    try:
+        with get_sync_db() as session:
+            result = rebuild_snapshot_sync(session, corp_id, force=force)
+    except Exception as e:
+        logger.warning(f"[ReportSnapshot] Rebuild failed for {corp_id}: {e}")
+        return {"corp_id": corp_id, "result": "failed", "error": str(e)[:200]}
+
+    logger.info(f"[ReportSnapshot] {corp_id}: {result}")
+    return {"corp_id": corp_id, "result": result}
+
+
+def schedule_report_rebuild(corp_id: Optional[str]) -> bool:
+    """
+    스냅샷 재생성 예약 (실패해도 호출 측 작업에 영향 없음)
+
+    Returns:
+        예약 여부
+    """
+    from app.services.report_snapshot import ReportSnapshotConfig
+
+    if not corp_id:
+        return False
+    config = ReportSnapshotConfig()
+    if not config.ENABLED:
+        return False
+    try:
+        rebuild_report_snapshot.apply_async(
+            args=[corp_id],
+            countdown=config.REBUILD_DELAY_SECONDS,
+            queue="low",
+        )
+        return True
+    except Exception as e:
+        logger.warning(f"[ReportSnapshot] Failed to schedule rebuild for {corp_id}: {e}")
+        return False
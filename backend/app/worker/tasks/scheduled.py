@@ -5,84 +5,88 @@ Periodic background tasks for automated signal detection
 
 import logging
 from datetime import datetime, UTC, timedelta
+from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import text
 
+from app.models.job import QueueReason
 from app.worker.celery_app import celery_app
 from app.worker.db import get_sync_db
+from app.worker.job_scheduler import INTERACTIVE_QUEUE, get_job_scheduler
+from app.worker.partition_maintenance import get_partition_maintainer
 from app.worker.tasks.analysis import run_analysis_pipeline
 
 logger = logging.getLogger(__name__)
 
 
+def queue_analysis_job(
+    db,
+    corp_id: str,
+    queue_reason: QueueReason,
+    input_fingerprint: Optional[str] = None,
+) -> str:
+    """분석 Job 생성 (생성 사유 기록) 후 파이프라인 태스크 dispatch (수동 실행 → high 큐)"""
+
+    job_id = str(uuid4())
+    db.execute(text("""
+        INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent,
+                              input_fingerprint, queue_reason)
+        VALUES (:job_id, 'ANALYZE', :corp_id, 'QUEUED', :queued_at, 0, :input_fingerprint, :queue_reason)
+    """), {
+        "job_id": job_id,
+        "corp_id": corp_id,
+        "queued_at": datetime.now(UTC),
+        "input_fingerprint": input_fingerprint,
+        "queue_reason": queue_reason.value,
+    })
+    db.commit()
+
+    run_analysis_pipeline.apply_async(args=[job_id, corp_id], queue=INTERACTIVE_QUEUE)
+    return job_id
+
+
+def _plan_summary(plan) -> dict:
+    return {
+        "jobs_created": len(plan.admitted),
+        "candidates": len(plan.candidates),
+        "deferred": max(0, len(plan.candidates) - plan.window),
+        "admission_window": plan.window,
+        "skipped_unchanged": plan.skipped_unchanged,
+        "queue_depths": plan.depths,
+    }
+
+
+@celery_app.task(name="schedule_analysis_jobs")
+def schedule_analysis_jobs():
+    """
+    Admit background analysis jobs within the scheduler's admission window.
+    Triggered every 5 minutes by Celery Beat (app.worker.job_scheduler).
+
+    Corporations that passed the input-change gate are ranked by risk score;
+    only the top `window` are queued, the rest are picked up by later ticks.
+    """
+    plan = get_job_scheduler().run()
+    return {"status": "success", **_plan_summary(plan)}
+
+
 @celery_app.task(name="scan_all_corporations")
 def scan_all_corporations():
     """
-    Scan all active corporations for new signals.
-    Triggered periodically by Celery Beat.
+    Scan all corporations for new signals (manual full scan).
 
-    This task:
-    1. Fetches all corporations from the database
-    2. Creates an analysis job for each corporation
-    3. Queues the analysis pipeline
+    Goes through the same scheduler as the periodic tick: only corporations whose
+    inputs changed or whose freshness SLA expired are candidates, ranked by risk
+    score and bounded by the admission window (queue depth / worker slots).
     """
-    logger.info("Starting scheduled scan of all corporations")
-
+    logger.info("Starting scan of all corporations")
     try:
-        with get_sync_db() as db:
-            # Get all corporations
-            result = db.execute(text("""
-                SELECT corp_id, corp_name
-                FROM corp
-                ORDER BY corp_id
-            """))
-            corporations = result.fetchall()
-
-            jobs_created = 0
-            for corp in corporations:
-                corp_id = corp[0]
-                corp_name = corp[1]
-
-                # Check if there's already a recent job (within last hour)
-                recent_job = db.execute(text("""
-                    SELECT job_id FROM rkyc_job
-                    WHERE corp_id = :corp_id
-                      AND status IN ('QUEUED', 'RUNNING')
-                      AND queued_at > :cutoff
-                    LIMIT 1
-                """), {
-                    "corp_id": corp_id,
-                    "cutoff": datetime.now(UTC) - timedelta(hours=1)
-                }).fetchone()
-
-                if recent_job:
-                    logger.debug(f"Skipping {corp_name} - recent job exists")
-                    continue
-
-                # Create new job
-                job_id = str(uuid4())
-                db.execute(text("""
-                    INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent)
-                    VALUES (:job_id, 'ANALYZE', :corp_id, 'QUEUED', :queued_at, 0)
-                """), {
-                    "job_id": job_id,
-                    "corp_id": corp_id,
-                    "queued_at": datetime.now(UTC)
-                })
-                db.commit()
-
-                # Queue the analysis task
-                run_analysis_pipeline.delay(job_id, corp_id)
-                jobs_created += 1
-                logger.info(f"Queued analysis job for {corp_name} (job_id={job_id[:8]}...)")
-
-            logger.info(f"Scheduled scan complete: {jobs_created} jobs created for {len(corporations)} corporations")
-            return {
-                "status": "success",
-                "corporations_scanned": len(corporations),
-                "jobs_created": jobs_created
-            }
+        plan = get_job_scheduler().run()
+        logger.info(
+            f"Scan complete: {len(plan.admitted)} jobs created for {len(plan.candidates)} candidates "
+            f"({plan.skipped_unchanged} unchanged)"
+        )
+        return {"status": "success", **_plan_summary(plan)}
 
     except Exception as e:
         logger.error(f"Scheduled scan failed: {str(e)}")
@@ -109,20 +113,8 @@ def scan_single_corporation(corp_id: str):
                 logger.error(f"Corporation not found: {corp_id}")
                 return {"status": "error", "message": "Corporation not found"}
 
-            # Create new job
-            job_id = str(uuid4())
-            db.execute(text("""
-                INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent)
-                VALUES (:job_id, 'ANALYZE', :corp_id, 'QUEUED', :queued_at, 0)
-            """), {
-                "job_id": job_id,
-                "corp_id": corp_id,
-                "queued_at": datetime.now(UTC)
-            })
-            db.commit()
-
-            # Queue the analysis task
-            run_analysis_pipeline.delay(job_id, corp_id)
+            # 수동/외부 이벤트 트리거는 변경 감지 게이트를 거치지 않음
+            job_id = queue_analysis_job(db, corp_id, QueueReason.MANUAL)
 
             logger.info(f"Queued analysis for {corp[0]} (job_id={job_id[:8]}...)")
             return {
@@ -144,6 +136,8 @@ def scan_high_risk_corporations():
     - Recent HIGH impact signals
     - HIGH internal risk grade
     - Recent overdue flags
+
+    Admitted through the job scheduler (risk score order, admission window).
     """
     logger.info("Starting high-risk corporation scan")
 
@@ -165,46 +159,17 @@ def scan_high_risk_corporations():
             """))
             high_risk_corps = result.fetchall()
 
-            jobs_created = 0
-            for corp in high_risk_corps:
-                corp_id = corp[0]
-
-                # Check for existing recent job
-                recent_job = db.execute(text("""
-                    SELECT job_id FROM rkyc_job
-                    WHERE corp_id = :corp_id
-                      AND status IN ('QUEUED', 'RUNNING')
-                      AND queued_at > :cutoff
-                    LIMIT 1
-                """), {
-                    "corp_id": corp_id,
-                    "cutoff": datetime.now(UTC) - timedelta(minutes=30)
-                }).fetchone()
-
-                if recent_job:
-                    continue
-
-                # Create and queue job
-                job_id = str(uuid4())
-                db.execute(text("""
-                    INSERT INTO rkyc_job (job_id, job_type, corp_id, status, queued_at, progress_percent)
-                    VALUES (:job_id, 'ANALYZE', :corp_id, 'QUEUED', :queued_at, 0)
-                """), {
-                    "job_id": job_id,
-                    "corp_id": corp_id,
-                    "queued_at": datetime.now(UTC)
-                })
-                db.commit()
-
-                run_analysis_pipeline.delay(job_id, corp_id)
-                jobs_created += 1
-
-            logger.info(f"High-risk scan complete: {jobs_created} jobs for {len(high_risk_corps)} high-risk corporations")
-            return {
-                "status": "success",
-                "high_risk_corporations": len(high_risk_corps),
-                "jobs_created": jobs_created
-            }
+        plan = get_job_scheduler().run(corp_ids=[corp[0] for corp in high_risk_corps])
+
+        logger.info(
+            f"High-risk scan complete: {len(plan.admitted)} jobs for {len(high_risk_corps)} high-risk corporations "
+            f"({plan.skipped_unchanged} unchanged)"
+        )
+        return {
+            "status": "success",
+            "high_risk_corporations": len(high_risk_corps),
+            **_plan_summary(plan),
+        }
 
     except Exception as e:
         logger.error(f"High-risk scan failed: {str(e)}")
@@ -216,6 +181,9 @@ def cleanup_old_jobs(days: int = 30):
     """
     Clean up old completed/failed jobs from the database.
     Keeps the database lean and improves query performance.
+
+    rkyc_job이 월 파티션 테이블이면(migration_v25) 월 전체가 cutoff 이전인 파티션을 먼저 분리하고,
+    남은 행만 DELETE (queued_at 조건으로 cutoff 이전 파티션만 스캔)
     """
     logger.info(f"Starting cleanup of jobs older than {days} days")
 
@@ -223,22 +191,67 @@ def cleanup_old_jobs(days: int = 30):
         with get_sync_db() as db:
             cutoff = datetime.now(UTC) - timedelta(days=days)
 
+            retired = get_partition_maintainer().retire_expired(db, "rkyc_job", cutoff)
+
+            # finished_at >= queued_at 이므로 queued_at 조건은 결과를 바꾸지 않음 (partition pruning용)
             result = db.execute(text("""
                 DELETE FROM rkyc_job
                 WHERE status IN ('DONE', 'FAILED')
                   AND finished_at < :cutoff
+                  AND queued_at < :cutoff
                 RETURNING job_id
             """), {"cutoff": cutoff})
 
             deleted_count = len(result.fetchall())
             db.commit()
 
-            logger.info(f"Cleanup complete: {deleted_count} old jobs deleted")
+            logger.info(
+                f"Cleanup complete: {deleted_count} old jobs deleted, "
+                f"{len(retired['retired'])} partitions ({retired['rows']} jobs) retired"
+            )
             return {
                 "status": "success",
-                "jobs_deleted": deleted_count
+                "jobs_deleted": deleted_count,
+                "jobs_retired": retired["rows"],
+                "partitions_retired": retired["retired"],
             }
 
     except Exception as e:
         logger.error(f"Job cleanup failed: {str(e)}")
         raise
+
+
+@celery_app.task(name="maintain_partitions")
+def maintain_partitions():
+    """
+    월 파티션 유지 (rkyc_job, rkyc_signal_index)
+    - 이번 달 ~ PARTITION_MONTHS_AHEAD개월 뒤 파티션 생성
+    - SIGNAL_INDEX_RETENTION_MONTHS가 지난 rkyc_signal_index 파티션 분리/삭제
+    """
+    try:
+        with get_sync_db() as db:
+            result = get_partition_maintainer().run(db)
+        logger.info(f"Partition maintenance complete: {result}")
+        return {"status": "success", **result}
+
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {str(e)}")
+        raise
+
+
+@celery_app.task(name="rollup_dashboard_counter")
+def rollup_dashboard_counter():
+    """
+    대시보드 카운터 증감 합산 (migration_v26)
+    트리거가 append한 rkyc_dashboard_counter_delta 행을 rkyc_dashboard_counter에 키 순서로 합산 후 삭제
+    """
+    try:
+        with get_sync_db() as db:
+            keys = db.execute(text("SELECT rkyc_dashboard_counter_rollup()")).scalar() or 0
+            db.commit()
+        logger.debug(f"Dashboard counter rollup complete: {keys} counter keys updated")
+        return {"status": "success", "keys_updated": keys}
+
+    except Exception as e:
+        logger.error(f"Dashboard counter rollup failed: {str(e)}")
+        raise
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Industry Knowledge Pre-populate Script
+
+배포 시 rkyc_industry_knowledge (IndustryKnowledgeStore Tier 3) 와 Redis를
+코드 seed 값(업종명/검색 키워드/기본 힌트)으로 채웁니다.
+industry_master에 있는 업종은 업종명을 industry_master 기준으로 적재합니다.
+
+이미 저장된 업종은 건너뜁니다 (LLM 생성 힌트 보존). --force 시 seed 값으로 덮어씁니다.
+seed 힌트는 첫 사용 시 LLM 힌트로 교체됩니다.
+
+Usage:
+    python scripts/prepopulate_industry_knowledge.py
+    python scripts/prepopulate_industry_knowledge.py --dry-run      # 적재 대상만 확인
+    python scripts/prepopulate_industry_knowledge.py --codes C26 F41
+    python scripts/prepopulate_industry_knowledge.py --force        # 기존 값 덮어쓰기
+    python scripts/prepopulate_industry_knowledge.py --invalidate   # 힌트만 무효화 (프롬프트 변경 후)
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    from app.worker.llm.industry_knowledge import (
+        INDUSTRY_KNOWLEDGE_VERSION,
+        SEED_INDUSTRY_NAMES,
+        build_seed_entry,
+        get_industry_knowledge_store,
+    )
+
+    parser = argparse.ArgumentParser(description='Pre-populate industry knowledge store')
+    parser.add_argument('--codes', nargs='+', help='Industry codes to load (default: seed + industry_master)')
+    parser.add_argument('--dry-run', action='store_true', help='Do not write, just show what would be loaded')
+    parser.add_argument('--force', action='store_true', help='Overwrite existing entries with seed values')
+    parser.add_argument('--invalidate', action='store_true', help='Only invalidate stored hints (all tiers)')
+    args = parser.parse_args()
+
+    store = get_industry_knowledge_store()
+
+    print("=" * 60)
+    print("Industry Knowledge Pre-populate")
+    print("=" * 60)
+    print(f"Mode: {'DRY-RUN (no changes)' if args.dry_run else 'LIVE'}")
+    print(f"Knowledge version: v{INDUSTRY_KNOWLEDGE_VERSION}")
+
+    if args.invalidate:
+        targets = args.codes or [None]
+        if args.dry_run:
+            print(f"Would invalidate hints for: {', '.join(c or 'ALL' for c in targets)}")
+            return
+        total = sum(store.invalidate(code) for code in targets)
+        print(f"Invalidated hints for {total} industries")
+        return
+
+    master_names = store.load_master_names()
+    codes = args.codes or sorted(set(SEED_INDUSTRY_NAMES) | set(master_names))
+    print(f"industry_master: {len(master_names)} rows, targets: {len(codes)}")
+    print("=" * 60)
+
+    loaded, skipped = [], []
+    for code in codes:
+        existing = store.get(code)
+        if existing is not None and not args.force:
+            skipped.append(code)
+            print(f"  [SKIP] {code} {existing.industry_name} (source={existing.source}, v{existing.version})")
+            continue
+
+        entry = build_seed_entry(code, master_names.get(code))
+        print(f"  [LOAD] {code} {entry.industry_name} (keywords={sum(len(v) for v in entry.keywords.values())})")
+        if not args.dry_run:
+            store.put(entry)
+        loaded.append(code)
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"Loaded: {len(loaded)}, Skipped (already stored): {len(skipped)}")
+    if not store.config.DB_ENABLED:
+        print("Warning: INDUSTRY_KNOWLEDGE_DB_ENABLED=false - only Redis/memory were written")
+
+
+if __name__ == '__main__':
+    main()
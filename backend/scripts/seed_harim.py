@@ -36,12 +36,11 @@ async def main():
         print("❌ '하림' 기업을 찾을 수 없습니다.")
         # 유사한 이름으로 재검색
         print("\n'하림' 관련 기업 검색...")
-        from app.services.dart_api import _corp_code_by_name, _normalize_corp_name
+        from app.services.dart_api import search_corp_codes
 
-        search_term = _normalize_corp_name("하림")
         matches = [
-            (name, code) for name, code in _corp_code_by_name.items()
-            if search_term in name or "하림" in name
+            (m.corp_name, m.corp_code)
+            for m in await search_corp_codes("하림", limit=10)
         ]
 
         if matches:
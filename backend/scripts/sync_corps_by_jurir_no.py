@@ -22,8 +22,7 @@ from datetime import datetime, timezone
 from app.services.dart_api import (
     load_corp_codes,
     get_company_info,
-    _corp_code_cache,
-    _corp_code_by_name,
+    list_corp_codes,
     DART_API_KEY,
     DART_BASE_URL,
 )
@@ -58,14 +57,12 @@ async def find_corp_by_jurir_no(jurir_no: str) -> dict | None:
     직접 검색하거나 캐시를 활용해야 함.
     """
     # 캐시된 corp_code 목록이 없으면 로드
-    if not _corp_code_cache:
-        print(f"[DART] Loading corp codes...")
-        await load_corp_codes()
-        print(f"[DART] Loaded {len(_corp_code_cache)} corp codes")
+    print(f"[DART] Loading corp codes...")
+    await load_corp_codes()
 
     # 모든 corp_code에 대해 순회하며 jurir_no 매칭
     # 너무 많으면 시간이 오래 걸리므로 batch로 처리
-    corp_codes = [k for k in _corp_code_cache.keys() if not k.startswith("stock:")]
+    corp_codes = list_corp_codes()
 
     print(f"[DART] Searching for jurir_no={jurir_no} in {len(corp_codes)} corps...")
 
@@ -99,9 +96,8 @@ async def search_corp_by_jurir_no_fast(jurir_no: str) -> dict | None:
     DART의 공시검색 API를 활용하여 법인등록번호로 검색 시도
     """
     # 캐시된 corp_code 목록에서 검색
-    if not _corp_code_cache:
-        print(f"[DART] Loading corp codes...")
-        await load_corp_codes()
+    print(f"[DART] Loading corp codes...")
+    await load_corp_codes()
 
     # 일반적으로 법인등록번호 앞 6자리는 등기소 코드
     # 110111 = 서울중앙지방법원
@@ -113,10 +109,10 @@ async def search_corp_by_jurir_no_fast(jurir_no: str) -> dict | None:
     # 효율적인 방법: 최근 공시 기업 중심으로 검색
     # 여기서는 모든 기업을 순회하는 대신 랜덤 샘플링
 
-    corp_codes = [k for k in _corp_code_cache.keys() if not k.startswith("stock:")]
+    corp_codes = list_corp_codes()
 
     # 상장사 우선 검색 (주로 법인등록번호 공개됨)
-    stock_corp_codes = [k.replace("stock:", "") for k in _corp_code_cache.keys() if k.startswith("stock:")]
+    stock_corp_codes = list_corp_codes(listed_only=True)
 
     print(f"[DART] Searching jurir_no={jurir_no} in {len(stock_corp_codes)} listed companies first...")
 
@@ -163,11 +159,10 @@ async def search_all_jurir_nos(jurir_nos: list[str]) -> dict[str, dict]:
     여러 법인등록번호를 한 번에 검색
     효율적으로 검색하기 위해 한 번의 순회로 모든 jurir_no 체크
     """
-    if not _corp_code_cache:
-        print(f"[DART] Loading corp codes...")
-        await load_corp_codes()
+    print(f"[DART] Loading corp codes...")
+    await load_corp_codes()
 
-    corp_codes = [k for k in _corp_code_cache.keys() if not k.startswith("stock:")]
+    corp_codes = list_corp_codes()
     target_set = set(jurir_nos)
     found = {}
 
@@ -0,0 +1,18 @@
+-- ============================================================
+-- Migration v17: Document Fact Digest
+-- 처리 완료 문서의 Fact 요약을 file_hash와 함께 저장
+-- DOC_INGEST가 변경되지 않은 문서에 대해 Fact 재조회/재요약을 생략
+-- ============================================================
+
+-- 1. rkyc_document 테이블에 fact digest 컬럼 추가
+-- 구조: {"file_hash": "...", "facts": [...], "summary": {...}, "generated_at": "..."}
+-- file_hash가 rkyc_document.file_hash와 다르면 무효
+ALTER TABLE rkyc_document ADD COLUMN IF NOT EXISTS fact_digest JSONB;
+
+COMMENT ON COLUMN rkyc_document.fact_digest IS 'DOC_INGEST 결과 요약 캐시 (file_hash 일치 시에만 유효)';
+
+-- Note: 일괄 Fact 조회(doc_id IN (...))는 기존 idx_fact_doc 인덱스 사용
+
+-- 확인용 쿼리
+-- SELECT doc_id, doc_type, fact_digest->>'file_hash' = file_hash AS digest_valid
+-- FROM rkyc_document WHERE corp_id = '8001-3719240';
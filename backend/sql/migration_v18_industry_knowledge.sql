@@ -0,0 +1,44 @@
+-- ============================================================
+-- Migration v18: Industry Knowledge Store
+-- 업종명/검색 키워드/LLM 업종 힌트를 DB에 저장 (IndustryKnowledgeStore Tier 3)
+-- 기존: 업종명·키워드는 코드 상수, 업종 힌트는 프로세스별 메모리 dict
+-- 배포 시 scripts/prepopulate_industry_knowledge.py 로 사전 적재
+-- ============================================================
+
+-- 1. rkyc_industry_knowledge 테이블 생성
+CREATE TABLE IF NOT EXISTS rkyc_industry_knowledge (
+    industry_code VARCHAR(10) PRIMARY KEY,
+    industry_name VARCHAR(100) NOT NULL,
+
+    -- 외부 검색 키워드 {"supply_chain": [...], "regulation": [...], "market": [...]}
+    keywords JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- 업종 힌트 {"typical_materials": [...], "typical_suppliers": [...], ...}
+    -- NULL이면 미생성/무효화됨 → 다음 조회 시 재생성
+    hints JSONB,
+
+    -- 힌트 프롬프트/스키마 버전 (INDUSTRY_KNOWLEDGE_VERSION과 다르면 stale)
+    version INTEGER NOT NULL DEFAULT 1,
+    source VARCHAR(20) NOT NULL DEFAULT 'seed',     -- seed, llm, manual
+
+    refreshed_at TIMESTAMPTZ,                        -- 힌트 생성 시각
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE rkyc_industry_knowledge IS '업종 지식 저장소 (업종명/키워드/LLM 힌트, Memory→Redis→DB 3-tier)';
+COMMENT ON COLUMN rkyc_industry_knowledge.hints IS 'LLM 업종 힌트 (NULL = 무효화됨)';
+COMMENT ON COLUMN rkyc_industry_knowledge.version IS '힌트 버전 (코드 상수와 다르면 백그라운드 재생성)';
+
+-- 2. 재생성 대상 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_industry_knowledge_refreshed ON rkyc_industry_knowledge(refreshed_at);
+
+-- 3. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v18 완료: rkyc_industry_knowledge 테이블 생성됨';
+END $$;
+
+-- 확인용 쿼리
+-- SELECT industry_code, industry_name, source, version, refreshed_at, hints IS NOT NULL AS has_hints
+-- FROM rkyc_industry_knowledge ORDER BY industry_code;
@@ -0,0 +1,36 @@
+-- ============================================================
+-- Migration v19: Corp Profile Phase Cache
+-- 프로파일링 단계(phase)별 산출물 저장 - 갱신 시 만료된 phase만 재실행 후 재병합
+-- phase: phase1/phase2/phase3 (Perplexity 검색), phaseN_summary (요약),
+--        gemini (Gemini Grounding 검색), consensus (합성 결과)
+-- ============================================================
+
+-- 1. rkyc_corp_profile_phase 테이블 생성
+CREATE TABLE IF NOT EXISTS rkyc_corp_profile_phase (
+    corp_id VARCHAR(20) NOT NULL REFERENCES corp(corp_id) ON DELETE CASCADE,
+    phase VARCHAR(30) NOT NULL,
+
+    -- phase 입력(쿼리/본문/프롬프트) sha256 - 입력이 바뀌면 TTL과 무관하게 재실행
+    input_hash VARCHAR(64) NOT NULL,
+    payload JSONB NOT NULL,
+
+    generated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL,             -- phase별 TTL (PROFILE_PHASE_TTL_*)
+
+    PRIMARY KEY (corp_id, phase)
+);
+
+COMMENT ON TABLE rkyc_corp_profile_phase IS '기업 프로파일링 phase별 산출물 캐시 (phase별 TTL)';
+
+-- 2. 만료 정리용 인덱스
+CREATE INDEX IF NOT EXISTS idx_corp_profile_phase_expires ON rkyc_corp_profile_phase(expires_at);
+
+-- 3. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v19 완료: rkyc_corp_profile_phase 테이블 생성됨';
+END $$;
+
+-- 확인용 쿼리
+-- SELECT corp_id, phase, generated_at, expires_at, expires_at > NOW() AS valid
+-- FROM rkyc_corp_profile_phase WHERE corp_id = '8001-3719240' ORDER BY phase;
@@ -0,0 +1,73 @@
+-- ============================================================
+-- Migration v20: DART Filing Local Sync
+-- 재무제표 주요계정 / 주요사항보고서를 배치(sync_dart_filings)로 로컬 적재
+-- 기존: 요청마다 DART 실시간 호출 (get_financial_statements_by_name, get_major_events_by_name)
+-- 조회 경로(banking_data, /dart/financials*, /dart/events*, 프로파일링)는 동기화된 기업이면 로컬 우선
+-- ============================================================
+
+-- 1. 재무제표 주요계정
+CREATE TABLE IF NOT EXISTS rkyc_dart_financial (
+    corp_code VARCHAR(8) NOT NULL,
+    bsns_year VARCHAR(4) NOT NULL,
+    reprt_code VARCHAR(5) NOT NULL,             -- 11011=사업보고서
+    fs_div VARCHAR(3) NOT NULL,                 -- OFS=개별, CFS=연결
+
+    revenue BIGINT,
+    operating_profit BIGINT,
+    net_income BIGINT,
+    total_assets BIGINT,
+    total_liabilities BIGINT,
+    total_equity BIGINT,
+    retained_earnings BIGINT,
+    debt_ratio DOUBLE PRECISION,
+
+    synced_at TIMESTAMPTZ DEFAULT NOW(),
+
+    PRIMARY KEY (corp_code, bsns_year, reprt_code, fs_div)
+);
+
+COMMENT ON TABLE rkyc_dart_financial IS 'DART 재무제표 주요계정 로컬 사본 (fnlttSinglAcnt)';
+
+-- 2. 주요사항보고서
+CREATE TABLE IF NOT EXISTS rkyc_dart_event (
+    rcept_no VARCHAR(14) PRIMARY KEY,           -- 접수번호 (YYYYMMDD + 일련번호, 단조 증가)
+    corp_code VARCHAR(8) NOT NULL,
+    rcept_dt VARCHAR(8) NOT NULL,
+    report_nm TEXT NOT NULL,
+    event_type VARCHAR(30) NOT NULL,
+    corp_name VARCHAR(200),
+    flr_nm VARCHAR(200),
+    rm VARCHAR(50),
+
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_dart_event_corp_dt ON rkyc_dart_event(corp_code, rcept_dt DESC);
+
+COMMENT ON TABLE rkyc_dart_event IS 'DART 주요사항보고서 로컬 사본 (list.json, pblntf_ty=B)';
+
+-- 3. 기업별 동기화 상태 (high-water mark)
+CREATE TABLE IF NOT EXISTS rkyc_dart_sync_state (
+    corp_code VARCHAR(8) PRIMARY KEY,
+
+    events_from VARCHAR(8),                     -- 로컬 공시가 보장하는 시작일
+    events_last_rcept_no VARCHAR(14),           -- 마지막으로 적재한 접수번호
+    events_last_rcept_dt VARCHAR(8),
+
+    financials_checked_at TIMESTAMPTZ,          -- 미제출 연도 재확인 주기 판단용
+    last_synced_at TIMESTAMPTZ,                 -- 로컬 조회 허용 여부 (DART_LOCAL_MAX_AGE_HOURS)
+    last_error TEXT
+);
+
+COMMENT ON TABLE rkyc_dart_sync_state IS 'DART 공시 동기화 상태 (기업별 high-water mark)';
+
+-- 4. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v20 완료: rkyc_dart_financial, rkyc_dart_event, rkyc_dart_sync_state 생성됨';
+END $$;
+
+-- 확인용 쿼리
+-- SELECT s.corp_code, s.events_last_rcept_no, s.last_synced_at,
+--        (SELECT COUNT(*) FROM rkyc_dart_event e WHERE e.corp_code = s.corp_code) AS events
+-- FROM rkyc_dart_sync_state s ORDER BY s.last_synced_at DESC;
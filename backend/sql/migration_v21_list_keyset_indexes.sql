@@ -0,0 +1,37 @@
+-- ============================================================
+-- Migration v21: List Keyset Pagination Indexes
+-- GET /signals, /corporations, /jobs cursor 페이지네이션 (app/services/pagination.py)
+-- 정렬: (sort DESC [NULLS LAST], PK DESC) - 인덱스 정렬과 일치해야 범위 스캔으로 시작
+-- rkyc_signal_index.detected_at은 NOT NULL → 기존 (필터, detected_at DESC) 인덱스도 그대로 사용
+-- ============================================================
+
+-- 1. 시그널 목록 (필터 없음 / 상태 필터)
+CREATE INDEX IF NOT EXISTS idx_signal_index_detected_keyset
+    ON rkyc_signal_index(detected_at DESC, signal_id DESC);
+
+-- 2. 기업 목록 (created_at nullable)
+CREATE INDEX IF NOT EXISTS idx_corp_created_keyset
+    ON corp(created_at DESC NULLS LAST, corp_id DESC);
+
+-- 3. 작업 목록 (queued_at nullable)
+CREATE INDEX IF NOT EXISTS idx_job_queued_keyset
+    ON rkyc_job(queued_at DESC NULLS LAST, job_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_job_corp_queued_keyset
+    ON rkyc_job(corp_id, queued_at DESC NULLS LAST, job_id DESC);
+
+-- 4. count=estimate 용 planner 통계 갱신
+ANALYZE rkyc_signal_index;
+ANALYZE corp;
+ANALYZE rkyc_job;
+
+-- 5. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v21 완료: keyset pagination 인덱스 생성됨';
+END $$;
+
+-- 확인용 쿼리
+-- EXPLAIN SELECT * FROM rkyc_signal_index
+-- WHERE (detected_at, signal_id) < (NOW(), '00000000-0000-0000-0000-000000000000')
+-- ORDER BY detected_at DESC, signal_id DESC LIMIT 51;
@@ -0,0 +1,144 @@
+-- ============================================================
+-- Migration v22: Dashboard Signal Counter
+-- GET /dashboard/summary를 전체 집계(rkyc_signal_index JOIN rkyc_signal) 대신
+-- (signal_type, impact_direction, signal_status)별 카운터(최대 27 row) 조회로 대체
+--
+-- 카운터는 트리거로 유지 → IndexPipeline, 상태 변경 API(PATCH status / dismiss),
+-- 관리 스크립트 등 모든 쓰기 경로가 같은 트랜잭션 안에서 반영됨
+-- - rkyc_signal_index INSERT/DELETE     → 해당 시그널 상태 버킷 +1/-1
+-- - rkyc_signal signal_status UPDATE    → 인덱스 행 수만큼 이전 상태 -1, 새 상태 +1
+-- - rkyc_signal DELETE                  → 인덱스 행을 먼저 삭제 (CASCADE 전, 상태 조회 가능하도록)
+-- 불일치 의심 시: SELECT rkyc_dashboard_counter_rebuild();
+-- ============================================================
+
+BEGIN;
+
+-- 집계 도중 들어오는 시그널이 카운터에서 빠지지 않도록 잠금
+LOCK TABLE rkyc_signal IN SHARE ROW EXCLUSIVE MODE;
+LOCK TABLE rkyc_signal_index IN SHARE ROW EXCLUSIVE MODE;
+
+-- 1. 카운터 테이블
+CREATE TABLE IF NOT EXISTS rkyc_dashboard_counter (
+    signal_type signal_type_enum NOT NULL,
+    impact_direction impact_direction_enum NOT NULL,
+    signal_status signal_status_enum NOT NULL,
+    signal_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (signal_type, impact_direction, signal_status)
+);
+
+COMMENT ON TABLE rkyc_dashboard_counter IS 'Dashboard 요약 카운터 (트리거 유지, GET /dashboard/summary)';
+
+-- 2. 카운터 증감
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_add(
+    p_signal_type signal_type_enum,
+    p_impact_direction impact_direction_enum,
+    p_signal_status signal_status_enum,
+    p_delta BIGINT
+) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO rkyc_dashboard_counter (signal_type, impact_direction, signal_status, signal_count, updated_at)
+    VALUES (p_signal_type, p_impact_direction, COALESCE(p_signal_status, 'NEW'), p_delta, NOW())
+    ON CONFLICT (signal_type, impact_direction, signal_status) DO UPDATE SET
+        signal_count = rkyc_dashboard_counter.signal_count + EXCLUDED.signal_count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. rkyc_signal_index INSERT/DELETE
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_on_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_status signal_status_enum;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT signal_status INTO v_status FROM rkyc_signal WHERE signal_id = NEW.signal_id;
+        PERFORM rkyc_dashboard_counter_add(NEW.signal_type, NEW.impact_direction, v_status, 1);
+        RETURN NEW;
+    END IF;
+
+    SELECT signal_status INTO v_status FROM rkyc_signal WHERE signal_id = OLD.signal_id;
+    PERFORM rkyc_dashboard_counter_add(OLD.signal_type, OLD.impact_direction, v_status, -1);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_index ON rkyc_signal_index;
+CREATE TRIGGER trigger_dashboard_counter_index
+    AFTER INSERT OR DELETE ON rkyc_signal_index
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_dashboard_counter_on_index();
+
+-- 4. rkyc_signal 상태 변경
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_on_status()
+RETURNS TRIGGER AS $$
+DECLARE
+    r RECORD;
+BEGIN
+    IF COALESCE(OLD.signal_status, 'NEW') = COALESCE(NEW.signal_status, 'NEW') THEN
+        RETURN NEW;
+    END IF;
+    FOR r IN
+        SELECT signal_type, impact_direction FROM rkyc_signal_index WHERE signal_id = NEW.signal_id
+    LOOP
+        PERFORM rkyc_dashboard_counter_add(r.signal_type, r.impact_direction, OLD.signal_status, -1);
+        PERFORM rkyc_dashboard_counter_add(r.signal_type, r.impact_direction, NEW.signal_status, 1);
+    END LOOP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_status ON rkyc_signal;
+CREATE TRIGGER trigger_dashboard_counter_status
+    AFTER UPDATE OF signal_status ON rkyc_signal
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_dashboard_counter_on_status();
+
+-- 5. rkyc_signal DELETE: CASCADE 전에 인덱스 행 삭제 (상태 조회 가능한 시점에 차감)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_on_signal_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM rkyc_signal_index WHERE signal_id = OLD.signal_id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_signal_delete ON rkyc_signal;
+CREATE TRIGGER trigger_dashboard_counter_signal_delete
+    BEFORE DELETE ON rkyc_signal
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_dashboard_counter_on_signal_delete();
+
+-- 6. 전체 재계산 (초기 적재 / 불일치 복구)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_rebuild()
+RETURNS BIGINT AS $$
+DECLARE
+    v_total BIGINT;
+BEGIN
+    LOCK TABLE rkyc_dashboard_counter IN EXCLUSIVE MODE;
+    DELETE FROM rkyc_dashboard_counter;
+    INSERT INTO rkyc_dashboard_counter (signal_type, impact_direction, signal_status, signal_count, updated_at)
+    SELECT si.signal_type, si.impact_direction, COALESCE(s.signal_status, 'NEW'), COUNT(*), NOW()
+    FROM rkyc_signal_index si
+    JOIN rkyc_signal s ON s.signal_id = si.signal_id
+    GROUP BY 1, 2, 3;
+    SELECT COALESCE(SUM(signal_count), 0) INTO v_total FROM rkyc_dashboard_counter;
+    RETURN v_total;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rkyc_dashboard_counter_rebuild();
+
+COMMIT;
+
+-- 7. 검증
+DO $$
+DECLARE
+    v_counter BIGINT;
+    v_actual BIGINT;
+BEGIN
+    SELECT COALESCE(SUM(signal_count), 0) INTO v_counter FROM rkyc_dashboard_counter;
+    SELECT COUNT(*) INTO v_actual FROM rkyc_signal_index si JOIN rkyc_signal s ON s.signal_id = si.signal_id;
+    RAISE NOTICE 'Migration v22 완료: rkyc_dashboard_counter = %, 실제 = %', v_counter, v_actual;
+END $$;
@@ -0,0 +1,117 @@
+-- ============================================================
+-- Migration v23: Corporation Report Snapshot
+-- GET /reports/corporation/{corp_id} 응답(FullReportResponse)을 corp_id별로 저장하고
+-- 원천 데이터가 바뀔 때만 다시 조립 (app.services.report_snapshot)
+--
+-- version은 트리거가 증가 → IndexPipeline, InsightPipeline, 프로필 갱신,
+-- 상태 변경 API(PATCH status / dismiss), 관리 스크립트 등 모든 쓰기 경로가 같은 트랜잭션 안에서 반영됨
+-- - rkyc_signal_index INSERT/UPDATE/DELETE   (rkyc_signal DELETE는 v22 트리거가 인덱스 행을 먼저 삭제)
+-- - rkyc_signal UPDATE                       (상태, 요약, 기각 사유 등)
+-- - rkyc_loan_insight INSERT/UPDATE/DELETE
+-- - rkyc_corp_profile INSERT/UPDATE/DELETE
+-- - corp UPDATE (corp_name, biz_no, industry_code)
+-- rkyc_evidence는 IndexPipeline이 시그널/인덱스와 같은 트랜잭션에서만 기록하므로 별도 트리거 없음
+--
+-- 스냅샷은 built_version = version 일 때만 제공, 아니면 조립 후 저장
+-- 전체 재생성: SELECT rkyc_report_snapshot_invalidate_all();
+-- ============================================================
+
+-- 1. 스냅샷 테이블
+CREATE TABLE IF NOT EXISTS rkyc_report_snapshot (
+    corp_id VARCHAR(20) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,          -- 원천 변경 시 +1 (트리거)
+    built_version BIGINT NOT NULL DEFAULT 0,    -- payload를 조립할 때의 version
+    etag VARCHAR(64),                           -- generated_at 제외 내용 해시
+    payload JSONB,                              -- FullReportResponse
+    built_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE rkyc_report_snapshot IS '기업 보고서 스냅샷 (트리거 version 기반 무효화, GET /reports/corporation/{corp_id})';
+
+-- 2. version 증가
+CREATE OR REPLACE FUNCTION rkyc_report_snapshot_touch(p_corp_id VARCHAR)
+RETURNS VOID AS $$
+BEGIN
+    IF p_corp_id IS NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO rkyc_report_snapshot (corp_id, version, updated_at)
+    VALUES (p_corp_id, 1, NOW())
+    ON CONFLICT (corp_id) DO UPDATE SET
+        version = rkyc_report_snapshot.version + 1,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. corp_id 컬럼이 있는 원천 테이블 공용 트리거 함수
+CREATE OR REPLACE FUNCTION rkyc_report_snapshot_on_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM rkyc_report_snapshot_touch(OLD.corp_id);
+        RETURN OLD;
+    END IF;
+    IF TG_OP = 'UPDATE' AND OLD.corp_id IS DISTINCT FROM NEW.corp_id THEN
+        PERFORM rkyc_report_snapshot_touch(OLD.corp_id);
+    END IF;
+    PERFORM rkyc_report_snapshot_touch(NEW.corp_id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_report_snapshot_signal_index ON rkyc_signal_index;
+CREATE TRIGGER trigger_report_snapshot_signal_index
+    AFTER INSERT OR UPDATE OR DELETE ON rkyc_signal_index
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_report_snapshot_on_change();
+
+DROP TRIGGER IF EXISTS trigger_report_snapshot_signal ON rkyc_signal;
+CREATE TRIGGER trigger_report_snapshot_signal
+    AFTER UPDATE ON rkyc_signal
+    FOR EACH ROW
+    WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION rkyc_report_snapshot_on_change();
+
+DROP TRIGGER IF EXISTS trigger_report_snapshot_loan_insight ON rkyc_loan_insight;
+CREATE TRIGGER trigger_report_snapshot_loan_insight
+    AFTER INSERT OR UPDATE OR DELETE ON rkyc_loan_insight
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_report_snapshot_on_change();
+
+DROP TRIGGER IF EXISTS trigger_report_snapshot_corp_profile ON rkyc_corp_profile;
+CREATE TRIGGER trigger_report_snapshot_corp_profile
+    AFTER INSERT OR UPDATE OR DELETE ON rkyc_corp_profile
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_report_snapshot_on_change();
+
+DROP TRIGGER IF EXISTS trigger_report_snapshot_corp ON corp;
+CREATE TRIGGER trigger_report_snapshot_corp
+    AFTER UPDATE OF corp_name, biz_no, industry_code ON corp
+    FOR EACH ROW
+    EXECUTE FUNCTION rkyc_report_snapshot_on_change();
+
+-- 4. 전체 무효화 (조립 로직 변경 배포 후 등)
+CREATE OR REPLACE FUNCTION rkyc_report_snapshot_invalidate_all()
+RETURNS BIGINT AS $$
+DECLARE
+    v_count BIGINT;
+BEGIN
+    UPDATE rkyc_report_snapshot
+    SET version = version + 1, updated_at = NOW()
+    WHERE built_version = version;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. 검증
+DO $$
+DECLARE
+    v_triggers INT;
+BEGIN
+    SELECT COUNT(*) INTO v_triggers
+    FROM pg_trigger
+    WHERE tgname LIKE 'trigger_report_snapshot_%' AND NOT tgisinternal;
+    RAISE NOTICE 'Migration v23 완료: rkyc_report_snapshot 트리거 % 개', v_triggers;
+END $$;
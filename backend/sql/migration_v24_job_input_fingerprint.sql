@@ -0,0 +1,38 @@
+-- ============================================================
+-- Migration v24: Job Input Fingerprint (변경 감지 게이트)
+-- 스케줄러가 마지막 분석 이후 입력이 바뀐 기업만 재분석 (app.services.input_fingerprint)
+--
+-- input_fingerprint: run_analysis_pipeline 시작 시 계산한 입력 해시
+--   (snapshot version/hash, document file_hash, banking data_date, profile 버전, 외부 이벤트 watermark)
+-- queue_reason: Job 생성 사유
+--   NO_PRIOR_RUN / INPUT_CHANGED / FRESHNESS_EXPIRED / GATE_DISABLED / MANUAL
+-- 기존 Job은 fingerprint가 없으므로 배포 후 첫 스캔은 전 기업 NO_PRIOR_RUN
+-- ============================================================
+
+-- 1. 컬럼
+ALTER TABLE rkyc_job ADD COLUMN IF NOT EXISTS input_fingerprint VARCHAR(64);
+ALTER TABLE rkyc_job ADD COLUMN IF NOT EXISTS queue_reason VARCHAR(30);
+
+COMMENT ON COLUMN rkyc_job.input_fingerprint IS '분석이 읽은 입력 해시 (sha256) - 변경 감지용';
+COMMENT ON COLUMN rkyc_job.queue_reason IS 'Job 생성 사유 (NO_PRIOR_RUN/INPUT_CHANGED/FRESHNESS_EXPIRED/GATE_DISABLED/MANUAL)';
+
+-- 2. 기업별 마지막 완료 분석 조회 (LATERAL ... ORDER BY finished_at DESC LIMIT 1)
+CREATE INDEX IF NOT EXISTS idx_job_corp_done_finished
+    ON rkyc_job(corp_id, finished_at DESC NULLS LAST)
+    WHERE status = 'DONE' AND job_type = 'ANALYZE';
+
+-- 3. 외부 이벤트 watermark (기업별 MAX(created_at))
+CREATE INDEX IF NOT EXISTS idx_external_event_target_corp_created
+    ON rkyc_external_event_target(corp_id, created_at DESC);
+
+ANALYZE rkyc_job;
+
+-- 4. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v24 완료: rkyc_job.input_fingerprint / queue_reason 추가됨';
+END $$;
+
+-- 확인용 쿼리
+-- SELECT queue_reason, COUNT(*) FROM rkyc_job
+-- WHERE queued_at > NOW() - INTERVAL '1 day' GROUP BY queue_reason;
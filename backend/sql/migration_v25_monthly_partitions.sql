@@ -0,0 +1,209 @@
+-- ============================================================
+-- Migration v25: Monthly Range Partitioning (rkyc_job, rkyc_signal_index)
+-- 이력 전체를 읽던 목록/정리 쿼리가 파티션 키 범위로 필요한 월만 읽도록 (app.worker.partition_maintenance)
+--
+-- rkyc_job           PARTITION BY RANGE (queued_at)    PK (job_id, queued_at)
+-- rkyc_signal_index  PARTITION BY RANGE (detected_at)  PK (index_id, detected_at)
+-- 파티션 이름: <table>_pYYYYMM (UTC 월 경계), 범위 밖 행은 <table>_default
+--
+-- - 기존 인덱스/CHECK/FK/트리거(v22 대시보드 카운터, v23 리포트 스냅샷)는 그대로 옮김
+--   (트리거는 데이터 복사 후 생성 → 카운터/스냅샷 버전 변화 없음)
+-- - rkyc_insight.job_id → rkyc_job FK 제거 (파티션 테이블 참조는 PK 전체(job_id, queued_at) 필요)
+-- - 미래 파티션은 maintain_partitions 태스크가 매일 MONTHS_AHEAD개월 앞까지 생성
+-- - 보존 기간이 지난 파티션은 DELETE 대신 DETACH 또는 DROP
+--
+-- rkyc_signal / rkyc_evidence는 분할하지 않음:
+--   시그널을 참조하는 FK(evidence, enrichment, embedding 등)와 중복 방지 UNIQUE
+--   (corp_id, signal_type, snapshot_version, event_signature)가 파티션 키를 포함할 수 없음
+-- ============================================================
+
+BEGIN;
+
+-- 1. 월 파티션 생성 (이미 있으면 건너뜀)
+--    default 파티션에 해당 월 행이 있으면: default 분리 → 행 이동 → 새 파티션/default 재연결
+--    (분리된 동안 행 트리거가 없으므로 카운터 변화 없음)
+CREATE OR REPLACE FUNCTION rkyc_create_monthly_partition(
+    p_parent TEXT,
+    p_key TEXT,
+    p_month DATE
+) RETURNS BOOLEAN AS $$
+DECLARE
+    v_name TEXT := p_parent || '_p' || to_char(p_month, 'YYYYMM');
+    v_default TEXT := p_parent || '_default';
+    v_from TIMESTAMPTZ := (date_trunc('month', p_month)::timestamp AT TIME ZONE 'UTC');
+    v_to TIMESTAMPTZ := ((date_trunc('month', p_month) + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC');
+    v_has_rows BOOLEAN := FALSE;
+BEGIN
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    IF to_regclass(v_default) IS NOT NULL THEN
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= %L AND %I < %L)',
+                       v_default, p_key, v_from, p_key, v_to)
+            INTO v_has_rows;
+    END IF;
+
+    IF NOT v_has_rows THEN
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                       v_name, p_parent, v_from, v_to);
+        RETURN TRUE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_parent, v_default);
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', v_name, p_parent);
+    EXECUTE format('WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                   v_default, p_key, v_from, p_key, v_to, v_name);
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                   p_parent, v_name, v_from, v_to);
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I DEFAULT', p_parent, v_default);
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. p_from_month ~ (이번 달 + p_months_ahead) 파티션 보장. Returns 새로 만든 파티션 수
+CREATE OR REPLACE FUNCTION rkyc_ensure_monthly_partitions(
+    p_parent TEXT,
+    p_key TEXT,
+    p_from_month DATE,
+    p_months_ahead INTEGER
+) RETURNS INTEGER AS $$
+DECLARE
+    v_month DATE := date_trunc('month', p_from_month)::date;
+    v_last DATE := (date_trunc('month', NOW() AT TIME ZONE 'UTC') + make_interval(months => p_months_ahead))::date;
+    v_created INTEGER := 0;
+BEGIN
+    WHILE v_month <= v_last LOOP
+        IF rkyc_create_monthly_partition(p_parent, p_key, v_month) THEN
+            v_created := v_created + 1;
+        END IF;
+        v_month := (v_month + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. 기존 테이블 → 월 파티션 테이블 (인덱스/CHECK/FK/트리거 유지, 데이터 복사)
+CREATE OR REPLACE FUNCTION rkyc_convert_to_monthly_partitions(
+    p_table TEXT,
+    p_key TEXT,
+    p_pk TEXT,
+    p_months_ahead INTEGER
+) RETURNS BIGINT AS $$
+DECLARE
+    v_old TEXT := p_table || '_unpartitioned';
+    v_index_defs TEXT[];
+    v_trigger_defs TEXT[];
+    v_fk RECORD;
+    v_def TEXT;
+    v_idx RECORD;
+    v_from DATE;
+    v_copied BIGINT;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(p_table)) THEN
+        RAISE NOTICE '% is already partitioned', p_table;
+        RETURN 0;
+    END IF;
+
+    -- 이름 변경 전에 정의 보관 (정의 안의 테이블 이름이 새 테이블을 가리키도록)
+    SELECT array_agg(pg_get_indexdef(i.indexrelid)) INTO v_index_defs
+    FROM pg_index i
+    WHERE i.indrelid = p_table::regclass AND NOT i.indisprimary AND NOT i.indisunique;
+
+    SELECT array_agg(pg_get_triggerdef(t.oid)) INTO v_trigger_defs
+    FROM pg_trigger t
+    WHERE t.tgrelid = p_table::regclass AND NOT t.tgisinternal;
+
+    -- 이 테이블을 참조하는 FK 제거 (파티션 테이블은 파티션 키 없는 참조 불가)
+    FOR v_fk IN
+        SELECT conrelid::regclass AS referencing, conname
+        FROM pg_constraint
+        WHERE confrelid = p_table::regclass AND contype = 'f'
+    LOOP
+        RAISE NOTICE 'Dropping foreign key %.% (references %)', v_fk.referencing, v_fk.conname, p_table;
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', v_fk.referencing, v_fk.conname);
+    END LOOP;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_table, v_old);
+    FOR v_idx IN
+        SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = v_old::regclass
+    LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I', v_idx.relname, left(v_idx.relname, 50) || '_unpart');
+    END LOOP;
+
+    EXECUTE format('UPDATE %I SET %I = NOW() WHERE %I IS NULL', v_old, p_key, p_key);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) PARTITION BY RANGE (%I)',
+        p_table, v_old, p_key
+    );
+    EXECUTE format('ALTER TABLE %I ALTER COLUMN %I SET NOT NULL', p_table, p_key);
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (%I, %I)', p_table, p_pk, p_key);
+
+    FOR v_fk IN
+        SELECT conname, pg_get_constraintdef(oid) AS def
+        FROM pg_constraint
+        WHERE conrelid = v_old::regclass AND contype = 'f'
+    LOOP
+        EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I %s', p_table, v_fk.conname, v_fk.def);
+    END LOOP;
+
+    EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', p_table || '_default', p_table);
+    EXECUTE format('SELECT COALESCE(MIN(%I), NOW()) FROM %I', p_key, v_old) INTO v_from;
+    PERFORM rkyc_ensure_monthly_partitions(p_table, p_key, v_from, p_months_ahead);
+
+    FOREACH v_def IN ARRAY COALESCE(v_index_defs, ARRAY[]::TEXT[]) LOOP
+        EXECUTE v_def;
+    END LOOP;
+
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', p_table, v_old);
+    GET DIAGNOSTICS v_copied = ROW_COUNT;
+
+    -- 트리거는 복사 후 생성 (기존 행은 카운터/스냅샷에 이미 반영됨)
+    FOREACH v_def IN ARRAY COALESCE(v_trigger_defs, ARRAY[]::TEXT[]) LOOP
+        EXECUTE v_def;
+    END LOOP;
+
+    -- 이전 테이블의 FK CASCADE/트리거가 계속 동작하지 않도록 삭제
+    EXECUTE format('DROP TABLE %I', v_old);
+    RETURN v_copied;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. 변환 (변환 중 쓰기 차단)
+LOCK TABLE rkyc_job IN ACCESS EXCLUSIVE MODE;
+LOCK TABLE rkyc_signal_index IN ACCESS EXCLUSIVE MODE;
+
+SELECT rkyc_convert_to_monthly_partitions('rkyc_job', 'queued_at', 'job_id', 3);
+SELECT rkyc_convert_to_monthly_partitions('rkyc_signal_index', 'detected_at', 'index_id', 3);
+
+-- 5. queued_at이 NOT NULL이 되었으므로 작업 목록 keyset 인덱스를 NULLS LAST 없이 재생성
+--    (app.services.pagination.keyset_order: NOT NULL 정렬 컬럼은 DESC만 사용)
+DROP INDEX IF EXISTS idx_job_queued_keyset;
+DROP INDEX IF EXISTS idx_job_corp_queued_keyset;
+CREATE INDEX idx_job_queued_keyset ON rkyc_job(queued_at DESC, job_id DESC);
+CREATE INDEX idx_job_corp_queued_keyset ON rkyc_job(corp_id, queued_at DESC, job_id DESC);
+
+-- 6. signal_id 조회 (시그널 삭제 시 v22 트리거의 인덱스 행 삭제, 상세/enriched 조회)
+CREATE INDEX IF NOT EXISTS idx_signal_index_signal ON rkyc_signal_index(signal_id);
+
+ANALYZE rkyc_job;
+ANALYZE rkyc_signal_index;
+
+COMMIT;
+
+-- 7. 검증
+DO $$
+DECLARE
+    v_job_parts INTEGER;
+    v_index_parts INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO v_job_parts FROM pg_inherits WHERE inhparent = 'rkyc_job'::regclass;
+    SELECT COUNT(*) INTO v_index_parts FROM pg_inherits WHERE inhparent = 'rkyc_signal_index'::regclass;
+    RAISE NOTICE 'Migration v25 완료: rkyc_job 파티션 %개, rkyc_signal_index 파티션 %개', v_job_parts, v_index_parts;
+END $$;
+
+-- 확인용 쿼리 (파티션 pruning)
+-- EXPLAIN SELECT * FROM rkyc_signal_index
+-- WHERE detected_at <= NOW() - INTERVAL '40 days' ORDER BY detected_at DESC, signal_id DESC LIMIT 20;
+-- SELECT rkyc_dashboard_counter_rebuild();  -- 카운터 불일치 의심 시
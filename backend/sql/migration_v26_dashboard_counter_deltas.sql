@@ -0,0 +1,161 @@
+-- ============================================================
+-- Migration v26: Dashboard Counter Delta Rows (v22 카운터 경합 제거)
+-- v22는 rkyc_signal_index 행마다 공유 카운터 row(최대 27개) 중 하나를 UPSERT
+--   → IndexPipeline이 한 트랜잭션에서 여러 유형 시그널을 넣으면 동시 Job끼리 같은 row를
+--     서로 다른 순서로 잠가 직렬화/교착 발생
+--
+-- 변경:
+-- - rkyc_dashboard_counter_delta: 증감을 append-only로 기록 (UNIQUE 없음 → 행 잠금 경합 없음)
+-- - rkyc_signal_index 트리거: FOR EACH ROW → FOR EACH STATEMENT (transition table)
+--   문장 단위로 (유형, 방향, 상태)별 합계만 delta에 INSERT
+-- - rkyc_dashboard_counter_add: delta INSERT (시그니처 유지 - 상태 변경 트리거, 파티션 분리 보정)
+-- - rkyc_dashboard_counter_rollup(): delta를 카운터에 정렬된 키 순서로 합산 후 삭제
+--   (rollup_dashboard_counter 태스크가 1분마다 실행, 카운터 row를 쓰는 곳은 rollup/rebuild뿐)
+-- - rkyc_dashboard_counter_current: 카운터 + 아직 합산되지 않은 delta (대시보드 조회용)
+-- ============================================================
+
+BEGIN;
+
+-- 1. Delta 테이블
+CREATE TABLE IF NOT EXISTS rkyc_dashboard_counter_delta (
+    delta_id BIGSERIAL PRIMARY KEY,
+    signal_type signal_type_enum NOT NULL,
+    impact_direction impact_direction_enum NOT NULL,
+    signal_status signal_status_enum NOT NULL,
+    delta BIGINT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE rkyc_dashboard_counter_delta IS '대시보드 카운터 증감 (append-only, rkyc_dashboard_counter_rollup이 주기적으로 합산)';
+
+-- 2. 증감 기록 (기존 UPSERT 대체)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_add(
+    p_signal_type signal_type_enum,
+    p_impact_direction impact_direction_enum,
+    p_signal_status signal_status_enum,
+    p_delta BIGINT
+) RETURNS VOID AS $$
+BEGIN
+    IF p_delta = 0 THEN
+        RETURN;
+    END IF;
+    INSERT INTO rkyc_dashboard_counter_delta (signal_type, impact_direction, signal_status, delta)
+    VALUES (p_signal_type, p_impact_direction, COALESCE(p_signal_status, 'NEW'), p_delta);
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. rkyc_signal_index 문장 단위 트리거 (transition table은 이벤트별로 분리해야 함)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_on_index_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO rkyc_dashboard_counter_delta (signal_type, impact_direction, signal_status, delta)
+    SELECT n.signal_type, n.impact_direction, COALESCE(s.signal_status, 'NEW'), COUNT(*)
+    FROM new_rows n
+    LEFT JOIN rkyc_signal s ON s.signal_id = n.signal_id
+    GROUP BY n.signal_type, n.impact_direction, COALESCE(s.signal_status, 'NEW');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_on_index_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- 시그널 삭제 시 BEFORE DELETE 트리거가 인덱스 행을 먼저 지우므로 상태 조회 가능
+    INSERT INTO rkyc_dashboard_counter_delta (signal_type, impact_direction, signal_status, delta)
+    SELECT o.signal_type, o.impact_direction, COALESCE(s.signal_status, 'NEW'), -COUNT(*)
+    FROM old_rows o
+    LEFT JOIN rkyc_signal s ON s.signal_id = o.signal_id
+    GROUP BY o.signal_type, o.impact_direction, COALESCE(s.signal_status, 'NEW');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_index ON rkyc_signal_index;
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_index_insert ON rkyc_signal_index;
+DROP TRIGGER IF EXISTS trigger_dashboard_counter_index_delete ON rkyc_signal_index;
+
+CREATE TRIGGER trigger_dashboard_counter_index_insert
+    AFTER INSERT ON rkyc_signal_index
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rkyc_dashboard_counter_on_index_insert();
+
+CREATE TRIGGER trigger_dashboard_counter_index_delete
+    AFTER DELETE ON rkyc_signal_index
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rkyc_dashboard_counter_on_index_delete();
+
+DROP FUNCTION IF EXISTS rkyc_dashboard_counter_on_index();
+
+-- 4. Delta → 카운터 합산. Returns 갱신한 카운터 키 수
+--    동시 실행 시 먼저 삭제된 delta는 건너뛰므로 중복 합산 없음, 키 순서로 UPSERT (교착 방지)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_rollup()
+RETURNS BIGINT AS $$
+DECLARE
+    v_keys BIGINT;
+BEGIN
+    WITH moved AS (
+        DELETE FROM rkyc_dashboard_counter_delta
+        RETURNING signal_type, impact_direction, signal_status, delta
+    ),
+    summed AS (
+        SELECT signal_type, impact_direction, signal_status, SUM(delta) AS delta
+        FROM moved
+        GROUP BY signal_type, impact_direction, signal_status
+        ORDER BY signal_type, impact_direction, signal_status
+    )
+    INSERT INTO rkyc_dashboard_counter (signal_type, impact_direction, signal_status, signal_count, updated_at)
+    SELECT signal_type, impact_direction, signal_status, delta, NOW() FROM summed
+    ON CONFLICT (signal_type, impact_direction, signal_status) DO UPDATE SET
+        signal_count = rkyc_dashboard_counter.signal_count + EXCLUDED.signal_count,
+        updated_at = EXCLUDED.updated_at;
+    GET DIAGNOSTICS v_keys = ROW_COUNT;
+    RETURN v_keys;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. 전체 재계산 (delta 포함 초기화)
+CREATE OR REPLACE FUNCTION rkyc_dashboard_counter_rebuild()
+RETURNS BIGINT AS $$
+DECLARE
+    v_total BIGINT;
+BEGIN
+    LOCK TABLE rkyc_dashboard_counter IN EXCLUSIVE MODE;
+    LOCK TABLE rkyc_dashboard_counter_delta IN EXCLUSIVE MODE;
+    DELETE FROM rkyc_dashboard_counter_delta;
+    DELETE FROM rkyc_dashboard_counter;
+
+    INSERT INTO rkyc_dashboard_counter (signal_type, impact_direction, signal_status, signal_count, updated_at)
+    SELECT si.signal_type, si.impact_direction, COALESCE(s.signal_status, 'NEW'), COUNT(*), NOW()
+    FROM rkyc_signal_index si
+    JOIN rkyc_signal s ON s.signal_id = si.signal_id
+    GROUP BY 1, 2, 3;
+
+    SELECT COALESCE(SUM(signal_count), 0) INTO v_total FROM rkyc_dashboard_counter;
+    RETURN v_total;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 6. 조회용 view (카운터 + 미합산 delta)
+CREATE OR REPLACE VIEW rkyc_dashboard_counter_current AS
+SELECT signal_type, impact_direction, signal_status, SUM(signal_count)::BIGINT AS signal_count
+FROM (
+    SELECT signal_type, impact_direction, signal_status, signal_count FROM rkyc_dashboard_counter
+    UNION ALL
+    SELECT signal_type, impact_direction, signal_status, delta FROM rkyc_dashboard_counter_delta
+) c
+GROUP BY signal_type, impact_direction, signal_status;
+
+COMMIT;
+
+-- 7. 검증
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration v26 완료: 대시보드 카운터 증감을 rkyc_dashboard_counter_delta에 기록 (문장 단위 트리거)';
+END $$;
+
+-- 확인용 쿼리
+-- SELECT COUNT(*) FROM rkyc_dashboard_counter_delta;  -- 1분 이내 rollup 되어야 함
+-- SELECT rkyc_dashboard_counter_rollup();
+-- SELECT * FROM rkyc_dashboard_counter_current WHERE signal_count <> 0;
@@ -0,0 +1,153 @@
+"""
+Unit tests for Bank Interpretation batch mode
+
+K개 시그널 → 1회 LLM 호출, index 기반 파싱, 실패 항목만 단건 fallback
+"""
+
+import json
+
+from app.worker.pipelines.bank_interpretation import (
+    BANK_INTERPRETATION_BATCH_SYSTEM_PROMPT,
+    BankInterpretationPipeline,
+    BankInterpretationService,
+)
+
+
+SNAPSHOT = {
+    "corp": {
+        "corp_name": "엠케이전자",
+        "industry_code": "C26",
+        "kyc_status": {"internal_risk_grade": "MED"},
+    },
+    "credit": {
+        "loan_summary": {
+            "total_exposure_krw": 12_000_000_000,
+            "overdue_flag": False,
+        }
+    },
+    "collateral": {"coverage_ratio_pct": 85.0},
+}
+
+
+def _signal(i: int) -> dict:
+    return {
+        "corp_id": "8001-3719240",
+        "signal_type": "DIRECT",
+        "event_type": "FINANCIAL_STATEMENT_UPDATE",
+        "impact_direction": "RISK",
+        "impact_strength": "MED",
+        "title": f"시그널 {i}",
+        "summary": f"요약 {i}",
+    }
+
+
+def _item(index: int) -> dict:
+    return {
+        "index": index,
+        "interpretation": f"당행 여신 관점 해석 {index}",
+        "portfolio_impact": "MED",
+        "recommended_action": "모니터링 강화 권고",
+        "action_priority": "NORMAL",
+    }
+
+
+class FakeLLM:
+    """call_with_fallback 호출을 기록하고 미리 정한 응답 반환"""
+
+    def __init__(self, batch_response_fn):
+        self.batch_response_fn = batch_response_fn
+        self.calls = []
+
+    def call_with_fallback(self, messages, temperature=0.1, max_tokens=4096, **kwargs):
+        self.calls.append(messages)
+        if messages[0]["content"] == BANK_INTERPRETATION_BATCH_SYSTEM_PROMPT:
+            return self.batch_response_fn(messages[1]["content"])
+        return json.dumps(_item(0), ensure_ascii=False)
+
+
+def _make_service(batch_response_fn, batch_size=8) -> tuple[BankInterpretationService, FakeLLM]:
+    service = BankInterpretationService(batch_size=batch_size, max_concurrency=1)
+    fake = FakeLLM(batch_response_fn)
+    service.llm = fake
+    return service, fake
+
+
+class TestBankInterpretationBatch:
+    """배치 모드 단위 테스트"""
+
+    def test_single_call_per_chunk(self):
+        """K개 시그널은 한 번의 호출로 처리"""
+        def respond(prompt):
+            count = prompt.count("## [index")
+            return json.dumps({"results": [_item(i) for i in range(count)]}, ensure_ascii=False)
+
+        service, fake = _make_service(respond, batch_size=4)
+        signals = [_signal(i) for i in range(10)]
+
+        results = service.interpret_batch(signals, SNAPSHOT)
+
+        assert len(fake.calls) == 3  # 4 + 4 + 2
+        assert [s for s, _ in results] == signals
+        assert all(interp is not None for _, interp in results)
+        assert results[5][1].interpretation == "당행 여신 관점 해석 1"
+
+    def test_results_matched_by_index(self):
+        """응답 순서가 달라도 index로 매칭"""
+        def respond(prompt):
+            return json.dumps({"results": [_item(2), _item(0), _item(1)]}, ensure_ascii=False)
+
+        service, _ = _make_service(respond)
+        results = service.interpret_batch([_signal(i) for i in range(3)], SNAPSHOT)
+
+        assert [interp.interpretation for _, interp in results] == [
+            "당행 여신 관점 해석 0",
+            "당행 여신 관점 해석 1",
+            "당행 여신 관점 해석 2",
+        ]
+
+    def test_fallback_only_for_missing_items(self):
+        """누락된 index만 단건 호출"""
+        def respond(prompt):
+            return json.dumps({"results": [_item(0), _item(2)]}, ensure_ascii=False)
+
+        service, fake = _make_service(respond)
+        results = service.interpret_batch([_signal(i) for i in range(3)], SNAPSHOT)
+
+        assert len(fake.calls) == 2  # 1 batch + 1 fallback
+        assert all(interp is not None for _, interp in results)
+
+    def test_unparseable_batch_falls_back_per_signal(self):
+        """배치 응답 파싱 실패 시 전부 단건 호출"""
+        service, fake = _make_service(lambda prompt: "not json")
+        results = service.interpret_batch([_signal(i) for i in range(3)], SNAPSHOT)
+
+        assert len(fake.calls) == 4
+        assert all(interp is not None for _, interp in results)
+
+    def test_forbidden_words_softened_in_batch(self):
+        """배치 결과에도 금지 표현 완화 적용"""
+        def respond(prompt):
+            item = _item(0)
+            item["recommended_action"] = "대출 회수 검토"
+            return json.dumps({"results": [item, _item(1)]}, ensure_ascii=False)
+
+        service, _ = _make_service(respond)
+        results = service.interpret_batch([_signal(0), _signal(1)], SNAPSHOT)
+
+        assert "대출 회수" not in results[0][1].recommended_action
+
+    def test_pipeline_uses_batch(self):
+        """Pipeline.execute는 배치 모드 사용"""
+        def respond(prompt):
+            count = prompt.count("## [index")
+            return json.dumps({"results": [_item(i) for i in range(count)]}, ensure_ascii=False)
+
+        pipeline = BankInterpretationPipeline()
+        service, fake = _make_service(respond)
+        pipeline.service = service
+
+        signals = pipeline.execute([_signal(i) for i in range(5)], {"snapshot_json": SNAPSHOT})
+
+        assert len(fake.calls) == 1
+        assert all(s["bank_interpretation"] for s in signals)
+        assert all(s["action_priority"] == "NORMAL" for s in signals)
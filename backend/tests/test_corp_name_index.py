@@ -0,0 +1,161 @@
+"""
+Unit tests for DART Corp Name Index / Corp Code Store
+
+정확/접두/부분 포함/n-gram 후보 순위, SQLite 저장소 빌드/교체,
+get_corp_code 인덱스 조회, 일괄 조회
+"""
+
+import asyncio
+import io
+import os
+import zipfile
+
+import pytest
+
+from app.services import dart_api
+from app.services.corp_name_index import CorpNameIndex, MatchType
+from app.services.dart_corp_store import DartCorpCodeStore
+from app.services.dart_api import (
+    _normalize_corp_name,
+    get_corp_code,
+    get_corp_codes_batch,
+    search_corp_codes,
+)
+
+CORPS = {
+    "00126380": "삼성전자(주)",
+    "00126371": "삼성전자서비스",
+    "00164779": "에스케이하이닉스(주)",
+    "00258801": "하림",
+    "00401731": "하림지주",
+    "00111722": "엠케이전자",
+    "00999999": "전자",
+}
+
+
+STOCK_CODES = {"00126380": "005930", "00164779": "000660"}
+
+
+def _entries():
+    return [(_normalize_corp_name(name), code, name) for code, name in CORPS.items()]
+
+
+def _corp_code_xml(corps: dict[str, str]) -> bytes:
+    rows = "".join(
+        f"<list><corp_code>{code}</corp_code><corp_name>{name}</corp_name>"
+        f"<stock_code>{STOCK_CODES.get(code, ' ')}</stock_code>"
+        f"<modify_date>20240101</modify_date></list>"
+        for code, name in corps.items()
+    )
+    return f"<?xml version='1.0' encoding='UTF-8'?><result>{rows}</result>".encode()
+
+
+def _corp_code_zip(corps: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("CORPCODE.xml", _corp_code_xml(corps))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def index():
+    return CorpNameIndex.build(_entries(), normalizer=_normalize_corp_name)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DartCorpCodeStore(str(tmp_path / "corp_codes.sqlite3"), normalizer=_normalize_corp_name)
+    store.build_from_zip(_corp_code_zip(CORPS))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def loaded(monkeypatch, store):
+    """DART 다운로드 없이 저장소만 빌드된 상태"""
+    monkeypatch.setattr(dart_api, "_corp_code_store", store)
+
+
+class TestCorpNameIndex:
+    """후보 순위 및 점수"""
+
+    def test_exact_ranks_first(self, index):
+        matches = index.search("삼성전자 주식회사", limit=3)
+        assert matches[0].corp_code == "00126380"
+        assert matches[0].match_type == MatchType.EXACT
+        assert matches[0].score == 1.0
+        assert matches[1].corp_code == "00126371"
+        assert matches[1].match_type == MatchType.PREFIX
+
+    def test_prefix_prefers_shorter_names(self, index):
+        matches = index.search("하", limit=2)
+        assert [m.corp_name for m in matches] == ["하림", "하림지주"]
+        assert all(m.match_type == MatchType.PREFIX for m in matches)
+
+    def test_contains_both_directions(self, index):
+        assert index.best("하이닉스").corp_code == "00164779"
+        # 기업명이 검색어 안에 포함된 경우 (예: 사업부 명칭)
+        match = index.best("엠케이전자반도체사업부")
+        assert match.corp_code == "00111722"
+        assert match.match_type == MatchType.CONTAINS
+
+    def test_ngram_candidates_are_fuzzy_only(self, index):
+        matches = index.search("삼성전지", limit=3)
+        assert matches[0].corp_code == "00126380"
+        assert matches[0].match_type == MatchType.NGRAM
+        assert index.best("삼성전지") is None
+        assert index.best("삼성전지", fuzzy=True).corp_code == "00126380"
+
+    def test_empty_query_and_min_score(self, index):
+        assert index.search("(주)") == []
+        assert all(m.score >= 0.7 for m in index.search("전자", limit=10, min_score=0.7))
+
+
+class TestCorpCodeStore:
+    """SQLite 저장소 빌드 / 조회 / 원자적 교체"""
+
+    def test_build_and_lookup(self, store):
+        assert store.count() == len(CORPS)
+        assert store.get_by_stock("005930") == "00126380"
+        assert store.get_corp_name("00258801") == "하림"
+        assert list(store.iter_corp_codes(listed_only=True)) == ["00126380", "00164779"]
+        assert store.is_fresh()
+
+    def test_sqlite_index_matches_memory_index(self, store, index):
+        for query in ["삼성전자", "하", "하이닉스", "엠케이전자반도체사업부", "삼성전지", "전자"]:
+            assert store.name_index().search(query, limit=5) == index.search(query, limit=5)
+
+    def test_rebuild_swaps_file_for_open_readers(self, store, monkeypatch):
+        from app.services import dart_corp_store
+        monkeypatch.setattr(dart_corp_store, "_REOPEN_CHECK_SECONDS", 0)
+        reader = DartCorpCodeStore(store.path, normalizer=_normalize_corp_name)
+        assert reader.name_index().best("하림지주").corp_code == "00401731"
+
+        store.build_from_zip(_corp_code_zip({**CORPS, "00401731": "하림홀딩스"}))
+        assert reader.name_index().best("하림홀딩스").corp_code == "00401731"
+        assert not [f for f in os.listdir(os.path.dirname(store.path)) if f.endswith(".tmp")]
+        reader.close()
+
+    def test_missing_store_is_empty(self, tmp_path):
+        empty = DartCorpCodeStore(str(tmp_path / "missing.sqlite3"))
+        assert empty.is_available() is False
+        assert empty.count() == 0
+        assert empty.name_index().search("삼성전자") == []
+
+
+class TestCorpCodeLookup:
+    """dart_api 조회 함수"""
+
+    def test_get_corp_code_uses_index(self, loaded):
+        assert asyncio.run(get_corp_code(corp_name="(주)하림")) == "00258801"
+        assert asyncio.run(get_corp_code(corp_name="없는회사")) is None
+        assert asyncio.run(get_corp_code(stock_code="005930")) == "00126380"
+
+    def test_batch_lookup(self, loaded):
+        result = asyncio.run(get_corp_codes_batch(["하림", "삼성전자", "없는회사", "하림"]))
+        assert result == {"하림": "00258801", "삼성전자": "00126380", "없는회사": None}
+
+    def test_search_returns_ranked_candidates(self, loaded):
+        matches = asyncio.run(search_corp_codes("하림", limit=5))
+        assert [m.corp_code for m in matches] == ["00258801", "00401731"]
+        assert matches[0].score > matches[1].score
@@ -0,0 +1,235 @@
+"""
+Unit tests for Shared DART Client
+
+endpoint별 응답 캐시, 동시 요청 병합, 일일 쿼터, 초당 한도(Redis 공유 / token bucket),
+단기 루프 클라이언트 정리, dart_api 조회 함수의 공유 클라이언트 사용
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import httpx
+import pytest
+
+from app.services import dart_api, dart_client
+from app.services.dart_client import (
+    DartClient,
+    DartClientConfig,
+    DartQuotaExceeded,
+    TokenBucket,
+)
+
+
+class FakeDart:
+    """OpenDART 응답 흉내 (httpx.MockTransport handler)"""
+
+    def __init__(self, status="000", delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        params = dict(request.url.params)
+        return httpx.Response(200, json={
+            "status": self.status,
+            "message": "정상" if self.status == "000" else "오류",
+            "corp_code": params.get("corp_code"),
+            "corp_name": "엠케이전자",
+            "ceo_nm": "홍길동",
+            "crtfc_key_seen": "crtfc_key" in params,
+        })
+
+
+def _client(fake: FakeDart, **overrides) -> DartClient:
+    config = DartClientConfig()
+    config.API_KEY = "test-key"
+    config.RATE_PER_SECOND = 0  # 테스트에서는 초당 제한 없음
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    client = DartClient(config=config, transport=httpx.MockTransport(fake))
+    client._redis_checked = True  # Redis 없이 memory-only
+    return client
+
+
+class TestResponseCache:
+    """endpoint별 freshness 캐시"""
+
+    def test_success_and_no_data_are_cached(self):
+        fake = FakeDart()
+        client = _client(fake)
+
+        async def run():
+            first = await client.get_json("company.json", {"corp_code": "00111722"})
+            second = await client.get_json("company.json", {"corp_code": "00111722"})
+            await client.get_json("company.json", {"corp_code": "00999999"})
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert first["crtfc_key_seen"] is True
+        assert len(fake.requests) == 2
+        assert client.get_stats()["hits"] == 1
+
+        fake.status = "013"
+        asyncio.run(client.get_json("list.json", {"corp_code": "00111722"}))
+        asyncio.run(client.get_json("list.json", {"corp_code": "00111722"}))
+        assert len(fake.requests) == 3
+
+    def test_errors_are_not_cached(self):
+        fake = FakeDart(status="100")
+        client = _client(fake)
+        asyncio.run(client.get_json("company.json", {"corp_code": "00111722"}))
+        asyncio.run(client.get_json("company.json", {"corp_code": "00111722"}))
+        assert len(fake.requests) == 2
+
+    def test_freshness_rules(self):
+        config = DartClientConfig()
+        last_year = str(datetime.now().year - 1)
+        old_year = str(datetime.now().year - 3)
+        assert config.get_ttl("list.json", {}, "000") == 3 * 3600
+        assert config.get_ttl("hyslrSttus.json", {"bsns_year": last_year}, "000") == 7 * 24 * 3600
+        assert config.get_ttl("hyslrSttus.json", {"bsns_year": old_year}, "000") == config.PAST_YEAR_TTL
+        assert config.get_ttl("company.json", {}, "013") == config.NO_DATA_TTL
+        assert config.get_ttl("company.json", {}, "020") == 0
+
+
+class TestCoalescingAndLimits:
+    """동시 요청 병합 / 쿼터 / token bucket"""
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        fake = FakeDart(delay=0.05)
+        client = _client(fake)
+
+        async def run():
+            return await asyncio.gather(*(
+                client.get_json("company.json", {"corp_code": "00111722"}) for _ in range(5)
+            ))
+
+        results = asyncio.run(run())
+        assert len(fake.requests) == 1
+        assert all(r == results[0] for r in results)
+        assert client.get_stats()["coalesced"] == 4
+
+    def test_daily_quota(self):
+        fake = FakeDart()
+        client = _client(fake, DAILY_QUOTA=2)
+        asyncio.run(client.get_json("company.json", {"corp_code": "A"}))
+        asyncio.run(client.get_json("company.json", {"corp_code": "B"}))
+        with pytest.raises(DartQuotaExceeded):
+            asyncio.run(client.get_json("company.json", {"corp_code": "C"}))
+        # 캐시 적중은 쿼터와 무관
+        asyncio.run(client.get_json("company.json", {"corp_code": "A"}))
+        assert len(fake.requests) == 2
+
+    def test_rate_limited_response_exhausts_quota(self):
+        fake = FakeDart(status="020")
+        client = _client(fake)
+        asyncio.run(client.get_json("company.json", {"corp_code": "A"}))
+        with pytest.raises(DartQuotaExceeded):
+            asyncio.run(client.get_json("company.json", {"corp_code": "B"}))
+
+    def test_token_bucket_spaces_requests(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+
+class FakeRateRedis:
+    """초당 한도 카운터에 필요한 명령만 구현"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class Pipe:
+            def __init__(self):
+                self.ops = []
+
+            def incr(self, key):
+                self.ops.append(key)
+
+            def expire(self, key, seconds):
+                pass
+
+            def execute(self):
+                key = self.ops[0]
+                redis.counts[key] = redis.counts.get(key, 0) + 1
+                return [redis.counts[key], True]
+
+        return Pipe()
+
+
+class TestSharedLimits:
+    """프로세스 간 공유 초당 한도 / memory TTL 상한"""
+
+    def test_rate_slots_shared_through_redis(self, monkeypatch):
+        monkeypatch.setattr(dart_client.time, "time", lambda: 1000.25)
+        redis_client = FakeRateRedis()
+        workers = [_client(FakeDart(), RATE_PER_SECOND=2) for _ in range(2)]
+        for worker in workers:
+            worker._redis = redis_client
+
+        waits = [worker._reserve_rate_slot() for worker in workers for _ in range(3)]
+        # 워커 수와 무관하게 합쳐서 초당 2건 - 찬 구간은 다음 1초 구간으로 예약
+        assert waits == [0.0, 0.0, 0.75, 0.75, 1.75, 1.75]
+
+    def test_rate_falls_back_to_local_bucket_without_redis(self):
+        client = _client(FakeDart(), RATE_PER_SECOND=5)
+        assert client._reserve_rate_slot() is None
+
+    def test_memory_copy_bounded(self):
+        client = _client(FakeDart())
+        asyncio.run(client.get_json("company.json", {"corp_code": "00111722"}))
+        (_, expires_at), = client._memory.values()
+        assert expires_at <= time.time() + client.config.MEMORY_TTL_SECONDS
+
+
+class TestHttpClientLifecycle:
+    """단기 루프 클라이언트는 요청마다 닫고, 등록된 루프는 공유"""
+
+    def test_short_lived_loop_does_not_keep_client(self):
+        client = _client(FakeDart())
+        asyncio.run(client.get_json("company.json", {"corp_code": "A"}, use_cache=False))
+        asyncio.run(client.get_json("company.json", {"corp_code": "B"}, use_cache=False))
+        assert len(client._clients) == 0
+        assert client.get_stats()["short_lived_clients"] == 2
+
+    def test_registered_loop_reuses_client(self):
+        client = _client(FakeDart())
+
+        async def run():
+            client.register_loop()
+            await client.get_json("company.json", {"corp_code": "A"}, use_cache=False)
+            shared = client._clients[asyncio.get_running_loop()]
+            await client.get_json("company.json", {"corp_code": "B"}, use_cache=False)
+            reused = client._clients[asyncio.get_running_loop()] is shared
+            await client.aclose()
+            return reused, shared.is_closed
+
+        assert asyncio.run(run()) == (True, True)
+        assert client.get_stats()["short_lived_clients"] == 0
+
+
+def test_company_info_uses_shared_client(monkeypatch):
+    fake = FakeDart()
+    monkeypatch.setattr(dart_client, "_dart_client", _client(fake))
+
+    async def run():
+        return await asyncio.gather(
+            dart_api.get_company_info("00111722"),
+            dart_api.get_company_info("00111722"),
+        )
+
+    first, second = asyncio.run(run())
+    assert first.ceo_name == "홍길동"
+    assert second.corp_name == "엠케이전자"
+    assert len(fake.requests) == 1
+    assert fake.requests[0].url.path == "/api/company.json"
@@ -0,0 +1,217 @@
+"""
+Unit tests for DART Filing Sync
+
+high-water mark 기반 증분 공시 동기화, 미제출 연도 재확인 주기,
+실패 시 상태 보존, 동기화된 기업의 로컬 우선 조회
+"""
+
+import asyncio
+from datetime import datetime, timedelta, UTC
+
+import httpx
+import pytest
+
+from app.services import dart_api, dart_client, dart_local
+from app.services.dart_client import DartClient, DartClientConfig
+from app.services.dart_local import DartLocalConfig, DartLocalStore
+from app.worker.tasks.dart_sync import sync_corp_filings, sync_portfolio_filings
+
+TODAY = datetime(2026, 3, 10)
+
+
+class InMemoryDartStore(DartLocalStore):
+    """rkyc_dart_* 테이블 대신 dict 사용"""
+
+    def __init__(self):
+        super().__init__(config=DartLocalConfig())
+        self.states = {}
+        self.events = {}
+        self.financials = {}
+
+    def get_state(self, corp_code):
+        state = self.states.get(corp_code)
+        return dict(state) if state else None
+
+    def update_state(self, corp_code, **fields):
+        self.states.setdefault(corp_code, {}).update(fields)
+        return True
+
+    def synced_years(self, corp_code):
+        return {year for code, year in self.financials if code == corp_code}
+
+    def save_financials(self, corp_code, rows, reprt_code="11011", fs_div="OFS"):
+        for row in rows:
+            self.financials[(corp_code, row["bsns_year"])] = dict(row, reprt_code=reprt_code)
+        return len(rows)
+
+    def save_events(self, corp_code, rows):
+        new = [row for row in rows if row["rcept_no"] not in self.events]
+        for row in new:
+            self.events[row["rcept_no"]] = dict(row, corp_code=corp_code)
+        return len(new)
+
+    def load_financials(self, corp_code, years, reprt_code="11011", fs_div="OFS"):
+        if not self.is_fresh(self.get_state(corp_code)):
+            return None
+        return [row for (code, year), row in sorted(self.financials.items(), reverse=True)
+                if code == corp_code and year in years]
+
+    def load_events(self, corp_code, bgn_de, end_de, pblntf_ty="B"):
+        if not self.is_fresh(self.get_state(corp_code)):
+            return None
+        return [row for row in self.events.values() if row["corp_code"] == corp_code]
+
+
+class FakeDart:
+    """list.json / fnlttSinglAcnt.json 응답 흉내"""
+
+    def __init__(self):
+        self.filings = []          # (rcept_no, rcept_dt, report_nm)
+        self.financial_years = {"2025", "2024"}
+        self.requests = []
+        self.fail = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append((request.url.path.rsplit("/", 1)[-1], params))
+        if self.fail:
+            return httpx.Response(200, json={"status": "800", "message": "시스템 점검"})
+
+        if request.url.path.endswith("list.json"):
+            items = [
+                {"rcept_no": no, "rcept_dt": dt, "report_nm": nm, "corp_name": "엠케이전자"}
+                for no, dt, nm in self.filings
+                if params["bgn_de"] <= dt <= params["end_de"]
+            ]
+            page_no, page_count = int(params["page_no"]), int(params["page_count"])
+            page = items[(page_no - 1) * page_count:page_no * page_count]
+            if not page:
+                return httpx.Response(200, json={"status": "013", "message": "조회된 데이터가 없습니다"})
+            total_page = (len(items) + page_count - 1) // page_count
+            return httpx.Response(200, json={"status": "000", "total_page": total_page, "list": page})
+
+        if params["bsns_year"] not in self.financial_years:
+            return httpx.Response(200, json={"status": "013", "message": "조회된 데이터가 없습니다"})
+        return httpx.Response(200, json={"status": "000", "list": [
+            {"account_nm": "매출액", "thstrm_amount": "1,000"},
+            {"account_nm": "부채총계", "thstrm_amount": "50"},
+            {"account_nm": "자본총계", "thstrm_amount": "100"},
+        ]})
+
+    def count(self, endpoint):
+        return sum(1 for name, _ in self.requests if name == endpoint)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeDart()
+    config = DartClientConfig()
+    config.API_KEY = "test-key"
+    config.RATE_PER_SECOND = 0
+    client = DartClient(config=config, transport=httpx.MockTransport(fake))
+    client._redis_checked = True
+    monkeypatch.setattr(dart_client, "_dart_client", client)
+    monkeypatch.setattr(dart_api, "datetime", type("FrozenDatetime", (datetime,), {
+        "now": classmethod(lambda cls, tz=None: TODAY),
+    }))
+    return fake
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = InMemoryDartStore()
+    monkeypatch.setattr(dart_local, "_dart_local_store", store)
+    return store
+
+
+def _sync(store, **kwargs):
+    return asyncio.run(sync_corp_filings("00111722", store=store, today=TODAY, **kwargs))
+
+
+class TestIncrementalSync:
+    """high-water mark 증분 동기화"""
+
+    def test_first_sync_then_only_new_filings(self, fake, store):
+        fake.filings = [
+            ("20250601000123", "20250601", "주요사항보고서(유상증자결정)"),
+            ("20260105000045", "20260105", "주요사항보고서(소송등의제기)"),
+        ]
+        result = _sync(store)
+        assert result == {"corp_code": "00111722", "events": 2, "financials": 2, "error": None}
+        state = store.states["00111722"]
+        assert state["events_from"] == "20250310"
+        assert state["events_last_rcept_no"] == "20260105000045"
+        assert store.events["20250601000123"]["event_type"] == "유상증자"
+        assert store.financials[("00111722", "2025")]["debt_ratio"] == 50.0
+
+        # 다음날: 마지막 동기화일 이후만 조회, 새 공시만 insert, 재무제표 재조회 없음
+        state["last_synced_at"] = datetime(2026, 3, 9, 21, tzinfo=UTC)
+        fake.filings.append(("20260309000007", "20260309", "주요사항보고서(회사합병결정)"))
+        list_calls, financial_calls = fake.count("list.json"), fake.count("fnlttSinglAcnt.json")
+        result = _sync(store)
+        assert result["events"] == 1 and result["financials"] == 0
+        assert fake.requests[-1][1]["bgn_de"] == "20260309"
+        assert fake.count("list.json") == list_calls + 1
+        assert fake.count("fnlttSinglAcnt.json") == financial_calls
+        assert store.states["00111722"]["events_last_rcept_no"] == "20260309000007"
+
+    def test_missing_years_rechecked_after_interval(self, fake, store):
+        _sync(store)
+        assert fake.count("fnlttSinglAcnt.json") == 3
+
+        store.states["00111722"]["financials_checked_at"] -= timedelta(days=8)
+        fake.financial_years.add("2023")
+        assert _sync(store)["financials"] == 1
+        assert fake.count("fnlttSinglAcnt.json") == 4  # 미제출이던 2023년만
+
+    def test_pages_through_large_windows(self, fake, store):
+        fake.filings = [(f"2026010{d}{i:06d}", f"2026010{d}", "주요사항보고서") for d in range(1, 4) for i in range(60)]
+        assert _sync(store)["events"] == 180
+        assert fake.count("list.json") == 2
+
+    def test_failure_keeps_high_water_mark(self, fake, store):
+        _sync(store)
+        synced_at = store.states["00111722"]["last_synced_at"]
+        fake.fail = True
+        result = _sync(store)
+        assert "800" in result["error"]
+        assert store.states["00111722"]["last_synced_at"] == synced_at
+        assert "800" in store.states["00111722"]["last_error"]
+
+    def test_portfolio_sync_runs_every_corp(self, fake, store):
+        results = asyncio.run(sync_portfolio_filings(["00111722", "00126380"], store=store))
+        assert [r["corp_code"] for r in results] == ["00111722", "00126380"]
+        assert set(store.states) == {"00111722", "00126380"}
+
+
+class TestLocalFirstReads:
+    """동기화된 기업은 로컬 사본 조회"""
+
+    def test_reads_local_when_fresh(self, fake, store):
+        fake.filings = [("20260105000045", "20260105", "주요사항보고서(소송등의제기)")]
+        _sync(store)
+        calls = len(fake.requests)
+
+        statements = asyncio.run(dart_api.get_financial_statements("00111722"))
+        events = asyncio.run(dart_api.get_major_events("00111722"))
+        assert [s.bsns_year for s in statements] == ["2025", "2024"]
+        assert statements[0].report_code == "11011"
+        assert [e.rcept_no for e in events] == ["20260105000045"]
+        assert len(fake.requests) == calls
+
+    def test_stale_or_unsynced_falls_back_to_dart(self, fake, store):
+        asyncio.run(dart_api.get_financial_statements("00111722", bsns_year="2025"))
+        assert fake.count("fnlttSinglAcnt.json") == 1
+
+        _sync(store)
+        store.states["00111722"]["last_synced_at"] -= timedelta(hours=store.config.MAX_AGE_HOURS + 1)
+        asyncio.run(dart_api.get_major_events("00111722", bgn_de="20260101"))
+        assert fake.count("list.json") == 2
+
+    def test_is_fresh(self):
+        store = DartLocalStore(config=DartLocalConfig())
+        assert store.is_fresh({"last_synced_at": datetime.now(UTC)})
+        assert not store.is_fresh({"last_synced_at": None})
+        assert not store.is_fresh(None)
+        store.config.ENABLED = False
+        assert not store.is_fresh({"last_synced_at": datetime.now(UTC)})
@@ -0,0 +1,138 @@
+"""
+Unit tests for Dashboard Summary Service
+
+카운터 행 → 응답 변환, TTL 캐시 / 동시 요청 공유 / 무효화,
+카운터 테이블 미존재 시 전체 집계 fallback
+"""
+
+import asyncio
+
+from app.models.signal import ImpactDirection, SignalStatus, SignalType
+from app.services.dashboard_summary import (
+    DashboardSummaryConfig,
+    DashboardSummaryService,
+)
+
+COUNTER_ROWS = [
+    ("DIRECT", "RISK", "NEW", 10),
+    ("DIRECT", "OPPORTUNITY", "REVIEWED", 3),
+    ("INDUSTRY", "RISK", "DISMISSED", 2),
+    ("ENVIRONMENT", "NEUTRAL", "NEW", 4),
+]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """AsyncSession 대체: 카운터 조회 / 전체 집계(ORM select) 구분 기록"""
+
+    def __init__(self, counter_rows=COUNTER_ROWS, counter_error=None, aggregate_rows=()):
+        self.counter_rows = counter_rows
+        self.counter_error = counter_error
+        self.aggregate_rows = list(aggregate_rows)
+        self.queries = []
+        self.statements = []
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        await asyncio.sleep(0)
+        self.statements.append(str(statement))
+        if "rkyc_dashboard_counter" in str(statement):
+            self.queries.append("counter")
+            if self.counter_error:
+                raise self.counter_error
+            return FakeResult(list(self.counter_rows))
+        self.queries.append("aggregate")
+        return FakeResult(self.aggregate_rows)
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _service(ttl=5.0):
+    config = DashboardSummaryConfig()
+    config.CACHE_TTL_SECONDS = ttl
+    config.CACHE_ENABLED = ttl > 0
+    return DashboardSummaryService(config=config)
+
+
+class TestSummaryFromCounter:
+    """카운터 기반 요약"""
+
+    def test_builds_response_from_counter_rows(self):
+        summary = asyncio.run(_service().get(FakeSession()))
+        assert summary.total_signals == 19
+        assert summary.new_signals == 14
+        assert summary.risk_signals == 12
+        assert summary.opportunity_signals == 3
+        assert summary.by_type == {"DIRECT": 13, "INDUSTRY": 2, "ENVIRONMENT": 4}
+        assert summary.by_status == {"NEW": 14, "REVIEWED": 3, "DISMISSED": 2}
+
+    def test_reads_counter_with_unrolled_deltas(self):
+        session = FakeSession()
+        asyncio.run(_service().get(session))
+        # 카운터 row만이 아니라 카운터 + 미합산 증감 view (migration_v26)
+        assert "rkyc_dashboard_counter_current" in session.statements[0]
+
+    def test_fallback_to_full_aggregate(self):
+        db = FakeSession(
+            counter_error=RuntimeError('relation "rkyc_dashboard_counter" does not exist'),
+            aggregate_rows=[
+                (SignalType.DIRECT, ImpactDirection.RISK, None, 5),  # 상태 NULL → NEW
+                (SignalType.INDUSTRY, ImpactDirection.OPPORTUNITY, SignalStatus.REVIEWED, 1),
+            ],
+        )
+        service = _service(ttl=0)
+        summary = asyncio.run(service.get(db))
+        assert summary.total_signals == 6
+        assert summary.by_status["NEW"] == 5
+        assert db.queries == ["counter", "aggregate"]
+        assert db.rollbacks == 1
+
+        # 재시도 대기 중에는 카운터를 다시 시도하지 않음
+        asyncio.run(service.get(db))
+        assert db.queries == ["counter", "aggregate", "aggregate"]
+        assert service.get_stats()["counter_available"] is False
+
+
+class TestSummaryCache:
+    """TTL 캐시"""
+
+    def test_cached_until_invalidated(self):
+        service = _service()
+        db = FakeSession()
+        first = asyncio.run(service.get(db))
+        second = asyncio.run(service.get(db))
+        assert second is first
+        assert second.generated_at == first.generated_at
+        assert db.queries == ["counter"]
+
+        service.invalidate()
+        db.counter_rows = COUNTER_ROWS + [("DIRECT", "RISK", "NEW", 1)]
+        assert asyncio.run(service.get(db)).total_signals == 20
+        assert db.queries == ["counter", "counter"]
+
+    def test_concurrent_requests_share_one_read(self):
+        service = _service()
+        db = FakeSession()
+
+        async def run():
+            return await asyncio.gather(*(service.get(db) for _ in range(10)))
+
+        results = asyncio.run(run())
+        assert db.queries == ["counter"]
+        assert len({id(r) for r in results}) == 1
+        assert service.get_stats()["hits"] == 9
+
+    def test_ttl_zero_disables_cache(self):
+        service = _service(ttl=0)
+        db = FakeSession()
+        asyncio.run(service.get(db))
+        asyncio.run(service.get(db))
+        assert db.queries == ["counter", "counter"]
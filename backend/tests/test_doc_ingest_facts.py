@@ -0,0 +1,92 @@
+"""
+Unit tests for DOC_INGEST Fact Saving
+
+행 검증(길이/NUL/비유한 수치), 일괄 INSERT, DB가 거부한 행만 제외하는 행 단위 재시도
+"""
+
+import contextlib
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models.document import DocType
+from app.worker.pipelines.doc_ingest import DocIngestPipeline
+
+
+class FakeSession:
+    """sync Session 대체: field_key가 rejected_keys에 있는 행이 포함된 INSERT는 실패"""
+
+    def __init__(self, rejected_keys=()):
+        self.rejected_keys = set(rejected_keys)
+        self.inserts = []  # executemany 호출별 행 목록
+        self.stored = []
+        self.savepoint_rollbacks = 0
+
+    def execute(self, statement, rows=None):
+        if not getattr(statement, "is_insert", False):
+            return None  # 기존 fact 삭제
+        self.inserts.append(rows)
+        if any(row["field_key"] in self.rejected_keys for row in rows):
+            raise ValueError("invalid input syntax")
+        self.stored.extend(rows)
+
+    @contextlib.contextmanager
+    def begin_nested(self):
+        try:
+            yield
+        except Exception:
+            self.savepoint_rollbacks += 1
+            raise
+
+
+def _pipeline():
+    # LLM/파서 초기화 없이 저장 로직만 사용
+    return DocIngestPipeline.__new__(DocIngestPipeline)
+
+
+def _doc():
+    return SimpleNamespace(doc_id=uuid4(), doc_type=DocType.BIZ_REG)
+
+
+def _fact(field_key, value="값", **extra):
+    return {"fact_type": "CORP_INFO", "field_key": field_key, "field_value": value, "confidence": "HIGH", **extra}
+
+
+class TestSaveFacts:
+    """rkyc_fact 저장"""
+
+    def test_single_bulk_insert(self):
+        db = FakeSession()
+        saved = _pipeline()._save_facts(db, _doc(), "C1", [_fact("corp_name"), _fact("capital", 1000)])
+
+        assert len(db.inserts) == 1 and len(db.inserts[0]) == 2
+        assert [f["field_key"] for f in saved] == ["corp_name", "capital"]
+
+    def test_rejected_row_does_not_fail_document(self):
+        db = FakeSession(rejected_keys={"ceo_name"})
+        facts = [_fact("corp_name"), _fact("ceo_name"), _fact("address")]
+        saved = _pipeline()._save_facts(db, _doc(), "C1", facts)
+
+        # 일괄 INSERT 실패 → 행 단위 재시도, 거부된 행만 제외
+        assert [f["field_key"] for f in saved] == ["corp_name", "address"]
+        assert [row["field_key"] for row in db.stored] == ["corp_name", "address"]
+        assert db.savepoint_rollbacks == 2
+
+    def test_invalid_rows_filtered_before_insert(self):
+        db = FakeSession()
+        facts = [
+            _fact("k" * 101),
+            _fact("growth_rate", float("nan")),
+            _fact("corp_name", "엠케이\x00전자", evidence_snippet="상호\x00", page_no="3"),
+        ]
+        saved = _pipeline()._save_facts(db, _doc(), "C1", facts)
+
+        assert [f["field_key"] for f in saved] == ["corp_name"]
+        row = db.inserts[0][0]
+        assert row["field_value_text"] == "엠케이전자"
+        assert row["evidence_snippet"] == "상호"
+        assert row["evidence_page_no"] == 3
+
+    def test_no_facts(self):
+        db = FakeSession()
+        assert _pipeline()._save_facts(db, _doc(), "C1", []) == []
+        assert db.inserts == []
@@ -0,0 +1,111 @@
+"""
+Unit tests for Streaming Document Upload (POST /documents/upload-stream)
+
+중복 파일(corp_id, doc_type, file_hash) 409, 워커(Celery) 처리 요청, 요청 실패 시 FAILED
+"""
+
+import asyncio
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from starlette.datastructures import UploadFile
+
+from app.api.v1.endpoints import documents
+from app.models.document import DocType, IngestStatus
+from app.worker.tasks import document_ingest
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 2048
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    """AsyncSession 대체: 중복 조회 결과 지정, 추가/커밋 기록"""
+
+    def __init__(self, existing=None):
+        self.existing = existing
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        return FakeResult(self.existing)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        pass
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    monkeypatch.setattr(documents, "DOCUMENT_STORAGE_PATH", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    calls = []
+
+    def apply_async(args=None, queue=None, **kwargs):
+        calls.append({"args": args, "queue": queue})
+        return SimpleNamespace(id="task-1")
+
+    monkeypatch.setattr(document_ingest.ingest_uploaded_document, "apply_async", apply_async)
+    return calls
+
+
+def _upload(db):
+    file = UploadFile(file=io.BytesIO(PDF_BYTES), filename="filing.pdf")
+    return asyncio.run(documents.upload_and_process_document_streaming(
+        corp_id="8001-3719240", doc_type=DocType.FIN_STATEMENT, file=file, db=db,
+    ))
+
+
+class TestUploadStream:
+    """업로드 → 워커 처리 요청"""
+
+    def test_dispatches_ingest_to_worker(self, storage, dispatched):
+        db = FakeSession()
+        response = _upload(db)
+
+        assert response.ingest_status == IngestStatus.PENDING
+        assert len(dispatched) == 1
+        doc_id, storage_path, file_hash = dispatched[0]["args"]
+        assert doc_id == str(response.doc_id)
+        assert storage_path == response.storage_path
+        assert file_hash == db.added[0].file_hash
+        assert dispatched[0]["queue"] == "high"
+
+    def test_duplicate_file_rejected(self, storage, dispatched):
+        db = FakeSession(existing=SimpleNamespace(doc_id="existing"))
+        with pytest.raises(HTTPException) as exc:
+            _upload(db)
+
+        assert exc.value.status_code == 409
+        assert db.added == []
+        assert dispatched == []
+        assert list(storage.rglob("*.pdf")) == []  # 업로드한 파일은 삭제
+
+    def test_dispatch_failure_marks_document_failed(self, storage, monkeypatch):
+        def broken(*args, **kwargs):
+            raise ConnectionError("broker unavailable")
+
+        monkeypatch.setattr(document_ingest.ingest_uploaded_document, "apply_async", broken)
+        db = FakeSession()
+        response = _upload(db)
+
+        assert response.ingest_status == IngestStatus.FAILED
+        assert db.added[0].ingest_status == IngestStatus.FAILED
+        assert "broker unavailable" in response.message
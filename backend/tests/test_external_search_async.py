@@ -0,0 +1,175 @@
+"""
+Unit tests for External Search async runtime
+
+프로세스 공유 이벤트 루프 + ENVIRONMENT 주제별 동시 쿼리 / 부분 결과
+"""
+
+import asyncio
+
+import pytest
+
+from app.worker.async_runtime import get_async_http_client, get_background_loop, run_async
+from app.worker.llm.search_cache import SharedSearchCache
+from app.worker.pipelines.external_search import ExternalSearchError, ExternalSearchPipeline
+
+
+def _make_pipeline(env_max_concurrency=3, query_timeout=0.5) -> ExternalSearchPipeline:
+    pipeline = ExternalSearchPipeline()
+    pipeline.enabled = True
+    pipeline.api_key = "test-key"
+    pipeline.env_max_concurrency = env_max_concurrency
+    pipeline.query_timeout = query_timeout
+    pipeline.total_timeout = 10.0
+    # 공유 검색 캐시는 test_search_cache.py에서 검증
+    pipeline.search_cache = SharedSearchCache()
+    pipeline.search_cache.config.ENABLED = False
+    return pipeline
+
+
+class FakePerplexity:
+    """_call_perplexity_async 대체: 주제별 지연/동시 실행 수 기록"""
+
+    def __init__(self, slow_keyword=None, delay=0.05, failing_keyword=None, slow_seconds=5):
+        self.slow_keyword = slow_keyword
+        self.failing_keyword = failing_keyword
+        self.slow_seconds = slow_seconds
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts = []
+        self.clients = set()
+
+    async def __call__(self, client, prompt, search_type):
+        self.prompts.append((search_type, prompt))
+        index = len(self.prompts)
+        self.clients.add(id(client))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.slow_keyword and self.slow_keyword in prompt:
+                await asyncio.sleep(self.slow_seconds)
+            await asyncio.sleep(self.delay)
+            if self.failing_keyword and self.failing_keyword in prompt:
+                raise ExternalSearchError("Perplexity HTTP 503 (environment)")
+        finally:
+            self.in_flight -= 1
+        return [{
+            "title": f"{search_type} 이벤트 {index}",
+            "summary": "요약",
+            "source_url": f"https://example.com/{index}",
+        }]
+
+
+class TestBackgroundLoop:
+    """프로세스 공유 루프 테스트"""
+
+    def test_loop_and_client_reused_across_calls(self):
+        async def current():
+            return asyncio.get_running_loop(), get_async_http_client()
+
+        loop1, client1 = run_async(current())
+        loop2, client2 = run_async(current())
+
+        assert loop1 is loop2 is get_background_loop().loop
+        assert client1 is client2
+
+    def test_run_async_timeout(self):
+        import concurrent.futures
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            run_async(asyncio.sleep(1), timeout=0.05)
+
+
+class TestEnvironmentQueryFanout:
+    """ENVIRONMENT 주제별 동시 쿼리"""
+
+    SELECTED = ["FX_RISK", "COMMODITY", "ENERGY_SECURITY", "REGULATION"]
+
+    def test_one_query_per_topic_bounded_concurrency(self):
+        pipeline = _make_pipeline(env_max_concurrency=2)
+        fake = FakePerplexity()
+        pipeline._call_perplexity_async = fake
+        stats = {}
+
+        events = run_async(pipeline._search_environment_events_async(
+            None, "반도체", "C26", self.SELECTED, query_stats=stats
+        ))
+
+        assert len(fake.prompts) == 4
+        assert fake.max_in_flight == 2
+        assert len(events) == 4
+        assert all(e["event_category"] == "ENVIRONMENT" for e in events)
+        assert stats["completed"] == 4
+        assert stats["partial"] is False
+
+    def test_timed_out_query_returns_partial_results(self):
+        pipeline = _make_pipeline(query_timeout=0.3)
+        pipeline._call_perplexity_async = FakePerplexity(slow_keyword="원자재 가격 변동")
+        stats = {}
+
+        events = run_async(pipeline._search_environment_events_async(
+            None, "반도체", "C26", self.SELECTED, query_stats=stats
+        ))
+
+        assert len(events) == 3
+        assert stats["timed_out"] == 1
+        assert stats["partial"] is True
+
+    def test_parallel_execute_uses_shared_client(self):
+        pipeline = _make_pipeline(query_timeout=0.3)
+        fake = FakePerplexity(slow_keyword="에너지 전력")
+        pipeline._call_perplexity_async = fake
+
+        result = pipeline._execute_parallel(
+            "엠케이전자", "반도체", "C26", None, self.SELECTED, None
+        )
+
+        assert len(result["direct_events"]) == 1
+        assert len(result["industry_events"]) == 1
+        assert len(result["environment_events"]) == 3
+        assert result["metadata"]["partial"] is True
+        assert result["metadata"]["environment_queries"]["timed_out"] == 1
+        assert len(fake.clients) == 1
+
+    def test_failed_query_counted(self):
+        pipeline = _make_pipeline()
+        pipeline._call_perplexity_async = FakePerplexity(failing_keyword="원자재 가격 변동")
+        stats = {}
+
+        events = run_async(pipeline._search_environment_events_async(
+            None, "반도체", "C26", self.SELECTED, query_stats=stats
+        ))
+
+        assert len(events) == 3
+        assert stats["failed"] == 1
+        assert stats["partial"] is True
+
+    def test_completed_tracks_kept_when_environment_exceeds_budget(self):
+        # 동시 1개 × 쿼리 0.4s × 4주제 > 전체 1s: 완료된 DIRECT/INDUSTRY/일부 주제 유지
+        pipeline = _make_pipeline(env_max_concurrency=1, query_timeout=0.5)
+        pipeline.total_timeout = 1.0
+        pipeline._call_perplexity_async = FakePerplexity(delay=0.4)
+
+        result = pipeline._execute_parallel(
+            "엠케이전자", "반도체", "C26", None, self.SELECTED, None
+        )
+
+        assert len(result["direct_events"]) == 1
+        assert len(result["industry_events"]) == 1
+        assert 1 <= len(result["environment_events"]) < 4
+        assert result["metadata"]["partial"] is True
+        assert result["metadata"]["failed_tracks"] == []
+
+    def test_slow_track_reported_without_dropping_others(self):
+        pipeline = _make_pipeline(query_timeout=0.3)
+        pipeline.total_timeout = 0.5
+        pipeline._call_perplexity_async = FakePerplexity(slow_keyword="참조 기업", slow_seconds=2)
+
+        result = pipeline._execute_parallel(
+            "엠케이전자", "반도체", "C26", None, self.SELECTED, None
+        )
+
+        assert result["industry_events"] == []
+        assert len(result["direct_events"]) == 1
+        assert len(result["environment_events"]) == 4
+        assert result["metadata"]["failed_tracks"] == ["INDUSTRY"]
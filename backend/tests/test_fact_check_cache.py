@@ -0,0 +1,167 @@
+"""
+Unit tests for Fact-Check cache and claim batching
+
+주장 정규화, 판정별 TTL, 배치 grounded 호출, 캐시 재사용
+"""
+
+import json
+import time
+
+from app.worker.async_runtime import run_async
+from app.worker.llm.fact_check_cache import FactCheckCache, normalize_claim
+from app.worker.llm.fact_checker import FactCheckResult, GeminiFactChecker
+
+
+def _signal(i: int, signal_type: str = "DIRECT") -> dict:
+    return {
+        "signal_type": signal_type,
+        "event_type": signal_type,
+        "title": f"이벤트 {i} 영업이익 1,200억원",
+        "summary": f"요약 {i}",
+        "impact_direction": "RISK",
+        "impact_strength": "MED",
+    }
+
+
+class FakeGemini:
+    """_call_gemini_with_grounding 대체: 호출 기록 + 배치/단건 응답"""
+
+    def __init__(self, batch_fn=None, verdict="verified"):
+        self.batch_fn = batch_fn
+        self.verdict = verdict
+        self.calls = []
+
+    async def __call__(self, prompt, system_prompt=None, max_tokens=1024):
+        self.calls.append(prompt)
+        if system_prompt == GeminiFactChecker.FACT_CHECK_BATCH_SYSTEM_PROMPT:
+            count = prompt.count("## [index")
+            if self.batch_fn:
+                return self.batch_fn(count)
+            return json.dumps({"results": [
+                {"index": i, "result": self.verdict, "confidence": 0.9, "explanation": f"확인 {i}"}
+                for i in range(count)
+            ]}, ensure_ascii=False)
+        return json.dumps({"result": self.verdict, "confidence": 0.8, "explanation": "단건"})
+
+
+def _make_checker(fake: FakeGemini, batch_size: int = 5) -> GeminiFactChecker:
+    cache = FactCheckCache(redis_client=None)
+    cache._redis_checked = True  # memory only
+    cache.config.ENABLED = True
+    checker = GeminiFactChecker(batch_size=batch_size, cache=cache)
+    checker.is_available = lambda: True
+    checker._call_gemini_with_grounding = fake
+    return checker
+
+
+class TestNormalizeClaim:
+    """주장 정규화"""
+
+    def test_equivalent_claims_normalize_equal(self):
+        assert normalize_claim("삼성전자, 영업이익 1,200억원!") == normalize_claim("삼성전자  영업이익 1200억원")
+        assert normalize_claim("“기준금리” 3.25%") == normalize_claim("기준금리 3.25%")
+
+    def test_decimal_point_preserved(self):
+        assert normalize_claim("3.25%") != normalize_claim("325%")
+
+
+class TestFactCheckCache:
+    """판정별 TTL"""
+
+    def test_ttl_by_verdict(self):
+        cache = FactCheckCache(redis_client=None)
+        cache._redis_checked = True
+        cache.config.ENABLED = True
+
+        assert cache.set("k1", {"result": "verified"}) == cache.config.TTL_DECISIVE
+        assert cache.set("k2", {"result": "false"}) == cache.config.TTL_DECISIVE
+        assert cache.set("k3", {"result": "unverified"}) == cache.config.TTL_UNVERIFIED
+        assert cache.set("k4", {"result": "error"}) == 0
+        assert cache.config.TTL_UNVERIFIED < cache.config.TTL_DECISIVE
+        assert set(cache.get_many(["k1", "k2", "k3", "k4"])) == {"k1", "k2", "k3"}
+
+    def test_memory_copy_bounded_by_memory_ttl(self):
+        cache = FactCheckCache(redis_client=None)
+        cache._redis_checked = True
+        cache.config.ENABLED = True
+
+        cache.set("k1", {"result": "verified"})
+        # 판정 TTL(7일)과 무관하게 다른 프로세스의 clear()가 MEMORY_TTL_SECONDS 안에 반영되도록
+        assert cache._memory["k1"][1] <= time.time() + cache.config.MEMORY_TTL_SECONDS
+
+    def test_industry_claims_shared_across_corps(self):
+        cache = FactCheckCache(redis_client=None)
+
+        industry = _signal(0, "INDUSTRY")
+        direct = _signal(0, "DIRECT")
+
+        assert cache.make_key(industry, "엠케이전자") == cache.make_key(industry, "삼성전자")
+        assert cache.make_key(direct, "엠케이전자") != cache.make_key(direct, "삼성전자")
+
+
+class TestFactCheckBatching:
+    """배치 grounded 호출"""
+
+    def test_claims_verified_in_batches(self):
+        fake = FakeGemini()
+        checker = _make_checker(fake, batch_size=4)
+
+        results = run_async(checker.check_signals_batch(
+            [_signal(i) for i in range(10)], "엠케이전자", max_concurrent=2
+        ))
+
+        assert len(fake.calls) == 3  # 4 + 4 + 2
+        assert all(r.result == FactCheckResult.VERIFIED for _, r in results)
+        assert results[5][1].explanation == "확인 1"
+
+    def test_rescan_served_from_cache(self):
+        fake = FakeGemini(verdict="false")
+        checker = _make_checker(fake)
+        signals = [_signal(i) for i in range(3)]
+
+        run_async(checker.check_signals_batch(signals, "엠케이전자"))
+        calls_after_first = len(fake.calls)
+        results = run_async(checker.check_signals_batch(signals, "엠케이전자"))
+
+        assert len(fake.calls) == calls_after_first
+        assert all(r.cached and r.result == FactCheckResult.FALSE for _, r in results)
+
+    def test_duplicate_claims_checked_once(self):
+        fake = FakeGemini()
+        checker = _make_checker(fake)
+
+        results = run_async(checker.check_signals_batch(
+            [_signal(0), _signal(0), _signal(1)], "엠케이전자"
+        ))
+
+        assert len(fake.calls) == 1
+        assert fake.calls[0].count("## [index") == 2
+        assert len(results) == 3
+
+    def test_missing_batch_items_fall_back_to_single(self):
+        fake = FakeGemini(batch_fn=lambda count: json.dumps({"results": [
+            {"index": 0, "result": "verified", "confidence": 0.9, "explanation": "ok"}
+        ]}))
+        checker = _make_checker(fake)
+
+        results = run_async(checker.check_signals_batch(
+            [_signal(i) for i in range(3)], "엠케이전자"
+        ))
+
+        assert len(fake.calls) == 3  # 1 batch + 2 single
+        assert [r.explanation for _, r in results] == ["ok", "단건", "단건"]
+
+    def test_errors_not_cached(self):
+        fake = FakeGemini(batch_fn=lambda count: "not json")
+        checker = _make_checker(fake)
+
+        async def failing(prompt, system_prompt=None, max_tokens=1024):
+            raise RuntimeError("gemini down")
+
+        checker._call_gemini_with_grounding = failing
+        results = run_async(checker.check_signals_batch([_signal(0), _signal(1)], "엠케이전자"))
+        assert all(r.result == FactCheckResult.ERROR for _, r in results)
+
+        checker._call_gemini_with_grounding = fake
+        run_async(checker.check_signals_batch([_signal(0), _signal(1)], "엠케이전자"))
+        assert len(fake.calls) == 3  # batch (unparseable) + 2 single
@@ -0,0 +1,207 @@
+"""
+Unit tests for Industry Knowledge Store
+
+Memory → Redis tier 조회, 버전/stale 판정, 무효화, 업종 힌트 백그라운드 재생성
+"""
+
+import asyncio
+import threading
+import json
+import time
+from dataclasses import replace
+
+import pytest
+
+from app.worker.async_runtime import run_async
+from app.worker.llm import industry_knowledge
+from app.worker.llm.industry_knowledge import (
+    INDUSTRY_KNOWLEDGE_VERSION,
+    IndustryKnowledgeConfig,
+    IndustryKnowledgeStore,
+    KnowledgeSource,
+    get_industry_keywords,
+    get_industry_name,
+)
+from app.worker.pipelines.corp_profiling import clear_industry_hints_cache, get_industry_hints
+
+
+class FakeRedis:
+    """IndustryKnowledgeStore가 사용하는 Redis 명령만 구현한 in-memory fake"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    def scan(self, cursor, match=None, count=None):
+        prefix = match.rstrip("*")
+        return 0, [key for key in self.store if key.startswith(prefix)]
+
+
+class FakeLLM:
+    """llm_service.generate 대체"""
+
+    def __init__(self, hints=None, fail=False):
+        self.hints = hints or {"typical_materials": ["생성된 원자재"]}
+        self.fail = fail
+        self.calls = 0
+
+    async def generate(self, prompt, system_prompt=None, temperature=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return f"```json\n{json.dumps(self.hints, ensure_ascii=False)}\n```"
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def store(monkeypatch, redis_client):
+    config = IndustryKnowledgeConfig()
+    config.DB_ENABLED = False
+    store = IndustryKnowledgeStore(config=config, redis_client=redis_client)
+    monkeypatch.setattr(industry_knowledge, "_industry_knowledge_store", store)
+    return store
+
+
+def _new_process_store(redis_client) -> IndustryKnowledgeStore:
+    """같은 Redis를 공유하는 다른 프로세스의 store"""
+    config = IndustryKnowledgeConfig()
+    config.DB_ENABLED = False
+    return IndustryKnowledgeStore(config=config, redis_client=redis_client)
+
+
+class TestTieredLookup:
+    """Memory → Redis → seed 조회"""
+
+    def test_seed_fallback_for_name_and_keywords(self, store):
+        assert get_industry_name("C26") == "전자부품 제조업"
+        assert "HBM" in get_industry_keywords("C26")["market"]
+        assert get_industry_name("Z99") == "업종코드 Z99"
+        assert get_industry_keywords("Z99")["supply_chain"][0] == "원자재"
+        assert store.get_stats()["seed_fallbacks"] == 2
+
+    def test_put_is_shared_through_redis(self, store, redis_client):
+        entry = replace(store.resolve("C26"), industry_name="반도체 제조업")
+        store.put(entry)
+
+        other = _new_process_store(redis_client)
+        assert other.resolve("C26").industry_name == "반도체 제조업"
+        assert other.get_stats()["redis_hits"] == 1
+
+    def test_pipeline_names_follow_store(self, store):
+        from app.worker.llm.prompts import get_industry_name as prompt_industry_name
+        from app.worker.pipelines.external_search import ExternalSearchPipeline
+
+        store.put(replace(store.resolve("C26"), industry_name="반도체 제조업"))
+        assert prompt_industry_name("C26") == "반도체 제조업"
+        assert ExternalSearchPipeline._get_industry_name(None, "C26") == "반도체 제조업"
+
+    def test_stale_by_version_and_age(self, store):
+        fresh = store.update_hints("C26", {"typical_materials": ["금"]})
+        assert store.is_stale(fresh) is False
+        assert store.is_stale(replace(fresh, version=INDUSTRY_KNOWLEDGE_VERSION - 1)) is True
+        assert store.is_stale(replace(fresh, refreshed_at=time.time() - 40 * 24 * 3600)) is True
+        assert store.is_stale(store.resolve("F41")) is True
+
+
+class TestInvalidation:
+    """clear_industry_hints_cache → 전 tier 힌트 무효화"""
+
+    def test_clear_keeps_name_and_keywords(self, store, redis_client):
+        store.update_hints("C26", {"typical_materials": ["금"]})
+        store.update_hints("F41", {"typical_materials": ["시멘트"]})
+
+        assert clear_industry_hints_cache("C26") == 1
+        assert redis_client.get(store._redis_key("C26")) is None
+        assert store.get("F41").hints == {"typical_materials": ["시멘트"]}
+
+        entry = store.resolve("C26")
+        assert entry.industry_name == "전자부품 제조업"
+        assert entry.source == KnowledgeSource.SEED
+
+    def test_clear_all(self, store, redis_client):
+        store.update_hints("C26", {"typical_materials": ["금"]})
+        store.update_hints("F41", {"typical_materials": ["시멘트"]})
+
+        assert clear_industry_hints_cache() == 2
+        assert redis_client.store == {}
+
+
+class TestIndustryHints:
+    """get_industry_hints: seed → 즉시 생성, stale → 백그라운드 재생성"""
+
+    def test_without_llm_returns_default_hints(self, store):
+        hints = asyncio.run(get_industry_hints("C26"))
+        assert "다나까 금속 (Tanaka)" in hints["typical_suppliers"]
+
+    def test_generated_hints_are_stored_and_reused(self, store, redis_client):
+        llm = FakeLLM()
+        assert asyncio.run(get_industry_hints("C26", llm)) == llm.hints
+        assert asyncio.run(get_industry_hints("C26", llm)) == llm.hints
+        assert llm.calls == 1
+
+        other = _new_process_store(redis_client)
+        entry = other.resolve("C26")
+        assert entry.hints == llm.hints
+        assert entry.source == KnowledgeSource.LLM
+
+    def test_llm_failure_falls_back_without_storing(self, store):
+        hints = asyncio.run(get_industry_hints("F41", FakeLLM(fail=True)))
+        assert hints["typical_materials"] == ["원자재", "부품", "소재"]
+        assert store.resolve("F41").source == KnowledgeSource.SEED
+
+    def test_stale_hints_served_while_refreshing(self, store):
+        old = {"typical_materials": ["이전 힌트"]}
+        store.put(replace(
+            store.update_hints("C26", old),
+            version=INDUSTRY_KNOWLEDGE_VERSION - 1,
+        ))
+        llm = FakeLLM(hints={"typical_materials": ["새 힌트"]})
+
+        assert asyncio.run(get_industry_hints("C26", llm)) == old
+
+        # 백그라운드 루프에서 재생성 완료 대기
+        async def wait_refreshed():
+            while store.get_stats()["refreshing"]:
+                await asyncio.sleep(0.01)
+        run_async(wait_refreshed(), timeout=2.0)
+
+        entry = store.resolve("C26")
+        assert entry.hints == llm.hints
+        assert entry.version == INDUSTRY_KNOWLEDGE_VERSION
+        assert llm.calls == 1
+
+    def test_refresh_writes_off_the_shared_loop(self, store, monkeypatch):
+        threads = {}
+        update_hints = store.update_hints
+
+        def recording_update(code, hints):
+            threads["update"] = threading.get_ident()
+            return update_hints(code, hints)
+
+        async def generate():
+            threads["loop"] = threading.get_ident()
+            return {"typical_materials": ["새 힌트"]}
+
+        monkeypatch.setattr(store, "update_hints", recording_update)
+        assert store.schedule_refresh("C26", generate)
+
+        async def wait_refreshed():
+            while store.get_stats()["refreshing"]:
+                await asyncio.sleep(0.01)
+        run_async(wait_refreshed(), timeout=2.0)
+
+        # DB/Redis 쓰기는 공유 루프 스레드가 아닌 작업 스레드에서 실행
+        assert threads["update"] != threads["loop"]
+        assert store.resolve("C26").hints["typical_materials"] == ["새 힌트"]
@@ -0,0 +1,252 @@
+"""
+Unit tests for Analysis Input Fingerprint
+
+구성요소별 변경 감지, freshness SLA, 게이트 비활성/구성요소 조회 실패 시 전부 생성
+"""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, UTC
+from types import SimpleNamespace
+
+from app.models.job import QueueReason
+from app.services.input_fingerprint import (
+    InputFingerprintConfig,
+    compute_fingerprint,
+    decide,
+    finalize_job_fingerprint,
+    fingerprint_components,
+    plan_scan,
+    record_job_fingerprint,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _row(corp_id="C1", last_fingerprint=None, last_finished_at=None, **overrides):
+    values = dict(
+        corp_id=corp_id,
+        snapshot_version=3,
+        snapshot_hash="a" * 64,
+        file_hashes="d1:h1,d2:h2",
+        banking_data_date=date(2026, 2, 1),
+        profile_version=datetime(2026, 2, 10, 9, 0, tzinfo=UTC),
+        dart_last_rcept_no="20260210000123",
+        external_last_event_at=None,
+        last_fingerprint=last_fingerprint,
+        last_finished_at=last_finished_at,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _fingerprint(row):
+    return compute_fingerprint(fingerprint_components(row))
+
+
+def _config(**overrides):
+    config = InputFingerprintConfig()
+    config.ENABLED = True
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+class FakeSession:
+    def __init__(self, rows=(), error=None):
+        self.rows = list(rows)
+        self.error = error
+        self.rolled_back = False
+
+    def execute(self, stmt, params=None):
+        if self.error:
+            raise self.error
+        rows = [r for r in self.rows if r.corp_id in params["corp_ids"]]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class TestFingerprint:
+    """구성요소 해시"""
+
+    def test_stable_for_same_inputs(self):
+        assert _fingerprint(_row()) == _fingerprint(_row(last_fingerprint="x"))
+        assert len(_fingerprint(_row())) == 64
+
+    def test_each_component_changes_fingerprint(self):
+        base = _fingerprint(_row())
+        changes = [
+            {"snapshot_version": 4},
+            {"file_hashes": "d1:h1,d2:h3"},
+            {"banking_data_date": date(2026, 3, 1)},
+            {"profile_version": datetime(2026, 2, 20, tzinfo=UTC)},
+            {"dart_last_rcept_no": "20260215000001"},
+            {"external_last_event_at": datetime(2026, 2, 28, tzinfo=UTC)},
+        ]
+        assert all(_fingerprint(_row(**change)) != base for change in changes)
+
+    def test_timezone_normalized(self):
+        kst = datetime(2026, 2, 10, 18, 0, tzinfo=UTC).astimezone()
+        assert _fingerprint(_row(profile_version=kst)) == _fingerprint(
+            _row(profile_version=datetime(2026, 2, 10, 18, 0, tzinfo=UTC))
+        )
+
+
+class TestDecide:
+    """Job 생성 사유"""
+
+    def test_reasons(self):
+        recent = NOW - timedelta(hours=2)
+        assert decide("f", None, None, 72, NOW) == QueueReason.NO_PRIOR_RUN
+        assert decide("f", "g", recent, 72, NOW) == QueueReason.INPUT_CHANGED
+        assert decide("f", "f", recent, 72, NOW) is None
+        assert decide("f", "f", NOW - timedelta(hours=72), 72, NOW) == QueueReason.FRESHNESS_EXPIRED
+
+    def test_naive_finished_at(self):
+        assert decide("f", "f", datetime(2026, 3, 1, 11, 0), 72, NOW) is None
+
+
+class TestPlanScan:
+    """스캔 대상 판정"""
+
+    def test_only_changed_or_stale_corps_queued(self):
+        unchanged = _row("C1", last_finished_at=NOW - timedelta(hours=1))
+        unchanged.last_fingerprint = _fingerprint(unchanged)
+        changed = _row("C2", last_fingerprint="old", last_finished_at=NOW - timedelta(hours=1))
+        stale = _row("C3", last_finished_at=NOW - timedelta(hours=100))
+        stale.last_fingerprint = _fingerprint(stale)
+        never = _row("C4")
+
+        plan = plan_scan(FakeSession([unchanged, changed, stale, never]), ["C1", "C2", "C3", "C4"], 72, _config(), NOW)
+
+        assert [(d.corp_id, d.reason) for d in plan.queued] == [
+            ("C2", QueueReason.INPUT_CHANGED),
+            ("C3", QueueReason.FRESHNESS_EXPIRED),
+            ("C4", QueueReason.NO_PRIOR_RUN),
+        ]
+        assert plan.skipped == 1
+        assert plan.queued[0].fingerprint == _fingerprint(changed)
+        assert plan.reason_counts() == {"INPUT_CHANGED": 1, "FRESHNESS_EXPIRED": 1, "NO_PRIOR_RUN": 1}
+
+    def test_disabled_queues_all(self):
+        plan = plan_scan(FakeSession(), ["C1", "C2"], 72, _config(ENABLED=False), NOW)
+        assert [d.reason for d in plan.queued] == [QueueReason.GATE_DISABLED] * 2
+
+    def test_component_load_failure_queues_all(self):
+        session = FakeSession(error=RuntimeError("column rkyc_job.input_fingerprint does not exist"))
+        plan = plan_scan(session, ["C1"], 72, _config(), NOW)
+        assert [d.reason for d in plan.queued] == [QueueReason.GATE_DISABLED]
+        assert session.rolled_back
+
+
+class RecordingSession(FakeSession):
+    """COMPONENTS_SQL 응답 + RECORD_SQL로 기록된 Job fingerprint 보관"""
+
+    def __init__(self, rows=()):
+        super().__init__(rows)
+        self.recorded = {}
+
+    def execute(self, stmt, params=None):
+        if "fingerprint" in params:
+            self.recorded[params["job_id"]] = params["fingerprint"]
+            return SimpleNamespace()
+        return super().execute(stmt, params)
+
+    def commit(self):
+        pass
+
+
+class _Stage:
+    def __init__(self, result=None, on_execute=None):
+        self.result = result
+        self.on_execute = on_execute
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def execute(self, *args, **kwargs):
+        if self.on_execute:
+            self.on_execute()
+        return self.result
+
+
+class TestJobFingerprint:
+    """분석이 쓴 프로필은 자기 fingerprint를 무효화하지 않음"""
+
+    def test_profile_written_by_analysis_is_folded_in(self):
+        row = _row()
+        session = RecordingSession([row])
+        started = record_job_fingerprint(session, "J1", "C1")
+        row.profile_version = datetime(2026, 3, 1, 11, 0, tzinfo=UTC)  # PROFILING 단계 upsert
+        row.last_fingerprint = finalize_job_fingerprint(session, "J1", "C1", started)
+        row.last_finished_at = NOW - timedelta(minutes=5)
+
+        assert session.recorded["J1"] == _fingerprint(row)
+        assert plan_scan(session, ["C1"], 72, _config(), NOW).queued == []
+
+    def test_other_inputs_changed_during_run_still_detected(self):
+        row = _row()
+        session = RecordingSession([row])
+        started = record_job_fingerprint(session, "J1", "C1")
+        row.file_hashes = "d1:h1,d2:h2,d3:h3"  # 분석 중 업로드된 문서
+        row.last_fingerprint = finalize_job_fingerprint(session, "J1", "C1", started)
+        row.last_finished_at = NOW - timedelta(minutes=5)
+
+        plan = plan_scan(session, ["C1"], 72, _config(), NOW)
+        assert [d.reason for d in plan.queued] == [QueueReason.INPUT_CHANGED]
+
+    def test_pipeline_run_leaves_gate_closed(self, monkeypatch):
+        import app.worker.tasks.analysis as analysis
+
+        row = _row()
+        session = RecordingSession([row])
+
+        @contextmanager
+        def fake_db():
+            yield session
+
+        def save_profile(profile):
+            row.profile_version = datetime(2026, 3, 1, 11, 30, tzinfo=UTC)
+
+        profile_result = SimpleNamespace(
+            profile={"profile_confidence": "HIGH"}, selected_queries=[], query_details=[], is_cached=False,
+        )
+        snapshot = {"corporation": {"corp_name": "엠케이전자", "industry_code": "C26"}}
+        stages = {
+            "SnapshotPipeline": _Stage(snapshot),
+            "DocIngestPipeline": _Stage({"documents_processed": 0, "facts_extracted": 0}),
+            "ExternalSearchPipeline": _Stage({}),
+            "ContextPipeline": _Stage({}),
+            "SignalExtractionPipeline": _Stage([]),
+            "ValidationPipeline": _Stage([]),
+            "DeduplicationPipeline": _Stage([]),
+            "BankInterpretationPipeline": _Stage([]),
+            "IndexPipeline": _Stage([]),
+            "InsightPipeline": _Stage({}),
+        }
+        for name, stage in stages.items():
+            monkeypatch.setattr(analysis, name, stage)
+        monkeypatch.setattr(analysis, "get_sync_db", fake_db)
+        monkeypatch.setattr(analysis, "update_job_progress", lambda *a, **k: None)
+        profiling_calls = []
+
+        async def profiling_execute(**kwargs):
+            profiling_calls.append(kwargs)
+            return profile_result
+
+        monkeypatch.setattr(
+            analysis, "get_corp_profiling_pipeline", lambda: SimpleNamespace(execute=profiling_execute),
+        )
+        monkeypatch.setattr(analysis, "run_async", lambda coro, timeout=None: asyncio.run(coro))
+        monkeypatch.setattr(analysis, "_save_profile_sync", save_profile)
+        monkeypatch.setattr(analysis, "schedule_report_rebuild", lambda corp_id: None)
+
+        assert analysis.run_analysis_pipeline.run("J1", "C1")["status"] == "success"
+        # 프로파일링은 기존 프로파일을 캐시로 읽지 않음 (db_session=None, 저장은 sync)
+        assert profiling_calls[0]["db_session"] is None
+
+        row.last_fingerprint = session.recorded["J1"]
+        row.last_finished_at = NOW - timedelta(minutes=5)
+        assert decide(_fingerprint(row), row.last_fingerprint, row.last_finished_at, 72, NOW) is None
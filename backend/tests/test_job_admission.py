@@ -0,0 +1,113 @@
+"""
+Unit tests for Analysis Job Admission
+
+대상 기업 배열을 INSERT 1회로 전달, 진행 중 시간 제한, publish되지 않은 Job만 FAILED 일괄 기록
+"""
+
+import contextlib
+import uuid
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+from app.models.job import QueueReason
+from app.services.input_fingerprint import ScanDecision
+from app.worker.job_admission import AdmittedJob, admit_analysis_jobs, dispatch_analysis_jobs
+
+
+class FakeSession:
+    def __init__(self, in_flight=()):
+        self.in_flight = set(in_flight)
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        rows = []
+        if "INSERT INTO rkyc_job" in str(stmt):
+            rows = [
+                SimpleNamespace(job_id=uuid.uuid4(), corp_id=corp_id, queue_reason=reason)
+                for corp_id, reason in zip(params["corp_ids"], params["reasons"])
+                if corp_id not in self.in_flight
+            ]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    def commit(self):
+        self.commits += 1
+
+
+def _decisions():
+    return [
+        ScanDecision("C1", QueueReason.INPUT_CHANGED, "f1"),
+        ScanDecision("C2", None, "f2"),
+        ScanDecision("C3", QueueReason.NO_PRIOR_RUN, "f3"),
+        ScanDecision("C4", QueueReason.GATE_DISABLED),
+    ]
+
+
+class TestAdmit:
+    """INSERT ... SELECT ... WHERE NOT EXISTS"""
+
+    def test_single_statement_for_all_corps(self):
+        db = FakeSession(in_flight={"C3"})
+        admitted = admit_analysis_jobs(db, _decisions(), active_within=timedelta(hours=1))
+
+        assert len(db.statements) == 1 and db.commits == 1
+        sql, params = db.statements[0]
+        assert "NOT EXISTS" in sql and "RETURNING" in sql
+        assert params["corp_ids"] == ["C1", "C3", "C4"]
+        assert params["fingerprints"] == ["f1", "f3", None]
+        assert params["reasons"] == ["INPUT_CHANGED", "NO_PRIOR_RUN", "GATE_DISABLED"]
+        assert datetime.now(UTC) - timedelta(hours=1, seconds=5) < params["active_since"] < datetime.now(UTC)
+        assert [(j.corp_id, j.queue_reason) for j in admitted] == [("C1", "INPUT_CHANGED"), ("C4", "GATE_DISABLED")]
+
+    def test_no_time_limit(self):
+        db = FakeSession()
+        admit_analysis_jobs(db, _decisions())
+        assert db.statements[0][1]["active_since"] is None
+
+    def test_nothing_to_admit(self):
+        db = FakeSession()
+        assert admit_analysis_jobs(db, [ScanDecision("C1", None)]) == []
+        assert db.statements == []
+
+
+class TestDispatch:
+    """Job별 publish"""
+
+    def test_publish_each_job(self):
+        sent = []
+        jobs = [AdmittedJob(str(uuid.uuid4()), "C1"), AdmittedJob(str(uuid.uuid4()), "C2")]
+        assert dispatch_analysis_jobs(jobs, publish=lambda job, queue: sent.append((job, queue)), queue="low") == 2
+        assert sent == [(jobs[0], "low"), (jobs[1], "low")]
+
+    def test_publish_failure_marks_jobs_failed(self):
+        db = FakeSession()
+
+        def publish(jobs, queue=None):
+            raise ConnectionError("broker down")
+
+        jobs = [AdmittedJob(str(uuid.uuid4()), "C1"), AdmittedJob(str(uuid.uuid4()), "C2")]
+        dispatched = dispatch_analysis_jobs(jobs, publish=publish, db_factory=lambda: contextlib.nullcontext(db))
+
+        assert dispatched == 0
+        sql, params = db.statements[0]
+        assert "CELERY_DISPATCH_FAILED" in sql
+        assert params["job_ids"] == [j.job_id for j in jobs]
+        assert "broker down" in params["error_message"]
+        assert db.commits == 1
+
+    def test_partial_failure_marks_only_unpublished_jobs(self):
+        db = FakeSession()
+        sent = []
+
+        def publish(job, queue=None):
+            if job.corp_id == "C2":
+                raise ConnectionError("broker down")
+            sent.append(job)
+
+        jobs = [AdmittedJob(str(uuid.uuid4()), corp_id) for corp_id in ("C1", "C2", "C3")]
+        dispatched = dispatch_analysis_jobs(jobs, publish=publish, db_factory=lambda: contextlib.nullcontext(db))
+
+        assert dispatched == 1 and sent == [jobs[0]]
+        # 첫 실패 이후 Job은 publish하지 않고 함께 FAILED 처리, 이미 publish된 Job은 그대로
+        assert db.statements[0][1]["job_ids"] == [jobs[1].job_id, jobs[2].job_id]
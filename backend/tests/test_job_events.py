@@ -0,0 +1,224 @@
+"""
+Unit tests for Job Progress Events
+
+Worker 진행 보고 coalescing (상태 변경/종료/오류/checkpoint만 DB 기록, publish 실패 시 매번 기록),
+SSE 스트림 (초기 상태 + Redis 보정, 종료 시 닫힘, heartbeat, Redis 없을 때 DB 조회 fallback)
+"""
+
+import asyncio
+import contextlib
+import json
+
+from app.models.job import JobStatus, ProgressStep
+from app.services.job_events import (
+    JobEventsConfig,
+    event_stream,
+    format_sse,
+    make_event,
+)
+from app.worker.job_progress import JobProgressReporter
+
+JOB_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _config(**overrides):
+    config = JobEventsConfig()
+    config.ENABLED = True
+    config.CHECKPOINT_SECONDS = 15.0
+    config.HEARTBEAT_SECONDS = 15.0
+    config.MAX_STREAM_SECONDS = 5.0
+    config.FALLBACK_POLL_SECONDS = 0.01
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+class FakePublisher:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
+        return self.ok
+
+
+class FakeSyncDb:
+    def __init__(self):
+        self.updates = []
+
+    @contextlib.contextmanager
+    def __call__(self):
+        db = self
+
+        class Session:
+            def execute(self, stmt):
+                db.updates.append(stmt.compile().params)
+
+                class Result:
+                    def scalar_one_or_none(self):
+                        return "8001-3719240"
+                return Result()
+
+            def commit(self):
+                pass
+
+        yield Session()
+
+
+def _reporter(ok=True, **config):
+    db = FakeSyncDb()
+    publisher = FakePublisher(ok)
+    return JobProgressReporter(config=_config(**config), publisher=publisher, db_factory=db), db, publisher
+
+
+def _run_job(reporter):
+    reporter.report(JOB_ID, JobStatus.RUNNING, step=ProgressStep.SNAPSHOT, percent=5)
+    for percent, step in ((20, ProgressStep.DOC_INGEST), (40, ProgressStep.EXTERNAL), (60, ProgressStep.SIGNAL)):
+        reporter.report(JOB_ID, JobStatus.RUNNING, step=step, percent=percent)
+    reporter.report(JOB_ID, JobStatus.DONE, step=ProgressStep.INSIGHT, percent=100)
+
+
+class TestProgressCoalescing:
+    """Worker 진행 보고"""
+
+    def test_only_transitions_written_to_db(self):
+        reporter, db, publisher = _reporter()
+        _run_job(reporter)
+
+        assert [u["status"] for u in db.updates] == ["RUNNING", "DONE"]
+        assert "finished_at" in db.updates[-1]
+        assert [e["percent"] for e in publisher.events] == [5, 20, 40, 60, 100]
+        # corp_id는 첫 기록의 RETURNING으로 받아 이후 이벤트에 사용 (기업 채널)
+        assert all(e["corp_id"] == "8001-3719240" for e in publisher.events)
+        assert reporter.get_stats()["coalesced"] == 3
+        assert reporter.get_stats()["active_jobs"] == 0
+
+    def test_checkpoint_interval(self):
+        reporter, db, _ = _reporter(CHECKPOINT_SECONDS=0)
+        _run_job(reporter)
+        assert len(db.updates) == 5
+
+    def test_errors_written_immediately(self):
+        reporter, db, _ = _reporter()
+        reporter.report(JOB_ID, JobStatus.RUNNING, step=ProgressStep.SNAPSHOT, percent=5)
+        reporter.report(JOB_ID, JobStatus.RUNNING, step="SIGNAL", percent=60, error_code="LLM_TIMEOUT")
+        assert len(db.updates) == 2
+        assert db.updates[-1]["error_code"] == "LLM_TIMEOUT"
+        assert db.updates[-1]["progress_step"] == "SIGNAL"
+
+    def test_publish_failure_falls_back_to_db(self):
+        reporter, db, _ = _reporter(ok=False)
+        _run_job(reporter)
+        assert len(db.updates) == 5
+
+
+class FakeSubscription:
+    def __init__(self, events):
+        self.events = list(events)
+        self.closed = False
+
+    async def next_event(self, timeout):
+        if self.events:
+            return self.events.pop(0)
+        await asyncio.sleep(0.01)
+        return None
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSubscriber:
+    def __init__(self, events=(), last=None, config=None):
+        self.config = config or _config()
+        self.subscription = FakeSubscription(events)
+        self.last = last or {}
+
+    async def subscribe(self, channel):
+        return self.subscription
+
+    async def last_events(self, job_ids):
+        return {j: self.last[j] for j in job_ids if j in self.last}
+
+
+def _collect(stream, limit=20):
+    async def run():
+        messages = []
+        async for message in stream:
+            messages.append(message)
+            if len(messages) >= limit:
+                break
+        return messages
+    return asyncio.run(run())
+
+
+def _states(*events):
+    async def load():
+        return list(events)
+    return load
+
+
+async def _connected():
+    return False
+
+
+def _data(messages):
+    return [json.loads(m.split("data: ", 1)[1]) for m in messages if m.startswith("id:")]
+
+
+class TestEventStream:
+    """SSE 스트림"""
+
+    def test_initial_state_then_events_until_done(self):
+        queued = make_event(JOB_ID, "QUEUED")
+        running = make_event(JOB_ID, "RUNNING", step="SNAPSHOT", percent=5)
+        subscriber = FakeSubscriber(
+            events=[make_event(JOB_ID, "RUNNING", step="SIGNAL", percent=60), make_event(JOB_ID, "DONE", percent=100)],
+            last={JOB_ID: running},
+        )
+        messages = _collect(event_stream("ch", _states(queued), _connected, subscriber))
+
+        # DB는 QUEUED지만 Redis 마지막 이벤트가 더 최신
+        assert [(d["status"], d["percent"]) for d in _data(messages)] == [("RUNNING", 5), ("RUNNING", 60), ("DONE", 100)]
+        assert messages[0].startswith(f"id: {JOB_ID}\nevent: progress\n")
+        assert subscriber.subscription.closed
+
+    def test_finished_job_closes_immediately(self):
+        done = make_event(JOB_ID, "DONE", percent=100)
+        subscriber = FakeSubscriber(last={JOB_ID: make_event(JOB_ID, "RUNNING", percent=60)})
+        messages = _collect(event_stream("ch", _states(done), _connected, subscriber))
+        assert _data(messages) == [done]
+
+    def test_heartbeat(self):
+        subscriber = FakeSubscriber(config=_config(HEARTBEAT_SECONDS=0.02, MAX_STREAM_SECONDS=0.2))
+        messages = _collect(event_stream("ch", _states(make_event(JOB_ID, "RUNNING")), _connected, subscriber))
+        assert ": ping\n\n" in messages
+
+    def test_stops_on_disconnect(self):
+        async def disconnected():
+            return True
+        subscriber = FakeSubscriber()
+        messages = _collect(event_stream("ch", _states(make_event(JOB_ID, "RUNNING")), disconnected, subscriber))
+        assert len(messages) == 1
+        assert subscriber.subscription.closed
+
+    def test_db_polling_without_redis(self):
+        snapshots = [
+            [make_event(JOB_ID, "RUNNING", percent=5, ts=None)],
+            [make_event(JOB_ID, "RUNNING", percent=5)],
+            [make_event(JOB_ID, "RUNNING", percent=60)],
+            [make_event(JOB_ID, "DONE", percent=100)],
+        ]
+        for snapshot in snapshots:
+            snapshot[0]["ts"] = "2026-01-01T00:00:00+00:00"
+
+        async def load():
+            return snapshots.pop(0) if len(snapshots) > 1 else snapshots[0]
+
+        messages = _collect(event_stream("ch", load, _connected, None, config=_config()))
+        assert [d["percent"] for d in _data(messages)] == [5, 60, 100]
+
+    def test_format_sse(self):
+        message = format_sse(make_event(JOB_ID, JobStatus.RUNNING, step=ProgressStep.SIGNAL, percent=60))
+        assert message.endswith("\n\n")
+        assert '"step":"SIGNAL"' in message
@@ -0,0 +1,287 @@
+"""
+Unit tests for Analysis Job Scheduler
+
+위험 점수 / 고위험 SLA, admission window (사용자 요청 우선, 큐 깊이 backpressure),
+broker 큐 깊이 (우선순위 키 합산, 실패 시 DB), 위험 점수 순 상위 window만 생성
+"""
+
+import contextlib
+import uuid
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+from app.models.job import QueueReason
+from app.services.input_fingerprint import InputFingerprintConfig, compute_fingerprint, fingerprint_components
+from app.worker.job_scheduler import (
+    BACKGROUND_QUEUE,
+    JobScheduler,
+    JobSchedulerConfig,
+    QueueProbe,
+    admission_window,
+    is_high_risk,
+    risk_score,
+)
+
+NOW = datetime.now(UTC)
+
+
+def _config(**overrides):
+    config = JobSchedulerConfig()
+    config.ENABLED = True
+    config.WORKER_SLOTS = 2
+    config.BACKLOG_PER_SLOT = 1
+    config.MAX_ADMIT_PER_TICK = 50
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+def _risk(corp_id="C1", high=0, med=0, overdue=False, grade=None, finished=None):
+    return SimpleNamespace(
+        corp_id=corp_id, high_signals=high, med_signals=med, overdue=overdue,
+        internal_grade=grade, last_finished_at=finished,
+    )
+
+
+class TestRiskScore:
+    """위험 점수"""
+
+    def test_components(self):
+        fresh = NOW - timedelta(hours=1)
+        assert risk_score(_risk(finished=NOW), 72, NOW) == 0
+        assert risk_score(_risk(high=5, finished=NOW), 72, NOW) == 45
+        assert risk_score(_risk(med=1, overdue=True, finished=NOW), 72, NOW) == 30
+        assert risk_score(_risk(grade="CCC", finished=NOW), 72, NOW) == 15
+        assert risk_score(_risk(grade="고위험", finished=NOW), 72, NOW) == 5
+        assert risk_score(_risk(grade="A", finished=fresh), 72, NOW) < 1
+        assert risk_score(_risk(finished=None), 72, NOW) == 35
+        assert risk_score(_risk(finished=NOW - timedelta(hours=36)), 72, NOW) == 17.5
+
+    def test_high_risk_tier(self):
+        assert is_high_risk(_risk(high=1))
+        assert is_high_risk(_risk(overdue=True))
+        assert is_high_risk(_risk(grade="HIGH"))
+        assert not is_high_risk(_risk(grade="MED"))
+        assert not is_high_risk(_risk())
+
+
+class TestAdmissionWindow:
+    """큐 깊이 기반 window"""
+
+    def test_capacity(self):
+        config = _config()
+        assert admission_window(2, 0, {"high": 0, "default": 0, "low": 0}, config) == 4
+        assert admission_window(2, 2, {"high": 0, "default": 0, "low": 1}, config) == 1
+        assert admission_window(2, 2, {"high": 0, "default": 1, "low": 3}, config) == 0
+
+    def test_interactive_jobs_block_background(self):
+        assert admission_window(8, 0, {"high": 1, "default": 0, "low": 0}, _config()) == 0
+
+    def test_cap_and_disabled(self):
+        assert admission_window(100, 0, {}, _config(MAX_ADMIT_PER_TICK=10)) == 10
+        assert admission_window(2, 50, {"high": 3}, _config(ENABLED=False, MAX_ADMIT_PER_TICK=7)) == 7
+
+
+class FakeRedis:
+    def __init__(self, lengths):
+        self.lengths = lengths
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class Pipe:
+            keys = []
+
+            def llen(self, key):
+                self.keys.append(key)
+
+            def execute(self):
+                return [redis.lengths.get(k, 0) for k in self.keys]
+        return Pipe()
+
+
+class TestQueueProbe:
+    """broker 큐 깊이 / 워커 슬롯"""
+
+    def test_depths_include_priority_keys(self):
+        probe = QueueProbe(_config(), redis_client=FakeRedis({"high": 1, "low": 4, "low\x06\x169": 2}))
+        assert probe.depths() == {"high": 1, "default": 0, "low": 6}
+
+    def test_depths_unavailable(self):
+        class Broken:
+            def pipeline(self, transaction=False):
+                raise ConnectionError("down")
+        assert QueueProbe(_config(), redis_client=Broken()).depths() is None
+
+    def test_worker_slots(self):
+        calls = []
+
+        class Inspect:
+            def stats(self):
+                calls.append(1)
+                return {"w1": {"pool": {"max-concurrency": 2}}, "w2": {"pool": {"max-concurrency": 4}}}
+
+        celery = SimpleNamespace(control=SimpleNamespace(inspect=lambda timeout: Inspect()))
+        probe = QueueProbe(_config(), celery=celery)
+        assert probe.worker_slots() == 6
+        assert probe.worker_slots() == 6
+        assert len(calls) == 1
+
+    def test_worker_slots_fallback(self):
+        celery = SimpleNamespace(control=SimpleNamespace(inspect=lambda timeout: SimpleNamespace(stats=lambda: None)))
+        assert QueueProbe(_config(WORKER_SLOTS=3), celery=celery).worker_slots() == 3
+
+
+class FakeProbe:
+    def __init__(self, depths, slots=2):
+        self._depths = depths
+        self.slots = slots
+
+    def depths(self):
+        return self._depths
+
+    def worker_slots(self):
+        return self.slots
+
+
+def _components(corp_id, finished, fingerprint=None):
+    row = SimpleNamespace(
+        corp_id=corp_id, snapshot_version=1, snapshot_hash="h", file_hashes=None,
+        banking_data_date=None, profile_version=None, dart_last_rcept_no=None,
+        external_last_event_at=None, last_fingerprint=None, last_finished_at=finished,
+    )
+    row.last_fingerprint = fingerprint or compute_fingerprint(fingerprint_components(row))
+    return row
+
+
+class FakeSession:
+    def __init__(self, risk_rows, component_rows, running=0, queued=(0, 0)):
+        self.risk_rows = risk_rows
+        self.component_rows = component_rows
+        self.running = running
+        self.queued = queued
+        self.inserted = []
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.statements.append(sql)
+        if "high_signals" in sql:
+            rows = self.risk_rows
+        elif "file_hashes" in sql:
+            rows = [r for r in self.component_rows if r.corp_id in params["corp_ids"]]
+        elif "INSERT INTO rkyc_job" in sql:
+            self.inserted.append(params)
+            rows = [SimpleNamespace(job_id=uuid.uuid4(), corp_id=c, queue_reason=r)
+                    for c, r in zip(params["corp_ids"], params["reasons"])]
+        else:
+            load = SimpleNamespace(running=self.running, queued_interactive=self.queued[0],
+                                   queued_background=self.queued[1])
+            return SimpleNamespace(fetchone=lambda: load)
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _portfolio():
+    recent = NOW - timedelta(hours=2)
+    risk_rows = [
+        _risk("LOW", finished=NOW - timedelta(hours=80)),                 # SLA 경과, 저위험
+        _risk("OVERDUE", overdue=True, finished=NOW - timedelta(hours=30)),  # 고위험 SLA(24h) 경과
+        _risk("SAME", high=2, finished=recent),                            # 입력 동일 + SLA 이내
+        _risk("NEW", grade="CCC", finished=None),                          # 분석 이력 없음
+        _risk("CHANGED", med=1, finished=recent),                          # 입력 변경
+    ]
+    component_rows = [
+        _components("LOW", NOW - timedelta(hours=80)),
+        _components("OVERDUE", NOW - timedelta(hours=30)),
+        _components("SAME", recent),
+        _components("CHANGED", recent, fingerprint="old"),
+    ]
+    new = _components("NEW", None)
+    new.last_fingerprint = None
+    component_rows.append(new)
+    return risk_rows, component_rows
+
+
+def _gate():
+    gate = InputFingerprintConfig()
+    gate.ENABLED = True
+    gate.FRESHNESS_HOURS = 72
+    gate.HIGH_RISK_FRESHNESS_HOURS = 24
+    return gate
+
+
+class TestScheduler:
+    """위험 점수 순 상위 window만 생성"""
+
+    def test_plan_ranks_candidates(self):
+        session = FakeSession(*_portfolio(), running=1)
+        scheduler = JobScheduler(_config(), FakeProbe({"high": 0, "default": 0, "low": 1}), _gate())
+        plan = scheduler.plan(session, now=NOW)
+
+        assert [(c.corp_id, c.reason) for c in plan.candidates] == [
+            ("OVERDUE", QueueReason.FRESHNESS_EXPIRED),
+            ("NEW", QueueReason.NO_PRIOR_RUN),
+            ("LOW", QueueReason.FRESHNESS_EXPIRED),
+            ("CHANGED", QueueReason.INPUT_CHANGED),
+        ]
+        assert plan.skipped_unchanged == 1
+        assert plan.window == 2
+        summary = plan.to_dict()
+        assert summary["deferred"] == 2
+        assert [c["selected"] for c in summary["top_candidates"]] == [True, True, False, False]
+
+    def test_run_admits_window_to_background_queue(self):
+        session = FakeSession(*_portfolio())
+        published = []
+        scheduler = JobScheduler(
+            _config(), FakeProbe({"high": 0, "default": 0, "low": 2}), _gate(),
+            db_factory=lambda: contextlib.nullcontext(session),
+            publish=lambda job, queue: published.append((job, queue)),
+        )
+        plan = scheduler.run()
+
+        assert session.inserted[0]["corp_ids"] == ["OVERDUE", "NEW"]
+        assert [j.corp_id for j in plan.admitted] == ["OVERDUE", "NEW"]
+        assert published[0][1] == BACKGROUND_QUEUE
+        assert scheduler.get_stats()["admitted"] == 2
+
+    def test_waiting_interactive_job_blocks_admission(self):
+        session = FakeSession(*_portfolio())
+        scheduler = JobScheduler(
+            _config(), FakeProbe({"high": 1, "default": 0, "low": 0}, slots=8), _gate(),
+            db_factory=lambda: contextlib.nullcontext(session),
+            publish=lambda job, queue: None,
+        )
+        plan = scheduler.run()
+        assert plan.window == 0 and plan.admitted == [] and session.inserted == []
+        assert scheduler.get_stats()["blocked_by_interactive"] == 1
+        # window가 0이면 위험 점수/fingerprint 조회 없이 종료
+        assert len(session.statements) == 1 and "FROM rkyc_job" in session.statements[0]
+
+    def test_preview_ranks_candidates_when_window_is_full(self):
+        session = FakeSession(*_portfolio())
+        scheduler = JobScheduler(
+            _config(), FakeProbe({"high": 1, "default": 0, "low": 0}), _gate(),
+            db_factory=lambda: contextlib.nullcontext(session),
+        )
+        plan = scheduler.preview()
+        assert plan.window == 0
+        assert len(plan.candidates) == 4 and plan.selected == []
+
+    def test_stale_cutoff_applies_to_running_jobs_only(self):
+        session = FakeSession(*_portfolio())
+        JobScheduler(_config(), FakeProbe({"high": 1}), _gate()).plan(session, now=NOW)
+        load_sql = " ".join(session.statements[0].split())
+        assert "WHERE status = 'QUEUED' OR (status = 'RUNNING' AND COALESCE(started_at, queued_at) >" in load_sql
+
+    def test_database_depth_fallback(self):
+        session = FakeSession(*_portfolio(), running=0, queued=(1, 0))
+        plan = JobScheduler(_config(), FakeProbe(None), _gate()).plan(session, now=NOW)
+        assert plan.depth_source == "database"
+        assert plan.window == 0
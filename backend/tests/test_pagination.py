@@ -0,0 +1,140 @@
+"""
+Unit tests for List Pagination Helpers
+
+keyset cursor 인코딩/조건/정렬, 페이지 분할, count=estimate 경로
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.corporation import Corporation
+from app.models.job import Job
+from app.models.signal import SignalIndex
+from app.services import pagination
+from app.services.pagination import (
+    CountMode,
+    InvalidCursor,
+    apply_keyset,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    dialect = postgresql.dialect()
+
+    def __init__(self, plan_rows):
+        self.plan_rows = plan_rows
+        self.statements = []
+
+    async def exec_driver_sql(self, sql):
+        self.statements.append(sql)
+        return FakeResult(json.dumps([{"Plan": {"Plan Rows": self.plan_rows}}]))
+
+
+class FakeSession:
+    """AsyncSession 대체: scalar()는 reltuples/count 순서대로 응답"""
+
+    def __init__(self, reltuples=None, plan_rows=0, exact=7):
+        self.reltuples = reltuples
+        self.exact = exact
+        self.conn = FakeConnection(plan_rows)
+        self.statements = []
+
+    async def scalar(self, statement, params=None):
+        self.statements.append(str(statement))
+        if "pg_class" in str(statement):
+            return self.reltuples
+        return self.exact
+
+    async def connection(self):
+        return self.conn
+
+
+class TestCursor:
+    """cursor 인코딩 및 keyset 조건"""
+
+    def test_round_trip(self):
+        ts = datetime(2026, 1, 5, 9, 30, tzinfo=UTC)
+        key = uuid.uuid4()
+        assert decode_cursor(encode_cursor(ts, key)) == (ts, str(key))
+        assert decode_cursor(encode_cursor(None, "8001-3719240")) == (None, "8001-3719240")
+
+    def test_invalid_cursor(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor("not-a-cursor")
+        with pytest.raises(InvalidCursor):
+            apply_keyset(select(Job), Job.queued_at, Job.job_id, encode_cursor(None, "not-a-uuid"))
+
+    def test_not_null_sort_uses_plain_order(self):
+        cursor = encode_cursor(datetime(2026, 1, 5, tzinfo=UTC), uuid.UUID(int=1))
+        sql = _sql(apply_keyset(select(SignalIndex), SignalIndex.detected_at, SignalIndex.signal_id, cursor))
+        assert "(rkyc_signal_index.detected_at, rkyc_signal_index.signal_id) <" in sql
+        assert "rkyc_signal_index.detected_at <= '2026-01-05" in sql  # partition pruning
+        assert "IS NULL" not in sql
+        assert sql.endswith("ORDER BY rkyc_signal_index.detected_at DESC, rkyc_signal_index.signal_id DESC")
+
+    def test_nullable_sort_keeps_nulls_last(self):
+        sql = _sql(apply_keyset(select(Corporation), Corporation.created_at, Corporation.corp_id,
+                                encode_cursor(datetime(2026, 1, 5, tzinfo=UTC), "8001-3719240")))
+        assert "OR corp.created_at IS NULL" in sql
+        assert "corp.created_at DESC NULLS LAST, corp.corp_id DESC" in sql
+
+        sql = _sql(apply_keyset(select(Corporation), Corporation.created_at, Corporation.corp_id,
+                                encode_cursor(None, "8001-3719240")))
+        assert "corp.created_at IS NULL AND corp.corp_id < '8001-3719240'" in sql
+
+    def test_split_page(self):
+        rows = [(datetime(2026, 1, d, tzinfo=UTC), f"C{d}") for d in (5, 4, 3)]
+        page, next_cursor = split_page(rows, 2, lambda r: r)
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1][0], "C4")
+        assert split_page(rows, 3, lambda r: r) == (rows, None)
+
+
+class TestCountRows:
+    """exact / estimate"""
+
+    def test_exact_is_default(self):
+        db = FakeSession(reltuples=50000)
+        assert asyncio.run(count_rows(db, select(Job), table="rkyc_job", filtered=False)) == (7, False)
+
+    def test_unfiltered_estimate_uses_reltuples(self):
+        db = FakeSession(reltuples=50000)
+        result = asyncio.run(count_rows(db, select(Job), CountMode.ESTIMATE, table="rkyc_job", filtered=False))
+        assert result == (50000, True)
+        assert not any("count(" in s for s in db.statements)
+
+    def test_filtered_estimate_uses_plan_rows(self):
+        db = FakeSession(plan_rows=12000)
+        query = select(Job).where(Job.corp_id == "8001-3719240")
+        assert asyncio.run(count_rows(db, query, CountMode.ESTIMATE, table="rkyc_job")) == (12000, True)
+        assert db.conn.statements[0].startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "'8001-3719240'" in db.conn.statements[0]
+
+    def test_small_or_unknown_estimates_count_exactly(self, monkeypatch):
+        db = FakeSession(plan_rows=pagination.ESTIMATE_EXACT_BELOW - 1)
+        assert asyncio.run(count_rows(db, select(Job), CountMode.ESTIMATE)) == (7, False)
+
+        db = FakeSession(reltuples=-1)  # ANALYZE 전
+        assert asyncio.run(count_rows(db, select(Job), CountMode.ESTIMATE, table="rkyc_job", filtered=False)) == (7, False)
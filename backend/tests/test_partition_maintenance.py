@@ -0,0 +1,185 @@
+"""
+Unit tests for Monthly Partition Maintenance
+
+파티션 이름/월 계산, 보존 기간 판정, 분리 전 카운터 보정, 미완료 Job 파티션 보존
+"""
+
+from datetime import date, datetime, UTC
+from types import SimpleNamespace
+
+from sqlalchemy.exc import OperationalError
+
+from app.worker.partition_maintenance import (
+    PartitionMaintainer,
+    PartitionMaintenanceConfig,
+    add_months,
+    expired_partitions,
+    partition_month,
+)
+
+
+def _config(**overrides):
+    config = PartitionMaintenanceConfig()
+    config.ENABLED = True
+    config.MONTHS_AHEAD = 3
+    config.SIGNAL_INDEX_RETENTION_MONTHS = 0
+    config.RETENTION_MODE = "detach"
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+class FakeResult:
+    def __init__(self, value=None, rows=()):
+        self.value = value
+        self.rows = list(rows)
+
+    def scalar(self):
+        return self.value
+
+    def fetchall(self):
+        return self.rows
+
+    def one(self):
+        return self.value
+
+
+class FakeDb:
+    """sync Session 대체: SQL 내용으로 응답"""
+
+    def __init__(self, partitioned=True, partitions=(), job_counts=(0, 0), rows=0, lock_busy=False):
+        self.partitioned = partitioned
+        self.lock_busy = lock_busy
+        self.partitions = list(partitions)
+        self.job_counts = job_counts
+        self.rows = rows
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("LOCK TABLE") and self.lock_busy:
+            raise OperationalError(sql, params, Exception("canceling statement due to lock timeout"))
+        if "pg_partitioned_table" in sql:
+            return FakeResult(self.partitioned)
+        if "pg_inherits" in sql:
+            return FakeResult(rows=[(name,) for name in self.partitions])
+        if "rkyc_ensure_monthly_partitions" in sql:
+            return FakeResult(2)
+        if "FILTER" in sql:
+            total, kept = self.job_counts
+            return FakeResult(SimpleNamespace(total=total, kept=kept))
+        if sql.startswith("SELECT COUNT(*)"):
+            return FakeResult(self.rows)
+        return FakeResult()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def ran(self, fragment):
+        return [sql for sql in self.statements if fragment in sql]
+
+
+class TestPartitionMonths:
+    """파티션 이름 / 보존 기간"""
+
+    def test_partition_month(self):
+        assert partition_month("rkyc_job_p202501") == date(2025, 1, 1)
+        assert partition_month("rkyc_job_default") is None
+        assert partition_month("rkyc_job_p202513") is None
+
+    def test_add_months(self):
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+    def test_only_whole_months_before_cutoff_expire(self):
+        names = ["rkyc_job_default", "rkyc_job_p202503", "rkyc_job_p202501", "rkyc_job_p202502"]
+        assert expired_partitions(names, datetime(2025, 3, 1, tzinfo=UTC)) == [
+            "rkyc_job_p202501", "rkyc_job_p202502",
+        ]
+        assert expired_partitions(names, datetime(2025, 2, 20, tzinfo=UTC)) == ["rkyc_job_p202501"]
+
+
+class TestRetirement:
+    """파티션 분리"""
+
+    CUTOFF = datetime(2025, 3, 1, tzinfo=UTC)
+
+    def test_job_partition_with_unexpired_rows_is_kept(self):
+        db = FakeDb(partitions=["rkyc_job_p202501"], job_counts=(10, 1))
+        result = PartitionMaintainer(_config()).retire_expired(db, "rkyc_job", self.CUTOFF)
+        assert result["retired"] == []
+        assert not db.ran("DETACH")
+        assert db.rollbacks == 1
+
+    def test_expired_job_partition_detached(self):
+        db = FakeDb(partitions=["rkyc_job_p202501", "rkyc_job_p202503"], job_counts=(10, 0))
+        result = PartitionMaintainer(_config()).retire_expired(db, "rkyc_job", self.CUTOFF)
+        assert result == {"partitioned": True, "retired": ["rkyc_job_p202501"], "rows": 10}
+        assert db.ran('ALTER TABLE "rkyc_job" DETACH PARTITION "rkyc_job_p202501"')
+        assert not db.ran("DROP TABLE")
+
+    def test_parent_locked_before_partition(self):
+        db = FakeDb(partitions=["rkyc_job_p202501"], job_counts=(10, 0))
+        PartitionMaintainer(_config()).retire_expired(db, "rkyc_job", self.CUTOFF)
+
+        # 조회와 같은 부모 → 파티션 순서, 잠금 대기 상한 설정 후 분리
+        assert db.ran('LOCK TABLE "rkyc_job", "rkyc_job_p202501" IN ACCESS EXCLUSIVE MODE')
+        order = [i for i, sql in enumerate(db.statements)
+                 for fragment in ("lock_timeout", "LOCK TABLE", "DETACH")
+                 if fragment in sql]
+        assert order == sorted(order) and len(order) == 3
+
+    def test_lock_timeout_defers_partition(self):
+        db = FakeDb(partitions=["rkyc_job_p202501"], job_counts=(10, 0), lock_busy=True)
+        maintainer = PartitionMaintainer(_config())
+        result = maintainer.retire_expired(db, "rkyc_job", self.CUTOFF)
+
+        assert result["retired"] == []
+        assert not db.ran("DETACH")
+        assert db.rollbacks == 1
+        assert maintainer.get_stats()["lock_timeouts"] == 1
+
+    def test_signal_index_counter_adjusted_before_drop(self):
+        db = FakeDb(partitions=["rkyc_signal_index_p202501"], rows=4)
+        maintainer = PartitionMaintainer(_config(RETENTION_MODE="drop"))
+        maintainer.retire_expired(db, "rkyc_signal_index", self.CUTOFF)
+
+        order = [i for i, sql in enumerate(db.statements)
+                 for fragment in ("rkyc_dashboard_counter_add", "rkyc_report_snapshot_touch", "DETACH", "DROP")
+                 if fragment in sql]
+        assert order == sorted(order) and len(order) == 4
+        assert maintainer.get_stats()["rows_retired"] == 4
+
+    def test_unpartitioned_table_skipped(self):
+        db = FakeDb(partitioned=False, partitions=["rkyc_job_p202501"])
+        result = PartitionMaintainer(_config()).retire_expired(db, "rkyc_job", self.CUTOFF)
+        assert result["partitioned"] is False
+        assert not db.ran("pg_inherits")
+
+
+class TestRun:
+    """Celery Beat 실행"""
+
+    def test_creates_partitions_without_retention_by_default(self):
+        db = FakeDb(partitions=["rkyc_signal_index_p202001"])
+        result = PartitionMaintainer(_config()).run(db, now=datetime(2025, 6, 15, tzinfo=UTC))
+        assert result["created"] == {"rkyc_job": 2, "rkyc_signal_index": 2}
+        assert result["retired"] == {}
+        assert not db.ran("DETACH")
+
+    def test_signal_index_retention(self):
+        db = FakeDb(partitions=["rkyc_signal_index_p202412", "rkyc_signal_index_p202501"], rows=1)
+        maintainer = PartitionMaintainer(_config(SIGNAL_INDEX_RETENTION_MONTHS=5))
+        result = maintainer.run(db, now=datetime(2025, 6, 15, tzinfo=UTC))
+        assert result["retired"] == {"rkyc_signal_index": ["rkyc_signal_index_p202412"]}
+
+    def test_disabled(self):
+        db = FakeDb()
+        assert PartitionMaintainer(_config(ENABLED=False)).run(db) == {"enabled": False}
+        assert db.statements == []
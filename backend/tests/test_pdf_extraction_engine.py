@@ -0,0 +1,135 @@
+"""
+Unit tests for PDF Extraction Engine
+
+페이지 단위 추출 + (file_hash, page_no) 캐시 테스트
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pdfplumber
+import pytest
+
+from app.worker.pipelines.doc_parsers import (
+    FinStatementParser,
+    PdfExtractionEngine,
+)
+
+SAMPLE_DIR = Path(__file__).resolve().parents[2] / "data" / "documents" / "upload"
+SAMPLE_PDF = SAMPLE_DIR / "FIN_STATEMENT" / "삼성전자_재무제표.pdf"
+
+pytestmark = pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample PDF not available")
+
+
+def _legacy_text(pdf_path: Path) -> str:
+    """Legacy extract_text_from_pdf behavior"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return "\n".join(t for t in (p.extract_text() for p in pdf.pages) if t)
+
+
+class FailingPool:
+    """submit()에서 실패하는 ProcessPoolExecutor 대체"""
+
+    def __init__(self, error):
+        self.error = error
+
+    def submit(self, *args, **kwargs):
+        raise self.error
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+class TestPdfExtractionEngine:
+    """PdfExtractionEngine 단위 테스트"""
+
+    def setup_method(self):
+        self.engine = PdfExtractionEngine(max_workers=1, cache_max_pages=100)
+
+    def teardown_method(self):
+        self.engine.shutdown()
+
+    def test_text_matches_legacy_extraction(self):
+        """엔진 텍스트는 기존 pdfplumber 추출과 동일"""
+        document = self.engine.extract(str(SAMPLE_PDF))
+
+        assert document.page_count >= 1
+        assert document.text == _legacy_text(SAMPLE_PDF)
+        assert document.file_hash == self.engine.file_hash(str(SAMPLE_PDF))
+
+    def test_second_extract_served_from_page_cache(self):
+        """두 번째 추출은 페이지 캐시 사용"""
+        first = self.engine.extract(str(SAMPLE_PDF))
+        second = self.engine.extract(str(SAMPLE_PDF))
+
+        assert first.cached_pages == 0
+        assert second.cached_pages == second.page_count
+        assert second.text == first.text
+        assert second.tables == first.tables
+
+    def test_invalidate_drops_pages(self):
+        """invalidate 후 재추출"""
+        document = self.engine.extract(str(SAMPLE_PDF))
+
+        removed = self.engine.invalidate(document.file_hash)
+
+        assert removed == document.page_count
+        assert self.engine.extract(str(SAMPLE_PDF)).cached_pages == 0
+
+    def test_cache_bounded_by_max_pages(self):
+        """캐시 페이지 수 상한"""
+        engine = PdfExtractionEngine(max_workers=1, cache_max_pages=0)
+        engine.extract(str(SAMPLE_PDF))
+
+        assert engine.get_stats()["cached_pages"] == 0
+
+    def test_process_pool_extraction(self):
+        """프로세스 풀 추출 결과는 직렬 추출과 동일"""
+        pooled = PdfExtractionEngine(max_workers=2, parallel_min_pages=1)
+        try:
+            document = pooled.extract(str(SAMPLE_PDF))
+        finally:
+            pooled.shutdown()
+
+        assert document.text == _legacy_text(SAMPLE_PDF)
+
+    def test_spawn_failure_disables_pool(self):
+        """자식 프로세스 생성 실패 → 직렬 추출, 이후 풀을 다시 만들지 않음"""
+        engine = PdfExtractionEngine(max_workers=2, parallel_min_pages=1, cache_max_pages=0)
+        engine._pool = FailingPool(AssertionError("daemonic processes are not allowed to have children"))
+
+        document = engine.extract(str(SAMPLE_PDF))
+
+        assert document.text == _legacy_text(SAMPLE_PDF)
+        assert engine._pool is None and engine._pool_disabled
+        assert engine._get_pool() is None
+
+    def test_broken_pool_is_recreated(self):
+        """이전 워커 비정상 종료(BrokenProcessPool)는 풀 비활성화 사유가 아님"""
+        engine = PdfExtractionEngine(max_workers=2, parallel_min_pages=1, cache_max_pages=0)
+        engine._pool = FailingPool(BrokenProcessPool("worker died"))
+
+        document = engine.extract(str(SAMPLE_PDF))
+
+        assert document.text == _legacy_text(SAMPLE_PDF)
+        assert not engine._pool_disabled
+
+    def test_missing_file_raises(self):
+        """존재하지 않는 파일"""
+        with pytest.raises(FileNotFoundError):
+            self.engine.extract(str(SAMPLE_DIR / "missing.pdf"))
+
+
+class TestParserUsesSharedEngine:
+    """Parser가 공유 엔진 캐시를 사용하는지 확인"""
+
+    def test_text_and_tables_share_one_read(self):
+        engine = PdfExtractionEngine(max_workers=1)
+        parser = FinStatementParser(extraction_engine=engine)
+
+        parser.extract_text_from_pdf(str(SAMPLE_PDF))
+        pages_after_text = engine.get_stats()["cached_pages"]
+        parser.extract_tables_from_pdf(str(SAMPLE_PDF))
+
+        assert pages_after_text >= 1
+        assert engine.get_stats()["cached_pages"] == pages_after_text
+        assert engine.extract(str(SAMPLE_PDF)).cached_pages == pages_after_text
@@ -0,0 +1,223 @@
+"""
+Unit tests for Portfolio Rule Evaluation
+
+벡터 mask 평가 결과가 기업별 경로(BankingInsightsEngine.analyze / RuleBasedSignalGenerator.generate)와
+동일한지 (무작위 포트폴리오), 결측/비정상 데이터, 빈 포트폴리오, 신규 시그널 후보 기업 분석 Job 생성
+"""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.services.banking_insights import BankingInsightsEngine
+from app.services.portfolio_rules import build_frame, evaluate_frame, signal_rule_masks
+from app.worker.tasks.portfolio_rules import admit_rule_triggered_jobs
+from app.worker.pipelines.signal_agents.rule_based_generator import RuleBasedSignalGenerator
+
+SIGNAL_TEXTS = [
+    "수출 물량 증가로 달러 매출 확대",
+    "매출 감소 및 영업이익 감소 우려",
+    "매출 성장세 지속",
+    "업황 회복 기대감",
+    "업황 악화로 수요 감소",
+    "대표이사 변경",
+]
+GRADES = ["A", "BBB", "BB", "저위험", "고위험", "CCC", None]
+
+
+def _banking(rng):
+    if rng.random() < 0.15:
+        return {}
+    return {
+        "loan_exposure": {
+            "total_exposure_krw": rng.choice([0, 5_0000_0000, 120_0000_0000]),
+            "composition": {"unsecured_loan": {"ratio": rng.choice([10, 40, 60, 80])}},
+            "risk_indicators": {
+                "grade_change": rng.choice([None, "UP", "DOWN", "STABLE"]),
+                "internal_grade": rng.choice(["A1", "B2"]),
+                "overdue_flag": rng.random() < 0.2,
+                "overdue_days": rng.choice([0, 10, 45]),
+                "overdue_amount": rng.choice([0, 3000_0000]),
+            },
+        },
+        "deposit_trend": {
+            "current_balance": rng.choice([0, 1_0000_0000, 100_0000_0000]),
+            "trend": rng.choice(["STABLE", "INCREASING", "DECREASING"]),
+        },
+        "collateral_detail": rng.choice([None, {"total_collateral_value": 50_0000_0000, "avg_ltv": rng.choice([0, 40, 60, 85])}]),
+        "trade_finance": rng.choice([None, {
+            "fx_exposure": {"hedge_ratio": rng.choice([10, 40, 70]), "net_position_usd": 1_200_000},
+            "export": {"current_receivables_usd": rng.choice([0, 800_000])},
+            "usance": {"utilization_rate": rng.choice([None, 30, 90])},
+        }]),
+        "financial_statements": {"financial_health": rng.choice(["", "WARNING", "IMPROVING", "GOOD"])},
+    }
+
+
+def _snapshot(rng, today):
+    return {
+        "corp": {"kyc_status": {
+            "internal_risk_grade": rng.choice(GRADES),
+            "last_kyc_updated": (today - timedelta(days=rng.choice([30, 364, 365, 600, 900]))).strftime("%Y-%m-%d"),
+        }},
+        "credit": {"loan_summary": {
+            "overdue_flag": rng.random() < 0.2,
+            "overdue_days": 35,
+            "total_exposure_krw": rng.choice([0, 100_0000_0000, 109_0000_0000, 150_0000_0000]),
+            "risk_grade_internal": "BBB",
+        }},
+        "collateral": {"total_collateral_value_krw": rng.choice([0, 50_0000_0000, 56_0000_0000, 30_0000_0000])},
+    }
+
+
+def _portfolio(n=120, seed=7):
+    rng = random.Random(seed)
+    today = datetime.now()
+    rows, signal_rows = [], []
+    for i in range(n):
+        corp_id = f"C{i:04d}"
+        banking = _banking(rng)
+        snapshot = _snapshot(rng, today) if rng.random() < 0.9 else None
+        prev = _snapshot(rng, today) if snapshot and rng.random() < 0.7 else None
+        rows.append(SimpleNamespace(
+            corp_id=corp_id,
+            corp_name=f"기업{i}",
+            loan_exposure=banking.get("loan_exposure"),
+            deposit_trend=banking.get("deposit_trend"),
+            collateral_detail=banking.get("collateral_detail"),
+            trade_finance=banking.get("trade_finance"),
+            financial_statements=banking.get("financial_statements"),
+            snapshot_json=snapshot,
+            prev_snapshot_json=prev,
+        ))
+        for j in range(rng.randint(0, 4)):
+            signal_rows.append(SimpleNamespace(
+                corp_id=corp_id,
+                signal_id=f"{corp_id}-s{j}",
+                signal_type="DIRECT",
+                event_type="NEWS",
+                summary=rng.choice(SIGNAL_TEXTS),
+                impact_direction=rng.choice(["RISK", "OPPORTUNITY", "NEUTRAL"]),
+                impact_strength="MED",
+            ))
+    return rows, signal_rows
+
+
+def _per_corp(rows, frame):
+    """기업별 경로 결과 (비교 기준)"""
+    expected = {}
+    generator = RuleBasedSignalGenerator()
+    for i, row in enumerate(rows):
+        insights = []
+        if frame.banking[i] is not None:
+            insights = BankingInsightsEngine(frame.banking[i], frame.signals[i], row.corp_name).analyze()
+        signals = []
+        if row.snapshot_json:
+            signals = generator.generate(row.corp_id, row.corp_name, row.snapshot_json, row.prev_snapshot_json)
+        if insights or signals:
+            expected[row.corp_id] = {"insights": insights, "signals": signals}
+    return expected
+
+
+class TestParity:
+    """기업별 경로와 동일한 결과"""
+
+    def test_random_portfolio_matches_per_corp_rules(self):
+        rows, signal_rows = _portfolio()
+        frame = build_frame(rows, signal_rows)
+        evaluation = evaluate_frame(frame)
+
+        actual = {r["corp_id"]: {"insights": r["insights"], "signals": r["signals"]} for r in evaluation.results}
+        assert actual == _per_corp(rows, frame)
+        assert evaluation.corporations == len(rows)
+        assert sum(evaluation.signal_counts.values()) == len(evaluation.signal_candidates())
+
+    def test_kyc_boundary(self):
+        rows, signal_rows = _portfolio(n=60, seed=3)
+        frame = build_frame(rows, signal_rows)
+        today = datetime.now().date()
+        kyc = signal_rule_masks(frame, today)["KYC_REFRESH"]
+        for i, row in enumerate(rows):
+            snapshot = row.snapshot_json
+            if not snapshot:
+                assert not kyc[i]
+                continue
+            last = datetime.strptime(snapshot["corp"]["kyc_status"]["last_kyc_updated"], "%Y-%m-%d").date()
+            assert kyc[i] == ((today - last).days >= 365)
+
+
+class TestEdgeCases:
+    """결측/비정상 데이터"""
+
+    def test_empty_portfolio(self):
+        evaluation = evaluate_frame(build_frame([], []))
+        assert evaluation.results == []
+        assert evaluation.summary()["corporations"] == 0
+
+    def test_malformed_values_are_skipped(self):
+        row = SimpleNamespace(
+            corp_id="C1", corp_name="기업",
+            loan_exposure='{"total_exposure_krw": 100, "risk_indicators": {"overdue_flag": true, "overdue_days": 40}}',
+            deposit_trend=None, collateral_detail={"avg_ltv": "N/A", "total_collateral_value": 10},
+            trade_finance=None, financial_statements=None,
+            snapshot_json={"credit": {"loan_summary": {"total_exposure_krw": "unknown"}}},
+            prev_snapshot_json={"credit": {"loan_summary": {"total_exposure_krw": 100}}},
+        )
+        evaluation = evaluate_frame(build_frame([row], []))
+        # JSON 문자열도 읽고, 숫자가 아닌 값은 해당 규칙에서만 제외
+        assert evaluation.signal_counts["LOAN_EXPOSURE_CHANGE"] == 0
+        assert evaluation.insight_counts["ltv_industry"] == 0
+        assert evaluation.insight_counts["overdue"] == 1
+        assert "연체 발생" in [i["title"] for i in evaluation.results[0]["insights"]]
+
+
+class FakeJobSession:
+    """sync Session 대체: 최근 분석 Job 조회 + Job INSERT (진행 중 기업 제외)"""
+
+    def __init__(self, recent=(), in_flight=()):
+        self.recent = set(recent)
+        self.in_flight = set(in_flight)
+        self.inserted = []
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if "INSERT INTO rkyc_job" in sql:
+            rows = [
+                SimpleNamespace(job_id=f"job-{corp_id}", corp_id=corp_id, queue_reason=reason)
+                for corp_id, reason in zip(params["corp_ids"], params["reasons"])
+                if corp_id not in self.in_flight
+            ]
+            self.inserted.extend(rows)
+        else:
+            rows = [(corp_id,) for corp_id in params["corp_ids"] if corp_id in self.recent]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    def commit(self):
+        pass
+
+
+class TestRuleTriggeredJobs:
+    """신규 시그널 후보 → 분석 Job"""
+
+    def test_one_job_per_corp_skipping_recent_and_in_flight(self):
+        candidates = [{"corp_id": c} for c in ("C1", "C1", "C2", "C3", "C4")]
+        db = FakeJobSession(recent={"C2"}, in_flight={"C3"})
+        admitted = admit_rule_triggered_jobs(db, candidates)
+
+        assert [job.corp_id for job in admitted] == ["C1", "C4"]
+        assert {job.queue_reason for job in admitted} == {"RULE_TRIGGERED"}
+
+    def test_limited_to_admission_window(self):
+        candidates = [{"corp_id": c} for c in ("C1", "C2", "C3")]
+        db = FakeJobSession()
+        assert [job.corp_id for job in admit_rule_triggered_jobs(db, candidates, limit=2)] == ["C1", "C2"]
+
+        # 사용자 요청 Job 대기 등으로 window가 0이면 생성하지 않음
+        db = FakeJobSession()
+        assert admit_rule_triggered_jobs(db, candidates, limit=0) == []
+        assert db.inserted == []
+
+    def test_no_candidates(self):
+        db = FakeJobSession()
+        assert admit_rule_triggered_jobs(db, []) == []
+        assert db.inserted == []
@@ -0,0 +1,181 @@
+"""
+Unit tests for Corp Profile phase memoization
+
+phase별 재사용 / 입력 변경 시 재실행 / 강제 재실행 / 실패 결과 미저장,
+3-Phase 검색 + 요약 + 합성 재사용
+"""
+
+import httpx
+
+from app.worker.pipelines.corp_profiling import CorpProfilingPipeline
+from app.worker.pipelines.profile_phase_cache import (
+    ALL_PHASES,
+    ProfilePhase,
+    ProfilePhaseCache,
+    ProfilePhaseCacheConfig,
+)
+
+
+class InMemoryPhaseCache(ProfilePhaseCache):
+    """rkyc_corp_profile_phase 대신 dict 사용 (만료는 expired로 흉내)"""
+
+    def __init__(self):
+        super().__init__(config=ProfilePhaseCacheConfig())
+        self.rows = {}
+        self.expired = set()
+        self.loads = 0
+
+    def load(self, corp_id):
+        self.loads += 1
+        return {
+            phase: dict(entry)
+            for (cid, phase), entry in self.rows.items()
+            if cid == corp_id and phase not in self.expired
+        }
+
+    def save(self, corp_id, phase, input_hash, payload):
+        self.rows[(corp_id, phase)] = {"input_hash": input_hash, "payload": payload}
+        self.expired.discard(phase)
+        return True
+
+
+class FakeLLM:
+    """call_with_json_response 대체 (요약/합성 호출 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def call_with_json_response(self, messages, temperature=None, **kwargs):
+        self.calls += 1
+        return {"business_summary": {"value": f"요약 {self.calls}", "confidence": "HIGH"}}
+
+
+class FakePerplexityClient:
+    """httpx.Client 대체: 쿼리 내용에 따라 phase별 응답"""
+
+    requests = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def post(self, url, headers=None, json=None):
+        query = json["messages"][-1]["content"]
+        FakePerplexityClient.requests.append(query)
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": f"검색 결과: {query[:20]}"}}],
+                "citations": ["https://dart.fss.or.kr/report"],
+            },
+            request=httpx.Request("POST", url),
+        )
+
+
+class TestPhaseMemo:
+    """PhaseMemo 재사용 규칙"""
+
+    def test_reuses_until_expired_or_input_changes(self):
+        cache = InMemoryPhaseCache()
+        calls = []
+
+        def compute(value):
+            calls.append(value)
+            return {"value": value}
+
+        cache.memo("C1").get_or_compute("phase1", "query-a", lambda: compute("a"))
+
+        memo = cache.memo("C1")
+        assert memo.get_or_compute("phase1", "query-a", lambda: compute("b")) == {"value": "a"}
+        assert memo.get_or_compute("phase1", "query-changed", lambda: compute("c")) == {"value": "c"}
+        assert memo.report() == {"phase1": "MISS"}
+
+        cache.expired.add("phase1")
+        assert cache.memo("C1").get_or_compute("phase1", "query-changed", lambda: compute("d")) == {"value": "d"}
+        assert calls == ["a", "c", "d"]
+
+    def test_rerun_and_uncacheable_results(self):
+        cache = InMemoryPhaseCache()
+        cache.memo("C1").get_or_compute("gemini", "q", lambda: {"content": "old"})
+
+        memo = cache.memo("C1", rerun=ALL_PHASES)
+        assert memo.get_or_compute("gemini", "q", lambda: {"content": "new"}) == {"content": "new"}
+
+        memo = cache.memo("C1")
+        failed = memo.get_or_compute(
+            "phase2", "q", lambda: {"error": "timeout"}, cacheable=lambda r: not r.get("error")
+        )
+        assert failed == {"error": "timeout"}
+        assert ("C1", "phase2") not in cache.rows
+        assert memo.report() == {"phase2": "MISS_NOT_STORED"}
+
+    def test_entries_loaded_once_per_run(self):
+        cache = InMemoryPhaseCache()
+        memo = cache.memo("C1")
+        for phase in ("phase1", "phase2", "phase3"):
+            memo.get_or_compute(phase, phase, lambda: {"ok": True})
+        assert cache.loads == 1
+
+
+class TestIncrementalProfileRefresh:
+    """3-Phase 검색/요약/합성: 만료된 phase만 재실행"""
+
+    def _run(self, pipeline, cache, llm, rerun=()):
+        memo = cache.memo("C1", rerun=rerun)
+        merged = pipeline._sync_perplexity_search("엠케이전자", "전자부품 제조업", "test-key", memo)
+        synthesized = pipeline._sync_claude_synthesis(
+            [{"provider": "perplexity", "profile": merged, "confidence": "MED"}],
+            "엠케이전자", "전자부품 제조업", "C26", [], llm, memo,
+        )
+        return memo.report(), synthesized
+
+    def test_only_expired_phase_is_rerun(self, monkeypatch):
+        monkeypatch.setattr(httpx, "Client", FakePerplexityClient)
+        FakePerplexityClient.requests = []
+        pipeline = CorpProfilingPipeline(orchestrator=object())
+        pipeline._industry_hints = {}
+        llm = FakeLLM()
+        pipeline._llm_service = llm
+        cache = InMemoryPhaseCache()
+
+        report, first = self._run(pipeline, cache, llm)
+        assert set(report.values()) == {"MISS"}
+        assert len(FakePerplexityClient.requests) == 3
+        assert llm.calls == 4  # 요약 3 + 합성 1
+
+        # 전부 유효 → 외부 호출 없이 동일 합성 결과
+        report, second = self._run(pipeline, cache, llm)
+        assert set(report.values()) == {"HIT"}
+        assert len(FakePerplexityClient.requests) == 3
+        assert llm.calls == 4
+        assert second == first
+
+        # phase3만 만료 → phase3 검색만 재실행 (본문 동일 → 요약/합성 재사용)
+        cache.expired.add(ProfilePhase.PHASE3)
+        report, _ = self._run(pipeline, cache, llm)
+        assert report[ProfilePhase.PHASE3] == "MISS"
+        assert report[ProfilePhase.PHASE1] == "HIT"
+        assert report[ProfilePhase.PHASE3_SUMMARY] == "HIT"
+        assert len(FakePerplexityClient.requests) == 4
+        assert llm.calls == 4
+
+    def test_force_reruns_all_phases(self, monkeypatch):
+        monkeypatch.setattr(httpx, "Client", FakePerplexityClient)
+        FakePerplexityClient.requests = []
+        pipeline = CorpProfilingPipeline(orchestrator=object())
+        pipeline._industry_hints = {}
+        llm = FakeLLM()
+        pipeline._llm_service = llm
+        cache = InMemoryPhaseCache()
+
+        self._run(pipeline, cache, llm)
+        report, _ = self._run(pipeline, cache, llm, rerun=ALL_PHASES)
+
+        assert "HIT" not in report.values()
+        assert len(FakePerplexityClient.requests) == 6
+        assert llm.calls == 8
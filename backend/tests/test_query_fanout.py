@@ -0,0 +1,217 @@
+"""
+Unit tests for Query Fan-out Helper
+
+동시 실행(별도 세션), 하위 조회별 timeout / 부분 결과, required 실패 전달,
+동시 세션 수 제한 (요청당 / 프로세스 전체), 요청 세션 커넥션 반환, 비활성화 시 요청 세션 순차 실행
+"""
+
+import asyncio
+import contextlib
+import time
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import ReplicaReadSession
+from app.services.query_fanout import QueryFanout, QueryFanoutConfig, SubQuery
+
+
+class FakeSession:
+    def __init__(self, name="pooled", in_transaction=False, dirty=()):
+        self.name = name
+        self.closed = False
+        self.savepoints = 0
+        self.commits = 0
+        self._in_transaction = in_transaction
+        self.new, self.dirty, self.deleted = (), list(dirty), ()
+
+    def in_transaction(self):
+        return self._in_transaction
+
+    async def commit(self):
+        self.commits += 1
+        self._in_transaction = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    @contextlib.asynccontextmanager
+    async def begin_nested(self):
+        self.savepoints += 1
+        yield
+
+
+class SessionFactory:
+    def __init__(self):
+        self.sessions = []
+        self.open = 0
+        self.max_open = 0
+
+    def __call__(self):
+        factory = self
+        session = FakeSession()
+
+        class Tracked:
+            async def __aenter__(self):
+                factory.open += 1
+                factory.max_open = max(factory.max_open, factory.open)
+                return session
+
+            async def __aexit__(self, *exc):
+                factory.open -= 1
+                session.closed = True
+
+        self.sessions.append(session)
+        return Tracked()
+
+
+def _fanout(enabled=True, max_concurrency=4, timeout=1.0, max_sessions=8):
+    config = QueryFanoutConfig()
+    config.ENABLED = enabled
+    config.MAX_CONCURRENCY = max_concurrency
+    config.MAX_SESSIONS = max_sessions
+    config.TIMEOUT_SECONDS = timeout
+    factory = SessionFactory()
+    return QueryFanout(config=config, session_factory=factory), factory
+
+
+def _sleep_then(value, seconds=0.05):
+    async def run(session):
+        await asyncio.sleep(seconds)
+        return (value, session)
+    return run
+
+
+async def _fail(session):
+    raise RuntimeError("relation does not exist")
+
+
+class TestFanout:
+    """동시 실행"""
+
+    def test_runs_concurrently_on_separate_sessions(self):
+        fanout, factory = _fanout()
+        queries = [SubQuery(name, _sleep_then(name, 0.1)) for name in ("corp", "signals", "profile")]
+
+        started = time.monotonic()
+        result = asyncio.run(fanout.run(FakeSession("request"), queries))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.25  # 합(0.3s)이 아니라 가장 느린 하위 조회 수준
+        assert [result[n][0] for n in ("corp", "signals", "profile")] == ["corp", "signals", "profile"]
+        assert len({id(result[n][1]) for n in ("corp", "signals", "profile")}) == 3
+        assert all(s.closed for s in factory.sessions)
+        assert not result.partial
+
+    def test_max_concurrency(self):
+        fanout, factory = _fanout(max_concurrency=2)
+        queries = [SubQuery(f"q{i}", _sleep_then(i, 0.02)) for i in range(5)]
+        asyncio.run(fanout.run(FakeSession("request"), queries))
+        assert factory.max_open == 2
+
+    def test_process_wide_session_limit(self):
+        fanout, factory = _fanout(max_concurrency=4, max_sessions=3)
+
+        async def two_requests():
+            queries = [SubQuery(f"q{i}", _sleep_then(i, 0.02)) for i in range(4)]
+            await asyncio.gather(
+                fanout.run(FakeSession("request-1"), queries),
+                fanout.run(FakeSession("request-2"), queries),
+            )
+
+        asyncio.run(two_requests())
+        # 요청 2개 x 4가 아니라 프로세스 전체 3개까지만 동시에 빌림
+        assert factory.max_open == 3 and len(factory.sessions) == 8
+
+    def test_request_session_released_before_fanout(self):
+        fanout, _ = _fanout()
+        db = FakeSession("request", in_transaction=True)
+        asyncio.run(fanout.run(db, [SubQuery("a", _sleep_then("a")), SubQuery("b", _sleep_then("b"))]))
+        assert db.commits == 1
+
+        # 변경 사항이 있는 세션은 그대로 둠
+        dirty = FakeSession("request", in_transaction=True, dirty=["signal"])
+        asyncio.run(fanout.run(dirty, [SubQuery("a", _sleep_then("a")), SubQuery("b", _sleep_then("b"))]))
+        assert dirty.commits == 0
+
+
+class TestPartialResults:
+    """timeout / 실패 처리"""
+
+    def test_optional_failures_use_defaults(self):
+        fanout, _ = _fanout(timeout=0.05)
+        result = asyncio.run(fanout.run(FakeSession("request"), [
+            SubQuery("evidences", _sleep_then("ok", 0.01), required=True),
+            SubQuery("similar_cases", _sleep_then("slow", 1.0), default=list),
+            SubQuery("insight_excerpt", _fail),
+        ]))
+
+        assert result["evidences"][0] == "ok"
+        assert result["similar_cases"] == []
+        assert result["insight_excerpt"] is None
+        assert result.errors["similar_cases"].startswith("timeout")
+        assert "RuntimeError" in result.errors["insight_excerpt"]
+        assert fanout.get_stats()["timeouts"] == 1
+
+    def test_required_failure_is_raised_after_all_finish(self):
+        fanout, factory = _fanout()
+        with pytest.raises(RuntimeError):
+            asyncio.run(fanout.run(FakeSession("request"), [
+                SubQuery("signals", _fail, required=True),
+                SubQuery("profile", _sleep_then("profile", 0.05)),
+            ]))
+        assert all(s.closed for s in factory.sessions)
+
+    def test_required_timeout(self):
+        fanout, _ = _fanout()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(fanout.run(FakeSession("request"), [
+                SubQuery("corp", _sleep_then("corp", 1.0), required=True, timeout=0.02),
+                SubQuery("profile", _sleep_then("profile", 0.01)),
+            ]))
+
+
+class TestSequential:
+    """비활성화 / 단일 하위 조회"""
+
+    def test_disabled_runs_on_request_session(self):
+        fanout, factory = _fanout(enabled=False)
+        db = FakeSession("request")
+        result = asyncio.run(fanout.run(db, [
+            SubQuery("corp", _sleep_then("corp", 0)),
+            SubQuery("profile", _fail, default="fallback"),
+        ]))
+        assert result["corp"][1] is db
+        assert result["profile"] == "fallback"
+        assert db.savepoints == 2  # 실패가 요청 트랜잭션을 중단시키지 않도록 SAVEPOINT
+        assert factory.sessions == []
+
+    def test_single_subquery_uses_request_session(self):
+        fanout, factory = _fanout()
+        db = FakeSession("request")
+        result = asyncio.run(fanout.run(db, [SubQuery("only", _sleep_then("only", 0))]))
+        assert result["only"][1] is db
+        assert fanout.get_stats()["sequential"] == 1
+
+
+class TestSessionBind:
+    """하위 세션은 요청 세션의 엔진을 따름 (replica 요청이 primary를 섞지 않도록)"""
+
+    def test_subsessions_follow_request_bind(self):
+        primary = create_async_engine("postgresql+asyncpg://u:p@primary/db")
+        replica = create_async_engine("postgresql+asyncpg://u:p@replica/db")
+        fanout = QueryFanout(config=QueryFanoutConfig())
+
+        async def bound_to(request_session):
+            async with fanout._get_session_factory(request_session)() as session:
+                return session.bind, type(session)
+
+        assert asyncio.run(bound_to(ReplicaReadSession(bind=replica))) == (replica, ReplicaReadSession)
+        assert asyncio.run(bound_to(AsyncSession(bind=primary))) == (primary, AsyncSession)
+        assert fanout._get_session_factory(AsyncSession(bind=primary)) is fanout._get_session_factory(
+            AsyncSession(bind=primary)
+        )
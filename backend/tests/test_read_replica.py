@@ -0,0 +1,199 @@
+"""
+Unit tests for Read Replica Routing
+
+replica 지연 확인 (허용 범위 / 확인 주기 / 실패 시 primary), read-your-writes 쿠키/헤더,
+get_read_db 세션 선택
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.requests import Request
+from starlette.responses import Response
+
+import app.core.database as database
+from app.core.database import (
+    READ_PRIMARY_COOKIE,
+    ReplicaReadSession,
+    ReplicaRouter,
+    get_read_db,
+    mark_read_your_writes,
+    wants_primary,
+)
+
+
+class FakeRouter(ReplicaRouter):
+    def __init__(self, lags, max_lag=5.0, interval=60.0):
+        super().__init__(engine=object(), max_lag_seconds=max_lag, check_interval_seconds=interval)
+        self.lags = list(lags)
+        self.probes = 0
+
+    async def _probe(self):
+        self.probes += 1
+        lag = self.lags.pop(0)
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+def _request(method="GET", headers=None, cookies=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    if cookies:
+        raw.append((b"cookie", "; ".join(f"{k}={v}" for k, v in cookies.items()).encode()))
+    return Request({"type": "http", "method": method, "headers": raw, "path": "/", "query_string": b""})
+
+
+class TestReplicaRouter:
+    """지연 확인"""
+
+    def test_lag_within_tolerance(self):
+        router = FakeRouter([1.0])
+        assert asyncio.run(router.is_usable())
+        assert router.lag_seconds == 1.0
+
+    def test_lagging_replica_falls_back(self):
+        router = FakeRouter([30.0])
+        assert not asyncio.run(router.is_usable())
+        assert router.get_stats()["lag_fallbacks"] == 1
+
+    def test_probe_failure_falls_back(self):
+        router = FakeRouter([ConnectionError("replica down")])
+        assert not asyncio.run(router.is_usable())
+        assert router.get_stats()["probe_errors"] == 1
+
+    def test_probe_once_per_interval(self):
+        router = FakeRouter([1.0, 1.0])
+
+        async def many():
+            return await asyncio.gather(*(router.is_usable() for _ in range(5)))
+
+        assert all(asyncio.run(many()))
+        assert router.probes == 1
+
+    def test_not_configured(self):
+        assert not asyncio.run(ReplicaRouter(engine=None).is_usable())
+
+
+class TestReadYourWrites:
+    """변경 요청 후 primary"""
+
+    def test_header_and_cookie(self):
+        assert wants_primary(_request(headers={"X-Read-Consistency": "primary"}))
+        assert wants_primary(_request(cookies={READ_PRIMARY_COOKIE: str(time.time() + 10)}))
+        assert not wants_primary(_request(cookies={READ_PRIMARY_COOKIE: str(time.time() - 1)}))
+        assert not wants_primary(_request(cookies={READ_PRIMARY_COOKIE: "junk"}))
+        assert not wants_primary(_request())
+
+    def test_cookie_set_after_successful_mutation(self, monkeypatch):
+        monkeypatch.setattr(database, "read_engine", object())
+
+        response = Response()
+        mark_read_your_writes(_request("POST"), response)
+        assert READ_PRIMARY_COOKIE in response.headers.get("set-cookie", "")
+
+        for method, status in (("GET", 200), ("POST", 422)):
+            response = Response(status_code=status)
+            mark_read_your_writes(_request(method), response)
+            assert "set-cookie" not in response.headers
+
+    def test_no_cookie_without_replica(self, monkeypatch):
+        monkeypatch.setattr(database, "read_engine", None)
+        response = Response()
+        mark_read_your_writes(_request("POST"), response)
+        assert "set-cookie" not in response.headers
+
+
+class FakeSession:
+    def __init__(self, name):
+        self.name = name
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def close(self):
+        pass
+
+
+class TestGetReadDb:
+    """세션 선택"""
+
+    def _select(self, monkeypatch, router, request):
+        monkeypatch.setattr(database, "ReadSessionLocal", lambda: FakeSession("replica"))
+        monkeypatch.setattr(database, "AsyncSessionLocal", lambda: FakeSession("primary"))
+        monkeypatch.setattr(database, "_replica_router", router)
+
+        async def first():
+            gen = get_read_db(request)
+            session = await gen.__anext__()
+            await gen.aclose()
+            return session.name
+
+        return asyncio.run(first())
+
+    def test_replica_when_usable(self, monkeypatch):
+        assert self._select(monkeypatch, FakeRouter([0.5]), _request()) == "replica"
+
+    def test_primary_when_lagging(self, monkeypatch):
+        assert self._select(monkeypatch, FakeRouter([60.0]), _request()) == "primary"
+
+    def test_primary_after_write(self, monkeypatch):
+        router = FakeRouter([0.5])
+        request = _request(headers={"X-Read-Consistency": "primary"})
+        assert self._select(monkeypatch, router, request) == "primary"
+        assert router.probes == 0
+        assert router.get_stats()["primary_reads"] == 1
+
+
+class TestReplicaFailover:
+    """replica 조회 오류 → primary 재시도"""
+
+    @pytest.fixture
+    def engines(self, monkeypatch):
+        primary = create_async_engine("postgresql+asyncpg://u:p@primary/db")
+        replica = create_async_engine("postgresql+asyncpg://u:p@replica/db")
+        monkeypatch.setattr(database, "engine", primary)
+        monkeypatch.setattr(database, "read_engine", replica)
+        monkeypatch.setattr(database, "_replica_router", ReplicaRouter(engine=replica, check_interval_seconds=60))
+        return primary, replica
+
+    def _patch_execute(self, monkeypatch, replica, error):
+        calls = []
+
+        async def execute(session, statement, *args, **kwargs):
+            calls.append(session.bind)
+            if session.bind is replica:
+                raise error
+            return "rows"
+
+        async def rollback(session):
+            pass
+
+        monkeypatch.setattr(AsyncSession, "execute", execute)
+        monkeypatch.setattr(AsyncSession, "rollback", rollback)
+        return calls
+
+    def test_connection_error_retried_on_primary(self, monkeypatch, engines):
+        primary, replica = engines
+        error = OperationalError("SELECT 1", {}, ConnectionResetError("replica gone"))
+        calls = self._patch_execute(monkeypatch, replica, error)
+
+        session = ReplicaReadSession(bind=replica)
+        assert asyncio.run(session.execute("SELECT 1")) == "rows"
+        assert calls == [replica, primary]
+        assert session.bind is primary
+        assert not database.get_replica_router()._usable
+
+    def test_query_error_not_retried(self, monkeypatch, engines):
+        primary, replica = engines
+        error = ProgrammingError("SELECT nope", {}, Exception("syntax error"))
+        calls = self._patch_execute(monkeypatch, replica, error)
+
+        with pytest.raises(ProgrammingError):
+            asyncio.run(ReplicaReadSession(bind=replica).execute("SELECT nope"))
+        assert calls == [replica]
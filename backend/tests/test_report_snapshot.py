@@ -0,0 +1,281 @@
+"""
+Unit tests for Corporation Report Snapshot
+
+보고서 조립(assemble_report), 스냅샷 적중/재조립/version 조건 저장,
+ETag 비교 및 304, Worker 재생성 결과
+"""
+
+import asyncio
+import contextlib
+import json
+from datetime import datetime, UTC
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.endpoints.reports import get_corporation_report
+from app.services import query_fanout, report_snapshot
+from app.services.report_builder import REPORT_EVIDENCE_LIST_LIMIT, assemble_report
+from app.services.report_snapshot import (
+    ReportSnapshotConfig,
+    ReportSnapshotService,
+    etag_matches,
+    rebuild_snapshot_sync,
+)
+
+CORP_ID = "8001-3719240"
+DETECTED = datetime(2026, 10, 1, 9, 0, tzinfo=UTC)
+
+
+def _signal(signal_type="DIRECT", impact="RISK", status="NEW"):
+    return SimpleNamespace(
+        signal_id=uuid4(), corp_id=CORP_ID, corp_name="엠케이전자", industry_code="C26",
+        signal_type=signal_type, event_type="KYC_REFRESH", impact_direction=impact,
+        impact_strength="MED", confidence="HIGH", title="title", summary_short="short",
+        evidence_count=1, detected_at=DETECTED, summary=None, signal_status=status,
+        reviewed_at=None, dismissed_at=None, dismiss_reason=None,
+    )
+
+
+def _evidence(signal_id):
+    return SimpleNamespace(
+        evidence_id=uuid4(), signal_id=signal_id, evidence_type="EXTERNAL", ref_type="URL",
+        ref_value="https://example.com", snippet="snippet", meta=None, created_at=DETECTED,
+    )
+
+
+class FakeResult:
+    def __init__(self, rows=(), rowcount=1):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    """AsyncSession 대체: 스냅샷 테이블 + 보고서 원천 조회"""
+
+    def __init__(self, snapshot_row=None, signals=(), store_rowcount=1, snapshot_error=None, insight_error=None):
+        self.snapshot_row = snapshot_row
+        self.insight_error = insight_error
+        self.signals = list(signals)
+        self.evidences = [_evidence(s.signal_id) for s in self.signals]
+        self.store_rowcount = store_rowcount
+        self.snapshot_error = snapshot_error
+        self.queries = []
+        self.stored = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def _execute(self, statement, params=None):
+        sql = str(statement)
+        if "rkyc_report_snapshot" in sql:
+            if self.snapshot_error:
+                raise self.snapshot_error
+            if sql.lstrip().startswith("INSERT"):
+                self.queries.append("store")
+                self.stored.append(params)
+                return FakeResult(rowcount=self.store_rowcount)
+            self.queries.append("read")
+            return FakeResult([self.snapshot_row] if self.snapshot_row else [])
+        if "rkyc_loan_insight" in sql and self.insight_error:
+            raise self.insight_error
+        if "ranked_evidence" in sql:
+            self.queries.append("evidence")
+            return FakeResult(self.evidences)
+        if "rkyc_signal_index" in sql:
+            self.queries.append("signals")
+            return FakeResult(self.signals)
+        self.queries.append("other")
+        return FakeResult()
+
+    async def execute(self, statement, params=None):
+        return self._execute(statement, params)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    def begin_nested(self):
+        return contextlib.nullcontext()
+
+
+class FakeSyncSession(FakeSession):
+    def execute(self, statement, params=None):
+        return self._execute(statement, params)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def sequential_fanout(monkeypatch):
+    """하위 조회를 요청 세션(FakeSession)에서 순차 실행"""
+    config = query_fanout.QueryFanoutConfig()
+    config.ENABLED = False
+    monkeypatch.setattr(query_fanout, "_query_fanout", query_fanout.QueryFanout(config=config))
+
+
+def _row(version, built_version, etag="abc", payload='{"cached": true}'):
+    return SimpleNamespace(version=version, built_version=built_version, etag=etag, payload=payload)
+
+
+def _service():
+    config = ReportSnapshotConfig()
+    config.ENABLED = True
+    return ReportSnapshotService(config=config)
+
+
+class TestAssembleReport:
+    """행 → FullReportResponse"""
+
+    def test_stats_and_evidence_limit(self):
+        signals = [_signal() for _ in range(8)] + [_signal("INDUSTRY", "OPPORTUNITY") for _ in range(4)]
+        evidences = [_evidence(s.signal_id) for s in signals]
+        report = assemble_report(CORP_ID, None, signals, evidences, None, None)
+
+        assert report.corporation.name == "엠케이전자"  # corp 행 없으면 첫 시그널에서
+        assert report.summary_stats.total == 12
+        assert report.summary_stats.direct == 8
+        assert report.summary_stats.opportunity == 4
+        assert report.signals[0].summary == "short"
+        assert len(report.signals[0].evidences) == 1
+        assert len(report.evidence_list) == REPORT_EVIDENCE_LIST_LIMIT
+
+
+class TestSnapshotService:
+    """스냅샷 적중 / 재조립 / 저장"""
+
+    def test_fresh_snapshot_is_served_without_building(self):
+        db = FakeSession(snapshot_row=_row(3, 3))
+        snapshot = asyncio.run(_service().get(db, CORP_ID))
+        assert snapshot.from_snapshot
+        assert snapshot.body == '{"cached": true}'
+        assert db.queries == ["read"]
+
+    def test_missing_snapshot_is_built_and_stored(self):
+        db = FakeSession(signals=[_signal()])
+        service = _service()
+        snapshot = asyncio.run(service.get(db, CORP_ID))
+
+        assert not snapshot.from_snapshot
+        assert json.loads(snapshot.body)["summary_stats"]["total"] == 1
+        assert db.queries[0] == "read" and db.queries[-1] == "store"
+        assert db.stored[0]["version"] == 0
+        assert db.stored[0]["etag"] == snapshot.etag
+        assert db.commits == 1
+        assert service.get_stats()["stored"] == 1
+
+    def test_stale_snapshot_rebuilt_with_read_version(self):
+        db = FakeSession(snapshot_row=_row(5, 4), signals=[_signal()])
+        service = _service()
+        asyncio.run(service.get(db, CORP_ID))
+        assert db.stored[0]["version"] == 5
+
+        # 조립 중 원천이 다시 바뀌면 저장되지 않음
+        db = FakeSession(snapshot_row=_row(5, 4), store_rowcount=0)
+        asyncio.run(service.get(db, CORP_ID))
+        assert service.get_stats()["store_skipped"] == 1
+
+    def test_unchanged_content_keeps_previous_payload(self):
+        built = FakeSession(signals=[_signal()])
+        first = asyncio.run(_service().get(built, CORP_ID))
+
+        # version만 바뀌고 보고서 내용은 같음 → 이전 payload(generated_at)와 ETag 유지
+        db = FakeSession(snapshot_row=_row(2, 1, etag=first.etag, payload='{"previous": true}'))
+        db.signals, db.evidences = built.signals, built.evidences
+        snapshot = asyncio.run(_service().get(db, CORP_ID))
+        assert snapshot.etag == first.etag
+        assert snapshot.body == '{"previous": true}'
+        assert db.stored[0]["payload"] == '{"previous": true}'
+
+    def test_store_unavailable_builds_inline(self):
+        db = FakeSession(snapshot_error=RuntimeError('relation "rkyc_report_snapshot" does not exist'))
+        service = _service()
+        snapshot = asyncio.run(service.get(db, CORP_ID))
+        assert snapshot.etag
+        assert db.rollbacks == 1
+        assert "store" not in db.queries
+
+        # 재시도 대기 중에는 스냅샷 테이블을 조회하지 않음
+        db.snapshot_error = None
+        asyncio.run(service.get(db, CORP_ID))
+        assert "read" not in db.queries
+        assert service.get_stats()["store_available"] is False
+
+
+    def test_partial_report_not_stored(self):
+        db = FakeSession(snapshot_row=_row(5, 4), signals=[_signal()], insight_error=TimeoutError())
+        service = _service()
+        snapshot = asyncio.run(service.get(db, CORP_ID))
+
+        assert snapshot.partial and snapshot.etag is None
+        assert json.loads(snapshot.body)["summary_stats"]["total"] == 1
+        assert "store" not in db.queries
+        assert service.get_stats()["partial"] == 1
+
+
+class TestETag:
+    """ETag / If-None-Match"""
+
+    def test_etag_matches(self):
+        assert etag_matches('"abc"', "abc")
+        assert etag_matches('W/"abc"', "abc")
+        assert etag_matches('"x", "abc"', "abc")
+        assert etag_matches("*", "abc")
+        assert not etag_matches('"abd"', "abc")
+        assert not etag_matches(None, "abc")
+
+    def test_endpoint_returns_304_for_matching_etag(self, monkeypatch):
+        service = _service()
+        monkeypatch.setattr(report_snapshot, "_report_snapshot_service", service)
+
+        response = asyncio.run(get_corporation_report(CORP_ID, None, FakeSession(snapshot_row=_row(1, 1))))
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc"'
+        assert response.body == b'{"cached": true}'
+
+        response = asyncio.run(get_corporation_report(CORP_ID, '"abc"', FakeSession(snapshot_row=_row(1, 1))))
+        assert response.status_code == 304
+        assert response.body == b""
+
+    def test_partial_report_has_no_etag(self, monkeypatch):
+        monkeypatch.setattr(report_snapshot, "_report_snapshot_service", _service())
+        db = FakeSession(signals=[_signal()], insight_error=RuntimeError("loan insight unavailable"))
+
+        response = asyncio.run(get_corporation_report(CORP_ID, "*", db))
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert response.headers["cache-control"] == "no-store"
+
+
+class TestRebuildSync:
+    """Worker 재생성"""
+
+    def test_rebuild_results(self):
+        assert rebuild_snapshot_sync(FakeSyncSession(snapshot_row=_row(2, 2)), CORP_ID) == "fresh"
+
+        session = FakeSyncSession(snapshot_row=_row(2, 1), signals=[_signal()])
+        assert rebuild_snapshot_sync(session, CORP_ID) == "rebuilt"
+        assert session.stored[0]["version"] == 2
+        stored = session.stored[0]
+
+        unchanged = FakeSyncSession(snapshot_row=_row(3, 2, etag=stored["etag"], payload=stored["payload"]))
+        unchanged.signals, unchanged.evidences = session.signals, session.evidences
+        assert rebuild_snapshot_sync(unchanged, CORP_ID) == "unchanged"
+
+        assert rebuild_snapshot_sync(FakeSyncSession(snapshot_row=_row(2, 1), store_rowcount=0), CORP_ID) == "stale"
+
+        partial = FakeSyncSession(snapshot_row=_row(2, 1), insight_error=RuntimeError("timeout"))
+        assert rebuild_snapshot_sync(partial, CORP_ID) == "partial"
+        assert "store" not in partial.queries
@@ -0,0 +1,300 @@
+"""
+Unit tests for Shared Search Result Cache
+
+업종/주제 단위 캐시, single-flight fill, 무효화
+"""
+
+import asyncio
+import fnmatch
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.worker.async_runtime import run_async
+from app.worker.llm.search_cache import SearchScope, SharedSearchCache
+from app.worker.pipelines.external_search import ExternalSearchError, ExternalSearchPipeline
+
+
+class FakeRedis:
+    """SharedSearchCache가 사용하는 Redis 명령만 구현한 in-memory fake"""
+
+    def __init__(self):
+        self.store = {}
+
+    def _alive(self, key):
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            del self.store[key]
+            return None
+        return value
+
+    def get(self, key):
+        return self._alive(key)
+
+    def ttl(self, key):
+        entry = self.store.get(key)
+        if entry is None or entry[1] is None:
+            return -1
+        return int(entry[1] - time.time())
+
+    def setex(self, key, ttl, value):
+        self.store[key] = (value, time.time() + ttl)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and self._alive(key) is not None:
+            return None
+        self.store[key] = (value, time.time() + ex if ex else None)
+        return True
+
+    def exists(self, key):
+        return int(self._alive(key) is not None)
+
+    def eval(self, script, numkeys, key, token):
+        if self._alive(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    def scan(self, cursor, match="*", count=100):
+        return 0, [key for key in list(self.store) if fnmatch.fnmatch(key, match)]
+
+
+def _make_cache(redis_client=None) -> SharedSearchCache:
+    cache = SharedSearchCache(redis_client=redis_client or FakeRedis())
+    cache.config.ENABLED = True
+    cache.config.POLL_INTERVAL_SECONDS = 0.01
+    return cache
+
+
+class CountingFill:
+    def __init__(self, events=None, delay=0.0, error=None):
+        self.events = events if events is not None else [{"title": "업종 뉴스"}]
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [dict(e) for e in self.events]
+
+
+class TestSharedSearchCache:
+    """SharedSearchCache 단위 테스트"""
+
+    def test_second_corp_reuses_result(self):
+        cache = _make_cache()
+        fill = CountingFill()
+
+        first = run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+        second = run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+
+        assert fill.calls == 1
+        assert first == second
+
+    def test_returned_events_are_copies(self):
+        """호출 측 태깅/팩트체크가 캐시 원본을 바꾸지 않음"""
+        cache = _make_cache()
+        fill = CountingFill()
+
+        events = run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+        events[0]["fact_check"] = {"result": "VERIFIED"}
+        again = run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+
+        assert "fact_check" not in again[0]
+
+    def test_concurrent_requests_single_flight(self):
+        cache = _make_cache()
+        fill = CountingFill(delay=0.05)
+
+        async def many():
+            return await asyncio.gather(*(
+                cache.get_or_fill(SearchScope.ENVIRONMENT, "C26", "FX", fill)
+                for _ in range(5)
+            ))
+
+        results = run_async(many())
+
+        assert fill.calls == 1
+        assert all(r == results[0] for r in results)
+
+    def test_waits_for_other_worker_fill(self):
+        """다른 워커가 락을 잡고 있으면 결과를 기다림"""
+        redis_client = FakeRedis()
+        worker_a = _make_cache(redis_client)
+        worker_b = _make_cache(redis_client)
+        fill_a = CountingFill(delay=0.1)
+        fill_b = CountingFill()
+
+        async def both():
+            return await asyncio.gather(
+                worker_a.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill_a),
+                worker_b.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill_b),
+            )
+
+        run_async(both())
+
+        assert fill_a.calls == 1
+        assert fill_b.calls == 0
+
+    def test_errors_are_not_cached(self):
+        cache = _make_cache()
+
+        with pytest.raises(RuntimeError):
+            run_async(cache.get_or_fill(
+                SearchScope.INDUSTRY, "C26", "반도체", CountingFill(error=RuntimeError("boom"))
+            ))
+
+        fill = CountingFill()
+        run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+        assert fill.calls == 1
+
+    def test_empty_result_uses_short_ttl(self):
+        cache = _make_cache()
+        key = cache.make_key(SearchScope.INDUSTRY, "C26", "반도체")
+
+        assert cache.set(key, []) == cache.config.EMPTY_TTL_SECONDS
+        assert cache.set(key, [{"title": "x"}]) == cache.config.TTL_SECONDS
+
+    def test_invalidate_by_industry(self):
+        redis_client = FakeRedis()
+        cache = _make_cache(redis_client)
+        fill = CountingFill()
+
+        for code in ("C26", "C10"):
+            run_async(cache.get_or_fill(SearchScope.INDUSTRY, code, "topic", fill))
+            run_async(cache.get_or_fill(SearchScope.ENVIRONMENT, code, "topic", fill))
+
+        removed = cache.invalidate(industry_code="C26")
+
+        assert removed >= 2
+        assert cache.get(cache.make_key(SearchScope.INDUSTRY, "C26", "topic")) is None
+        assert cache.get(cache.make_key(SearchScope.INDUSTRY, "C10", "topic")) is not None
+
+        # 다른 워커 메모리에 남아 있어도 Redis가 비었으므로 새 워커는 다시 검색
+        fresh = _make_cache(redis_client)
+        assert fresh.get(fresh.make_key(SearchScope.ENVIRONMENT, "C26", "topic")) is None
+
+    def test_invalidate_reaches_other_process_after_memory_ttl(self):
+        redis_client = FakeRedis()
+        worker, api = _make_cache(redis_client), _make_cache(redis_client)
+        key = worker.make_key(SearchScope.INDUSTRY, "C26", "topic")
+        worker.set(key, [{"title": "x"}])
+
+        # memory 복사본은 Redis TTL(6h)이 아니라 MEMORY_TTL_SECONDS까지만 유지
+        expires_at = worker._memory[key][1]
+        assert expires_at <= time.time() + worker.config.MEMORY_TTL_SECONDS
+
+        api.invalidate(industry_code="C26")
+        worker._memory[key] = (worker._memory[key][0], time.time() - 1)  # memory TTL 경과
+        assert worker.get(key) is None
+
+    def test_disabled_always_fills(self):
+        cache = _make_cache()
+        cache.config.ENABLED = False
+        fill = CountingFill()
+
+        run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+        run_async(cache.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", fill))
+
+        assert fill.calls == 2
+
+
+class ThreadRecordingRedis(FakeRedis):
+    """Redis 명령이 실행된 스레드 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def exists(self, key):
+        self.threads.add(threading.get_ident())
+        return super().exists(key)
+
+
+class TestRedisOffLoop:
+    """동기 Redis 호출은 공유 이벤트 루프 밖에서 실행"""
+
+    def test_poll_loop_does_not_block_event_loop(self):
+        redis_client = ThreadRecordingRedis()
+        worker_a = _make_cache(redis_client)
+        worker_b = _make_cache(redis_client)
+
+        async def both():
+            loop_thread = threading.get_ident()
+            await asyncio.gather(
+                worker_a.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", CountingFill(delay=0.1)),
+                worker_b.get_or_fill(SearchScope.INDUSTRY, "C26", "반도체", CountingFill()),
+            )
+            return loop_thread
+
+        loop_thread = run_async(both())
+        assert redis_client.threads
+        assert loop_thread not in redis_client.threads
+
+
+def _pipeline_with_cache(cache: SharedSearchCache) -> ExternalSearchPipeline:
+    pipeline = ExternalSearchPipeline()
+    pipeline.api_key = "test-key"
+    pipeline.search_cache = cache
+    return pipeline
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestSearchFailuresNotCached:
+    """Perplexity 호출 실패는 빈 결과로 캐시되지 않음"""
+
+    def test_http_error_not_cached(self):
+        cache = _make_cache()
+        pipeline = _pipeline_with_cache(cache)
+
+        async def search(handler):
+            async with _client(handler) as client:
+                return await pipeline._search_industry_events_async(client, "엠케이전자", "반도체", "C26")
+
+        with pytest.raises(ExternalSearchError):
+            run_async(search(lambda request: httpx.Response(503)))
+        assert cache.get_stats()["fills"] == 0
+
+        not_found = {"choices": [{"message": {"content": '{"status": "NOT_FOUND", "facts": []}'}}]}
+        calls = []
+
+        def ok(request):
+            calls.append(request)
+            return httpx.Response(200, json=not_found)
+
+        assert run_async(search(ok)) == []
+        assert run_async(search(ok)) == []
+        assert len(calls) == 1  # 실제 결과 없음은 짧은 TTL로 캐시
+
+    def test_timeout_not_cached(self):
+        cache = _make_cache()
+        pipeline = _pipeline_with_cache(cache)
+
+        def timeout(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        async def search():
+            async with _client(timeout) as client:
+                return await pipeline._search_industry_events_async(client, "엠케이전자", "반도체", "C26")
+
+        with pytest.raises(TimeoutError):
+            run_async(search())
+        assert cache.get_stats()["memory_entries"] == 0
@@ -0,0 +1,98 @@
+"""
+Unit tests for Worker Database Layer
+
+프로세스별 풀 크기, transaction pooler 판정, Job 단위 세션 공유/롤백/스레드 분리
+"""
+
+import threading
+
+from sqlalchemy import create_engine, text
+
+from app.worker.db import (
+    current_job_session,
+    derive_async_pool_settings,
+    derive_pool_settings,
+    get_sync_db,
+    is_transaction_pooler,
+    job_session,
+)
+
+
+class TestPoolSettings:
+    """노드 상한 / 프로세스 수"""
+
+    def test_split_across_processes(self):
+        assert derive_pool_settings(2, 12) == (2, 3)
+        assert derive_async_pool_settings(2, 12) == (1, 0)
+        assert derive_pool_settings(4, 12) == (1, 1)
+        assert derive_async_pool_settings(4, 12) == (1, 0)
+
+    def test_sync_and_async_pools_share_process_budget(self):
+        for concurrency in (1, 2, 3, 4):
+            budget = 24 // concurrency
+            sync_pool = sum(derive_pool_settings(concurrency, 24))
+            async_pool = sum(derive_async_pool_settings(concurrency, 24))
+            assert sync_pool + async_pool == budget
+            assert async_pool >= 1
+
+    def test_minimum_per_process(self):
+        assert derive_pool_settings(16, 12) == (1, 1)
+        assert derive_async_pool_settings(16, 12) == (1, 0)
+        assert derive_pool_settings(0, 12) == (4, 5)
+        assert derive_async_pool_settings(0, 12) == (1, 2)
+
+    def test_transaction_pooler_detection(self):
+        assert is_transaction_pooler("postgresql://u:p@pooler.supabase.com:6543/postgres")
+        assert not is_transaction_pooler("postgresql://u:p@db.supabase.co:5432/postgres")
+        assert is_transaction_pooler("postgresql://u:p@localhost:5432/db", override=True)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (v INTEGER)"))
+    return engine
+
+
+class TestJobSession:
+    """태스크 동안 커넥션 하나를 공유"""
+
+    def test_blocks_share_connection(self):
+        engine = _engine()
+        with job_session(engine) as job:
+            with get_sync_db() as db:
+                db.execute(text("INSERT INTO t VALUES (1)"))
+                db.commit()
+                first = db.connection().connection.dbapi_connection
+            with get_sync_db() as db:
+                assert db.connection().connection.dbapi_connection is first
+                assert db.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+            assert job.uses == 2
+        assert current_job_session() is None
+        assert job.connection is None
+
+    def test_uncommitted_work_discarded_between_blocks(self):
+        with job_session(_engine()):
+            with get_sync_db() as db:
+                db.execute(text("INSERT INTO t VALUES (1)"))
+            with get_sync_db() as db:
+                assert db.execute(text("SELECT COUNT(*) FROM t")).scalar() == 0
+
+    def test_nested_block_uses_separate_session(self):
+        with job_session(_engine()):
+            with get_sync_db() as outer:
+                with get_sync_db() as inner:
+                    assert inner is not outer
+            with get_sync_db() as db:
+                assert db is outer
+
+    def test_other_threads_get_own_session(self):
+        seen = {}
+        with job_session(_engine()):
+            with get_sync_db() as db:
+                owner = db
+            thread = threading.Thread(target=lambda: seen.update(job=current_job_session()))
+            thread.start()
+            thread.join()
+        assert owner is not None
+        assert seen["job"] is None